@@ -17,7 +17,9 @@ Key characteristics (from the legacy design):
 - Optional auxiliary rings: sensory pre-ring, vault ring, think ring.
 
 Environment variable semantics are preserved for all env vars referenced in the
-legacy excerpt (VRX_*).
+legacy excerpt (VRX_*). They are read once at construction into a frozen
+:class:`~vraxion.instnct.runtime_config.RuntimeConfig` cached on the model, so
+forward() never touches ``os.environ``.
 """
 
 from __future__ import annotations
@@ -25,47 +27,21 @@ from __future__ import annotations
 import math
 import os
 from dataclasses import dataclass
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import torch
 from torch import nn
 from torch.nn import functional as F
 
+from .runtime_config import RuntimeConfig
+
 
 # -----------------------------
 # Small helpers (no side effects)
 # -----------------------------
 
 
-def _env_is_one(name: str, default: bool = False) -> bool:
-    """Legacy boolean semantics: only the literal string '1' enables."""
-    val = os.environ.get(name)
-    if val is None:
-        return default
-    return str(val).strip() == "1"
-
-
-def _env_float(name: str, default: float) -> float:
-    val = os.environ.get(name)
-    if val is None or str(val).strip() == "":
-        return float(default)
-    try:
-        return float(val)
-    except Exception:
-        return float(default)
-
-
-def _env_int(name: str, default: int) -> int:
-    val = os.environ.get(name)
-    if val is None or str(val).strip() == "":
-        return int(default)
-    try:
-        return int(float(val))
-    except Exception:
-        return int(default)
-
-
-def nan_guard(tag: str, x: torch.Tensor, step: int) -> None:
+def nan_guard(tag: str, x: torch.Tensor, step: int, enabled: Optional[bool] = None) -> None:
     """
     Optional NaN/Inf guard for debugging.
 
@@ -74,8 +50,13 @@ def nan_guard(tag: str, x: torch.Tensor, step: int) -> None:
 
     - VRX_NAN_GUARD unset / '0': no-op (default).
     - VRX_NAN_GUARD == '1': raise RuntimeError on first non-finite detection.
+
+    Callers on hot paths pass ``enabled`` from their :class:`RuntimeConfig`
+    snapshot; when omitted the env var is read directly.
     """
-    if os.environ.get("VRX_NAN_GUARD", "0").strip() != "1":
+    if enabled is None:
+        enabled = os.environ.get("VRX_NAN_GUARD", "0").strip() == "1"
+    if not enabled:
         return
     if x is None:
         return
@@ -206,6 +187,9 @@ GAUSS_TAU = 8.0
 PTR_KERNEL = "gauss"  # "gauss" or "vonmises"
 PTR_KAPPA = 8.0
 PTR_EDGE_EPS = 0.0
+# Kernel-weight lookup table: >0 quantizes the fractional pointer into this many
+# bins and linearly interpolates precomputed weights (0 = exact path).
+PTR_KERNEL_LUT = 0
 
 # Activation and special non-linearities.
 ACT_NAME = "tanh"
@@ -261,6 +245,7 @@ SOFT_READOUT_TAU = 8.0
 
 # Satiety early-exit.
 SATIETY_THRESH = 0.0
+SATIETY_EVERY = 1  # check cadence in timesteps; 1 checks every step
 
 # Token decay controls (legacy BOS/EOS semantics).
 BOS_DECAY = 1.0
@@ -280,6 +265,7 @@ PTR_JUMP_DISABLED = False
 
 # Dual-pointer anchor controls (Phase A).
 PTR_ANCHOR_MIN_STEP = 0.0
+PTR_ANCHOR_FIXED_POINT = True  # int64 lattice anchor; False forces the float64 path
 PTR_ANCHOR_CLICK_INJECT = False
 PTR_ANCHOR_CONF_MIN = 0.0
 
@@ -296,6 +282,29 @@ PTR_DTYPE = torch.float32
 EXPERT_HEADS = 1
 
 
+def _gru_weights(cell: nn.Module) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Float (weight_ih, weight_hh, bias_ih, bias_hh) of a float or int8 dynamic GRUCell."""
+    wi = getattr(cell, "weight_ih", None)
+    if torch.is_tensor(wi):
+        return wi, cell.weight_hh, cell.bias_ih, cell.bias_hh
+    wb = cell._weight_bias()  # torch.ao dynamic-quantized cell: packed int8 weights
+    return (
+        wb["weight"]["weight_ih"].dequantize(),
+        wb["weight"]["weight_hh"].dequantize(),
+        wb["bias"]["bias_ih"],
+        wb["bias"]["bias_hh"],
+    )
+
+
+def _float_dtype(module: nn.Module, fallback: torch.dtype = torch.float32) -> torch.dtype:
+    """Activation dtype of a float module; int8 dynamic modules run in ``fallback``."""
+    for name in ("weight_ih", "weight"):
+        w = getattr(module, name, None)
+        if torch.is_tensor(w):
+            return w.dtype
+    return fallback
+
+
 # -----------------------------
 # Main model
 # -----------------------------
@@ -323,7 +332,8 @@ class AbsoluteHallway(nn.Module):
     - Readout: average of states at last K pointers (tensorized) or soft readout
       window.
     - Satiety exit: if max prob > SATIETY_THRESH, stop processing further
-      timesteps for that sample.
+      timesteps for that sample. Checked every SATIETY_EVERY steps; readout
+      heads are only evaluated on check steps and the final step.
     """
 
     def __init__(
@@ -339,9 +349,14 @@ class AbsoluteHallway(nn.Module):
         time_pointer: bool = False,
         aux_ring: bool = False,
         context_scale_init: float = 0.2,
+        runtime_config: Optional[RuntimeConfig] = None,
     ) -> None:
         super().__init__()
 
+        # Frozen env snapshot: read once here instead of per step in forward().
+        rtc = runtime_config if runtime_config is not None else RuntimeConfig.from_env()
+        self.runtime_config = rtc
+
         self.ring_len = int(ring_len)
         self.slot_dim = int(slot_dim)
         self.num_classes = int(num_classes)
@@ -353,6 +368,8 @@ class AbsoluteHallway(nn.Module):
         self.ptr_kernel = PTR_KERNEL if PTR_KERNEL in {"gauss", "vonmises"} else "gauss"
         self.ptr_kappa = float(PTR_KAPPA)
         self.ptr_edge_eps = float(PTR_EDGE_EPS)
+        self.ptr_kernel_lut = int(max(0, PTR_KERNEL_LUT))
+        self._kernel_lut_cache: Dict[Tuple, torch.Tensor] = {}
 
         # Activation.
         self.act_name = str(ACT_NAME)
@@ -416,8 +433,8 @@ class AbsoluteHallway(nn.Module):
         self.ptr_update_ema_state: Optional[float] = None
 
         # Usage smoothing.
-        self.usage_soft_enabled = _env_is_one("VRX_USAGE_SOFT", default=False)
-        self.usage_soft_temp = float(_env_float("VRX_USAGE_SOFT_TEMP", 0.5))
+        self.usage_soft_enabled = bool(rtc.usage_soft)
+        self.usage_soft_temp = float(rtc.usage_soft_temp)
 
         # Pointer gating schedule.
         self.ptr_gate_mode = str(PTR_GATE_MODE)
@@ -462,14 +479,11 @@ class AbsoluteHallway(nn.Module):
             self.register_buffer("state_loop_proj", torch.empty(0))
 
         # Sensory ring (env-controlled).
-        sensory_flag = os.environ.get("VRX_SENSORY_RING", "1").strip().lower()
-        self.sensory_enabled = sensory_flag not in {"0", "false", "off", "no"}
-        sensory_len_env = os.environ.get("VRX_SENSORY_RING_LEN")
-        sensory_dim_env = os.environ.get("VRX_SENSORY_SLOT_DIM")
+        self.sensory_enabled = bool(rtc.sensory_ring)
         default_sensory_len = max(1, self.ring_len // 2)
         default_sensory_dim = max(8, self.slot_dim // 3)
-        self.sensory_len = max(1, int(sensory_len_env)) if sensory_len_env else default_sensory_len
-        self.sensory_dim = max(8, int(sensory_dim_env)) if sensory_dim_env else default_sensory_dim
+        self.sensory_len = max(1, rtc.sensory_ring_len) if rtc.sensory_ring_len else default_sensory_len
+        self.sensory_dim = max(8, rtc.sensory_slot_dim) if rtc.sensory_slot_dim else default_sensory_dim
         if self.sensory_enabled:
             self.sensory_proj_in = nn.Linear(int(input_dim), self.sensory_dim)
             self.sensory_gru = nn.GRUCell(self.sensory_dim, self.sensory_dim)
@@ -480,22 +494,22 @@ class AbsoluteHallway(nn.Module):
             self.sensory_bridge = None
 
         # Vault ring (env-controlled).
-        self.vault_enabled = _env_is_one("VRX_VAULT", default=False)
-        self.vault_len = int(max(1, _env_int("VRX_VAULT_LEN", 32)))
-        self.vault_dim = int(max(8, _env_int("VRX_VAULT_DIM", 128)))
-        self.vault_decay = float(_env_float("VRX_VAULT_DECAY", 0.3))
-        self.vault_inject_scale = float(_env_float("VRX_VAULT_INJECT_SCALE", 0.2))
+        self.vault_enabled = bool(rtc.vault)
+        self.vault_len = int(max(1, rtc.vault_len))
+        self.vault_dim = int(max(8, rtc.vault_dim))
+        self.vault_decay = float(rtc.vault_decay)
+        self.vault_inject_scale = float(rtc.vault_inject_scale)
 
         # Adaptive vault control (self-regulating "tap").
-        self.vault_adapt = _env_is_one("VRX_VAULT_ADAPT", default=False)
-        self.vault_gate_min = float(_env_float("VRX_VAULT_GATE_MIN", 0.0))
-        self.vault_gate_max = float(_env_float("VRX_VAULT_GATE_MAX", 0.6))
-        self.vault_alpha_min = float(_env_float("VRX_VAULT_ALPHA_MIN", 0.05))
-        self.vault_alpha_max = float(_env_float("VRX_VAULT_ALPHA_MAX", 0.5))
-        self.vault_k_surprise = float(_env_float("VRX_VAULT_K_SURPRISE", 0.25))
-        self.vault_k_utility = float(_env_float("VRX_VAULT_K_UTILITY", 0.25))
-        self.vault_probe_every = int(_env_int("VRX_VAULT_PROBE_EVERY", 200))
-        self.vault_probe_beta = float(_env_float("VRX_VAULT_PROBE_BETA", 0.9))
+        self.vault_adapt = bool(rtc.vault_adapt)
+        self.vault_gate_min = float(rtc.vault_gate_min)
+        self.vault_gate_max = float(rtc.vault_gate_max)
+        self.vault_alpha_min = float(rtc.vault_alpha_min)
+        self.vault_alpha_max = float(rtc.vault_alpha_max)
+        self.vault_k_surprise = float(rtc.vault_k_surprise)
+        self.vault_k_utility = float(rtc.vault_k_utility)
+        self.vault_probe_every = int(rtc.vault_probe_every)
+        self.vault_probe_beta = float(rtc.vault_probe_beta)
 
         self.vault_util_ema: Optional[float] = None
         self.vault_loss_floor: Optional[float] = None
@@ -510,45 +524,39 @@ class AbsoluteHallway(nn.Module):
             self.vault_up = None
 
         # Think ring (env-controlled).
-        self.think_enabled = _env_is_one("VRX_THINK_RING", default=False)
-        self.think_mode = os.environ.get("VRX_THINK_RING_MODE", "parallel").strip().lower()
-        self.think_len = int(max(1, _env_int("VRX_THINK_RING_LEN", 128)))
-        self.think_dim = int(max(8, _env_int("VRX_THINK_RING_DIM", 21)))
-        self.think_alpha = float(_env_float("VRX_THINK_RING_ALPHA", 0.1))
+        self.think_enabled = bool(rtc.think_ring)
+        self.think_mode = str(rtc.think_mode)
+        self.think_len = int(max(1, rtc.think_len))
+        self.think_dim = int(max(8, rtc.think_dim))
+        self.think_alpha = float(rtc.think_alpha)
 
         # Dual-core think ring.
-        self.think_dual = _env_is_one("VRX_THINK_RING_DUAL", default=False)
-        self.think_alpha_low = float(_env_float("VRX_THINK_RING_ALPHA_LOW", self.think_alpha))
-        self.think_alpha_high = float(_env_float("VRX_THINK_RING_ALPHA_HIGH", self.think_alpha))
+        self.think_dual = bool(rtc.think_dual)
+        self.think_alpha_low = float(rtc.think_alpha_low)
+        self.think_alpha_high = float(rtc.think_alpha_high)
 
         # Mix semantics: VRX_THINK_RING_MIX is *slow* share.
-        self.think_mix = float(_env_float("VRX_THINK_RING_MIX", 0.5))
-        fast_share = os.environ.get("VRX_THINK_RING_FAST_SHARE")
-        if fast_share is not None and str(fast_share).strip() != "":
-            try:
-                self.think_mix = 1.0 - float(fast_share)
-            except Exception:
-                pass
+        self.think_mix = float(rtc.think_mix)
 
         # Optional brainstem mixer (entropy-driven).
-        self.think_brainstem = _env_is_one("VRX_THINK_RING_BRAINSTEM", default=False)
-        self.think_brainstem_every = int(max(1, _env_int("VRX_THINK_RING_BRAINSTEM_EVERY", 1)))
-        self.think_brainstem_dt = float(_env_float("VRX_THINK_RING_BRAINSTEM_DT", 1.0))
+        self.think_brainstem = bool(rtc.think_brainstem)
+        self.think_brainstem_every = int(max(1, rtc.think_brainstem_every))
+        self.think_brainstem_dt = float(rtc.think_brainstem_dt)
         self.brainstem = BrainstemMixer() if self.think_brainstem else None
         self.think_brainstem_w = 0.0
         self.think_brainstem_mix = float(self.think_mix)
         self.think_brainstem_info: Optional[Dict] = None
 
         # Optional EMA writeback for think ring state.
-        self.think_write_ema = _env_is_one("VRX_THINK_RING_WRITE_EMA", default=False)
+        self.think_write_ema = bool(rtc.think_write_ema)
 
         # Adaptive think-alpha slider (kept for compatibility; used externally).
-        self.think_alpha_adapt = _env_is_one("VRX_THINK_ALPHA_ADAPT", default=False)
-        self.think_alpha_min = float(_env_float("VRX_THINK_ALPHA_MIN", self.think_alpha))
-        self.think_alpha_max = float(_env_float("VRX_THINK_ALPHA_MAX", self.think_alpha))
-        self.think_alpha_beta = float(_env_float("VRX_THINK_ALPHA_BETA", 0.95))
-        self.think_alpha_jitter_low = float(_env_float("VRX_THINK_ALPHA_JITTER_LOW", 0.02))
-        self.think_alpha_jitter_high = float(_env_float("VRX_THINK_ALPHA_JITTER_HIGH", 0.08))
+        self.think_alpha_adapt = bool(rtc.think_alpha_adapt)
+        self.think_alpha_min = float(rtc.think_alpha_min)
+        self.think_alpha_max = float(rtc.think_alpha_max)
+        self.think_alpha_beta = float(rtc.think_alpha_beta)
+        self.think_alpha_jitter_low = float(rtc.think_alpha_jitter_low)
+        self.think_alpha_jitter_high = float(rtc.think_alpha_jitter_high)
         self.think_alpha_jitter_ema: Optional[float] = None
         self.think_alpha_target = float(self.think_alpha)
 
@@ -601,6 +609,7 @@ class AbsoluteHallway(nn.Module):
 
         # Telemetry.
         self.satiety_exits = 0
+        self.satiety_every = int(max(1, SATIETY_EVERY))
         self.blur_window = 1
         self.debug_stats: Optional[Dict] = None
 
@@ -721,12 +730,31 @@ class AbsoluteHallway(nn.Module):
             router_map = router_map.to(ptr_int.device)
         idx = ptr_int.clamp(0, router_map.numel() - 1)
         expert_ids = router_map[idx].to(torch.long)
-        # Guard against stale maps if expert count changed.
-        if expert_ids.numel() and int(expert_ids.max().item()) >= int(self.head.num_experts):
-            expert_ids = expert_ids % int(self.head.num_experts)
-        return expert_ids
+        # Guard against stale maps if expert count changed. The modulo is a
+        # no-op for in-range ids, so it is applied without a host-side check.
+        num_experts = int(getattr(self.head, "num_experts", 1) or 1)
+        return expert_ids % num_experts
 
-    def _update_expert_stats(self, expert_ids: Optional[torch.Tensor]) -> None:
+    def _ptr_bins(self, ptr_int: torch.Tensor) -> torch.Tensor:
+        """
+        Pointer histogram bin per sample.
+
+        Integer form of ``bucketize(ptr_int, bin_edges) - 1`` (clamped): the
+        edges are exact multiples of ring_range / bins, so the bin is
+        ceil(ptr * bins / ring_range) - 1 without touching the edge buffer.
+        """
+        nbins = int(self.pointer_hist_bins)
+        rr = int(self.ring_range)
+        bins = torch.div(ptr_int.to(torch.long) * nbins + (rr - 1), rr, rounding_mode="floor") - 1
+        return bins.clamp(0, nbins - 1)
+
+    def _update_expert_stats(self, expert_ids: Optional[torch.Tensor], sync: bool = True) -> None:
+        """
+        Expert routing stats for the last forward.
+
+        With sync=False (inference path) every stat stays a tensor on the
+        model's device, so no host sync is issued per forward.
+        """
         self.ptr_expert_ids = None
         self.ptr_expert_counts = None
         self.ptr_expert_active = 0
@@ -737,6 +765,13 @@ class AbsoluteHallway(nn.Module):
         counts = torch.bincount(expert_ids, minlength=int(self.head.num_experts)).float()
         total = counts.sum().clamp(min=1.0)
         probs = counts / total
+        if not sync:
+            self.ptr_expert_ids = expert_ids.detach()
+            self.ptr_expert_counts = counts.detach()
+            self.ptr_expert_active = (counts > 0).sum()
+            self.ptr_expert_max_share = counts.max() / total
+            self.ptr_expert_entropy = -(probs * torch.log(probs + 1e-12)).sum() / math.log(int(self.head.num_experts))
+            return
         max_share = (counts.max() / total).item()
         active = int((counts > 0).sum().item())
         entropy = 0.0
@@ -810,6 +845,15 @@ class AbsoluteHallway(nn.Module):
         centers = torch.remainder(base.unsqueeze(1) + offsets_long.unsqueeze(0), rr)
         centers = torch.nan_to_num(centers, nan=0, posinf=rr - 1, neginf=0)
         centers_f = centers.to(ptr_float.dtype)
+        lut = self._kernel_lut(offsets, rr, tau_override, ptr_float.device, ptr_float.dtype)
+        if lut is not None:
+            bins = lut.shape[0] - 1
+            u = (ptr_float - base.to(ptr_float.dtype)).clamp(0.0, 1.0) * float(bins)
+            j0 = torch.floor(u).long().clamp(0, bins - 1)
+            # Linear interpolation keeps a gradient w.r.t. the pointer.
+            frac_w = (u - j0.to(u.dtype)).unsqueeze(1)
+            weights = lut[j0] * (1.0 - frac_w) + lut[j0 + 1] * frac_w
+            return centers, weights, centers_f
         if self.ptr_kernel == "vonmises":
             angle_scale = (2.0 * math.pi) / max(float(rr), 1e-6)
             delta = (centers_f - ptr_float.unsqueeze(1)) * angle_scale
@@ -823,10 +867,175 @@ class AbsoluteHallway(nn.Module):
         weights = torch.softmax(logits, dim=1)
         return centers, weights, centers_f
 
+    def _kernel_lut(
+        self,
+        offsets: torch.Tensor,
+        ring_range: int,
+        tau_override: Optional[float],
+        device: torch.device,
+        dtype: torch.dtype,
+    ) -> Optional[torch.Tensor]:
+        """
+        Kernel-weight table [bins+1, 2K+1] over the fractional pointer in [0, 1].
+
+        The weights depend only on frac(ptr), the offsets and tau/kappa, so
+        the table is built in float64 once per parameter set and cached. Returns
+        None when LUT mode is off, or when a gauss window is wide enough to wrap
+        the ring (the exact path handles that case).
+
+        Linear interpolation error is at most max|w''| / (8 * bins**2) per
+        weight, which :meth:`kernel_lut_error_bound` estimates from the table.
+        For K=2 and bins=4096 that is ~5e-8 at tau=0.25, ~3e-9 at tau=2 and
+        ~1e-6 at tau=0.05.
+        """
+        bins = int(self.ptr_kernel_lut)
+        if bins <= 0:
+            return None
+        rr = int(ring_range)
+        k = (int(offsets.numel()) - 1) // 2
+        if self.ptr_kernel == "vonmises":
+            param = max(float(self.ptr_kappa), 1e-6)
+        else:
+            if 2 * (k + 1) > rr:
+                return None
+            param = max(float(self.gauss_tau if tau_override is None else tau_override), 1e-4)
+        key = (self.ptr_kernel, param, k, rr, bins, str(device), dtype)
+        lut = self._kernel_lut_cache.get(key)
+        if lut is None:
+            frac = torch.linspace(0.0, 1.0, bins + 1, dtype=torch.float64)
+            delta = torch.arange(-k, k + 1, dtype=torch.float64).unsqueeze(0) - frac.unsqueeze(1)
+            if self.ptr_kernel == "vonmises":
+                logits = param * torch.cos(delta * ((2.0 * math.pi) / max(float(rr), 1e-6)))
+            else:
+                logits = -(delta**2) / param
+            lut = torch.softmax(logits, dim=1).to(device=device, dtype=dtype)
+            if len(self._kernel_lut_cache) >= 8:
+                self._kernel_lut_cache.clear()
+            self._kernel_lut_cache[key] = lut
+        return lut
+
+    def kernel_lut_error_bound(self, tau_override: Optional[float] = None) -> float:
+        """
+        Estimated max abs weight error of LUT mode vs the exact kernel path.
+
+        Uses the table's second differences (max|T[j-1] - 2T[j] + T[j+1]| / 8),
+        which matches the interpolation bound max|w''| / (8 * bins**2). Returns
+        0.0 when LUT mode is off or not applicable.
+        """
+        offsets = torch.arange(-self.gauss_k, self.gauss_k + 1, dtype=torch.float64)
+        lut = self._kernel_lut(offsets, int(self.ring_range), tau_override, torch.device("cpu"), torch.float64)
+        if lut is None or lut.shape[0] < 3:
+            return 0.0
+        d2 = lut[2:] - 2.0 * lut[1:-1] + lut[:-2]
+        return float(d2.abs().max()) / 8.0
+
+    def _readout_step(
+        self,
+        state: torch.Tensor,
+        h: torch.Tensor,
+        ptr_int: torch.Tensor,
+        ptr_read_phys: torch.Tensor,
+        last_ptrs: torch.Tensor,
+        offsets_sr: Optional[torch.Tensor],
+    ) -> torch.Tensor:
+        """Per-step readout logits (soft window or pointer-history mean)."""
+        ring_range = int(self.ring_range)
+        if self.soft_readout:
+            assert offsets_sr is not None
+            pos_idx_sr, w_sr, _ = self._compute_kernel_weights(
+                ptr_read_phys, offsets_sr, ring_range, tau_override=float(self.soft_readout_tau)
+            )
+            pos_idx_exp_sr = pos_idx_sr.unsqueeze(-1).expand(-1, -1, self.slot_dim)
+            gathered_sr = state.gather(1, pos_idx_exp_sr)
+            fused_sr = (w_sr.unsqueeze(-1) * gathered_sr.to(w_sr.dtype)).sum(dim=1)
+            if fused_sr.dtype != state.dtype:
+                fused_sr = fused_sr.to(state.dtype)
+            fused = fused_sr
+        else:
+            gather_idx = last_ptrs.clamp(0, ring_range - 1)
+            gather_idx_exp = gather_idx.unsqueeze(-1).expand(-1, -1, self.slot_dim)
+            gathered = state.gather(1, gather_idx_exp)
+            fused = gathered.mean(dim=1)
+
+        if fused.dtype != h.dtype:
+            fused = fused.to(h.dtype)
+
+        read_vec = fused + h
+        return self.head(read_vec, self._map_expert_ids(ptr_int))
+
+    @staticmethod
+    def _masked_slot_write(
+        ring: torch.Tensor,
+        batch_idx: torch.Tensor,
+        ptr: torch.Tensor,
+        value: torch.Tensor,
+        mask: torch.Tensor,
+    ) -> None:
+        """
+        In-place ``ring[b, ptr[b]] = value[b]`` for rows where ``mask`` is set.
+
+        Fixed-shape: masked-out rows write their current slot back, so there is
+        no boolean indexing (no data-dependent shape, no host sync).
+        """
+        keep = ring[batch_idx, ptr]
+        ring.index_put_((batch_idx, ptr), torch.where(mask.unsqueeze(-1), value, keep))
+
+    def _think_ring_step(
+        self,
+        ring: torch.Tensor,
+        ptr: torch.Tensor,
+        think_inp: torch.Tensor,
+        alpha: float,
+        ema: bool,
+        active_mask: torch.Tensor,
+        batch_idx: torch.Tensor,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        One think-ring step: read the slot at ``ptr``, update it with think_gru,
+        write it back for active rows (in place) and advance their pointers.
+
+        Returns (ptr, delta).
+        """
+        assert self.think_gru is not None
+        assert self.think_proj_out is not None
+        prev = ring[batch_idx, ptr]
+        st = self.think_gru(think_inp, prev)
+        if st.dtype != ring.dtype:
+            st = st.to(ring.dtype)
+
+        # Optional EMA writeback so alpha behaves like a time constant.
+        if ema:
+            a = min(max(float(alpha), 0.0), 1.0)
+            write = (1.0 - a) * prev + a * st
+        else:
+            write = st
+
+        ring.index_put_((batch_idx, ptr), torch.where(active_mask.unsqueeze(-1), write, prev))
+        ptr = (ptr + active_mask.to(torch.long)) % int(self.think_len)
+        return ptr, self.think_proj_out(write)
+
+    def _anchor_snap(
+        self,
+        ptr: torch.Tensor,
+        min_step: float,
+        lattice_n: int,
+        fixed: bool,
+    ) -> Tuple[Optional[torch.Tensor], torch.Tensor]:
+        """
+        Snap ``ptr`` to the nearest min_step lattice point on the ring.
+
+        Returns (anchor_idx, anchor). ``anchor_idx`` holds int64 lattice counts
+        in fixed-point mode and is None on the legacy float64 path.
+        """
+        if fixed:
+            anchor_idx = torch.remainder(torch.round(ptr / min_step).long(), lattice_n)
+            return anchor_idx, anchor_idx.to(ptr.dtype) * min_step
+        anchor = torch.remainder(torch.round(ptr / min_step) * min_step, float(self.ring_range))
+        return None, anchor
+
     def _compute_gru_gates(self, inp: torch.Tensor, cur: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """Recompute GRU gates for telemetry (sigmoid/tanh activations)."""
-        wi, wh = self.gru.weight_ih, self.gru.weight_hh
-        bi, bh = self.gru.bias_ih, self.gru.bias_hh
+        wi, wh, bi, bh = _gru_weights(self.gru)
         gates = F.linear(inp, wi, bi) + F.linear(cur, wh, bh)
         r, z, n = gates.chunk(3, dim=1)
         r = torch.sigmoid(r)
@@ -834,23 +1043,110 @@ class AbsoluteHallway(nn.Module):
         n = torch.tanh(n)
         return r, z, n
 
+    def _seq_gru(self, cell: nn.GRUCell) -> nn.GRU:
+        """
+        ``nn.GRU`` sharing ``cell``'s parameters (same Parameter objects).
+
+        It is kept in a plain dict, not registered, so state_dict/parameters()
+        are unchanged. On CUDA the shared weights are flattened into one cuDNN
+        buffer when the GRU is built and again only after they move (``.to``
+        rebinds the data); optimizer steps and ``load_state_dict`` update them
+        in place and keep the layout.
+        """
+        cache = self.__dict__.setdefault("_seq_grus", {})
+        ent = cache.get(id(cell))
+        if ent is None or ent[0] is not cell:
+            # Built on meta so its own init draws nothing from the global RNG
+            # (the pointer init later in forward must see the same stream).
+            gru = nn.GRU(cell.input_size, cell.hidden_size, bias=cell.bias, batch_first=True, device="meta")
+            # GRUCell and GRU share gate layout (r, z, n); RNNBase tracks the swap.
+            gru.weight_ih_l0 = cell.weight_ih
+            gru.weight_hh_l0 = cell.weight_hh
+            if cell.bias:
+                gru.bias_ih_l0 = cell.bias_ih
+                gru.bias_hh_l0 = cell.bias_hh
+            ent = [cell, gru, None]
+            cache[id(cell)] = ent
+        gru = ent[1]
+        w = cell.weight_ih
+        if ent[2] != (w.device, w.dtype, w.data_ptr()):
+            gru.flatten_parameters()
+            ent[2] = (w.device, w.dtype, cell.weight_ih.data_ptr())
+        gru.train(self.training)
+        return gru
+
+    def _gru_scan(
+        self,
+        cell: nn.GRUCell,
+        seq: torch.Tensor,
+        h: torch.Tensor,
+        decay: Optional[torch.Tensor] = None,
+        reset_steps: Sequence[int] = (),
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Run ``cell`` over ``seq`` [B,T,D] with the fused (cuDNN on CUDA) GRU kernel.
+
+        ``decay`` [B,T] scales the hidden state before each step listed in
+        ``reset_steps``; the sequence is split into segments at those steps so
+        the result matches a per-step ``GRUCell`` loop. Returns (outputs, h_last).
+        """
+        T = int(seq.shape[1])
+        if T == 0:
+            return h.new_zeros(h.shape[0], 0, h.shape[1]), h
+        # int8 dynamic-quantized cells (see vraxion.instnct.quantize) have no
+        # fused sequence kernel and are stepped one timestep at a time.
+        fused = torch.is_tensor(getattr(cell, "weight_ih", None))
+        gru = self._seq_gru(cell) if fused else None
+        bounds = sorted({0, T, *(int(s) for s in reset_steps if 0 <= int(s) < T)})
+        outs = []
+        for s, e in zip(bounds[:-1], bounds[1:]):
+            if decay is not None and s in reset_steps:
+                h = h * decay[:, s].view(-1, 1).to(h.dtype)
+            if not fused:
+                steps = []
+                for i in range(s, e):
+                    h = cell(seq[:, i], h)
+                    steps.append(h)
+                outs.append(torch.stack(steps, dim=1))
+                continue
+            out, h_n = gru(seq[:, s:e], h.unsqueeze(0))
+            h = h_n.squeeze(0)
+            outs.append(out)
+        return (outs[0] if len(outs) == 1 else torch.cat(outs, dim=1)), h
+
     # -----------------------------
     # Forward
     # -----------------------------
 
-    def forward(self, x: torch.Tensor, return_xray: bool = False):
+    def forward(self, x: torch.Tensor, return_xray: bool = False, inference: bool = False):
         """
         Args:
             x: [B,T,input_dim]
             return_xray: if True, returns an extra dict with telemetry.
+            inference: no-grad fast path. Logits are identical to the regular
+                forward; telemetry is limited to last_ptr_bins, last_ptr_int,
+                ptr_flip_rate, satiety_exits and expert stats, all kept as
+                tensors on x's device (no per-forward host sync). Movement costs,
+                pointer histograms, dwell/ping-pong, controller means, debug
+                stats and state-loop metrics are skipped, and move_penalty is
+                returned as zero.
 
         Returns:
             (logits, move_penalty) or (logits, move_penalty, xray)
         """
         if x.dim() != 3:
             raise ValueError(f"Expected x to have shape [B,T,D], got {tuple(x.shape)}")
+        if inference:
+            if return_xray:
+                raise ValueError("inference=True does not collect x-ray telemetry")
+            if torch.is_grad_enabled():
+                with torch.no_grad():
+                    return self.forward(x, inference=True)
+        telemetry = not inference
         B, T, _ = x.shape
         device = x.device
+        rtc = self.runtime_config
+        nan_on = bool(rtc.nan_guard)
 
         # Legacy BOS/EOS decay mode only triggers on scalar token streams.
         bos_decay = max(0.0, min(1.0, float(BOS_DECAY)))
@@ -867,6 +1163,20 @@ class AbsoluteHallway(nn.Module):
         ring_range = int(self.ring_range)
         ptr_dtype = PTR_DTYPE
 
+        # Whole-sequence BOS/EOS step lists (one host sync each) so the step
+        # loops never branch on device values.
+        seq_decay = None
+        bos_steps: List[int] = []
+        eos_steps: Set[int] = set()
+        if bos_mask is not None:
+            assert eos_mask is not None
+            assert decay_on is not None and decay_off is not None
+            bos_steps = bos_mask.any(dim=0).nonzero().flatten().tolist()
+            eos_steps = set(eos_mask.any(dim=0).nonzero().flatten().tolist())
+            if bos_steps:
+                seq_decay = torch.where(bos_mask, decay_on, decay_off)
+        bos_step_set = set(bos_steps)
+
         # -----------------------------
         # Sensory ring pre-processing
         # -----------------------------
@@ -875,31 +1185,39 @@ class AbsoluteHallway(nn.Module):
             assert self.sensory_proj_in is not None
             assert self.sensory_gru is not None
             assert self.sensory_bridge is not None
-            s_dtype = self.sensory_gru.weight_ih.dtype
-            s_state = torch.zeros(B, self.sensory_len, self.sensory_dim, device=device, dtype=s_dtype)
+            # The sensory pointer is t % sensory_len, so the ring is a fixed
+            # delay line: step t reads the hidden state written at t - L. Each
+            # L-sized block therefore only depends on the previous block's
+            # outputs and runs as one fused GRU scan.
+            s_dtype = _float_dtype(self.sensory_gru)
+            s_len = int(self.sensory_len)
             s_h = torch.zeros(B, self.sensory_dim, device=device, dtype=s_dtype)
-            s_ptr = torch.zeros(B, device=device, dtype=torch.long)
+            s_inp_seq = self._apply_activation(self.sensory_proj_in(x))
+            # Decay hits every ring slot, so a context read at t carries the
+            # product of the decays over (t - L, t].
+            s_win = None
+            if seq_decay is not None and T > s_len:
+                s_win = seq_decay.to(s_dtype).unfold(1, s_len, 1).prod(dim=-1)[:, 1:]
             s_out = []
-            s_decay_on = decay_on.to(s_dtype) if decay_on is not None else None
-            s_decay_off = decay_off.to(s_dtype) if decay_off is not None else None
-            idx = torch.arange(B, device=device)
-            for t in range(T):
-                if bos_mask is not None:
-                    mask_t = bos_mask[:, t]
-                    if bool(mask_t.any()):
-                        decay = torch.where(mask_t, s_decay_on, s_decay_off).view(B, 1, 1)
-                        s_state = s_state * decay
-                        s_h = s_h * decay.view(B, 1)
-                s_inp = self.sensory_proj_in(x[:, t, :])
-                s_inp = self._apply_activation(s_inp)
-                s_ctx = s_state[idx, s_ptr]
-                s_h = self.sensory_gru(s_inp + s_ctx, s_h)
-                if s_h.dtype != s_state.dtype:
-                    s_h = s_h.to(s_state.dtype)
-                s_state[idx, s_ptr] = s_h
-                s_out.append(s_h)
-                s_ptr = (s_ptr + 1) % int(self.sensory_len)
-            sensory_seq = torch.stack(s_out, dim=1)
+            for s in range(0, T, s_len):
+                e = min(T, s + s_len)
+                blk = s_inp_seq[:, s:e]
+                if s > 0:
+                    s_ctx = s_out[-1][:, : e - s]
+                    if s_win is not None:
+                        s_ctx = s_ctx * s_win[:, s - s_len : e - s_len].unsqueeze(-1)
+                    blk = blk + s_ctx
+                blk_resets = [r - s for r in bos_steps if s <= r < e]
+                blk_out, s_h = self._gru_scan(
+                    self.sensory_gru,
+                    blk,
+                    s_h,
+                    decay=seq_decay[:, s:e] if seq_decay is not None else None,
+                    reset_steps=blk_resets,
+                )
+                s_out.append(blk_out.to(s_dtype))
+                s_h = s_h.to(s_dtype)
+            sensory_seq = torch.cat(s_out, dim=1)
 
         # -----------------------------
         # Diagnostic bypass
@@ -908,24 +1226,19 @@ class AbsoluteHallway(nn.Module):
             h = torch.zeros(B, self.slot_dim, device=device, dtype=x.dtype)
             movement_cost = torch.tensor(0.0, device=device, dtype=x.dtype)
             pointer_addresses = torch.zeros(B, device=device, dtype=torch.long)
-            for t in range(T):
-                if bos_mask is not None:
-                    mask_t = bos_mask[:, t]
-                    if bool(mask_t.any()):
-                        decay = torch.where(mask_t, decay_on, decay_off).view(B, 1)
-                        h = h * decay
-                if self.sensory_enabled:
-                    assert sensory_seq is not None
-                    assert self.sensory_bridge is not None
-                    inp = self.sensory_bridge(sensory_seq[:, t, :])
-                else:
-                    inp = self.input_proj(x[:, t, :])
-                inp = self._apply_activation(inp)
-                nan_guard("inp", inp, t)
-                h = self.gru(inp, h)
-                nan_guard("upd", h, t)
+            if self.sensory_enabled:
+                assert sensory_seq is not None
+                assert self.sensory_bridge is not None
+                inp_seq = self.sensory_bridge(sensory_seq)
+            else:
+                inp_seq = self.input_proj(x)
+            inp_seq = self._apply_activation(inp_seq)
+            nan_guard("inp", inp_seq, 0, enabled=nan_on)
+            # Plain GRU over the whole sequence; BOS decay splits it into segments.
+            upd_seq, h = self._gru_scan(self.gru, inp_seq, h, decay=seq_decay, reset_steps=bos_steps)
+            nan_guard("upd", upd_seq, T - 1, enabled=nan_on)
             logits = self.head(h, pointer_addresses)
-            nan_guard("logits_final", logits, T)
+            nan_guard("logits_final", logits, T, enabled=nan_on)
             return logits, movement_cost
 
         # -----------------------------
@@ -944,7 +1257,11 @@ class AbsoluteHallway(nn.Module):
 
         ptr_int_init = torch.floor(torch.remainder(ptr_float, float(ring_range))).clamp(0, ring_range - 1).long()
         ptr_int = ptr_int_init
-        last_ptrs = ptr_int_init.view(B, 1).repeat(1, int(self.blur_window))
+        # Read-pointer history as a preallocated ring buffer; the readout takes a
+        # mean over it, so slot order does not matter.
+        blur_window = int(self.blur_window)
+        last_ptrs = ptr_int_init.view(B, 1).repeat(1, blur_window)
+        last_ptrs_head = 0
         hist = torch.zeros(self.pointer_hist_bins, device=device, dtype=torch.long)
         satiety_exited = torch.zeros(B, device=device, dtype=torch.bool)
         ptr_vel = torch.zeros(B, device=device, dtype=ptr_dtype)
@@ -956,8 +1273,8 @@ class AbsoluteHallway(nn.Module):
         vault_active = bool(self.vault_enabled and bos_mask is not None and eos_mask is not None)
         vault_ring = None
         vault_ptr = None
-        vault_injections = 0
-        vault_updates = 0
+        vault_injections: torch.Tensor | int = 0
+        vault_updates: torch.Tensor | int = 0
         if vault_active:
             assert self.vault_down is not None
             assert self.vault_up is not None
@@ -991,10 +1308,9 @@ class AbsoluteHallway(nn.Module):
         max_dwell = torch.zeros(B, device=device, dtype=torch.long)
         flip_count = torch.zeros(B, device=device, dtype=torch.long)
         pingpong_count = torch.zeros(B, device=device, dtype=torch.long)
-        total_active_steps = 0
         active_steps_per_sample = torch.zeros(B, device=device, dtype=torch.long)
 
-        collect_xray = bool(return_xray or self.collect_xray)
+        collect_xray = bool(telemetry and (return_xray or self.collect_xray))
         target_mask = None
         gate_sat_count = 0.0
         gate_sat_total = 0.0
@@ -1027,17 +1343,25 @@ class AbsoluteHallway(nn.Module):
             min_step = max(min_step_floor, float(PTR_ANCHOR_MIN_STEP))
         self.ptr_min_step = float(min_step)
 
-        ptr_anchor = ptr_float.to(torch.float64)
-        ptr_anchor = torch.remainder(torch.round(ptr_anchor / min_step) * min_step, float(ring_range))
-        ptr_residual = ptr_float.to(torch.float64) - ptr_anchor
-        ptr_float = (ptr_anchor + ptr_residual).to(ptr_dtype)
+        # Fixed-point anchor: int64 lattice counts plus a residual in the pointer
+        # dtype (fp32 for half/fp32 pointers) when min_step tiles the ring
+        # exactly. Otherwise fall back to the legacy float64 anchor/residual.
+        lattice_n = int(round(float(ring_range) / min_step))
+        anchor_fixed = bool(PTR_ANCHOR_FIXED_POINT) and lattice_n >= 1 and lattice_n * min_step == float(ring_range)
+        if not anchor_fixed:
+            res_dtype = torch.float64
+        elif ptr_dtype == torch.float64:
+            res_dtype = torch.float64
+        else:
+            res_dtype = torch.float32
 
-        res_mean_init = float(ptr_residual.abs().mean().item())
-        self.ptr_residual_mean = res_mean_init
-        self.ptr_orbit = 2 if res_mean_init >= (min_step * 0.1) else 1
+        anchor_idx, ptr_anchor = self._anchor_snap(ptr_float.to(res_dtype), min_step, lattice_n, anchor_fixed)
+        ptr_residual = ptr_float.to(res_dtype) - ptr_anchor
+        ptr_float = (ptr_anchor + ptr_residual).to(ptr_dtype)
 
         # Internal state loop metrics.
-        if self.state_loop_metrics:
+        state_loop_on = bool(self.state_loop_metrics and telemetry)
+        if state_loop_on:
             loop_samples = B if self.state_loop_samples <= 0 else min(B, self.state_loop_samples)
             mode_prev = torch.full((loop_samples,), -1, device=device, dtype=torch.long)
             mode_prevprev = torch.full((loop_samples,), -1, device=device, dtype=torch.long)
@@ -1049,27 +1373,39 @@ class AbsoluteHallway(nn.Module):
             mode_steps = 0
 
         satiety_enabled = float(SATIETY_THRESH) > 0.0 and self.num_classes > 1
+        satiety_every = int(max(1, self.satiety_every))
+        # Only satiety exits can deactivate samples, so this is refreshed on
+        # satiety-check steps instead of syncing every step.
+        any_active = B > 0
 
         # Pre-allocate offsets for the main kernel.
         offsets = torch.arange(-self.gauss_k, self.gauss_k + 1, device=device, dtype=ptr_float.dtype)
 
+        # Per-forward device constants (hoisted out of the step loop).
+        offsets_sr = None
+        if self.soft_readout:
+            sr_k = int(self.soft_readout_k)
+            offsets_sr = torch.arange(-sr_k, sr_k + 1, device=device, dtype=ptr_dtype)
+        state_loop_proj = self.state_loop_proj.to(device) if self.state_loop_metrics else None
+        context_scale_f = torch.sigmoid(self.context_logit)
+        batch_idx = torch.arange(B, device=device)
+
         logits = torch.zeros(B, self.num_classes, device=device, dtype=x.dtype)
         upd = h  # placeholder for type-checkers
 
         for t in range(T):
-            active_mask = ~satiety_exited
-            if not bool(active_mask.any()):
+            if not any_active:
                 break
+            active_mask = ~satiety_exited
 
             # BOS decay.
-            if bos_mask is not None:
-                mask_t = bos_mask[:, t]
-                if bool(mask_t.any()):
-                    decay = torch.where(mask_t, decay_on, decay_off).view(B, 1, 1)
-                    state = state * decay
-                    h = h * decay.view(B, 1)
-                    if vault_active and vault_ring is not None:
-                        vault_ring = vault_ring * decay
+            if t in bos_step_set:
+                assert seq_decay is not None
+                decay = seq_decay[:, t].view(B, 1, 1)
+                state = state * decay
+                h = h * decay.view(B, 1)
+                if vault_active and vault_ring is not None:
+                    vault_ring = vault_ring * decay
 
             anchor_clicks = 0
 
@@ -1103,23 +1439,21 @@ class AbsoluteHallway(nn.Module):
                 inp = self.input_proj(x[:, t, :])
 
             # Vault inject on BOS.
-            if vault_active and bos_mask is not None and vault_ring is not None and vault_ptr is not None:
-                mask_t = bos_mask[:, t]
-                if bool(mask_t.any()):
-                    idx = torch.arange(B, device=device)
-                    read_idx = (vault_ptr - 1) % int(self.vault_len)
-                    read_vec = vault_ring[idx, read_idx]
-                    gate = float(self.vault_gate if self.vault_adapt else self.vault_inject_scale)
-                    assert self.vault_up is not None
-                    inp = inp + self.vault_up(read_vec).to(inp.dtype) * gate
-                    vault_injections += int(mask_t.sum().item())
+            if vault_active and t in bos_step_set and vault_ring is not None and vault_ptr is not None:
+                assert bos_mask is not None
+                read_idx = (vault_ptr - 1) % int(self.vault_len)
+                read_vec = vault_ring[batch_idx, read_idx]
+                gate = float(self.vault_gate if self.vault_adapt else self.vault_inject_scale)
+                assert self.vault_up is not None
+                inp = inp + self.vault_up(read_vec).to(inp.dtype) * gate
+                vault_injections = vault_injections + bos_mask[:, t].sum()
 
             inp = self._apply_activation(inp)
-            nan_guard("inp", inp, t)
+            nan_guard("inp", inp, t, enabled=nan_on)
 
             # Kernel weights around pointer.
             pos_idx, weights, _ = self._compute_kernel_weights(ptr_float, offsets, ring_range)
-            nan_guard("weights", weights, t)
+            nan_guard("weights", weights, t, enabled=nan_on)
 
             # Gather neighborhood.
             pos_idx_exp = pos_idx.unsqueeze(-1).expand(-1, -1, self.slot_dim).clamp(0, ring_range - 1)
@@ -1137,9 +1471,9 @@ class AbsoluteHallway(nn.Module):
                 cur = cur.to(inp.dtype)
 
             # Feed ring context as an additive cue.
-            context_scale = torch.sigmoid(self.context_logit).to(inp.dtype)
+            context_scale = context_scale_f.to(inp.dtype)
             gru_in = inp if self.aux_ring else (inp + context_scale * cur)
-            nan_guard("gru_in", gru_in, t)
+            nan_guard("gru_in", gru_in, t, enabled=nan_on)
 
             prev_h = h
 
@@ -1163,34 +1497,8 @@ class AbsoluteHallway(nn.Module):
                 assert self.think_proj_in is not None
                 assert self.think_gru is not None
                 assert self.think_proj_out is not None
-                idx = torch.arange(B, device=device)
                 think_inp = self.think_proj_in(gru_in)
-
-                def _think_step(ring: torch.Tensor, ptr: torch.Tensor, alpha: float):
-                    prev = ring[idx, ptr]
-                    st = self.think_gru(think_inp, prev)
-                    if st.dtype != ring.dtype:
-                        st = st.to(ring.dtype)
-
-                    # Optional EMA writeback so alpha behaves like a time constant.
-                    if self.think_write_ema or think_dual:
-                        a = float(alpha)
-                        if a < 0.0:
-                            a = 0.0
-                        elif a > 1.0:
-                            a = 1.0
-                        write = (1.0 - a) * prev + a * st
-                    else:
-                        write = st
-
-                    if bool(active_mask.any()):
-                        ring[idx[active_mask], ptr[active_mask]] = write[active_mask]
-                        ptr = (ptr + active_mask.to(torch.long)) % int(self.think_len)
-
-                    delta = self.think_proj_out(write)
-                    if delta.dtype != h_new.dtype:
-                        delta = delta.to(h_new.dtype)
-                    return ring, ptr, delta
+                think_ema = bool(self.think_write_ema or think_dual)
 
                 if think_dual and think_ring2 is not None and think_ptr2 is not None:
                     mix = float(getattr(self, "think_mix", 0.5))
@@ -1210,11 +1518,19 @@ class AbsoluteHallway(nn.Module):
                     mix = max(0.0, min(1.0, mix))
                     self.think_brainstem_mix = float(mix)
 
-                    think_ring, think_ptr, delta_fast = _think_step(think_ring, think_ptr, float(self.think_alpha_high))
-                    think_ring2, think_ptr2, delta_slow = _think_step(think_ring2, think_ptr2, float(self.think_alpha_low))
+                    think_ptr, delta_fast = self._think_ring_step(
+                        think_ring, think_ptr, think_inp, float(self.think_alpha_high), think_ema, active_mask, batch_idx
+                    )
+                    think_ptr2, delta_slow = self._think_ring_step(
+                        think_ring2, think_ptr2, think_inp, float(self.think_alpha_low), think_ema, active_mask, batch_idx
+                    )
                     think_delta = (mix * delta_slow) + ((1.0 - mix) * delta_fast)
                 else:
-                    think_ring, think_ptr, think_delta = _think_step(think_ring, think_ptr, float(self.think_alpha))
+                    think_ptr, think_delta = self._think_ring_step(
+                        think_ring, think_ptr, think_inp, float(self.think_alpha), think_ema, active_mask, batch_idx
+                    )
+                if think_delta.dtype != h_new.dtype:
+                    think_delta = think_delta.to(h_new.dtype)
 
                 if str(self.think_mode) == "replace":
                     h_new = think_delta
@@ -1224,20 +1540,19 @@ class AbsoluteHallway(nn.Module):
             # Freeze hidden for inactive samples.
             upd = torch.where(active_mask.unsqueeze(1), h_new, prev_h)
             h = upd
-            nan_guard("upd", upd, t)
+            nan_guard("upd", upd, t, enabled=nan_on)
 
             # Vault write on EOS.
-            if vault_active and eos_mask is not None and vault_ring is not None and vault_ptr is not None:
+            if vault_active and t in eos_steps and vault_ring is not None and vault_ptr is not None:
+                assert eos_mask is not None
                 mask_t = eos_mask[:, t]
-                if bool(mask_t.any()):
-                    idx = torch.arange(B, device=device)
-                    assert self.vault_down is not None
-                    write_vec = self.vault_down(upd)
-                    if write_vec.dtype != vault_ring.dtype:
-                        write_vec = write_vec.to(vault_ring.dtype)
-                    vault_ring[idx[mask_t], vault_ptr[mask_t]] = write_vec[mask_t]
-                    vault_ptr = (vault_ptr + mask_t.to(torch.long)) % int(self.vault_len)
-                    vault_updates += int(mask_t.sum().item())
+                assert self.vault_down is not None
+                write_vec = self.vault_down(upd)
+                if write_vec.dtype != vault_ring.dtype:
+                    write_vec = write_vec.to(vault_ring.dtype)
+                self._masked_slot_write(vault_ring, batch_idx, vault_ptr, write_vec, mask_t)
+                vault_ptr = (vault_ptr + mask_t.to(torch.long)) % int(self.vault_len)
+                vault_updates = vault_updates + mask_t.sum()
 
             if collect_xray:
                 h_abs_sum += float(upd.abs().sum().item())
@@ -1246,9 +1561,9 @@ class AbsoluteHallway(nn.Module):
                 h_abs_count_step += int(upd.numel())
 
             # State loop metrics (mode sequence).
-            if self.state_loop_metrics and (t % int(self.state_loop_every) == 0):
+            if state_loop_on and (t % int(self.state_loop_every) == 0):
                 loop_active = active_mask[:loop_samples]
-                proj = upd[:loop_samples] @ self.state_loop_proj.to(device)
+                proj = upd[:loop_samples] @ state_loop_proj
                 mode = torch.argmax(proj, dim=1)
                 mode_counts += torch.bincount(mode, minlength=int(self.state_loop_dim))
                 if int(mode_prev[0].item()) == -1:
@@ -1301,12 +1616,8 @@ class AbsoluteHallway(nn.Module):
 
                 # Baseline inertia override (compat).
                 base_inertia = float(getattr(self, "ptr_inertia_base", self.ptr_inertia))
-                inertia_override = os.environ.get("VRX_PTR_INERTIA_OVERRIDE")
-                if inertia_override is not None:
-                    try:
-                        base_inertia = float(inertia_override)
-                    except Exception:
-                        pass
+                if rtc.ptr_inertia_override is not None:
+                    base_inertia = float(rtc.ptr_inertia_override)
                 self.ptr_inertia = float(base_inertia)
 
                 # Attention mass after any warp.
@@ -1365,7 +1676,7 @@ class AbsoluteHallway(nn.Module):
                 walk_use = torch.full((B,), float(self.ptr_walk_prob), device=device, dtype=ptr_dtype)
 
                 # Respect manual steering override: disable neural heads.
-                if os.environ.get("VRX_PTR_INERTIA_OVERRIDE") is None:
+                if not rtc.ptr_inertia_override_set:
                     inertia_use = torch.sigmoid(self.inertia_head(upd)).squeeze(1).to(ptr_dtype)
                     deadzone_use = F.softplus(self.deadzone_head(upd)).squeeze(1).to(ptr_dtype)
                     walk_use = torch.sigmoid(self.walk_head(upd)).squeeze(1).to(ptr_dtype)
@@ -1374,26 +1685,27 @@ class AbsoluteHallway(nn.Module):
                 deadzone_use = torch.clamp(deadzone_use, min=0.0)
                 walk_use = torch.clamp(walk_use, 0.0, 1.0)
 
-                ctrl_inertia_tensor_pre = inertia_use.mean()
-                ctrl_inertia_pre = float(ctrl_inertia_tensor_pre.item())
+                if telemetry:
+                    ctrl_inertia_pre = float(inertia_use.mean().item())
 
                 inertia_floor = float(getattr(self, "ptr_inertia_floor", 0.0) or 0.0)
                 if inertia_floor > 0.0:
                     inertia_floor = min(inertia_floor, 0.99)
                     inertia_use = torch.clamp(inertia_use, min=inertia_floor)
 
-                ctrl_inertia_tensor = inertia_use.mean()
-                ctrl_inertia_mean = float(ctrl_inertia_tensor.item())
-                ctrl_deadzone_mean = float(deadzone_use.mean().item())
-                ctrl_walk_mean = float(walk_use.mean().item())
+                if telemetry:
+                    ctrl_inertia_tensor = inertia_use.mean()
+                    ctrl_inertia_mean = float(ctrl_inertia_tensor.item())
+                    ctrl_deadzone_mean = float(deadzone_use.mean().item())
+                    ctrl_walk_mean = float(walk_use.mean().item())
 
-                self.ptr_inertia_dyn_pre = ctrl_inertia_pre
-                self.ptr_inertia_dyn = ctrl_inertia_mean
-                self.ptr_inertia_dyn_tensor = ctrl_inertia_tensor
+                    self.ptr_inertia_dyn_pre = ctrl_inertia_pre
+                    self.ptr_inertia_dyn = ctrl_inertia_mean
+                    self.ptr_inertia_dyn_tensor = ctrl_inertia_tensor
 
                 theta_ptr, theta_gate = self._gather_params(ptr_float)
                 jump_logits = self.jump_score(upd).squeeze(1) + theta_gate
-                nan_guard("jump_logits", jump_logits, t)
+                nan_guard("jump_logits", jump_logits, t, enabled=nan_on)
 
                 p = torch.sigmoid(jump_logits)
                 if 0.0 < float(PTR_JUMP_CAP) < 1.0:
@@ -1417,9 +1729,10 @@ class AbsoluteHallway(nn.Module):
                 ptr_float = self.circ_lerp(non_jump_ptr, target_ste, p, ring_range)
 
                 # Raw (pre-inertia) velocity.
-                ptr_float_pre = torch.where(active_mask, ptr_float, prev_ptr)
-                delta_pre = self.wrap_delta(prev_ptr, ptr_float_pre, ring_range)
-                raw_movement_cost = raw_movement_cost + delta_pre.abs().mean()
+                if telemetry:
+                    ptr_float_pre = torch.where(active_mask, ptr_float, prev_ptr)
+                    delta_pre = self.wrap_delta(prev_ptr, ptr_float_pre, ring_range)
+                    raw_movement_cost = raw_movement_cost + delta_pre.abs().mean()
 
                 # Inertia (stay-bias).
                 if bool((inertia_use > 0.0).any()):
@@ -1458,9 +1771,16 @@ class AbsoluteHallway(nn.Module):
                 step_units = torch.floor(ptr_residual.abs() / min_step) * torch.sign(ptr_residual)
                 step_units = torch.clamp(step_units, -1.0, 1.0)
                 click_mask = step_units != 0
-                if bool(click_mask.any()):
-                    anchor_clicks = int(click_mask.sum().item())
-                    ptr_anchor = torch.remainder(ptr_anchor + step_units * min_step, float(ring_range))
+                # A zero step leaves anchor and residual unchanged, so the
+                # inference path applies it unconditionally (no host sync).
+                if not telemetry or bool(click_mask.any()):
+                    if telemetry:
+                        anchor_clicks = int(click_mask.sum().item())
+                    if anchor_idx is not None:
+                        anchor_idx = torch.remainder(anchor_idx + step_units.long(), lattice_n)
+                        ptr_anchor = anchor_idx.to(res_dtype) * min_step
+                    else:
+                        ptr_anchor = torch.remainder(ptr_anchor + step_units * min_step, float(ring_range))
                     ptr_residual = ptr_residual - step_units * min_step
 
             ptr_float = torch.remainder(ptr_anchor + ptr_residual, float(ring_range))
@@ -1470,8 +1790,8 @@ class AbsoluteHallway(nn.Module):
 
             # When pointer is blocked, keep anchor/residual consistent.
             if self.ptr_lock or self.time_pointer or (not update_allowed) or (int(self.ptr_warmup_steps) > 0 and t < int(self.ptr_warmup_steps)):
-                ptr_anchor = torch.remainder(torch.round(ptr_float.to(torch.float64) / min_step) * min_step, float(ring_range))
-                ptr_residual = self.wrap_delta(ptr_anchor, ptr_float.to(torch.float64), ring_range)
+                anchor_idx, ptr_anchor = self._anchor_snap(ptr_float.to(res_dtype), min_step, lattice_n, anchor_fixed)
+                ptr_residual = self.wrap_delta(ptr_anchor, ptr_float.to(res_dtype), ring_range)
                 if self.ptr_vel_enabled:
                     ptr_vel = torch.where(active_mask, ptr_vel, torch.zeros_like(ptr_vel))
                 ptr_float = torch.where(active_mask, ptr_float, prev_ptr)
@@ -1479,11 +1799,12 @@ class AbsoluteHallway(nn.Module):
             # Hard clamp for safety.
             ptr_float = torch.nan_to_num(ptr_float, nan=0.0, posinf=float(ring_range - 1), neginf=0.0)
             ptr_float = torch.remainder(ptr_float, float(ring_range))
-            nan_guard("ptr_float", ptr_float, t)
+            nan_guard("ptr_float", ptr_float, t, enabled=nan_on)
 
             # Movement cost (wrap-aware).
-            delta = torch.remainder(ptr_float - prev_ptr + float(ring_range) / 2.0, float(ring_range)) - float(ring_range) / 2.0
-            movement_cost = movement_cost + delta.abs().mean()
+            if telemetry:
+                delta = torch.remainder(ptr_float - prev_ptr + float(ring_range) / 2.0, float(ring_range)) - float(ring_range) / 2.0
+                movement_cost = movement_cost + delta.abs().mean()
 
             # Update history tensorized: prepend read ptr, drop last.
             ptr_float_phys = torch.remainder(ptr_float, float(ring_range))
@@ -1498,12 +1819,8 @@ class AbsoluteHallway(nn.Module):
             if self.ptr_phantom_read:
                 ptr_float_phys = ptr_int.float()
 
-            res_mean = float(ptr_residual.abs().mean().item())
-            self.ptr_residual_mean = res_mean
-            self.ptr_orbit = 2 if res_mean >= (min_step * 0.1) else 1
-
             # Debug stats (opt-in).
-            if bool(DEBUG_STATS) and (int(DEBUG_EVERY) <= 0 or (t % int(DEBUG_EVERY) == 0)):
+            if telemetry and bool(DEBUG_STATS) and (int(DEBUG_EVERY) <= 0 or (t % int(DEBUG_EVERY) == 0)):
                 stats = {
                     "active_rate": float(active_mask.float().mean().item()),
                     "ptr_float_min": float(ptr_float.min().item()),
@@ -1553,113 +1870,113 @@ class AbsoluteHallway(nn.Module):
                 stats["ptr_kernel"] = str(self.ptr_kernel)
                 self.debug_stats = stats
 
-            last_ptrs = torch.cat([ptr_read_int.view(B, 1), last_ptrs[:, :-1]], dim=1)
-
-            bins = torch.bucketize(ptr_int.float(), self.bin_edges.to(device)) - 1
-            bins = bins.clamp(0, self.pointer_hist_bins - 1)
+            last_ptrs[:, last_ptrs_head] = ptr_read_int
+            last_ptrs_head = (last_ptrs_head + 1) % blur_window
 
-            if bool(active_mask.any()):
-                active_bins = bins[active_mask]
-                step_counts = torch.bincount(active_bins, minlength=self.pointer_hist_bins)
-            else:
-                step_counts = torch.zeros_like(hist)
-            hist = hist + step_counts
+            if telemetry:
+                bins = self._ptr_bins(ptr_int)
+                if bool(active_mask.any()):
+                    active_bins = bins[active_mask]
+                    step_counts = torch.bincount(active_bins, minlength=self.pointer_hist_bins)
+                else:
+                    step_counts = torch.zeros_like(hist)
+                hist = hist + step_counts
 
             # Pointer trace metrics (only count active samples).
             if prev_ptr_int is None:
                 prev_ptr_int = ptr_int
                 prev_prev_ptr_int = ptr_int
-                dwell_len = torch.where(active_mask, torch.ones_like(dwell_len), dwell_len)
-                max_dwell = torch.maximum(max_dwell, dwell_len)
+                if telemetry:
+                    dwell_len = torch.where(active_mask, torch.ones_like(dwell_len), dwell_len)
+                    max_dwell = torch.maximum(max_dwell, dwell_len)
             else:
                 flip = active_mask & (ptr_int != prev_ptr_int)
                 flip_count = flip_count + flip.long()
-                dwell_len = torch.where(
-                    active_mask,
-                    torch.where(flip, torch.ones_like(dwell_len), dwell_len + 1),
-                    dwell_len,
-                )
-                max_dwell = torch.maximum(max_dwell, dwell_len)
-                pingpong = active_mask & (ptr_int == prev_prev_ptr_int) & (ptr_int != prev_ptr_int)
-                pingpong_count = pingpong_count + pingpong.long()
+                if telemetry:
+                    dwell_len = torch.where(
+                        active_mask,
+                        torch.where(flip, torch.ones_like(dwell_len), dwell_len + 1),
+                        dwell_len,
+                    )
+                    max_dwell = torch.maximum(max_dwell, dwell_len)
+                    pingpong = active_mask & (ptr_int == prev_prev_ptr_int) & (ptr_int != prev_ptr_int)
+                    pingpong_count = pingpong_count + pingpong.long()
                 prev_prev_ptr_int = prev_ptr_int
                 prev_ptr_int = ptr_int
 
-            total_active_steps += int(active_mask.sum().item())
             active_steps_per_sample += active_mask.long()
 
             # Optional auto-adjust pointer update cadence.
-            if self.ptr_update_auto and (t % int(self.ptr_update_every_step) == 0) and total_active_steps > 0:
-                flip_rate = float(flip_count.sum().item() / max(1, total_active_steps))
-                if self.ptr_update_ema_state is None:
-                    ema = flip_rate
-                else:
-                    ema = float(self.ptr_update_ema) * float(self.ptr_update_ema_state) + (1.0 - float(self.ptr_update_ema)) * flip_rate
-                self.ptr_update_ema_state = ema
-                if ema > float(self.ptr_update_target_flip):
-                    self.ptr_update_every = min(int(self.ptr_update_max), int(self.ptr_update_every) + 1)
-                elif ema < float(self.ptr_update_target_flip) * 0.5:
-                    self.ptr_update_every = max(int(self.ptr_update_min), int(self.ptr_update_every) - 1)
-
-            # Satiety check (optionally soft slice readout).
-            if self.soft_readout:
-                k = int(self.soft_readout_k)
-                offsets_sr = torch.arange(-k, k + 1, device=device, dtype=ptr_float_phys.dtype)
-                pos_idx_sr, w_sr, _ = self._compute_kernel_weights(
-                    ptr_read_phys, offsets_sr, ring_range, tau_override=float(self.soft_readout_tau)
-                )
-                pos_idx_exp_sr = pos_idx_sr.unsqueeze(-1).expand(-1, -1, self.slot_dim)
-                gathered_sr = state.gather(1, pos_idx_exp_sr)
-                fused_sr = (w_sr.unsqueeze(-1) * gathered_sr.to(w_sr.dtype)).sum(dim=1)
-                if fused_sr.dtype != state.dtype:
-                    fused_sr = fused_sr.to(state.dtype)
-                fused = fused_sr
-            else:
-                gather_idx = last_ptrs.clamp(0, ring_range - 1)
-                gather_idx_exp = gather_idx.unsqueeze(-1).expand(-1, -1, self.slot_dim)
-                gathered = state.gather(1, gather_idx_exp)
-                fused = gathered.mean(dim=1)
-
-            if fused.dtype != h.dtype:
-                fused = fused.to(h.dtype)
-
-            read_vec = fused + h
-            expert_ids = self._map_expert_ids(ptr_int)
-            logits_step = self.head(read_vec, expert_ids)
-            nan_guard("logits_step", logits_step, t)
-
-            if satiety_enabled:
+            if self.ptr_update_auto and (t % int(self.ptr_update_every_step) == 0):
+                total_active_steps = int(active_steps_per_sample.sum().item())
+                if total_active_steps > 0:
+                    flip_rate = float(flip_count.sum().item() / max(1, total_active_steps))
+                    if self.ptr_update_ema_state is None:
+                        ema = flip_rate
+                    else:
+                        ema = float(self.ptr_update_ema) * float(self.ptr_update_ema_state) + (1.0 - float(self.ptr_update_ema)) * flip_rate
+                    self.ptr_update_ema_state = ema
+                    if ema > float(self.ptr_update_target_flip):
+                        self.ptr_update_every = min(int(self.ptr_update_max), int(self.ptr_update_every) + 1)
+                    elif ema < float(self.ptr_update_target_flip) * 0.5:
+                        self.ptr_update_every = max(int(self.ptr_update_min), int(self.ptr_update_every) - 1)
+
+            # Lazy readout: heads are only evaluated on steps whose output is
+            # consumed (satiety checks and the final step).
+            satiety_check = satiety_enabled and (t % satiety_every) == 0
+            if satiety_check:
+                logits_step = self._readout_step(state, h, ptr_int, ptr_read_phys, last_ptrs, offsets_sr)
+                nan_guard("logits_step", logits_step, t, enabled=nan_on)
                 probs = torch.softmax(logits_step, dim=1)
                 confident = probs.max(dim=1).values > float(SATIETY_THRESH)
                 satiety_exited = satiety_exited | confident
-
-            # Final readout for return value: by default, read current ptr bin.
-            if self.soft_readout:
-                logits = logits_step
-            else:
-                gather_idx2 = ptr_int.clamp(0, ring_range - 1).unsqueeze(1).unsqueeze(2)  # [B,1,1]
-                gather_idx2_exp = gather_idx2.expand(-1, 1, self.slot_dim)
-                fused2 = state.gather(1, gather_idx2_exp).squeeze(1)
-                if fused2.dtype != h.dtype:
-                    fused2 = fused2.to(h.dtype)
-                read_vec2 = fused2 + h
-                logits = self.head(read_vec2, expert_ids)
-                nan_guard("logits_final_step", logits, t)
+                any_active = bool((~satiety_exited).any())
+
+            if t == T - 1 or not any_active:
+                # Final readout for return value: by default, read current ptr bin.
+                if self.soft_readout:
+                    if not satiety_check:
+                        logits_step = self._readout_step(state, h, ptr_int, ptr_read_phys, last_ptrs, offsets_sr)
+                    logits = logits_step
+                else:
+                    gather_idx2 = ptr_int.clamp(0, ring_range - 1).unsqueeze(1).unsqueeze(2)  # [B,1,1]
+                    gather_idx2_exp = gather_idx2.expand(-1, 1, self.slot_dim)
+                    fused2 = state.gather(1, gather_idx2_exp).squeeze(1)
+                    if fused2.dtype != h.dtype:
+                        fused2 = fused2.to(h.dtype)
+                    read_vec2 = fused2 + h
+                    logits = self.head(read_vec2, self._map_expert_ids(ptr_int))
+                    nan_guard("logits_final_step", logits, t, enabled=nan_on)
 
         # ---------------------------------
         # End loop: finalize telemetry
         # ---------------------------------
-        self.pointer_hist = hist.detach().cpu()
+        if inference:
+            # Device-resident telemetry: callers accumulate it on device and
+            # sync once, so nothing here forces a host round-trip.
+            self.satiety_exits = satiety_exited.sum()
+            self.last_ptr_bins = self._ptr_bins(ptr_int).detach()
+            self.last_ptr_int = ptr_int.detach()
+            self._update_expert_stats(self._map_expert_ids(ptr_int), sync=False)
+            steps = active_steps_per_sample.sum().clamp(min=1)
+            self.ptr_flip_rate = flip_count.sum().to(torch.float32) / steps
+            return logits, torch.zeros((), device=device, dtype=x.dtype)
+
         self.satiety_exits = int(satiety_exited.sum().item())
 
-        last_bins = torch.bucketize(ptr_int.float(), self.bin_edges.to(device)) - 1
-        last_bins = last_bins.clamp(0, self.pointer_hist_bins - 1).detach().cpu()
+        last_bins = self._ptr_bins(ptr_int).detach().cpu()
         self.last_ptr_bins = last_bins
         self.last_ptr_int = ptr_int.detach().cpu()
         self._update_expert_stats(self._map_expert_ids(ptr_int))
 
-        denom = max(1, total_active_steps)
+        denom = max(1, int(active_steps_per_sample.sum().item()))
         self.ptr_flip_rate = float(flip_count.sum().item()) / denom
+
+        res_mean = float(ptr_residual.abs().mean().item())
+        self.ptr_residual_mean = res_mean
+        self.ptr_orbit = 2 if res_mean >= (min_step * 0.1) else 1
+        self.pointer_hist = hist.detach().cpu()
+
         self.ptr_pingpong_rate = float(pingpong_count.sum().item()) / denom
         self.ptr_max_dwell = int(max_dwell.max().item()) if max_dwell.numel() else 0
         mean_dwell = active_steps_per_sample.float() / (flip_count.float() + 1.0)
@@ -1681,7 +1998,7 @@ class AbsoluteHallway(nn.Module):
         steps_used = max(1, t + 1 if T > 0 else 1)
 
         if vault_active:
-            self.vault_inj_rate = float(vault_injections / max(1, T))
+            self.vault_inj_rate = float(vault_injections) / max(1, T)
             self.vault_updates = int(vault_updates)
         else:
             self.vault_inj_rate = 0.0
@@ -225,7 +225,10 @@ class LocationExpertRouter(nn.Module):
         else:
             expidx = pointer_addresses.to(torch.long, non_blocking=True) % self.num_experts
 
-        outdty = explst[0].weight.dtype
+        # int8 dynamic-quantized experts expose ``weight`` as a method and
+        # produce activations in the input dtype.
+        weight = explst[0].weight
+        outdty = weight.dtype if torch.is_tensor(weight) else x.dtype
         outten = torch.zeros(x.shape[0], explst[0].out_features, device=x.device, dtype=outdty)
 
         for idxsix, expsix in enumerate(explst):
@@ -0,0 +1,112 @@
+"""Int8 dynamic-quantized CPU inference export for AbsoluteHallway.
+
+Converts the matmul-heavy submodules to int8-weight / fp32-activation kernels
+(``torch.ao`` dynamic quantization, fbgemm/qnnpack on CPU):
+  - gru, input_proj
+  - think_gru (think ring), sensory_gru (sensory pre-ring)
+  - LocationExpertRouter linears (head.single or head.experts.N)
+
+Everything else (ring state, pointer heads, projections into the auxiliary
+rings) stays fp32. The export is inference-only: it operates on a deep copy,
+leaves the source model untouched and returns the copy in eval mode.
+
+Use ``accuracy_delta`` to compare eval summaries of the fp32 and int8 models
+(see tools/eval_ckpt_assoc_byte.py --int8).
+"""
+
+from __future__ import annotations
+
+import copy
+import warnings
+from typing import Any, Dict, List, Mapping, Optional
+
+import torch
+import torch.nn as nn
+
+# Submodule names converted to int8 (when present on the model).
+INT8_MODULES = ("gru", "input_proj", "think_gru", "sensory_gru")
+
+
+def int8_module_names(model: nn.Module) -> List[str]:
+    """Qualified names of the submodules ``quantize_dynamic_int8`` converts."""
+
+    names: List[str] = []
+    for namstr in INT8_MODULES:
+        if isinstance(getattr(model, namstr, None), (nn.Linear, nn.GRUCell)):
+            names.append(namstr)
+
+    head = getattr(model, "head", None)
+    if head is not None:
+        for subnam, submod in head.named_modules():
+            if subnam and isinstance(submod, nn.Linear):
+                names.append(f"head.{subnam}")
+    return names
+
+
+def quantize_dynamic_int8(model: nn.Module, *, names: Optional[List[str]] = None) -> nn.Module:
+    """Return an int8 dynamic-quantized CPU copy of ``model`` for inference.
+
+    Raises RuntimeError when this torch build has no dynamic quantization
+    support.
+    """
+
+    try:
+        from torch.ao.quantization import default_dynamic_qconfig, quantize_dynamic
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(f"int8 dynamic quantization unavailable in this torch build: {exc}") from exc
+
+    qmodel = copy.deepcopy(model).to(device="cpu", dtype=torch.float32)
+    qmodel.eval()
+    spec = {namstr: default_dynamic_qconfig for namstr in (names if names is not None else int8_module_names(qmodel))}
+    if not spec:
+        return qmodel
+
+    with warnings.catch_warnings():
+        # torch.ao eager quantization emits deprecation notices on recent builds.
+        warnings.simplefilter("ignore")
+        return quantize_dynamic(qmodel, qconfig_spec=spec, dtype=torch.qint8, inplace=True)
+
+
+def _tensor_bytes(tenval: Optional[torch.Tensor]) -> int:
+    return int(tenval.numel() * tenval.element_size()) if torch.is_tensor(tenval) else 0
+
+
+def state_bytes(model: nn.Module) -> int:
+    """Weight bytes: float params/buffers plus packed int8 weights and their biases."""
+
+    total = 0
+    for modobj in model.modules():
+        for tenval in list(modobj.parameters(recurse=False)) + list(modobj.buffers(recurse=False)):
+            total += _tensor_bytes(tenval)
+        if not callable(getattr(modobj, "_weight_bias", None)):
+            continue
+        # int8 dynamic modules: Linear returns (weight, bias), GRU cells return
+        # {"weight": {...}, "bias": {...}}.
+        wbval = modobj._weight_bias()
+        if isinstance(wbval, dict):
+            wbval = tuple(wbval["weight"].values()) + tuple(wbval["bias"].values())
+        for tenval in wbval:
+            total += _tensor_bytes(tenval)
+    return int(total)
+
+
+def accuracy_delta(fp32_eval: Mapping[str, Any], int8_eval: Mapping[str, Any]) -> Dict[str, Optional[float]]:
+    """int8 - fp32 for every numeric metric present in both eval summaries."""
+
+    delta: Dict[str, Optional[float]] = {}
+    for keystr, refval in fp32_eval.items():
+        newval = int8_eval.get(keystr)
+        if isinstance(refval, bool) or isinstance(newval, bool):
+            continue
+        if isinstance(refval, (int, float)) and isinstance(newval, (int, float)):
+            delta[keystr] = float(newval) - float(refval)
+    return delta
+
+
+__all__ = [
+    "INT8_MODULES",
+    "accuracy_delta",
+    "int8_module_names",
+    "quantize_dynamic_int8",
+    "state_bytes",
+]
@@ -0,0 +1,234 @@
+"""Frozen runtime configuration snapshot for INSTNCT.
+
+The model and the train loops historically re-read ``VRX_*`` env vars at call
+time (several times per timestep for ``VRX_NAN_GUARD`` and
+``VRX_PTR_INERTIA_OVERRIDE``). :class:`RuntimeConfig` captures those knobs once
+into an immutable, typed object that is cached on the model and read from the
+hot paths instead.
+
+Semantics:
+- Parsing matches the legacy per-call reads exactly (strict "1" flags, tolerant
+  float/int parsing with defaults).
+- A snapshot never changes after construction. Call :func:`reload` (or build a
+  new snapshot with :meth:`RuntimeConfig.from_env`) after mutating the env,
+  e.g. in tests.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from vraxion.settings import Settings, load_settings
+
+
+def _env_is_one(env: Mapping[str, str], name: str, default: bool = False) -> bool:
+    """Legacy boolean semantics: only the literal string '1' enables."""
+    val = env.get(name)
+    if val is None:
+        return default
+    return str(val).strip() == "1"
+
+
+def _env_float(env: Mapping[str, str], name: str, default: float) -> float:
+    val = env.get(name)
+    if val is None or str(val).strip() == "":
+        return float(default)
+    try:
+        return float(val)
+    except Exception:
+        return float(default)
+
+
+def _env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    val = env.get(name)
+    if val is None or str(val).strip() == "":
+        return int(default)
+    try:
+        return int(float(val))
+    except Exception:
+        return int(default)
+
+
+def _env_opt_int(env: Mapping[str, str], name: str) -> Optional[int]:
+    # Matches the legacy ``int(raw) if raw else default`` reads (strict int).
+    val = env.get(name)
+    return int(val) if val else None
+
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Immutable snapshot of the env knobs read by the model and train loops."""
+
+    # ---- Hot-path knobs (read per step in the legacy code) ----
+    nan_guard: bool
+    ptr_inertia_override_set: bool
+    ptr_inertia_override: Optional[float]
+    force_cadence_1: bool
+    ignore_max_steps: bool
+
+    # ---- Model construction knobs ----
+    usage_soft: bool
+    usage_soft_temp: float
+
+    sensory_ring: bool
+    sensory_ring_len: Optional[int]
+    sensory_slot_dim: Optional[int]
+
+    vault: bool
+    vault_len: int
+    vault_dim: int
+    vault_decay: float
+    vault_inject_scale: float
+    vault_adapt: bool
+    vault_gate_min: float
+    vault_gate_max: float
+    vault_alpha_min: float
+    vault_alpha_max: float
+    vault_k_surprise: float
+    vault_k_utility: float
+    vault_probe_every: int
+    vault_probe_beta: float
+
+    think_ring: bool
+    think_mode: str
+    think_len: int
+    think_dim: int
+    think_alpha: float
+    think_dual: bool
+    think_alpha_low: float
+    think_alpha_high: float
+    think_mix: float
+    think_brainstem: bool
+    think_brainstem_every: int
+    think_brainstem_dt: float
+    think_write_ema: bool
+    think_alpha_adapt: bool
+    think_alpha_min: float
+    think_alpha_max: float
+    think_alpha_beta: float
+    think_alpha_jitter_low: float
+    think_alpha_jitter_high: float
+
+    # Optional full settings snapshot (see :func:`vraxion.settings.load_settings`).
+    settings: Optional[Settings] = None
+
+    @classmethod
+    def from_env(
+        cls,
+        env: Optional[Mapping[str, str]] = None,
+        *,
+        settings: Optional[Settings] = None,
+    ) -> "RuntimeConfig":
+        """Build a snapshot from ``env`` (defaults to ``os.environ``)."""
+
+        envmap = os.environ if env is None else env
+
+        override_raw = envmap.get("VRX_PTR_INERTIA_OVERRIDE")
+        override_val: Optional[float] = None
+        if override_raw is not None:
+            try:
+                override_val = float(override_raw)
+            except Exception:
+                override_val = None
+
+        sensory_flag = envmap.get("VRX_SENSORY_RING", "1").strip().lower()
+
+        think_alpha = _env_float(envmap, "VRX_THINK_RING_ALPHA", 0.1)
+
+        # Mix semantics: VRX_THINK_RING_MIX is *slow* share.
+        think_mix = _env_float(envmap, "VRX_THINK_RING_MIX", 0.5)
+        fast_share = envmap.get("VRX_THINK_RING_FAST_SHARE")
+        if fast_share is not None and str(fast_share).strip() != "":
+            try:
+                think_mix = 1.0 - float(fast_share)
+            except Exception:
+                pass
+
+        return cls(
+            nan_guard=envmap.get("VRX_NAN_GUARD", "0").strip() == "1",
+            ptr_inertia_override_set=override_raw is not None,
+            ptr_inertia_override=override_val,
+            force_cadence_1=envmap.get("VRX_FORCE_CADENCE_1") == "1",
+            ignore_max_steps=envmap.get("VRX_IGNORE_MAX_STEPS") == "1",
+            usage_soft=_env_is_one(envmap, "VRX_USAGE_SOFT", default=False),
+            usage_soft_temp=_env_float(envmap, "VRX_USAGE_SOFT_TEMP", 0.5),
+            sensory_ring=sensory_flag not in {"0", "false", "off", "no"},
+            sensory_ring_len=_env_opt_int(envmap, "VRX_SENSORY_RING_LEN"),
+            sensory_slot_dim=_env_opt_int(envmap, "VRX_SENSORY_SLOT_DIM"),
+            vault=_env_is_one(envmap, "VRX_VAULT", default=False),
+            vault_len=_env_int(envmap, "VRX_VAULT_LEN", 32),
+            vault_dim=_env_int(envmap, "VRX_VAULT_DIM", 128),
+            vault_decay=_env_float(envmap, "VRX_VAULT_DECAY", 0.3),
+            vault_inject_scale=_env_float(envmap, "VRX_VAULT_INJECT_SCALE", 0.2),
+            vault_adapt=_env_is_one(envmap, "VRX_VAULT_ADAPT", default=False),
+            vault_gate_min=_env_float(envmap, "VRX_VAULT_GATE_MIN", 0.0),
+            vault_gate_max=_env_float(envmap, "VRX_VAULT_GATE_MAX", 0.6),
+            vault_alpha_min=_env_float(envmap, "VRX_VAULT_ALPHA_MIN", 0.05),
+            vault_alpha_max=_env_float(envmap, "VRX_VAULT_ALPHA_MAX", 0.5),
+            vault_k_surprise=_env_float(envmap, "VRX_VAULT_K_SURPRISE", 0.25),
+            vault_k_utility=_env_float(envmap, "VRX_VAULT_K_UTILITY", 0.25),
+            vault_probe_every=_env_int(envmap, "VRX_VAULT_PROBE_EVERY", 200),
+            vault_probe_beta=_env_float(envmap, "VRX_VAULT_PROBE_BETA", 0.9),
+            think_ring=_env_is_one(envmap, "VRX_THINK_RING", default=False),
+            think_mode=envmap.get("VRX_THINK_RING_MODE", "parallel").strip().lower(),
+            think_len=_env_int(envmap, "VRX_THINK_RING_LEN", 128),
+            think_dim=_env_int(envmap, "VRX_THINK_RING_DIM", 21),
+            think_alpha=think_alpha,
+            think_dual=_env_is_one(envmap, "VRX_THINK_RING_DUAL", default=False),
+            think_alpha_low=_env_float(envmap, "VRX_THINK_RING_ALPHA_LOW", think_alpha),
+            think_alpha_high=_env_float(envmap, "VRX_THINK_RING_ALPHA_HIGH", think_alpha),
+            think_mix=think_mix,
+            think_brainstem=_env_is_one(envmap, "VRX_THINK_RING_BRAINSTEM", default=False),
+            think_brainstem_every=_env_int(envmap, "VRX_THINK_RING_BRAINSTEM_EVERY", 1),
+            think_brainstem_dt=_env_float(envmap, "VRX_THINK_RING_BRAINSTEM_DT", 1.0),
+            think_write_ema=_env_is_one(envmap, "VRX_THINK_RING_WRITE_EMA", default=False),
+            think_alpha_adapt=_env_is_one(envmap, "VRX_THINK_ALPHA_ADAPT", default=False),
+            think_alpha_min=_env_float(envmap, "VRX_THINK_ALPHA_MIN", think_alpha),
+            think_alpha_max=_env_float(envmap, "VRX_THINK_ALPHA_MAX", think_alpha),
+            think_alpha_beta=_env_float(envmap, "VRX_THINK_ALPHA_BETA", 0.95),
+            think_alpha_jitter_low=_env_float(envmap, "VRX_THINK_ALPHA_JITTER_LOW", 0.02),
+            think_alpha_jitter_high=_env_float(envmap, "VRX_THINK_ALPHA_JITTER_HIGH", 0.08),
+            settings=settings,
+        )
+
+
+_CURRENT: Optional[RuntimeConfig] = None
+
+
+def reload() -> RuntimeConfig:
+    """Rebuild the process-wide snapshot from the current env and settings."""
+
+    global _CURRENT
+    _CURRENT = RuntimeConfig.from_env(settings=load_settings())
+    return _CURRENT
+
+
+def get_runtime_config() -> RuntimeConfig:
+    """Return the process-wide snapshot, building it on first use."""
+
+    if _CURRENT is None:
+        return reload()
+    return _CURRENT
+
+
+def runtime_config_for(model: object) -> RuntimeConfig:
+    """Snapshot cached on ``model`` (see AbsoluteHallway), else a fresh one from the env.
+
+    Train loops call this once before their step loop and read per-step knobs
+    from the result instead of ``os.environ``.
+    """
+
+    rtc = getattr(model, "runtime_config", None)
+    if isinstance(rtc, RuntimeConfig):
+        return rtc
+    return RuntimeConfig.from_env()
+
+
+__all__ = [
+    "RuntimeConfig",
+    "get_runtime_config",
+    "reload",
+    "runtime_config_for",
+]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
 import torch
 
 import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
 
+from vraxion.instnct import absolute_hallway
 from vraxion.instnct.absolute_hallway import AbsoluteHallway
 
 
@@ -132,5 +134,304 @@ class AbsoluteHallwayTests(unittest.TestCase):
             self.assertTrue(torch.isfinite(logits).all().item())
             self.assertTrue(torch.isfinite(move_penalty).all().item())
 
+    def test_ptr_bins_match_bucketize(self) -> None:
+        with conftest.temporary_env(
+            VRX_SENSORY_RING="0",
+            VRX_VAULT="0",
+            VRX_THINK_RING="0",
+        ):
+            for ring_len in (8, 100, 127, 128, 129, 1000, 8192):
+                model = AbsoluteHallway(input_dim=1, num_classes=2, ring_len=ring_len, slot_dim=8)
+                ptr_int = torch.arange(model.ring_range, dtype=torch.long)
+                legacy = (torch.bucketize(ptr_int.float(), model.bin_edges) - 1).clamp(0, model.pointer_hist_bins - 1)
+                self.assertTrue(torch.equal(model._ptr_bins(ptr_int), legacy), msg=f"ring_len={ring_len}")
+
+    def test_blur_window_ring_buffer_forward(self) -> None:
+        with conftest.temporary_env(
+            VRX_SENSORY_RING="0",
+            VRX_VAULT="0",
+            VRX_THINK_RING="0",
+            VRX_NAN_GUARD=None,
+        ):
+            model = AbsoluteHallway(
+                input_dim=4,
+                num_classes=3,
+                ring_len=8,
+                slot_dim=16,
+                ptr_stride=1,
+                gauss_k=1,
+                gauss_tau=2.0,
+            ).cpu()
+            model.blur_window = 3
+            model.train()
+
+            x = torch.randn(2, 6, 4, dtype=torch.float32)
+            logits, move_penalty = model(x)
+            (logits.sum() + move_penalty).backward()
+
+            self.assertEqual(tuple(logits.shape), (2, 3))
+            self.assertTrue(torch.isfinite(logits).all().item())
+            self.assertIsNotNone(model.input_proj.weight.grad)
+
+    def test_lazy_readout_head_call_count(self) -> None:
+        from vraxion.instnct import absolute_hallway as ah
+
+        with conftest.temporary_env(
+            VRX_SENSORY_RING="0",
+            VRX_VAULT="0",
+            VRX_THINK_RING="0",
+            VRX_NAN_GUARD=None,
+        ):
+            model = AbsoluteHallway(input_dim=4, num_classes=3, ring_len=8, slot_dim=16, gauss_k=1, gauss_tau=2.0)
+            model.eval()
+
+            calls = []
+            model.head.register_forward_hook(lambda *_: calls.append(1))
+            x = torch.randn(2, 7, 4)
+
+            old_thresh = ah.SATIETY_THRESH
+            try:
+                # Satiety off: only the final step is read out.
+                ah.SATIETY_THRESH = 0.0
+                model(x)
+                self.assertEqual(len(calls), 1)
+
+                # Satiety on (never confident) at cadence 3: t=0,3,6 plus final.
+                calls.clear()
+                ah.SATIETY_THRESH = 0.999
+                model.satiety_every = 3
+                model(x)
+                self.assertEqual(len(calls), 4)
+            finally:
+                ah.SATIETY_THRESH = old_thresh
+
+    def _ptr_trajectory(self, ptr_dtype: torch.dtype, fixed_point: bool) -> list:
+        from vraxion.instnct import absolute_hallway as ah
+
+        seen = []
+        old = (ah.PTR_DTYPE, ah.PTR_ANCHOR_FIXED_POINT, ah.nan_guard)
+
+        def _record(tag, x, step, enabled=None):
+            if tag == "ptr_float":
+                seen.append(x.detach().clone())
+
+        try:
+            ah.PTR_DTYPE = ptr_dtype
+            ah.PTR_ANCHOR_FIXED_POINT = fixed_point
+            ah.nan_guard = _record
+            with conftest.temporary_env(
+                VRX_SENSORY_RING="0",
+                VRX_VAULT="0",
+                VRX_THINK_RING="0",
+                VRX_NAN_GUARD=None,
+            ):
+                torch.manual_seed(11)
+                model = AbsoluteHallway(input_dim=4, num_classes=3, ring_len=16, slot_dim=8, gauss_k=1, gauss_tau=2.0)
+                model.eval()
+                x = torch.randn(3, 24, 4)
+                with torch.no_grad():
+                    model(x)
+        finally:
+            ah.PTR_DTYPE, ah.PTR_ANCHOR_FIXED_POINT, ah.nan_guard = old
+        return seen
+
+    def test_fixed_point_anchor_trajectory_fp64_bit_identical(self) -> None:
+        ref = self._ptr_trajectory(torch.float64, fixed_point=False)
+        got = self._ptr_trajectory(torch.float64, fixed_point=True)
+        self.assertEqual(len(ref), 24)
+        self.assertEqual(len(got), len(ref))
+        for a, b in zip(ref, got):
+            self.assertEqual(a.dtype, torch.float64)
+            self.assertTrue(torch.equal(a, b))
+
+    def test_fixed_point_anchor_trajectory_fp32_within_tolerance(self) -> None:
+        ref = self._ptr_trajectory(torch.float32, fixed_point=False)
+        got = self._ptr_trajectory(torch.float32, fixed_point=True)
+        self.assertEqual(len(got), len(ref))
+        for a, b in zip(ref, got):
+            # Compare on the ring: a wrap at 0/ring_len is not a drift.
+            diff = torch.remainder(a - b + 8.0, 16.0) - 8.0
+            self.assertLessEqual(float(diff.abs().max()), 1e-4)
+
+    def test_fused_bypass_and_sensory_match_cell_loop(self) -> None:
+        from vraxion.instnct import absolute_hallway as ah
 
+        old_decay = ah.BOS_DECAY
+        try:
+            ah.BOS_DECAY = 0.25
+            with conftest.temporary_env(
+                VRX_SENSORY_RING="1",
+                VRX_SENSORY_RING_LEN="3",
+                VRX_VAULT="0",
+                VRX_THINK_RING="0",
+                VRX_NAN_GUARD=None,
+            ):
+                torch.manual_seed(3)
+                model = AbsoluteHallway(
+                    input_dim=1, num_classes=3, ring_len=8, slot_dim=16, gauss_k=1, gauss_tau=2.0, bypass_ring=True
+                ).cpu()
+            model.eval()
+            x = torch.tensor([[1, 3, 4, 0, 1, 2, 3, 3, 1, 4, 0], [0, 4, 1, 3, 3, 2, 4, 1, 0, 0, 2]]).float().unsqueeze(-1)
+
+            # Reference: the per-step GRUCell recurrences.
+            B, T, _ = x.shape
+            bos = x[:, :, 0] == float(ah.BOS_ID)
+            with torch.no_grad():
+                s_state = torch.zeros(B, model.sensory_len, model.sensory_dim)
+                s_h = torch.zeros(B, model.sensory_dim)
+                h = torch.zeros(B, model.slot_dim)
+                for t in range(T):
+                    d = torch.where(bos[:, t], 0.25, 1.0).view(B, 1)
+                    s_state = s_state * d.unsqueeze(-1)
+                    s_h = s_h * d
+                    h = h * d
+                    s_inp = model._apply_activation(model.sensory_proj_in(x[:, t, :]))
+                    s_h = model.sensory_gru(s_inp + s_state[:, t % model.sensory_len], s_h)
+                    s_state[:, t % model.sensory_len] = s_h
+                    inp = model._apply_activation(model.sensory_bridge(s_h))
+                    h = model.gru(inp, h)
+                want = model.head(h, torch.zeros(B, dtype=torch.long))
+                got, _ = model(x)
+
+            self.assertTrue(torch.allclose(got, want, atol=1e-5))
+        finally:
+            ah.BOS_DECAY = old_decay
+
+    def test_masked_slot_write_matches_boolean_indexing(self) -> None:
+        torch.manual_seed(5)
+        ring = torch.randn(4, 6, 3)
+        ptr = torch.tensor([0, 5, 2, 2])
+        value = torch.randn(4, 3)
+        mask = torch.tensor([True, False, True, False])
+        idx = torch.arange(4)
+
+        want = ring.clone()
+        want[idx[mask], ptr[mask]] = value[mask]
+        got = ring.clone()
+        AbsoluteHallway._masked_slot_write(got, idx, ptr, value, mask)
+
+        self.assertTrue(torch.equal(got, want))
+
+    def test_kernel_lut_matches_exact_within_bound(self) -> None:
+        with conftest.temporary_env(
+            VRX_SENSORY_RING="0",
+            VRX_VAULT="0",
+            VRX_THINK_RING="0",
+            VRX_NAN_GUARD=None,
+        ):
+            model = AbsoluteHallway(input_dim=4, num_classes=3, ring_len=16, slot_dim=8, gauss_k=2, gauss_tau=0.5)
+        offsets = torch.arange(-2, 3, dtype=torch.float64)
+        ptr = (torch.rand(512, dtype=torch.float64) * 16.0).requires_grad_(True)
+
+        for kernel in ("gauss", "vonmises"):
+            model.ptr_kernel = kernel
+            model.ptr_kernel_lut = 0
+            _, exact, _ = model._compute_kernel_weights(ptr, offsets, 16)
+            model.ptr_kernel_lut = 4096
+            centers, approx, _ = model._compute_kernel_weights(ptr, offsets, 16)
+
+            bound = model.kernel_lut_error_bound()
+            self.assertGreater(bound, 0.0)
+            self.assertLess(bound, 1e-6)
+            self.assertLessEqual(float((approx - exact).abs().max()), bound * 1.01 + 1e-12)
+            self.assertTrue(torch.allclose(approx.sum(dim=1), torch.ones(512, dtype=torch.float64)))
+
+            # Interpolation keeps a pointer gradient close to the exact one.
+            g_exact = torch.autograd.grad((exact * offsets).sum(), ptr)[0]
+            g_lut = torch.autograd.grad((approx * offsets).sum(), ptr)[0]
+            self.assertTrue(torch.allclose(g_lut, g_exact, atol=1e-3))
+
+    def test_inference_fast_path_matches_eval_forward(self) -> None:
+        with conftest.temporary_env(
+            VRX_SENSORY_RING="0",
+            VRX_VAULT="0",
+            VRX_THINK_RING="0",
+            VRX_NAN_GUARD=None,
+        ):
+            model = AbsoluteHallway(input_dim=4, num_classes=3, ring_len=16, slot_dim=8, gauss_k=2, gauss_tau=2.0)
+        model.eval()
+        x = torch.randn(3, 10, 4)
+
+        torch.manual_seed(0)
+        with torch.no_grad():
+            want, _ = model(x)
+        want_bins = model.last_ptr_bins.clone()
+        want_flip = model.ptr_flip_rate
+
+        torch.manual_seed(0)
+        got, move_penalty = model(x, inference=True)
+
+        self.assertTrue(torch.equal(got, want))
+        self.assertFalse(got.requires_grad)
+        self.assertEqual(float(move_penalty), 0.0)
+        self.assertTrue(torch.equal(model.last_ptr_bins, want_bins))
+        self.assertAlmostEqual(float(model.ptr_flip_rate), want_flip, places=6)
+        with self.assertRaises(ValueError):
+            model(x, return_xray=True, inference=True)
+
+    def test_inference_telemetry_stays_on_device(self) -> None:
+        with conftest.temporary_env(
+            VRX_SENSORY_RING="0",
+            VRX_VAULT="0",
+            VRX_THINK_RING="0",
+            VRX_NAN_GUARD=None,
+        ), mock.patch.object(absolute_hallway, "EXPERT_HEADS", 2):
+            model = AbsoluteHallway(input_dim=4, num_classes=3, ring_len=16, slot_dim=8, gauss_k=2, gauss_tau=2.0)
+        model.eval()
+        x = torch.randn(3, 10, 4)
+
+        def _sync(*_args, **_kwargs):
+            raise AssertionError("host sync on the inference path")
+
+        with (
+            mock.patch.object(torch.Tensor, "item", _sync),
+            mock.patch.object(torch.Tensor, "cpu", _sync),
+            mock.patch.object(torch.Tensor, "tolist", _sync),
+        ):
+            model(x, inference=True)
+
+        self.assertEqual(int(model.ptr_expert_counts.sum()), 3)
+        for name in ("last_ptr_bins", "last_ptr_int", "ptr_flip_rate", "satiety_exits", "ptr_expert_entropy"):
+            val = getattr(model, name)
+            self.assertTrue(torch.is_tensor(val), msg=name)
+            self.assertEqual(val.device, x.device, msg=name)
+
+    def test_seq_gru_shares_cell_parameters(self) -> None:
+        with conftest.temporary_env(VRX_SENSORY_RING="0", VRX_VAULT="0", VRX_THINK_RING="0", VRX_NAN_GUARD=None):
+            model = AbsoluteHallway(
+                input_dim=1, num_classes=3, ring_len=8, slot_dim=16, gauss_k=1, gauss_tau=2.0, bypass_ring=True
+            ).cpu()
+        keys = set(model.state_dict())
+        nparams = len(list(model.parameters()))
+
+        logits, _ = model(torch.randn(2, 5, 1))
+        logits.sum().backward()
+
+        gru = model._seq_gru(model.gru)
+        self.assertIs(gru, model._seq_gru(model.gru))
+        self.assertIs(gru.weight_ih_l0, model.gru.weight_ih)
+        self.assertIs(gru.bias_hh_l0, model.gru.bias_hh)
+        self.assertIsNotNone(model.gru.weight_hh.grad)
+        # Not registered: checkpoints and optimizers see only the cell.
+        self.assertEqual(set(model.state_dict()), keys)
+        self.assertEqual(len(list(model.parameters())), nparams)
+
+    def test_seq_gru_draws_no_global_rng(self) -> None:
+        with conftest.temporary_env(VRX_VAULT="0", VRX_THINK_RING="0", VRX_NAN_GUARD=None):
+            model = AbsoluteHallway(
+                input_dim=1, num_classes=3, ring_len=8, slot_dim=16, gauss_k=1, gauss_tau=2.0
+            ).cpu()
+        model.eval()
+        x = torch.randn(2, 5, 1)
+        outs = []
+        with torch.no_grad():
+            for _ in range(2):
+                torch.manual_seed(7)
+                outs.append(model(x)[0])
+        # The first forward builds the sequence GRUs; it must not shift the RNG.
+        self.assertTrue(torch.equal(outs[0], outs[1]))
 
+        h = torch.randn(2, 16)
+        out, h_last = model._gru_scan(model.gru, torch.randn(2, 0, 16), h)
+        self.assertEqual(tuple(out.shape), (2, 0, 16))
+        self.assertIs(h_last, h)
@@ -1,4 +1,8 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
 
@@ -59,6 +63,60 @@ class TestAntRatioPickBatchV0(unittest.TestCase):
         self.assertIn("non_monotonic_ratio_detected; abort refinement", res.notes)
         self.assertIsNotNone(res.chosen_batch)
 
+    def test_main_in_process_builds_one_tuner_per_config(self) -> None:
+        from tools import ant_ratio_pick_batch_v0 as pick
+        from tools import batch_autotune, gpu_env_dump
+
+        built = []
+
+        class _FakeTuner:
+            def __init__(self, **kwargs):
+                built.append(kwargs)
+                self.closed = False
+                self.calls = []
+
+            def measure(self, batch, *, warmup_steps, measure_steps):
+                self.calls.append((batch, warmup_steps, measure_steps))
+                ratio = 0.10 + 0.03 * float(batch)
+                ok = ratio < 0.92
+                return {
+                    "peak_vram_reserved_bytes": int(ratio * 1000),
+                    "stability_pass": ok,
+                    "had_oom": not ok,
+                    "had_nan": False,
+                    "had_inf": False,
+                    "fail_reasons": [] if ok else ["runtime_exception", "oom"],
+                }
+
+            def vram_ratio(self, metrics):
+                return metrics["peak_vram_reserved_bytes"] / 1000.0
+
+            def write_artifacts(self, out_dir, metrics):
+                out_dir.mkdir(parents=True, exist_ok=True)
+                (out_dir / "metrics.json").write_text(json.dumps(metrics), encoding="utf-8")
+                return out_dir
+
+            def close(self):
+                self.closed = True
+
+        with tempfile.TemporaryDirectory() as td:
+            with (
+                mock.patch.object(batch_autotune, "BatchAutotuner", _FakeTuner),
+                mock.patch.object(gpu_env_dump, "collect_env", return_value={"total_vram_bytes": 1000}),
+                mock.patch.object(pick, "_run_probe_once", side_effect=AssertionError("no subprocess in-process")),
+            ):
+                rc = pick.main(["--ant-tiers", "small", "--expert-heads", "1,2", "--out-root", td])
+            self.assertEqual(rc, 0)
+            out = json.loads((Path(td) / "ant_ratio_batch_targets_v0.json").read_text(encoding="utf-8"))
+
+        self.assertEqual([b["out_dim"] for b in built], [1, 2])
+        self.assertEqual(built[0]["env_obj"], {"total_vram_bytes": 1000})
+        for row in out["rows"]:
+            self.assertEqual(row["probe_mode"], "in_process")
+            self.assertFalse(row["unusable"])
+            self.assertTrue(0.82 <= row["chosen_ratio"] <= 0.88)
+            self.assertIn("_ms10", row["chosen_run_root"])
+
 
 if __name__ == "__main__":
     unittest.main()
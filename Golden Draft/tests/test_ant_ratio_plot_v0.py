@@ -5,6 +5,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
 
 class TestAntRatioPlotV0(unittest.TestCase):
     def test_cli_writes_html(self) -> None:
@@ -57,3 +59,36 @@ class TestAntRatioPlotV0(unittest.TestCase):
             self.assertIn("Plotly.newPlot", html)
             self.assertIn("ant_ratio_packets.jsonl", html)
             self.assertIn("stress", html)
+
+    def test_max_points_caps_traces_and_lod_embeds_fine(self) -> None:
+        from tools.ant_ratio_plot_v0 import build_html
+
+        packets = [
+            {
+                "ant_tier": "real",
+                "expert_heads": i % 16,
+                "batch_size": 8,
+                "stability_pass": True,
+                "vram_ratio_reserved": i / 3000.0,
+                "throughput_tokens_per_s": 1000.0 + (5000.0 if i == 1234 else float(i % 7)),
+                "assoc_byte_disjoint_accuracy": 0.5,
+            }
+            for i in range(3000)
+        ]
+
+        def _traces(html: str, name: str):
+            line = next(ln for ln in html.splitlines() if ln.strip().startswith(f"const {name} = "))
+            return json.loads(line.strip()[len(f"const {name} = ") : -1])
+
+        full = build_html(packets=packets, title="t")
+        self.assertEqual(len(_traces(full, "dataVramTok")[0]["x"]), 3000)
+        self.assertNotIn("fine_plot_vram_tok", full)
+
+        capped = build_html(packets=packets, title="t", max_points=100, lod=True)
+        trace = _traces(capped, "dataVramTok")[0]
+        self.assertLessEqual(len(trace["x"]), 102)
+        self.assertEqual(len(trace["text"]), len(trace["x"]))
+        self.assertEqual(len(trace["marker"]["size"]), len(trace["x"]))
+        self.assertIn(6000.0, trace["y"])  # the spike survives
+        self.assertIn('id="fine_plot_vram_tok"', capped)
+        self.assertIn("Downsampled:", capped)
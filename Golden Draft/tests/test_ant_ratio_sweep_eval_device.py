@@ -59,6 +59,39 @@ class TestAntRatioSweepEvalDevice(unittest.TestCase):
             hidx = cmd.index("--heartbeat-s")
             self.assertEqual(cmd[hidx + 1], "60")
 
+    def test_sequential_eval_flags_are_forwarded(self) -> None:
+        from tools.ant_ratio_sweep_v0 import _run_capability_eval
+
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td)
+            tool = repo_root / "Golden Draft" / "tools" / "eval_ckpt_assoc_byte.py"
+            tool.parent.mkdir(parents=True, exist_ok=True)
+            tool.write_text("# stub", encoding="utf-8")
+            run_root = repo_root / "runs" / "assoc"
+            run_root.mkdir(parents=True, exist_ok=True)
+            (run_root / "report.json").write_text("{}", encoding="utf-8")
+
+            with mock.patch(
+                "tools.ant_ratio_sweep_v0.subprocess.run", return_value=SimpleNamespace(returncode=0)
+            ) as mrun:
+                _run_capability_eval(
+                    repo_root=repo_root,
+                    run_root=run_root,
+                    checkpoint=run_root / "checkpoint.pt",
+                    eval_samples=512,
+                    batch_size=3,
+                    device="cpu",
+                    eval_seed_offset=1000003,
+                    force_disjoint=False,
+                    timeout_s=0,
+                    heartbeat_s=60,
+                    seq_threshold=0.25,
+                )
+
+            cmd = mrun.call_args[0][0]
+            self.assertEqual(cmd[cmd.index("--seq-threshold") + 1], "0.25")
+            self.assertNotIn("--seq-margin", cmd)
+
 
 if __name__ == "__main__":
     unittest.main()
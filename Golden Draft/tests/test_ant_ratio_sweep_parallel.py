@@ -0,0 +1,117 @@
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+
+class TestAntRatioSweepParallel(unittest.TestCase):
+    def test_parallel_matches_serial_and_resume_skips_done_stages(self) -> None:
+        from tools import ant_ratio_sweep_v0 as sweep
+        from tools import ant_ratio_packet_v0 as pktmod
+        from tools import ant_ratio_plot_v0 as pltmod
+
+        calls = []
+        lock = threading.Lock()
+        envs = {}
+
+        def _note(stage, path, kwargs):
+            with lock:
+                calls.append((stage, Path(path).parts[-2:]))
+                envs[stage] = dict(kwargs.get("env_extra") or {})
+
+        def _fake_probe(**kwargs):
+            out_dir = Path(kwargs["out_dir"])
+            _note("probe", out_dir.parent, kwargs)
+            if int(kwargs["batch"]) == 3:
+                raise sweep.SweepError("probe metrics missing")
+            # The first config finishes last when run concurrently.
+            time.sleep(0.2 if int(kwargs["batch"]) == 1 else 0.0)
+            metrics = {"stability_pass": True, "had_oom": False, "had_nan": False, "had_inf": False}
+            out_dir.mkdir(parents=True, exist_ok=True)
+            (out_dir / "metrics.json").write_text(json.dumps(metrics), encoding="utf-8")
+            return out_dir, metrics
+
+        def _fake_train(**kwargs):
+            run_root = Path(kwargs["run_root"])
+            _note("train", run_root, kwargs)
+            run_root.mkdir(parents=True, exist_ok=True)
+            ckpt = run_root / "checkpoint_last_good.pt"
+            ckpt.write_bytes(b"fake")
+            return ckpt, 0
+
+        def _fake_eval(**kwargs):
+            run_root = Path(kwargs["run_root"])
+            _note("eval", run_root, kwargs)
+            rep = run_root / "report.json"
+            rep.write_text("{}", encoding="utf-8")
+            return rep, True
+
+        def _fake_packet(**kwargs):
+            return {
+                "ant_tier": kwargs.get("ant_tier_override"),
+                "token_budget_steps": int(kwargs.get("capability_steps_override", 0)),
+                "probe_run_root": Path(kwargs["probe_run_root"]).parts[-2],
+                "assoc_run_root": Path(kwargs["assoc_run_root"]).parts[-2],
+                "vram_ratio_reserved": 0.8,
+                "throughput_tokens_per_s": 10.0,
+                "assoc_byte_disjoint_accuracy": 0.5,
+            }
+
+        with tempfile.TemporaryDirectory() as td:
+            td_path = Path(td)
+            batch_targets = td_path / "batch_targets.json"
+            batch_targets.write_text(
+                json.dumps(
+                    {
+                        "rows": [
+                            {"ant_tier": "small", "expert_heads": 1, "chosen_batch": 1},
+                            {"ant_tier": "small", "expert_heads": 1, "chosen_batch": 2},
+                            {"ant_tier": "small", "expert_heads": 1, "chosen_batch": 3},
+                            {"ant_tier": "real", "expert_heads": 2, "chosen_batch": 4},
+                        ]
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+            def _sweep(out_root, *extra):
+                with (
+                    mock.patch.dict(sys.modules, {"ant_ratio_packet_v0": pktmod, "ant_ratio_plot_v0": pltmod}),
+                    mock.patch("tools.ant_ratio_sweep_v0._repo_root", return_value=td_path),
+                    mock.patch("tools.ant_ratio_sweep_v0._run_probe", side_effect=_fake_probe),
+                    mock.patch("tools.ant_ratio_sweep_v0._run_capability_train", side_effect=_fake_train),
+                    mock.patch("tools.ant_ratio_sweep_v0._run_capability_eval", side_effect=_fake_eval),
+                    mock.patch.object(pktmod, "build_packet", side_effect=_fake_packet),
+                    mock.patch.object(pltmod, "build_html", return_value="<html></html>"),
+                ):
+                    rc = sweep.main(["--batch-targets", str(batch_targets), "--out-root", str(out_root), *extra])
+                self.assertEqual(rc, 0)
+                return (
+                    (out_root / "ant_ratio_summary.csv").read_text(encoding="utf-8"),
+                    (out_root / "ant_ratio_packets.jsonl").read_text(encoding="utf-8"),
+                )
+
+            serial = _sweep(td_path / "serial")
+            self.assertEqual(envs["train"], {})
+            calls.clear()
+            parallel = _sweep(td_path / "par", "--jobs", "3", "--cpu-threads", "6", "--gpu-slots", "2")
+            self.assertEqual(parallel, serial)
+            self.assertEqual(len(calls), 10)
+            self.assertEqual(envs["train"].get("OMP_NUM_THREADS"), "2")
+            self.assertIn("error", serial[0].splitlines()[3])
+
+            calls.clear()
+            resumed = _sweep(td_path / "par", "--jobs", "3", "--resume", "1")
+            self.assertEqual(resumed, serial)
+            # Only the failed config's probe runs again.
+            self.assertEqual(calls, [("probe", ("runs_probe", "small_E1_B0003"))])
+
+
+if __name__ == "__main__":
+    unittest.main()
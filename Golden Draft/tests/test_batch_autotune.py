@@ -0,0 +1,88 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+from conftest import temporary_env
+
+from tools import batch_autotune, gpu_capacity_probe
+
+ANT = json.dumps({"ring_len": 32, "slot_dim": 16, "ptr_dtype": "fp32", "precision": "fp32"})
+COL = json.dumps({"seq_len": 8, "synth_len": 4, "batch_size": 2, "ptr_update_every": 1, "state_loop_samples": 0})
+
+
+class TestBatchAutotune(unittest.TestCase):
+    def test_trials_match_probe_schema_and_survive_oom(self) -> None:
+        with tempfile.TemporaryDirectory() as td, temporary_env(VRX_FORCE_DEVICE="cpu"):
+            probe_dir = Path(td) / "probe"
+            rc = gpu_capacity_probe.main(
+                ["--ant", ANT, "--colony", COL, "--out-dim", "1", "--batch", "3", "--warmup-steps", "1"]
+                + ["--measure-steps", "2", "--precision", "fp32", "--amp", "0", "--output-dir", str(probe_dir)]
+            )
+            self.assertEqual(rc, 0)
+            probe = json.loads((probe_dir / gpu_capacity_probe.ART_METRICS_JSON).read_text(encoding="utf-8"))
+
+            tuner = batch_autotune.BatchAutotuner(
+                ant=ANT, colony=COL, out_dim=1, precision="fp32", amp=0, env_obj={"total_vram_bytes": None}
+            )
+            metrics = tuner.measure(3, warmup_steps=1, measure_steps=2)
+            self.assertEqual(set(metrics) - set(probe), {"probe_mode"})
+            self.assertEqual(metrics["probe_id"], probe["probe_id"])
+            self.assertTrue(batch_autotune.metrics_pass(metrics))
+            self.assertEqual(metrics["batch_size"], 3)
+            self.assertIsNone(tuner.vram_ratio(metrics))
+
+            out_dir = tuner.write_artifacts(Path(td) / "trial", metrics)
+            for name in (gpu_capacity_probe.ART_ENV, gpu_capacity_probe.ART_METRICS_JSON, gpu_capacity_probe.ART_SUMMARY):
+                self.assertTrue((out_dir / name).exists(), msg=name)
+
+            # Batches above 5 "run out of memory": the search must land on 5 and
+            # the tuner must keep working after the failed trials.
+            real_make = gpu_capacity_probe._make_train_step
+
+            def _make(torch_mod, model, opt, x, y, **kw):
+                step = real_make(torch_mod, model, opt, x, y, **kw)
+                if int(x.shape[0]) <= 5:
+                    return step
+
+                def _oom():
+                    raise RuntimeError("CUDA out of memory. Tried to allocate 2.00 GiB")
+
+                return _oom
+
+            with mock.patch.object(gpu_capacity_probe, "_make_train_step", side_effect=_make):
+                best, tried = tuner.search_max_batch(max_batch=64, warmup_steps=0, measure_steps=1)
+            self.assertEqual(best, 5)
+            self.assertEqual(sorted(tried), [1, 2, 4, 5, 6, 8])
+            self.assertTrue(tried[8]["had_oom"])
+            self.assertEqual(tried[8]["fail_reasons"], ["runtime_exception", "oom"])
+            self.assertTrue(batch_autotune.metrics_pass(tuner.measure(2, warmup_steps=0, measure_steps=1)))
+            tuner.close()
+
+    def test_trials_restore_controller_attributes(self) -> None:
+        with temporary_env(VRX_FORCE_DEVICE="cpu"):
+            tuner = batch_autotune.BatchAutotuner(
+                ant=ANT, colony=COL, out_dim=1, precision="fp32", amp=0, env_obj={"total_vram_bytes": None}
+            )
+            inertia = tuner.model.ptr_inertia
+            seen = []
+            real_make = gpu_capacity_probe._make_train_step
+
+            def _make(torch_mod, model, opt, x, y, **kw):
+                seen.append((model.ptr_inertia, hasattr(model, "vrx_test_ema")))
+                # Stand-in for controller state a trial leaves behind.
+                model.ptr_inertia = inertia + 0.25
+                model.vrx_test_ema = 1.0
+                return real_make(torch_mod, model, opt, x, y, **kw)
+
+            with mock.patch.object(gpu_capacity_probe, "_make_train_step", side_effect=_make):
+                tuner.measure(2, warmup_steps=0, measure_steps=1)
+                tuner.measure(2, warmup_steps=0, measure_steps=1)
+            self.assertEqual(seen, [(inertia, False), (inertia, False)])
+            tuner.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
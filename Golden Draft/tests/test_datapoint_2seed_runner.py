@@ -0,0 +1,74 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools import datapoint_2seed_runner as dpr
+
+
+class TestDatapoint2SeedRunner(unittest.TestCase):
+    @unittest.skipUnless(hasattr(os, "sched_setaffinity"), "needs CPU affinity support")
+    def test_start_pins_child(self) -> None:
+        cpu = min(os.sched_getaffinity(0))
+        proc = dpr._start(
+            [sys.executable, "-c", "import os, time; time.sleep(0.3); print(sorted(os.sched_getaffinity(0)), os.environ['OMP_NUM_THREADS'])"],
+            cwd=".",
+            env={**os.environ, **dpr.thread_env(1)},
+            cpus=[cpu],
+            capture=True,
+        )
+        out, _ = proc.communicate()
+        self.assertEqual(proc.returncode, 0)
+        self.assertEqual(out.strip(), f"[{cpu}] 1")
+
+    def test_parallel_runs_seeds_concurrently_and_gates_after(self) -> None:
+        lock = threading.Lock()
+        live = {"now": 0, "max": 0}
+        seen = {}
+        order = []
+
+        with tempfile.TemporaryDirectory() as td:
+
+            def _fake_boot(**kwargs):
+                with lock:
+                    live["now"] += 1
+                    live["max"] = max(live["max"], live["now"])
+                    seen[kwargs["seed"]] = (kwargs.get("env_extra"), kwargs.get("cpus"))
+                time.sleep(0.1)
+                run_root = Path(td) / f"seed{kwargs['seed']}"
+                run_root.mkdir()
+                report = {
+                    "settings": {"seed": kwargs["seed"], "val_range": 16},
+                    "train": {"steps": 5},
+                    "eval": {"eval_acc": 0.5, "eval_n": 4096},
+                }
+                (run_root / "report.json").write_text(json.dumps(report), encoding="utf-8")
+                with lock:
+                    live["now"] -= 1
+                return run_root, ""
+
+            with (
+                mock.patch.object(dpr, "_ensure_dashboard"),
+                mock.patch.object(dpr, "usable_cpus", return_value=[0, 1, 2, 3]),
+                mock.patch.object(dpr, "_run_boot", side_effect=_fake_boot),
+                mock.patch.object(dpr, "_postmortem_eval", side_effect=lambda **kw: order.append("eval")),
+                mock.patch.object(dpr, "_ingest_and_gate", side_effect=lambda root: order.append("ingest")),
+            ):
+                rc = dpr.main(["--seeds", "111,222", "--steps", "5", "--parallel"])
+
+        self.assertEqual(rc, 0)
+        self.assertEqual(live["max"], 2)
+        self.assertEqual(order, ["eval", "eval", "ingest"])
+        self.assertEqual(seen[111], ({"OMP_NUM_THREADS": "2", "MKL_NUM_THREADS": "2"}, [0, 1]))
+        self.assertEqual(seen[222], ({"OMP_NUM_THREADS": "2", "MKL_NUM_THREADS": "2"}, [2, 3]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import math
+import unittest
+from unittest import mock
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools import downsample
+
+
+def _series(nitems: int):
+    yvals = [math.sin(i / 50.0) for i in range(nitems)]
+    yvals[1234] = 25.0  # spike
+    yvals[4321] = -25.0  # dip
+    yvals[777] = float("nan")  # divergence marker
+    return yvals
+
+
+class TestDownsample(unittest.TestCase):
+    def test_minmax_keeps_extremes_and_nonfinite(self):
+        yvals = _series(10000)
+        idx = downsample.minmax_indices(yvals, 200)
+
+        self.assertLessEqual(len(idx), 200 + 3)
+        self.assertEqual(idx, sorted(set(idx)))
+        for must in (0, 777, 1234, 4321, 9999):
+            self.assertIn(must, idx)
+
+        idx = downsample.minmax_indices(yvals, 200, keep_nonfinite=False)
+        self.assertNotIn(777, idx)
+
+    def test_minmax_python_fallback_matches_numpy(self):
+        yvals = _series(5000)
+        want = downsample.minmax_indices(yvals, 128)
+        with mock.patch.object(downsample, "np", None):
+            got = downsample.minmax_indices(yvals, 128)
+        self.assertEqual(got, want)
+
+    def test_small_inputs_pass_through(self):
+        self.assertEqual(downsample.downsample_indices([1.0, 2.0, 3.0], 10), [0, 1, 2])
+        self.assertEqual(downsample.downsample_indices([1.0, 2.0, 3.0], 0, method="lttb"), [0, 1, 2])
+
+    def test_lttb_budget_and_endpoints(self):
+        yvals = _series(10000)
+        xvals = [float(i) for i in range(10000)]
+        idx = downsample.downsample_indices(yvals, 300, x=xvals, method="lttb")
+
+        self.assertLessEqual(len(idx), 301)
+        self.assertEqual(idx, sorted(set(idx)))
+        for must in (0, 777, 1234, 4321, 9999):
+            self.assertIn(must, idx)
+
+        with self.assertRaises(ValueError):
+            downsample.downsample_indices(yvals, 300, method="stride")
+
+
+if __name__ == "__main__":
+    unittest.main()
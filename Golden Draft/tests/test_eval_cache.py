@@ -0,0 +1,128 @@
+import sys
+import tempfile
+import unittest
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest import mock
+
+import torch
+import torch.nn as nn
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools import eval_cache
+from tools.instnct_eval import EvalDeps
+
+# Module global read by the model (like absolute_hallway.PTR_DTYPE).
+PTR_KERNEL_LUT = 0
+
+
+class _CountingModel(nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lin = nn.Linear(2, 3)
+        self.head = SimpleNamespace(out_features=3)
+        self.calls = 0
+
+    def forward(self, x: torch.Tensor):
+        self.calls += 1
+        return self.lin(x), None
+
+
+def _deps() -> EvalDeps:
+    return EvalDeps(device="cpu", dtype=torch.float32, amp_autocast=lambda: nullcontext(), log=lambda _m: None)
+
+
+class TestEvalCache(unittest.TestCase):
+    def test_hashes_are_content_based(self) -> None:
+        sd = {"b": torch.ones(2), "a": torch.arange(3), "s": torch.tensor(1.5)}
+        same = {"a": torch.arange(3), "s": torch.tensor(1.5), "b": torch.ones(2)}
+        self.assertEqual(eval_cache.state_hash(sd), eval_cache.state_hash(same))
+        same["b"][0] = 2.0
+        self.assertNotEqual(eval_cache.state_hash(sd), eval_cache.state_hash(same))
+        # dtype is part of the content.
+        self.assertNotEqual(
+            eval_cache.state_hash({"a": torch.zeros(2)}), eval_cache.state_hash({"a": torch.zeros(2, dtype=torch.float64)})
+        )
+
+        batches = [(torch.zeros(2, 2), torch.tensor([0, 1]))]
+        self.assertEqual(eval_cache.loader_fingerprint(batches), eval_cache.loader_fingerprint(list(batches)))
+        self.assertNotEqual(
+            eval_cache.loader_fingerprint(batches), eval_cache.loader_fingerprint([(torch.zeros(2, 2), torch.tensor([1, 1]))])
+        )
+
+    def test_cached_eval_model_skips_second_eval(self) -> None:
+        torch.manual_seed(0)
+        model = _CountingModel()
+        loader = [(torch.randn(4, 2), torch.tensor([0, 1, 2, 0])) for _ in range(3)]
+
+        with tempfile.TemporaryDirectory() as td:
+            cache = eval_cache.EvalCache(td)
+            first = eval_cache.cached_eval_model(model, loader, "toy", "m", deps=_deps(), cache=cache)
+            self.assertEqual(model.calls, 3)
+
+            # New cache object over the same file: persistent hit.
+            again = eval_cache.cached_eval_model(
+                model, loader, "toy", "m", deps=_deps(), cache=eval_cache.EvalCache(td)
+            )
+            self.assertEqual(model.calls, 3)
+            self.assertEqual(again, first)
+            self.assertEqual(model.last_eval_acc, first["eval_acc"])
+
+            with torch.no_grad():
+                model.lin.bias.add_(1.0)
+            eval_cache.cached_eval_model(model, loader, "toy", "m", deps=_deps(), cache=cache)
+            self.assertEqual(model.calls, 6)
+
+            eval_cache.cached_eval_model(
+                model, loader, "toy", "m", deps=_deps(), cache=cache, extra_settings={"split": "disjoint"}
+            )
+            self.assertEqual(model.calls, 9)
+
+    def test_key_covers_runtime_config_and_module_globals(self) -> None:
+        torch.manual_seed(0)
+        model = _CountingModel()
+        loader = [(torch.randn(4, 2), torch.tensor([0, 1, 2, 0]))]
+
+        with tempfile.TemporaryDirectory() as td, conftest.temporary_env(VRX_PTR_INERTIA_OVERRIDE=None):
+            cache = eval_cache.EvalCache(td)
+            eval_cache.cached_eval_model(model, loader, "toy", "m", deps=_deps(), cache=cache)
+            eval_cache.cached_eval_model(model, loader, "toy", "m", deps=_deps(), cache=cache)
+            self.assertEqual(model.calls, 1)
+
+            with conftest.temporary_env(VRX_PTR_INERTIA_OVERRIDE="0.5"):
+                eval_cache.cached_eval_model(model, loader, "toy", "m", deps=_deps(), cache=cache)
+            self.assertEqual(model.calls, 2)
+
+            with mock.patch.object(sys.modules[__name__], "PTR_KERNEL_LUT", 1):
+                eval_cache.cached_eval_model(model, loader, "toy", "m", deps=_deps(), cache=cache)
+            self.assertEqual(model.calls, 3)
+
+        self.assertTrue(any(pth.endswith("runtime_config.py") for pth in eval_cache.instnct_sources()))
+
+    def test_put_skips_unserializable_payload(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = eval_cache.EvalCache(td)
+            self.assertFalse(cache.put("k", {"eval_acc": 0.5, "t": torch.ones(1)}))
+            self.assertIsNone(cache.get("k"))
+
+            # JSON round-trip: int keys come back as strings, tuples as lists.
+            self.assertTrue(cache.put("k", {"per_class": {0: 0.5}, "shape": (2, 3)}))
+            self.assertEqual(cache.get("k"), {"per_class": {"0": 0.5}, "shape": [2, 3]})
+
+            model = _CountingModel()
+            loader = [(torch.randn(4, 2), torch.tensor([0, 1, 2, 0]))]
+            logs = []
+
+            def _eval(model, loader, dataset_name, model_name, deps):
+                return {"eval_acc": 0.25, "raw": torch.zeros(1)}
+
+            out = eval_cache.cached_eval_model(
+                model, loader, "toy", "m", deps=_deps(), cache=cache, eval_fn=_eval, log=logs.append
+            )
+            self.assertTrue(torch.equal(out["raw"], torch.zeros(1)))
+            self.assertTrue(any("not JSON-serializable" in msg for msg in logs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,18 @@ class TestEvalCkptHeartbeat(unittest.TestCase):
         hb = [line for line in logs if "[eval_ckpt][heartbeat]" in line]
         self.assertGreaterEqual(len(hb), 2)
 
+    def test_rng_state_replays_draws(self) -> None:
+        import random
+
+        import torch
+
+        from tools.eval_ckpt_assoc_byte import _rng_state, _set_rng_state
+
+        state = _rng_state()
+        first = (random.random(), torch.rand(3).tolist())
+        _set_rng_state(state)
+        self.assertEqual((random.random(), torch.rand(3).tolist()), first)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ from typing import List, Tuple
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 from torch.utils.data import Dataset, Subset
 
 import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
@@ -13,10 +14,14 @@ import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
 from tools.instnct_eval import (
     EvalDeps,
     EvalLoaderSpec,
+    SequentialEvalSpec,
+    bernstein_interval,
     build_eval_loader_from_dataset,
     build_eval_loader_from_subset,
     eval_model,
+    eval_model_sequential,
     log_eval_overlap,
+    wilson_interval,
 )
 
 
@@ -54,6 +59,16 @@ class _ZeroLogitsModel(nn.Module):
         return torch.zeros((bsz, int(self.head.out_features)), device=x.device, dtype=x.dtype), None
 
 
+class _InferenceKwModel(_ZeroLogitsModel):
+    def __init__(self, num_classes: int) -> None:
+        super().__init__(num_classes)
+        self.seen: List[bool] = []
+
+    def forward(self, x: torch.Tensor, inference: bool = False):
+        self.seen.append(bool(inference))
+        return super().forward(x)
+
+
 class _PtrBinsModel(nn.Module):
     def __init__(self, num_classes: int, pointer_hist_bins: int) -> None:
         super().__init__()
@@ -105,6 +120,17 @@ class _FlipSeqModel(nn.Module):
         return torch.zeros((bsz, int(self.head.out_features)), device=x.device, dtype=x.dtype), None
 
 
+class _EchoModel(nn.Module):
+    """Predicts x[:, 0] as the class id (correct iff x holds the label)."""
+
+    def __init__(self, num_classes: int) -> None:
+        super().__init__()
+        self.head = SimpleNamespace(out_features=int(num_classes))
+
+    def forward(self, x: torch.Tensor):
+        return F.one_hot(x[:, 0].long(), int(self.head.out_features)).to(x.dtype), None
+
+
 class _NoOutFeaturesHead:
     def __init__(self, out_features: int) -> None:
         self.experts = [SimpleNamespace(out_features=int(out_features))]
@@ -280,6 +306,15 @@ class TestEvalModel(unittest.TestCase):
             ],
         )
 
+    def test_eval_model_uses_inference_fast_path_when_supported(self) -> None:
+        ys = [0, 1, 2, 3]
+        xs = [torch.tensor([0.0], dtype=torch.float32) for _ in ys]
+        loader, _ = build_eval_loader_from_dataset(_ToyXYDataset(xs, ys), spec=EvalLoaderSpec(eval_samples=4, batch_size=2))
+
+        model = _InferenceKwModel(num_classes=4)
+        eval_model(model, loader, "toy", "inf", deps=_deps())
+        self.assertEqual(model.seen, [True, True])
+
     def test_eval_model_mi_bits(self) -> None:
         ys = [0, 1, 2, 0, 1, 2]
         xs = [torch.tensor([float(y)], dtype=torch.float32) for y in ys]
@@ -340,6 +375,85 @@ class TestEvalModel(unittest.TestCase):
         res = eval_model(_FlipSeqModel(num_classes=2, flips=flips), loader, "toy", "flip", deps=_deps())
         self.assertAlmostEqual(res["eval_ptr_flip_rate"], sum(flips) / len(flips), places=7)
 
+    def test_ptr_flip_rate_tensor_matches_float(self) -> None:
+        flips = [0.1, 0.5, 0.9]
+        xs = [torch.tensor([0.0], dtype=torch.float32) for _ in range(5)]
+        ds = _ToyXYDataset(xs, [0, 0, 0, 0, 0])
+        loader, _ = build_eval_loader_from_dataset(ds, spec=EvalLoaderSpec(eval_samples=len(ds), batch_size=2))
+
+        class _TensorFlipModel(_FlipSeqModel):
+            def forward(self, x: torch.Tensor):
+                out = super().forward(x)
+                # Device-resident flip rate (no host sync inside the model).
+                self.ptr_flip_rate = torch.tensor(self.ptr_flip_rate, dtype=torch.float64)
+                return out
+
+        ref = eval_model(_FlipSeqModel(num_classes=2, flips=flips), loader, "toy", "flip", deps=_deps())
+        res = eval_model(_TensorFlipModel(num_classes=2, flips=flips), loader, "toy", "flip", deps=_deps())
+        self.assertIsInstance(res["eval_ptr_flip_rate"], float)
+        self.assertEqual(res, ref)
+
+    def test_confidence_intervals(self) -> None:
+        lo, hi = wilson_interval(80, 100, 0.05)
+        # Reference Wilson 95% interval for 80/100.
+        self.assertAlmostEqual(lo, 0.7112, places=3)
+        self.assertAlmostEqual(hi, 0.8666, places=3)
+        blo, bhi = bernstein_interval(80, 100, 0.05)
+        self.assertLess(blo, lo)
+        self.assertGreater(bhi, hi)
+        self.assertEqual(wilson_interval(0, 0, 0.05), (0.0, 1.0))
+
+    def _seq_loader(self, n: int, acc_every: int):
+        # Every acc_every-th sample is mislabeled for _EchoModel.
+        xs = [torch.tensor([float(i % 2)]) for i in range(n)]
+        ys = [(i % 2) if (acc_every <= 0 or i % acc_every) else 1 - (i % 2) for i in range(n)]
+        ds = _ToyXYDataset(xs, ys)
+        loader, _ = build_eval_loader_from_dataset(ds, spec=EvalLoaderSpec(eval_samples=n, batch_size=16))
+        return loader
+
+    def test_eval_model_sequential_stops_above_threshold(self) -> None:
+        loader = self._seq_loader(2048, acc_every=0)
+        res = eval_model_sequential(
+            _EchoModel(2), loader, "toy", "seq", deps=_deps(), spec=SequentialEvalSpec(threshold=0.5, seed=1)
+        )
+        self.assertEqual(res["eval_stop"], "above")
+        self.assertEqual(res["eval_acc"], 1.0)
+        self.assertLess(res["eval_n"], 256)
+        self.assertEqual(res["eval_n_total"], 2048)
+        self.assertGreater(res["eval_ci_low"], 0.5)
+
+    def test_eval_model_sequential_below_and_exhausted(self) -> None:
+        loader = self._seq_loader(512, acc_every=2)  # 50% accuracy
+        below = eval_model_sequential(
+            _EchoModel(2), loader, "toy", "seq", deps=_deps(), spec=SequentialEvalSpec(threshold=0.9)
+        )
+        self.assertEqual(below["eval_stop"], "below")
+        self.assertLess(below["eval_ci_high"], 0.9)
+
+        full = eval_model_sequential(
+            _EchoModel(2),
+            loader,
+            "toy",
+            "seq",
+            deps=_deps(),
+            spec=SequentialEvalSpec(threshold=0.5, method="bernstein"),
+        )
+        self.assertEqual(full["eval_stop"], "exhausted")
+        self.assertEqual(full["eval_n"], 512)
+        self.assertAlmostEqual(full["eval_acc"], 0.5)
+
+    def test_eval_model_sequential_margin_and_seeded_order(self) -> None:
+        loader = self._seq_loader(4096, acc_every=4)
+        spec = SequentialEvalSpec(margin=0.05, seed=7)
+        first = eval_model_sequential(_EchoModel(2), loader, "toy", "seq", deps=_deps(), spec=spec)
+        again = eval_model_sequential(_EchoModel(2), loader, "toy", "seq", deps=_deps(), spec=spec)
+        self.assertEqual(first["eval_stop"], "margin")
+        self.assertLessEqual((first["eval_ci_high"] - first["eval_ci_low"]) / 2.0, 0.05)
+        self.assertLess(first["eval_n"], 4096)
+        self.assertEqual(first, again)
+        with self.assertRaises(ValueError):
+            eval_model_sequential(_EchoModel(2), loader, "toy", "seq", deps=_deps(), spec=SequentialEvalSpec())
+
     def test_head_out_features_is_patched(self) -> None:
         xs = [torch.tensor([0.0], dtype=torch.float32) for _ in range(2)]
         ys = [0, 1]
@@ -1,4 +1,5 @@
 import os
+import pickle
 import tempfile
 import unittest
 
@@ -7,7 +8,12 @@ import torch
 import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
 
 import tools.instnct_evolution as evo
-from tools.instnct_evolution import EvolutionConfig, mutate_state_dict, run_evolution, save_evo_checkpoint
+from tools.instnct_evolution import (
+    EvolutionConfig,
+    mutate_state_dict,
+    run_evolution,
+    save_evo_checkpoint,
+)
 
 
 class _DummyHallway:
@@ -41,6 +47,36 @@ def _eval_model(model: _DummyHallway, eval_loader, dataset_name: str, tag: str):
     return {"eval_loss": loss, "eval_acc": acc, "tag": tag}
 
 
+# Pool callables live at module level so spawned workers can unpickle them.
+_SEEN_CALLS = []
+
+
+def _noisy_train(model: _DummyHallway, loader, steps: int, dataset_name: str, tag: str):
+    # Consumes the RNG so per-task seeding is exercised; ``calls`` is
+    # controller state that must follow the individual, not the worker.
+    # _SEEN_CALLS is only filled by inline (workers=1) runs.
+    calls = getattr(model, "calls", 0)
+    model.calls = calls + 1
+    _SEEN_CALLS.append((tag.split("_")[1], calls))
+    model.w = model.w + 0.1 * float(steps) + 0.05 * torch.randn(()) + 0.01 * calls
+    return {"tag": tag, "w": float(model.w), "calls": calls}
+
+
+def _dying_train(model: _DummyHallway, loader, steps: int, dataset_name: str, tag: str):
+    # Simulates a worker killed mid-task (OOM killer, segfault).
+    os._exit(3)
+
+
+class _TinyNet(torch.nn.Module):
+    def __init__(self, input_dim: int, num_classes: int, ring_len: int, slot_dim: int):
+        super().__init__()
+        self.body = torch.nn.Linear(input_dim, slot_dim)
+        self.gate_head = torch.nn.Linear(slot_dim, num_classes)
+
+    def forward(self, x):
+        return self.gate_head(torch.tanh(self.body(x)))
+
+
 class TestInstnctEvolution(unittest.TestCase):
     def test_mutate_state_dict_pointer_only(self):
         torch.manual_seed(0)
@@ -213,6 +249,245 @@ class TestInstnctEvolution(unittest.TestCase):
 
             self.assertTrue(any(linesx.startswith("Evolution resume failed:") for linesx in loglst))
 
+    def test_mutate_into_in_place_seeded(self):
+        torch.manual_seed(0)
+        parent = _TinyNet(3, 2, 0, 5)
+        child = _TinyNet(3, 2, 0, 5)
+        ptrs = {k: v.data_ptr() for k, v in child.state_dict().items()}
+
+        evo.mutate_into_(child, parent, std=0.1, pointer_only=True, seed=3)
+        first = {k: v.clone() for k, v in child.state_dict().items()}
+        self.assertEqual(ptrs, {k: v.data_ptr() for k, v in child.state_dict().items()})
+        self.assertTrue(torch.equal(first["body.weight"], parent.body.weight))
+        self.assertFalse(torch.equal(first["gate_head.weight"], parent.gate_head.weight))
+
+        evo.mutate_into_(child, parent, std=0.1, pointer_only=True, seed=3)
+        for keystr, tenval in child.state_dict().items():
+            self.assertTrue(torch.equal(tenval, first[keystr]))
+
+    def test_run_evolution_recycles_models(self):
+        built = []
+
+        def _ctor(**kwargs):
+            modobj = _TinyNet(**kwargs)
+            modobj.calls = 0
+            built.append(modobj)
+            return modobj
+
+        def _train(model, loader, steps, dataset_name, tag):
+            model.calls += 1
+            return {"tag": tag}
+
+        seen = []
+
+        def _eval(model, eval_loader, dataset_name, tag):
+            seen.append((tag.split("_")[1], model.calls))
+            lossv = float(model.gate_head.weight.abs().sum())
+            return {"eval_loss": lossv, "eval_acc": 0.0}
+
+        cfgobj = EvolutionConfig(
+            pop=4,
+            gens=3,
+            steps=1,
+            mut_std=0.05,
+            pointer_only=False,
+            checkpoint_every=0,
+            resume=False,
+            checkpoint_individual=False,
+            progress=False,
+            seed=5,
+        )
+        oldck = evo.save_evo_checkpoint
+        evo.save_evo_checkpoint = lambda *args, **kwargs: None
+        try:
+            outobj = run_evolution(
+                "dummy",
+                loader=object(),
+                eval_loader=object(),
+                input_dim=3,
+                num_classes=2,
+                root="unused",
+                ring_len=0,
+                slot_dim=4,
+                config=cfgobj,
+                model_ctor=_ctor,
+                train_steps=_train,
+                eval_model=_eval,
+                log=lambda _msg: None,
+            )
+        finally:
+            evo.save_evo_checkpoint = oldck
+
+        self.assertEqual(len(built), cfgobj.pop)
+        self.assertEqual(outobj["mode"], "evolution")
+        # Recycled children restart from the construction-time attributes:
+        # only the single elite has been trained twice by gen 1.
+        self.assertEqual(sorted(calls for gen, calls in seen if gen == "1"), [1, 1, 1, 2])
+
+    def test_run_evolution_drops_attrs_added_by_training(self):
+        seen = []
+
+        def _train(model, loader, steps, dataset_name, tag):
+            # Lazily created controller state, like AbsoluteHallway's loss_ema.
+            seen.append((tag.split("_")[1], getattr(model, "loss_ema", None)))
+            model.loss_ema = float(getattr(model, "loss_ema", 0.0)) + 1.0
+            return {"tag": tag}
+
+        def _eval(model, eval_loader, dataset_name, tag):
+            return {"eval_loss": float(model.gate_head.weight.abs().sum()), "eval_acc": 0.0}
+
+        cfgobj = EvolutionConfig(
+            pop=3,
+            gens=2,
+            steps=1,
+            mut_std=0.05,
+            pointer_only=False,
+            checkpoint_every=0,
+            resume=False,
+            checkpoint_individual=False,
+            progress=False,
+            seed=2,
+        )
+        oldck = evo.save_evo_checkpoint
+        evo.save_evo_checkpoint = lambda *args, **kwargs: None
+        try:
+            run_evolution(
+                "dummy",
+                loader=object(),
+                eval_loader=object(),
+                input_dim=3,
+                num_classes=2,
+                root="unused",
+                ring_len=0,
+                slot_dim=4,
+                config=cfgobj,
+                model_ctor=_TinyNet,
+                train_steps=_train,
+                eval_model=_eval,
+                log=lambda _msg: None,
+            )
+        finally:
+            evo.save_evo_checkpoint = oldck
+
+        # The elite keeps its EMA; the two recycled children start without one.
+        self.assertEqual(sorted(str(ema) for gen, ema in seen if gen == "1"), ["1.0", "None", "None"])
+
+    def test_restore_attrs_deletes_new_plain_attrs(self):
+        modobj = _TinyNet(3, 2, 0, 4)
+        modobj.ptr_inertia = 0.5
+        snap = evo._snapshot_attrs(modobj)
+        modobj.ptr_inertia = 0.9
+        modobj.usage_ema = torch.ones(2)
+        modobj.last_eval_acc = 0.75
+        evo._restore_attrs(modobj, snap)
+        self.assertEqual(modobj.ptr_inertia, 0.5)
+        self.assertFalse(hasattr(modobj, "usage_ema"))
+        self.assertFalse(hasattr(modobj, "last_eval_acc"))
+        self.assertIsInstance(modobj.body, torch.nn.Linear)
+
+    def _pool_run(self, workers: int, resume_state=None, seed=11, logfn=None, spawn=False, train=None):
+        cfgobj = EvolutionConfig(
+            pop=5,
+            gens=3,
+            steps=2,
+            mut_std=0.1,
+            pointer_only=False,
+            checkpoint_every=0,
+            resume=resume_state is not None,
+            checkpoint_individual=False,
+            progress=False,
+            workers=workers,
+            seed=seed,
+            threads=2,
+        )
+        saved = []
+
+        oldld = evo.torch.load
+        oldck = evo.save_evo_checkpoint
+        oldin = evo.torch.cuda.is_initialized
+        if spawn:
+            # The pool falls back to spawn once CUDA is initialized.
+            evo.torch.cuda.is_initialized = lambda: True
+        evo.torch.load = lambda *args, **kwargs: {"gen": 0, "model": resume_state}
+        evo.save_evo_checkpoint = lambda gen, model, *args, **kwargs: saved.append(float(model.state_dict()["w"]))
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                if resume_state is not None:
+                    evodir = os.path.join(tmpdir, "artifacts", "evolution")
+                    os.makedirs(evodir)
+                    open(os.path.join(evodir, "evo_latest.pt"), "wb").close()
+                outobj = run_evolution(
+                    "dummy",
+                    loader=object(),
+                    eval_loader=object(),
+                    input_dim=1,
+                    num_classes=2,
+                    root=tmpdir,
+                    ring_len=8,
+                    slot_dim=4,
+                    config=cfgobj,
+                    model_ctor=_DummyHallway,
+                    train_steps=train or _noisy_train,
+                    eval_model=_eval_model,
+                    log=logfn or (lambda _msg: None),
+                )
+        finally:
+            evo.torch.load = oldld
+            evo.save_evo_checkpoint = oldck
+            evo.torch.cuda.is_initialized = oldin
+        return outobj, saved
+
+    def test_run_evolution_pool_deterministic_across_worker_counts(self):
+        del _SEEN_CALLS[:]
+        refobj, refsav = self._pool_run(1)
+        seen = list(_SEEN_CALLS)
+        self.assertEqual(len(refsav), 3)
+        self.assertEqual(refobj["best_train"]["tag"].split("_")[1], "2")
+        for workers in (2, 3):
+            outobj, saved = self._pool_run(workers)
+            self.assertEqual(saved, refsav)
+            self.assertEqual(outobj, refobj)
+        # Only the single gen-0 elite keeps its attributes into gen 1.
+        self.assertEqual(sorted(calls for gen, calls in seen if gen == "1"), [0, 0, 0, 0, 1])
+
+    def test_run_evolution_pool_spawn_matches_inline(self):
+        refobj, refsav = self._pool_run(1)
+        outobj, saved = self._pool_run(2, spawn=True)
+        self.assertEqual(saved, refsav)
+        self.assertEqual(outobj, refobj)
+
+    def test_runner_pool_callables_pickle(self):
+        # Spawned workers receive these by pickle (Windows, or CUDA initialized).
+        from tools import instnct_runner
+
+        with conftest.temporary_env(VRX_RING_LEN="8", VRX_SLOT_DIM="16"):
+            ctx = instnct_runner.default_context()
+        pickle.dumps((ctx.model_ctor, ctx.train_steps, ctx.eval_model))
+
+    def test_run_evolution_pool_raises_when_a_worker_dies(self):
+        with self.assertRaisesRegex(RuntimeError, "evolution worker .* exited"):
+            self._pool_run(2, train=_dying_train)
+
+    def test_run_evolution_pool_keeps_caller_rng_and_draws_seed(self):
+        loglst = []
+        torch.manual_seed(123)
+        rngsta = torch.get_rng_state()
+        self._pool_run(1)
+        self.assertTrue(torch.equal(torch.get_rng_state(), rngsta))
+
+        torch.manual_seed(123)
+        expect = int(torch.randint(0, 2**62, ()).item())
+        torch.manual_seed(123)
+        self._pool_run(1, seed=None, logfn=loglst.append)
+        self.assertIn(f"seed={expect} ", "\n".join(loglst))
+
+    def test_run_evolution_pool_resume(self):
+        refobj, refsav = self._pool_run(1, resume_state={"w": torch.tensor(2.0)})
+        outobj, saved = self._pool_run(2, resume_state={"w": torch.tensor(2.0)})
+        self.assertEqual(saved, refsav)
+        self.assertGreater(refsav[0], 2.0)
+        self.assertEqual(outobj, refobj)
+
 
 if __name__ == "__main__":
     unittest.main()
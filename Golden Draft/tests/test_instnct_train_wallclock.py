@@ -218,6 +218,30 @@ class TestInstnctTrainWallclock(unittest.TestCase):
 
         self.assertEqual(model.ptr_update_every, 1)
 
+    def test_inertia_override_value_comes_from_runtime_config(self):
+        from vraxion.instnct.runtime_config import RuntimeConfig
+
+        model = DummyModel(in_dim=4, num_classes=3)
+        model.runtime_config = RuntimeConfig.from_env(env={"VRX_PTR_INERTIA_OVERRIDE": "0.3"})
+        loader = self._make_loader()
+
+        counter = itertools.count(start=0.0, step=0.01)
+
+        # The env changed after the snapshot was taken: the snapshot wins.
+        with mock.patch.dict(os.environ, {"VRX_PTR_INERTIA_OVERRIDE": "0.7"}), mock.patch.object(wall.time, "time", side_effect=lambda: next(counter)):
+            wall.train_wallclock(
+                model=model,
+                loader=loader,
+                dataset_name="ds",
+                model_name="m",
+                num_classes=3,
+                wall_clock=0.05,
+                eval_loader=None,
+            )
+
+        self.assertEqual(model.ptr_inertia, 0.3)
+        self.assertEqual(model.ptr_inertia_ema, 0.3)
+
 
 if __name__ == "__main__":
     unittest.main()
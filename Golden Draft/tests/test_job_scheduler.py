@@ -0,0 +1,118 @@
+import ctypes
+import sys
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools import job_scheduler
+from tools.job_scheduler import Job, SchedulerError, SlotPool, cpu_partition, run_jobs
+
+
+class TestJobScheduler(unittest.TestCase):
+    def test_dependencies_failures_and_serial_order(self) -> None:
+        order = []
+
+        def _mk(name, fail=False):
+            def _fn(ctx):
+                order.append(name)
+                if fail:
+                    raise ValueError(f"{name} broke")
+                return sum(ctx.results.values()) + 1
+
+            return _fn
+
+        jobs = [
+            Job("a/probe", _mk("a/probe")),
+            Job("a/train", _mk("a/train"), deps=("a/probe",)),
+            Job("b/probe", _mk("b/probe", fail=True)),
+            Job("b/train", _mk("b/train"), deps=("b/probe",)),
+            Job("b/eval", _mk("b/eval"), deps=("b/train",)),
+        ]
+        done = []
+        res = run_jobs(jobs, SlotPool(cpu_threads=4), max_workers=1, on_done=lambda r: done.append(r.name))
+
+        self.assertEqual(order, ["a/probe", "a/train", "b/probe"])
+        self.assertEqual(done, [j.name for j in jobs])
+        self.assertEqual(res["a/train"].value, 2)
+        self.assertTrue(res["b/eval"].skipped)
+        self.assertIsInstance(res["b/eval"].error, ValueError)
+
+        with self.assertRaises(SchedulerError):
+            run_jobs([Job("x", _mk("x"), deps=("y",)), Job("y", _mk("y"), deps=("x",))], SlotPool(cpu_threads=1))
+
+    def test_slots_bound_concurrency_and_partition_threads(self) -> None:
+        lock = threading.Lock()
+        live = {"cpu": 0, "gpu": 0, "max_cpu": 0, "max_gpu": 0}
+        envs = {}
+
+        def _fn(ctx):
+            with lock:
+                envs[ctx.name] = (ctx.env_overrides(), ctx.gpu_slot)
+                live["cpu"] += 1
+                live["max_cpu"] = max(live["max_cpu"], live["cpu"])
+                if ctx.gpu_slot is not None:
+                    live["gpu"] += 1
+                    live["max_gpu"] = max(live["max_gpu"], live["gpu"])
+            time.sleep(0.05)
+            with lock:
+                live["cpu"] -= 1
+                if ctx.gpu_slot is not None:
+                    live["gpu"] -= 1
+
+        jobs = [Job(f"j{i}", _fn, cpu_threads=2, gpu=(i % 2 == 0)) for i in range(8)]
+        pool = SlotPool(cpu_threads=6, gpu_devices=["1"])
+        res = run_jobs(jobs, pool, max_workers=8)
+
+        self.assertTrue(all(r.ok for r in res.values()))
+        self.assertEqual(live["max_cpu"], 3)
+        self.assertEqual(live["max_gpu"], 1)
+        self.assertEqual(envs["j0"][0], {"OMP_NUM_THREADS": "2", "MKL_NUM_THREADS": "2", "CUDA_VISIBLE_DEVICES": "1"})
+        self.assertEqual(envs["j1"][0], {"OMP_NUM_THREADS": "2", "MKL_NUM_THREADS": "2"})
+
+        # An oversized RAM request is clamped to the budget: it still runs, alone.
+        res = run_jobs([Job("big", lambda ctx: 1, ram_mb=1e9)], SlotPool(cpu_threads=1, ram_mb=100.0))
+        self.assertTrue(res["big"].ok)
+
+    def test_cpu_partition(self) -> None:
+        self.assertEqual(cpu_partition(2, range(8)), [[0, 1, 2, 3], [4, 5, 6, 7]])
+        self.assertEqual(cpu_partition(2, [0, 2, 4]), [[0], [2, 4]])
+        # Fewer CPUs than parts: every part shares all of them.
+        self.assertEqual(cpu_partition(2, [3]), [[3], [3]])
+
+    def test_pin_process_windows_mask_and_unsupported_log(self) -> None:
+        kernel32 = mock.Mock()
+        kernel32.OpenProcess.return_value = 77
+        kernel32.SetProcessAffinityMask.return_value = 1
+        logs = []
+        job_scheduler._PIN_NOTED.clear()
+        with (
+            mock.patch.object(job_scheduler, "os", SimpleNamespace()),
+            mock.patch.object(job_scheduler, "sys", SimpleNamespace(platform="win32", stderr=sys.stderr)),
+            mock.patch.object(ctypes, "WinDLL", create=True, return_value=kernel32),
+            mock.patch.object(ctypes, "get_last_error", create=True, return_value=5),
+        ):
+            self.assertTrue(job_scheduler.pin_process(1234, [2, 3], log=logs.append))
+            kernel32.SetProcessAffinityMask.assert_called_once_with(77, 0b1100)
+            kernel32.CloseHandle.assert_called_once_with(77)
+
+            kernel32.OpenProcess.return_value = 0
+            self.assertFalse(job_scheduler.pin_process(1234, [0], log=logs.append))
+        self.assertEqual(logs, ["CPU pinning unavailable (OpenProcess failed (winerror 5)); runs share all cores"])
+
+        with (
+            mock.patch.object(job_scheduler, "os", SimpleNamespace()),
+            mock.patch.object(job_scheduler, "sys", SimpleNamespace(platform="darwin", stderr=sys.stderr)),
+        ):
+            self.assertFalse(job_scheduler.pin_process(1, [0], log=logs.append))
+            self.assertFalse(job_scheduler.pin_process(2, [1], log=logs.append))
+        # One line per reason, not per run.
+        self.assertEqual(len(logs), 2)
+        self.assertIn("not supported on darwin", logs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
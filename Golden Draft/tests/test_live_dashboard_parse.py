@@ -1,4 +1,8 @@
+import importlib.util
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 
 class TestLiveDashboardParse(unittest.TestCase):
@@ -25,6 +29,92 @@ class TestLiveDashboardParse(unittest.TestCase):
 
         self.assertEqual(parse_log_file("/path/does/not/exist.log"), [])
 
+    def test_log_tail_parses_only_appended_lines(self):
+        from tools.live_dashboard import LogTail, parse_log_lines
+
+        lines = [
+            "grad_norm(theta_ptr)=2.0\n",
+            "step 1 | loss 1.0 | raw_delta=0.5 shard=1/8, traction=0.1\n",
+            "grad_norm(theta_ptr)=3.0\n",
+            "step 2 | loss 2.0 | raw_delta=0.6 shard=1/8\n",
+            "step 3 | loss 3.0 | raw_delta=0.7 shard=2/8\n",
+        ]
+
+        with tempfile.TemporaryDirectory() as td:
+            logpth = os.path.join(td, "vraxion.log")
+            tail = LogTail(logpth)
+            self.assertEqual(tail.poll(), 0)
+
+            with open(logpth, "w", encoding="utf-8") as fp:
+                fp.writelines(lines[:3])
+                fp.write("step 2 | loss 2.0 | raw_")  # partial line: not consumed yet
+            self.assertEqual(tail.poll(), 1)
+
+            # The grad carry from the previous poll attaches to step 2.
+            with open(logpth, "a", encoding="utf-8") as fp:
+                fp.write("delta=0.6 shard=1/8\n")
+                fp.write(lines[4])
+            self.assertEqual(tail.poll(), 2)
+            self.assertEqual(tail.poll(), 0)
+            self.assertEqual(tail.rows(), parse_log_lines(lines))
+
+            # Truncation restarts from the top.
+            with open(logpth, "w", encoding="utf-8") as fp:
+                fp.write(lines[4])
+            self.assertEqual(tail.poll(), 1)
+            self.assertEqual([r["step"] for r in tail.rows()], [3])
+
+            # Rotation: the file is moved away and a new one starts at the same path.
+            os.replace(logpth, os.path.join(td, "last.log"))
+            with open(logpth, "w", encoding="utf-8") as fp:
+                fp.writelines(lines[:2])
+            self.assertEqual(tail.poll(), 1)
+            self.assertEqual(tail.rows(), parse_log_lines(lines[:2]))
+            self.assertEqual(tail.resets, 2)
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas not installed")
+    def test_tail_frame_appends_only_new_rows(self):
+        from pandas.testing import assert_frame_equal
+
+        from tools.live_dashboard import LogTail, parse_log
+
+        lines = [
+            "grad_norm(theta_ptr)=2.0\n",
+            "step 1 | loss 1.0 | raw_delta=0.5 shard=1/8, traction=0.1\n",
+            "step 2 | loss 2.0 | raw_delta=0.6 shard=1/8\n",
+            "grad_norm(theta_ptr)=9.0\n",
+            "step 3 | loss 3.0 | raw_delta=0.7 shard=2/8\n",
+            # Restart from a checkpoint: step 2 repeats and must keep the first row.
+            "grad_norm(theta_ptr)=4.0\n",
+            "step 2 | loss 9.0 | raw_delta=0.9 shard=1/8\n",
+            "step 4 | loss 4.0 | raw_delta=0.8 shard=2/8\n",
+        ]
+
+        with tempfile.TemporaryDirectory() as td:
+            logpth = os.path.join(td, "vraxion.log")
+            tail = LogTail(logpth)
+            starts = []
+            real_to_frame = LogTail.to_frame
+
+            def _to_frame(obj, start=0):
+                starts.append(start)
+                return real_to_frame(obj, start)
+
+            with mock.patch.object(LogTail, "to_frame", _to_frame):
+                for upto in (2, 3, 5, 8, 8):
+                    with open(logpth, "w", encoding="utf-8") as fp:
+                        fp.writelines(lines[:upto])
+                    got = parse_log(logpth, tail=tail)
+                    want = parse_log(logpth)
+                    assert_frame_equal(got, want, check_dtype=False, obj=f"upto={upto}")
+
+            # Each refresh converted only the rows parsed since the previous one.
+            self.assertEqual(starts, [0, 1, 2, 3])
+            self.assertEqual(list(tail.frame()["step"]), [1, 2, 3, 4])
+            # Clipping for display does not touch the cached raw tension.
+            self.assertAlmostEqual(tail.frame()["tension"].max(), 9.0 * 0.7 / 100.0)
+            self.assertLess(parse_log(logpth, tail=tail)["tension"].max(), 9.0 * 0.7 / 100.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+"""Behavior locks for :mod:`vraxion.instnct.quantize`."""
+
+from __future__ import annotations
+
+import unittest
+from contextlib import nullcontext
+
+import torch
+import torch.nn as nn
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools.instnct_eval import EvalDeps, eval_model
+from vraxion.instnct import absolute_hallway as ah
+from vraxion.instnct import quantize
+
+
+def _tiny_model(**kwargs) -> ah.AbsoluteHallway:
+    with conftest.temporary_env(
+        VRX_SENSORY_RING="1",
+        VRX_VAULT="0",
+        VRX_THINK_RING="1",
+        VRX_NAN_GUARD=None,
+    ):
+        return ah.AbsoluteHallway(
+            input_dim=1, num_classes=4, ring_len=8, slot_dim=16, gauss_k=1, gauss_tau=2.0, **kwargs
+        )
+
+
+class QuantizeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._old_heads = ah.EXPERT_HEADS
+        ah.EXPERT_HEADS = 2
+
+    def tearDown(self) -> None:
+        ah.EXPERT_HEADS = self._old_heads
+
+    def test_export_converts_core_and_expert_linears(self) -> None:
+        torch.manual_seed(0)
+        model = _tiny_model()
+        qmodel = quantize.quantize_dynamic_int8(model)
+
+        self.assertEqual(
+            quantize.int8_module_names(model),
+            ["gru", "input_proj", "think_gru", "sensory_gru", "head.experts.0", "head.experts.1"],
+        )
+        for namstr in ("gru", "input_proj", "think_gru", "sensory_gru"):
+            self.assertFalse(torch.is_tensor(getattr(getattr(qmodel, namstr), "weight_ih", None)))
+            self.assertIsInstance(getattr(model, namstr), (nn.Linear, nn.GRUCell))
+        # Ring-side projections stay fp32.
+        self.assertIsInstance(qmodel.think_proj_in, nn.Linear)
+        self.assertLess(quantize.state_bytes(qmodel), quantize.state_bytes(model))
+
+        x = torch.randn(3, 6, 1)
+        logits, _ = qmodel(x, inference=True)
+        self.assertEqual(tuple(logits.shape), (3, 4))
+        self.assertTrue(torch.isfinite(logits).all().item())
+
+    def test_bypass_path_runs_quantized_cells(self) -> None:
+        torch.manual_seed(0)
+        model = _tiny_model(bypass_ring=True)
+        qmodel = quantize.quantize_dynamic_int8(model)
+        x = torch.randn(2, 5, 1)
+        with torch.no_grad():
+            ref, _ = model(x)
+            got, _ = qmodel(x)
+        self.assertLess(float((got - ref).abs().max()), 0.1)
+
+    def test_eval_model_accepts_quantized_model(self) -> None:
+        torch.manual_seed(0)
+        qmodel = quantize.quantize_dynamic_int8(_tiny_model())
+        batches = [(torch.randn(4, 6, 1), torch.tensor([0, 1, 2, 3]))]
+        deps = EvalDeps(device="cpu", dtype=torch.float32, amp_autocast=nullcontext, log=lambda _msg: None)
+        out = eval_model(qmodel, batches, "toy", "int8", deps=deps)
+        self.assertEqual(out["eval_n"], 4)
+
+    def test_accuracy_delta_numeric_keys_only(self) -> None:
+        delta = quantize.accuracy_delta(
+            {"eval_acc": 0.75, "eval_loss": 1.0, "eval_n": 8, "eval_acc_d0": None, "flag": True},
+            {"eval_acc": 0.5, "eval_loss": 1.5, "eval_n": 8, "eval_acc_d0": None, "flag": False},
+        )
+        self.assertEqual(delta, {"eval_acc": -0.25, "eval_loss": 0.5, "eval_n": 0.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
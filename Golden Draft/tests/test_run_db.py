@@ -3,13 +3,20 @@ import sqlite3
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools import run_db
+from tools.vcog_parse import OnlineStats
+
 
 ROOT = Path(__file__).resolve().parents[1]
 PY = sys.executable
 RUN_DB = ROOT / "tools" / "run_db.py"
+RUN_DB_QUERY = ROOT / "tools" / "run_db_query.py"
 
 
 class TestRunDb(unittest.TestCase):
@@ -133,6 +140,182 @@ class TestRunDb(unittest.TestCase):
             self.assertAlmostEqual(row[3], 0.1234, places=7)
             self.assertAlmostEqual(row[4], 0.2345, places=7)
 
+    def test_run_db_metrics_table_and_backfill(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            db_root = td / "db"
+
+            emit = td / "emit.py"
+            emit.write_text(
+                "\n".join(
+                    [
+                        "print('synth | demo | step 0001/0100 | loss 0.5000 | V_COG[ORB:2 RD:1.0e+00]')",
+                        "print('V_COG[ORB:3 RD:4.0e+00]')",
+                        "print('synth | demo | step 0002/0100 | loss 0.2500')",
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+
+            r = subprocess.run(
+                [PY, "-B", str(RUN_DB), "--db-root", str(db_root), "--run-name", "metrics", "--", PY, "-B", str(emit)],
+                cwd=str(ROOT),
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(r.returncode, 0, msg=r.stderr)
+            run_id = Path(r.stdout.strip().splitlines()[-1]).name
+
+            db_path = db_root / "runs.sqlite"
+            sql = "SELECT step, key, value FROM metrics WHERE run_id = ? ORDER BY rowid"
+            con = sqlite3.connect(str(db_path))
+            try:
+                self.assertEqual(con.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+                live = con.execute(sql, (run_id,)).fetchall()
+                con.execute("DELETE FROM metrics")
+                con.commit()
+            finally:
+                con.close()
+
+            # The V_COG-only line inherits step 1 from the preceding step line.
+            self.assertEqual(
+                live,
+                [
+                    (1, "loss", 0.5),
+                    (1, "vcog.ORB", 2.0),
+                    (1, "vcog.RD", 1.0),
+                    (1, "vcog.ORB", 3.0),
+                    (1, "vcog.RD", 4.0),
+                    (2, "loss", 0.25),
+                ],
+            )
+
+            q = subprocess.run(
+                [PY, "-B", str(RUN_DB_QUERY), "--db-root", str(db_root), "backfill"],
+                cwd=str(ROOT),
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(q.returncode, 0, msg=q.stderr)
+            self.assertIn(f"{run_id}  rows=6", q.stdout)
+
+            con = sqlite3.connect(str(db_path))
+            try:
+                self.assertEqual(con.execute(sql, (run_id,)).fetchall(), live)
+            finally:
+                con.close()
+
+            q = subprocess.run(
+                [PY, "-B", str(RUN_DB_QUERY), "--db-root", str(db_root), "metrics", "loss", "--step", "2", "--last-runs", "5"],
+                cwd=str(ROOT),
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(q.returncode, 0, msg=q.stderr)
+            self.assertEqual(q.stdout.strip(), f"{run_id}  step=2  loss=0.25")
+
+    def test_run_db_fts_grep_and_backfill(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            db_root = td / "db"
+
+            emit = td / "emit.py"
+            emit.write_text(
+                "import sys\n"
+                "print('synth | demo | step 0001/0100 | loss 0.5000')\n"
+                "print('Checkpoint saved', file=sys.stderr)\n",
+                encoding="utf-8",
+            )
+
+            def _record(*extra: str) -> Path:
+                r = subprocess.run(
+                    [PY, "-B", str(RUN_DB), "--db-root", str(db_root), *extra, "--", PY, "-B", str(emit)],
+                    cwd=str(ROOT),
+                    capture_output=True,
+                    text=True,
+                )
+                self.assertEqual(r.returncode, 0, msg=r.stderr)
+                return Path(r.stdout.strip().splitlines()[-1])
+
+            def _grep(*args: str) -> subprocess.CompletedProcess:
+                return subprocess.run(
+                    [PY, "-B", str(RUN_DB_QUERY), "--db-root", str(db_root), "grep", *args],
+                    cwd=str(ROOT),
+                    capture_output=True,
+                    text=True,
+                )
+
+            indexed = _record("--run-name", "fts", "--fts")
+            (indexed / "stderr.log").unlink()
+
+            # Literal runs are served from the index (the log file is gone).
+            q = _grep("check.oint", "-i", "--run-id", indexed.name)
+            self.assertEqual(q.returncode, 0, msg=q.stderr)
+            self.assertEqual(q.stdout.strip(), f"{indexed.name}/stderr.log: Checkpoint saved")
+
+            # The regex still post-filters FTS candidates (trigram matching is case-insensitive).
+            self.assertEqual(_grep("checkpoint", "--run-id", indexed.name).returncode, 1)
+
+            # Patterns without required literals scan the files.
+            self.assertEqual(_grep("Check(p|x)oint", "--run-id", indexed.name).returncode, 1)
+
+            plain = _record("--run-name", "plain")
+            q = subprocess.run(
+                [PY, "-B", str(RUN_DB_QUERY), "--db-root", str(db_root), "backfill", "--logs"],
+                cwd=str(ROOT),
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(q.returncode, 0, msg=q.stderr)
+            self.assertIn(f"{plain.name}  log_lines=", q.stdout)
+            self.assertNotIn(f"{indexed.name}  log_lines=", q.stdout)
+
+            (plain / "stdout.log").unlink()
+            q = _grep("loss 0.5000")
+            self.assertEqual(q.returncode, 0, msg=q.stderr)
+            self.assertEqual(
+                sorted(q.stdout.strip().splitlines()),
+                sorted(f"{d.name}/stdout.log: synth | demo | step 0001/0100 | loss 0.5000" for d in (plain, indexed)),
+            )
+
+    def test_run_writer_batches_and_final_flushes(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            with (
+                open(td / "stdout.log", "w", encoding="utf-8", newline="") as out_fp,
+                open(td / "stderr.log", "w", encoding="utf-8", newline="") as err_fp,
+                open(td / "metrics.jsonl", "w", encoding="utf-8", newline="\n") as met_fp,
+            ):
+                loss_stats = OnlineStats()
+                writer = run_db._RunWriter(
+                    log_fps={"stdout": out_fp, "stderr": err_fp},
+                    metrics_fp=met_fp,
+                    loss_stats=loss_stats,
+                    last_vcog={},
+                    flush_interval_s=0.05,
+                )
+                try:
+                    # A line split across chunks is recorded once it completes.
+                    writer.put("stdout", "synth | demo | step 0001/0100 | lo")
+                    writer.put("stdout", "ss 0.5000\nsynth | demo | step 0002/0100 | loss 0.2500")
+
+                    deadline = time.monotonic() + 5.0
+                    while "step 0002" not in (td / "stdout.log").read_text(encoding="utf-8"):
+                        self.assertLess(time.monotonic(), deadline, "time-budget flush never happened")
+                        time.sleep(0.01)
+                    flushed = (td / "metrics.jsonl").read_text(encoding="utf-8").splitlines()
+                    self.assertEqual([json.loads(ln)["step"] for ln in flushed], [1])
+
+                    # EOF records the trailing partial line.
+                    writer.put("stdout", None)
+                finally:
+                    writer.close()
+
+                events = [json.loads(ln) for ln in (td / "metrics.jsonl").read_text(encoding="utf-8").splitlines()]
+                self.assertEqual([ev["step"] for ev in events], [1, 2])
+                self.assertEqual(loss_stats.to_dict()["n"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+"""Behavior locks for :mod:`vraxion.instnct.runtime_config`."""
+
+from __future__ import annotations
+
+import dataclasses
+import unittest
+
+import torch
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from vraxion.instnct import runtime_config
+from vraxion.instnct.absolute_hallway import AbsoluteHallway
+from vraxion.instnct.runtime_config import RuntimeConfig
+
+
+def _tiny_model(**kwargs) -> AbsoluteHallway:
+    return AbsoluteHallway(
+        input_dim=2,
+        num_classes=3,
+        ring_len=8,
+        slot_dim=8,
+        ptr_stride=1,
+        gauss_k=1,
+        gauss_tau=2.0,
+        **kwargs,
+    )
+
+
+class RuntimeConfigTests(unittest.TestCase):
+    def test_from_env_parsing_matches_legacy(self) -> None:
+        cfg = RuntimeConfig.from_env(
+            {
+                "VRX_NAN_GUARD": " 1 ",
+                "VRX_PTR_INERTIA_OVERRIDE": "not-a-float",
+                "VRX_FORCE_CADENCE_1": "1",
+                "VRX_IGNORE_MAX_STEPS": "true",
+                "VRX_SENSORY_RING": "off",
+                "VRX_VAULT_LEN": "bad",
+                "VRX_THINK_RING_ALPHA": "0.3",
+                "VRX_THINK_RING_FAST_SHARE": "0.25",
+            }
+        )
+        self.assertTrue(cfg.nan_guard)
+        # Any value (even malformed) counts as "override set".
+        self.assertTrue(cfg.ptr_inertia_override_set)
+        self.assertIsNone(cfg.ptr_inertia_override)
+        self.assertTrue(cfg.force_cadence_1)
+        self.assertFalse(cfg.ignore_max_steps)
+        self.assertFalse(cfg.sensory_ring)
+        self.assertEqual(cfg.vault_len, 32)
+        self.assertAlmostEqual(cfg.think_alpha_low, 0.3)
+        self.assertAlmostEqual(cfg.think_mix, 0.75)
+        self.assertIsNone(cfg.settings)
+
+    def test_snapshot_is_frozen(self) -> None:
+        cfg = RuntimeConfig.from_env({})
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            cfg.nan_guard = True  # type: ignore[misc]
+
+    def test_model_caches_snapshot_at_construction(self) -> None:
+        with conftest.temporary_env(VRX_SENSORY_RING="0", VRX_NAN_GUARD=None):
+            model = _tiny_model()
+        self.assertIsInstance(model.runtime_config, RuntimeConfig)
+        self.assertFalse(model.runtime_config.nan_guard)
+
+        # Later env changes do not leak into the hot path.
+        with conftest.temporary_env(VRX_NAN_GUARD="1"):
+            self.assertFalse(model.runtime_config.nan_guard)
+
+    def test_explicit_config_drives_nan_guard(self) -> None:
+        cfg = dataclasses.replace(RuntimeConfig.from_env({"VRX_SENSORY_RING": "0"}), nan_guard=True)
+        model = _tiny_model(runtime_config=cfg).cpu()
+        model.eval()
+        with torch.no_grad():
+            model.input_proj.weight.fill_(float("nan"))
+        with self.assertRaises(RuntimeError):
+            model(torch.randn(2, 3, 2))
+
+    def test_runtime_config_for_prefers_model_snapshot(self) -> None:
+        with conftest.temporary_env(VRX_SENSORY_RING="0", VRX_IGNORE_MAX_STEPS="1"):
+            model = _tiny_model()
+        with conftest.temporary_env(VRX_IGNORE_MAX_STEPS=None):
+            self.assertIs(runtime_config.runtime_config_for(model), model.runtime_config)
+            self.assertTrue(runtime_config.runtime_config_for(model).ignore_max_steps)
+            self.assertFalse(runtime_config.runtime_config_for(object()).ignore_max_steps)
+
+    def test_reload_rebuilds_process_snapshot(self) -> None:
+        with conftest.temporary_env(VRX_FORCE_CADENCE_1="1"):
+            first = runtime_config.reload()
+        self.assertTrue(first.force_cadence_1)
+        self.assertIs(runtime_config.get_runtime_config(), first)
+        self.assertIsNotNone(first.settings)
+
+        with conftest.temporary_env(VRX_FORCE_CADENCE_1=None):
+            second = runtime_config.reload()
+        self.assertFalse(second.force_cadence_1)
+        self.assertIs(runtime_config.get_runtime_config(), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import conftest  # noqa: F401  (import side-effect: sys.path bootstrap)
+
+from tools import sweep_assoc_repulsion as sar
+
+
+def _acc_for(env):
+    lam = float(env["PRISMN_DVLAM"])
+    tau = float(env["PRISMN_DVTAU"])
+    seed = int(env["VAR_RUN_SEED"])
+    # Peak at DVLAM=1e-3, DVTAU=0.2; seeds add a small offset.
+    return round(0.5 - abs(lam - 1e-3) - abs(tau - 0.2) + (seed - 126) * 0.001, 6)
+
+
+class TestSweepAssocRepulsion(unittest.TestCase):
+    def test_workers_manifest_summary_and_resume(self) -> None:
+        lock = threading.Lock()
+        calls = []
+        live = {"now": 0, "max": 0}
+        broken = {"dvlam_0.01_tau_0.1"}
+
+        def _fake_run_one(*, repo_root, run_root, extra_env, args, cpus=None):
+            name = run_root.name.split("_mosaic_", 1)[1]
+            with lock:
+                calls.append((name, cpus, extra_env.get("OMP_NUM_THREADS")))
+                live["now"] += 1
+                live["max"] = max(live["max"], live["now"])
+            try:
+                time.sleep(0.02)
+                if name in broken:
+                    raise RuntimeError("bench entrypoint exited rc=1")
+                run_root.mkdir(parents=True, exist_ok=True)
+                report = {"eval": {"eval_acc": _acc_for(extra_env)}}
+                (run_root / "report.json").write_text(json.dumps(report), encoding="utf-8")
+                return run_root
+            finally:
+                with lock:
+                    live["now"] -= 1
+
+        with tempfile.TemporaryDirectory() as td:
+            td_path = Path(td)
+
+            def _sweep(out_name, *extra):
+                with (
+                    mock.patch.object(sar, "_repo_root", return_value=td_path),
+                    mock.patch.object(sar, "_run_one", side_effect=_fake_run_one),
+                    mock.patch.object(sar, "cpu_partition", return_value=[[0, 1], [2, 3], [4, 5]]),
+                ):
+                    self.assertEqual(sar.main(["--out-jsonl", str(td_path / out_name), *extra]), 0)
+                rows = sar._read_jsonl(td_path / out_name)
+                return {(r["stage"], r["name"], r["seed"]): r.get("eval_acc", r.get("error")) for r in rows}
+
+            serial = _sweep("serial.jsonl")
+            self.assertEqual(live["max"], 1)
+            self.assertTrue(all(c[1] is None and c[2] is None for c in calls))
+            self.assertEqual(len(serial), 1 + 7 + 5 + 3)
+            self.assertIn(("dvtau", "dvlam_0.001_tau_0.2", 126), serial)
+
+            calls.clear()
+            par = _sweep("par.jsonl", "--workers", "3")
+            self.assertEqual(par, serial)
+            self.assertEqual(live["max"], 3)
+            self.assertTrue(all(c[2] == "2" for c in calls))
+
+            manifest = json.loads((td_path / "par.manifest.json").read_text(encoding="utf-8"))["runs"]
+            status = sorted(ent["status"] for ent in manifest.values())
+            self.assertEqual(status.count("error"), 1)
+            self.assertEqual(status.count("done"), 15)
+            summary = json.loads((td_path / "par.summary.json").read_text(encoding="utf-8"))
+            self.assertEqual(summary["stages"]["dvlam"], {"done": 6, "error": 1, "best": mock.ANY})
+            self.assertEqual(summary["stages"]["dvlam"]["best"]["name"], "dvlam_0.001_tau_0.1")
+            self.assertEqual(summary["confirm"]["n"], 3)
+
+            # Simulate a crash right after a run wrote report.json: drop its
+            # jsonl row and mark it running again. Resume must recover it and
+            # only rerun the failed point.
+            lines = (td_path / "par.jsonl").read_text(encoding="utf-8").splitlines()
+            keep = [ln for ln in lines if '"confirm_seed128"' not in ln]
+            (td_path / "par.jsonl").write_text("\n".join(keep) + "\n", encoding="utf-8")
+            for ent in manifest.values():
+                if ent["row"]["name"] == "confirm_seed128":
+                    ent["status"] = "running"
+            (td_path / "par.manifest.json").write_text(json.dumps({"runs": manifest}), encoding="utf-8")
+
+            broken.clear()
+            calls.clear()
+            _sweep("par.jsonl", "--workers", "3", "--resume")
+            self.assertEqual([c[0] for c in calls], ["dvlam_0.01_tau_0.1"])
+            manifest = json.loads((td_path / "par.manifest.json").read_text(encoding="utf-8"))["runs"]
+            self.assertTrue(all(ent["status"] == "done" for ent in manifest.values()))
+            rows = sar._read_jsonl(td_path / "par.jsonl")
+            self.assertEqual(sum(1 for r in rows if r["name"] == "confirm_seed128"), 1)
+
+    def test_run_one_pins_the_bench_process(self) -> None:
+        proc = mock.Mock(pid=4321)
+        proc.wait.return_value = 0
+        with tempfile.TemporaryDirectory() as td:
+            run_root = Path(td) / "run"
+            run_root.mkdir()
+            (run_root / "report.json").write_text("{}", encoding="utf-8")
+            with (
+                mock.patch.object(sar.subprocess, "Popen", return_value=proc),
+                mock.patch.object(sar, "pin_process", return_value=True) as pin,
+            ):
+                sar._run_one(repo_root=Path(td), run_root=run_root, extra_env={}, args=[], cpus=[2, 3])
+        self.assertEqual(pin.call_args.args, (4321, [2, 3]))
+        self.assertIn("log", pin.call_args.kwargs)
+
+    def test_baseline_failure_cancels_the_ladder(self) -> None:
+        calls = []
+
+        def _fake_run_one(*, repo_root, run_root, extra_env, args, cpus=None):
+            calls.append(run_root.name.split("_mosaic_", 1)[1])
+            raise RuntimeError("bench entrypoint exited rc=1")
+
+        with tempfile.TemporaryDirectory() as td:
+            td_path = Path(td)
+            with (
+                mock.patch.object(sar, "_repo_root", return_value=td_path),
+                mock.patch.object(sar, "_run_one", side_effect=_fake_run_one),
+            ):
+                with self.assertRaisesRegex(RuntimeError, "baseline failed"):
+                    sar.main(["--out-jsonl", str(td_path / "fail.jsonl")])
+            self.assertEqual(calls, ["baseline_div0"])
+            manifest = json.loads((td_path / "fail.manifest.json").read_text(encoding="utf-8"))["runs"]
+            status = sorted(ent["status"] for ent in manifest.values())
+            self.assertEqual(status, ["error"] + ["pending"] * 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import math
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -7,7 +9,28 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from tools.vcog_parse import OnlineStats, parse_line, parse_vcog_kv
+from tools.vcog_parse import (
+    RESTEP,
+    REVCOG,
+    OnlineStats,
+    parse_files,
+    parse_line,
+    parse_lines,
+    parse_vcog_kv,
+)
+
+LINES = [
+    "synth | demo | step 0001/0100 | loss 0.1234 | V_COG[PRGRS:100.0% ORB:2 RD:1.0e+00 AC:1]",
+    "heartbeat ok",
+    "V_COG[ORB:3 NOTE:warm]",
+    "step 7 | loss nan-ish",
+    "stepping | loss 1.0",
+    "grad_norm(theta_ptr)=1.0e-03",
+    "train step 12 lr 0.1 loss 2.5e-01",
+    "V_COG[] step",
+    "V_COG[ORB:5 EXTRA:1.5]",
+    "",
+]
 
 
 class TestVcogParse(unittest.TestCase):
@@ -50,6 +73,49 @@ class TestVcogParse(unittest.TestCase):
         self.assertIsNone(ev)
         self.assertIsNone(vcog)
 
+    def test_prefilter_matches_regex_reference(self):
+        for line in LINES:
+            stpmat = RESTEP.search(line)
+            vcgmat = REVCOG.search(line)
+            ev, vcog = parse_line(line)
+            if stpmat is None and vcgmat is None:
+                self.assertEqual((ev, vcog), (None, None), line)
+                continue
+            assert ev is not None
+            self.assertEqual(ev.get("step"), int(stpmat.group(1)) if stpmat else None, line)
+            self.assertEqual(vcog, parse_vcog_kv(vcgmat.group(1)) if vcgmat else None, line)
+
+    def test_parse_lines_columns_match_parse_line(self):
+        want = []
+        for line in LINES:
+            ev, vcog = parse_line(line)
+            if ev is None and vcog is None:
+                continue
+            assert ev is not None
+            ev.pop("ts_utc")
+            want.append((ev, vcog))
+
+        cols = parse_lines(LINES)
+        self.assertEqual(cols.events(), want)
+        self.assertEqual(list(cols.line_no), [0, 2, 6, 7, 8])
+        self.assertEqual(list(cols.step), [1, -1, 12, -1, -1])
+        self.assertEqual(cols.vcog["ORB"], [2.0, 3.0, None, None, 5.0])
+        self.assertEqual(cols.vcog["EXTRA"], [None, None, None, None, 1.5])
+
+    def test_parse_files_pool_matches_serial(self):
+        with tempfile.TemporaryDirectory() as td:
+            paths = []
+            for idx in range(3):
+                pth = os.path.join(td, f"log{idx}.txt")
+                with open(pth, "w", encoding="utf-8") as fp:
+                    fp.write("\n".join(LINES[idx:]) + "\n")
+                paths.append(pth)
+
+            serial = [c.events() for c in parse_files(paths)]
+            pooled = [c.events() for c in parse_files(paths, workers=2)]
+        self.assertEqual(pooled, serial)
+        self.assertEqual(len(serial[0]), 5)
+
     def test_online_stats_ignores_nan_inf(self):
         st = OnlineStats()
         st.update(float("nan"))
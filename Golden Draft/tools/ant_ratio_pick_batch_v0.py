@@ -1,7 +1,11 @@
 """VRA-77: Pick batch per (ant_tier, expert_heads) to target reserved VRAM ratio.
 
-This tool runs the VRA-32 probe harness and selects a batch that lands near a
-target reserved VRAM ratio while remaining PASS.
+This tool measures candidate batches with the VRA-32 probe workload and selects
+a batch that lands near a target reserved VRAM ratio while remaining PASS.
+
+By default candidates are measured in-process (``tools/batch_autotune.py``):
+the model is built once per config and each candidate runs a short window.
+``--in-process 0`` falls back to one probe-harness subprocess per candidate.
 
 Hard rules (v0):
 - Run artifacts live under repo-root bench_vault/_tmp/... (gitignored).
@@ -343,6 +347,18 @@ def _run_probe_once(
     )
 
 
+def _tune_once(*, tuner: Any, out_dir: Path, batch: int, warmup_steps: int, measure_steps: int) -> ProbeObservation:
+    metrics = tuner.measure(int(batch), warmup_steps=int(warmup_steps), measure_steps=int(measure_steps))
+    tuner.write_artifacts(out_dir, metrics)
+    return ProbeObservation(
+        batch=int(batch),
+        run_root=str(out_dir),
+        vram_ratio_reserved=tuner.vram_ratio(metrics),
+        stability_pass=bool(_is_pass(metrics)),
+        fail_reasons=list(metrics.get("fail_reasons") or []),
+    )
+
+
 def _parse_csv_ints(s: str) -> List[int]:
     out: List[int] = []
     for part in (s or "").split(","):
@@ -397,6 +413,15 @@ def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
     ap.add_argument("--accept-low", type=float, default=0.82)
     ap.add_argument("--accept-high", type=float, default=0.88)
     ap.add_argument("--max-calls", type=int, default=10, help="Hard cap on probe calls per config.")
+    ap.add_argument(
+        "--in-process",
+        type=int,
+        default=1,
+        choices=(0, 1),
+        help="1: measure candidates in-process (model built once per config); 0: one probe subprocess per candidate.",
+    )
+    ap.add_argument("--tune-warmup-steps", type=int, default=2, help="Warmup steps per in-process candidate.")
+    ap.add_argument("--tune-measure-steps", type=int, default=10, help="Measured steps per in-process candidate.")
     ap.add_argument("--force-device", default="", help="Optional VRX_FORCE_DEVICE override passed to probe (cpu/cuda).")
     ap.add_argument("--out-root", default="", help="Output root dir. Default: bench_vault/_tmp/vra77_batch_target_v0/<ts>/")
     return ap.parse_args(list(argv) if argv is not None else None)
@@ -416,6 +441,25 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     ant_tiers = _parse_csv_strs(args.ant_tiers)
     expert_heads = _parse_csv_ints(args.expert_heads)
 
+    in_process = int(args.in_process) == 1
+    if in_process:
+        warmup_steps, measure_steps = int(args.tune_warmup_steps), int(args.tune_measure_steps)
+        if str(args.force_device).strip():
+            os.environ["VRX_FORCE_DEVICE"] = str(args.force_device).strip()
+        try:  # pragma: no cover
+            from .batch_autotune import BatchAutotuner
+            from .gpu_env_dump import collect_env
+        except ImportError:  # pragma: no cover
+            draft_root = Path(__file__).resolve().parents[1]
+            if str(draft_root) not in sys.path:
+                sys.path.insert(0, str(draft_root))
+            from tools.batch_autotune import BatchAutotuner
+            from tools.gpu_env_dump import collect_env
+        # One env dump (nvidia-smi, git) shared by every config's artifacts.
+        env_obj = collect_env(precision=str(args.precision), amp=int(args.amp))
+    else:
+        warmup_steps, measure_steps = int(args.warmup_steps), int(args.measure_steps)
+
     rows: List[Dict[str, Any]] = []
 
     for tier in ant_tiers:
@@ -424,10 +468,16 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             tag = _safe_tag(f"{tier}_E{eh}")
             runs_dir = out_root / "runs" / tag
 
+            tuner: Any = None
+
             def _eval_at_batch(b: int) -> ProbeObservation:
                 run_dir = runs_dir / _safe_tag(
-                    f"{tier}_x_real_E{int(eh)}_B{int(b):04d}_{args.precision}_amp{int(args.amp)}_ms{int(args.measure_steps)}"
+                    f"{tier}_x_real_E{int(eh)}_B{int(b):04d}_{args.precision}_amp{int(args.amp)}_ms{measure_steps}"
                 )
+                if tuner is not None:
+                    return _tune_once(
+                        tuner=tuner, out_dir=run_dir, batch=int(b), warmup_steps=warmup_steps, measure_steps=measure_steps
+                    )
                 return _run_probe_once(
                     repo_root=repo_root,
                     probe_tool=probe_tool,
@@ -436,14 +486,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     colony=str(args.colony),
                     out_dim=int(eh),
                     batch=int(b),
-                    warmup_steps=int(args.warmup_steps),
-                    measure_steps=int(args.measure_steps),
+                    warmup_steps=warmup_steps,
+                    measure_steps=measure_steps,
                     precision=str(args.precision),
                     amp=int(args.amp),
                     force_device=str(args.force_device).strip(),
                 )
 
+            t0 = time.perf_counter()
             try:
+                if in_process:
+                    tuner = BatchAutotuner(
+                        ant=ant_preset,
+                        colony=str(args.colony),
+                        out_dim=int(eh),
+                        precision=str(args.precision),
+                        amp=int(args.amp),
+                        env_obj=env_obj,
+                    )
                 res = pick_batch_for_target(
                     eval_at_batch=_eval_at_batch,
                     target_ratio=float(args.target),
@@ -463,6 +523,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     notes=[f"exception: {exc}"],
                     observations=[],
                 )
+            finally:
+                if tuner is not None:
+                    tuner.close()
+                    tuner = None
+            pick_wall_s = time.perf_counter() - t0
+            print(f"[vra77] {tier}/E{eh}: chosen_batch={res.chosen_batch} in {pick_wall_s:.1f}s", file=sys.stderr)
 
             row: Dict[str, Any] = {
                 "ant_tier": str(tier),
@@ -479,6 +545,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 "boundary_fail_run_root": res.boundary_fail_run_root,
                 "unusable": bool(res.unusable),
                 "notes": list(res.notes),
+                "probe_mode": "in_process" if in_process else "subprocess",
+                "pick_wall_s": round(pick_wall_s, 3),
             }
             rows.append(row)
 
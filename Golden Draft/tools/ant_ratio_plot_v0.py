@@ -5,6 +5,9 @@ Output: A single HTML file with embedded data and a small dashboard.
 
 Implementation choice (v0):
 - Use Plotly via CDN to avoid Python dependencies.
+- ``--max-points`` caps every trace (min/max-preserving, see downsample.py);
+  ``--lod`` also embeds the full-resolution 2D traces and swaps them in,
+  re-decimated to the visible x-range, when a 2D plot is zoomed.
 """
 
 from __future__ import annotations
@@ -16,6 +19,14 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+try:  # pragma: no cover
+    from .downsample import METHODS, downsample_indices
+except ImportError:  # pragma: no cover
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools.downsample import METHODS, downsample_indices
+
 
 def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
@@ -90,7 +101,139 @@ def _compute_desirability(
     return (tok_log_norm, ratio_fit, max(0.0, min(1.0, tok_log_norm * ratio_fit)))
 
 
-def build_html(*, packets: List[Dict[str, Any]], title: str) -> str:
+_POINT_KEYS = ("x", "y", "z", "text")
+_MARKER_KEYS = ("size", "color", "symbol")
+
+
+def _take_points(trace: Dict[str, Any], idx: Sequence[int]) -> Dict[str, Any]:
+    """Subset every per-point array of a Plotly trace."""
+
+    npts = len(trace.get("x") or [])
+    out = dict(trace)
+    for key in _POINT_KEYS:
+        vals = trace.get(key)
+        if isinstance(vals, list) and len(vals) == npts:
+            out[key] = [vals[i] for i in idx]
+    marker = trace.get("marker")
+    if isinstance(marker, dict):
+        marker = dict(marker)
+        for key in _MARKER_KEYS:
+            vals = marker.get(key)
+            if isinstance(vals, list) and len(vals) == npts:
+                marker[key] = [vals[i] for i in idx]
+        out["marker"] = marker
+    return out
+
+
+def _cap_trace(trace: Dict[str, Any], budget: int, method: str) -> Dict[str, Any]:
+    """Keep about ``budget`` points: per value axis (y, z), extremes along x."""
+
+    xs = trace.get("x") or []
+    npts = len(xs)
+    if budget <= 0 or npts <= budget:
+        return trace
+
+    order = sorted(range(npts), key=lambda i: float(xs[i]))
+    xsort = [float(xs[i]) for i in order]
+    valkeys = [k for k in ("y", "z") if isinstance(trace.get(k), list)]
+    per_key = max(2, budget // max(1, len(valkeys)))
+    keep: set = set()
+    for key in valkeys:
+        vals = [float(trace[key][i]) for i in order]
+        keep.update(order[j] for j in downsample_indices(vals, per_key, x=xsort, method=method))
+    return _take_points(trace, sorted(keep))
+
+
+def _json_for_script(obj: Any) -> str:
+    """JSON safe inside a <script type="application/json"> block (NaN -> null)."""
+
+    def _clean(val: Any) -> Any:
+        if isinstance(val, float) and not math.isfinite(val):
+            return None
+        if isinstance(val, list):
+            return [_clean(v) for v in val]
+        if isinstance(val, dict):
+            return {k: _clean(v) for k, v in val.items()}
+        return val
+
+    return json.dumps(_clean(obj), separators=(",", ":"), ensure_ascii=True).replace("</", "<\\/")
+
+
+_LOD_JS = """
+      const LOD_BUDGET = %(budget)d;
+      const lodCache = {};
+      const lodFine = (id) => {
+        if (!(id in lodCache)) {
+          const el = document.getElementById("fine_" + id);
+          lodCache[id] = el ? JSON.parse(el.textContent) : null;
+        }
+        return lodCache[id];
+      };
+      const lodTake = (tr, idx) => {
+        const n = tr.x.length;
+        const out = Object.assign({}, tr);
+        for (const k of ["x", "y", "z", "text"]) {
+          if (Array.isArray(tr[k]) && tr[k].length === n) out[k] = idx.map((i) => tr[k][i]);
+        }
+        if (tr.marker) {
+          out.marker = Object.assign({}, tr.marker);
+          for (const k of ["size", "color", "symbol"]) {
+            if (Array.isArray(tr.marker[k]) && tr.marker[k].length === n) out.marker[k] = idx.map((i) => tr.marker[k][i]);
+          }
+        }
+        return out;
+      };
+      // Points inside [x0, x1]; above the budget keep each bucket's min and max y.
+      const lodSlice = (tr, x0, x1) => {
+        const inside = [];
+        for (let i = 0; i < tr.x.length; i++) if (tr.x[i] >= x0 && tr.x[i] <= x1) inside.push(i);
+        if (inside.length <= LOD_BUDGET) return lodTake(tr, inside);
+        const nb = Math.max(1, Math.floor(LOD_BUDGET / 2));
+        const keep = [];
+        for (let b = 0; b < nb; b++) {
+          const lo = Math.floor((b * inside.length) / nb);
+          const hi = Math.floor(((b + 1) * inside.length) / nb);
+          let imin = -1;
+          let imax = -1;
+          for (let j = lo; j < hi; j++) {
+            const k = inside[j];
+            const v = tr.y[k];
+            if (v === null || !Number.isFinite(v)) { keep.push(k); continue; }
+            if (imin < 0 || v < tr.y[imin]) imin = k;
+            if (imax < 0 || v > tr.y[imax]) imax = k;
+          }
+          if (imin >= 0) keep.push(imin);
+          if (imax >= 0 && imax !== imin) keep.push(imax);
+        }
+        keep.sort((a, b) => a - b);
+        return lodTake(tr, keep);
+      };
+      const lodBind = (id, coarse) => {
+        const el = document.getElementById(id);
+        el.on("plotly_relayout", (ev) => {
+          const fine = lodFine(id);
+          if (!fine) return;
+          if (ev["xaxis.autorange"]) { Plotly.react(id, coarse, el.layout); return; }
+          const x0 = ev["xaxis.range[0]"];
+          const x1 = ev["xaxis.range[1]"];
+          if (x0 === undefined || x1 === undefined) return;
+          Plotly.react(id, fine.map((tr) => lodSlice(tr, x0, x1)), el.layout);
+        });
+      };
+      lodBind("plot_vram_tok", dataVramTok);
+      lodBind("plot_heads_tok", dataHeadsTok);
+      lodBind("plot_heads_acc", dataHeadsAcc);
+"""
+
+
+def build_html(
+    *,
+    packets: List[Dict[str, Any]],
+    title: str,
+    max_points: int = 0,
+    method: str = "minmax",
+    lod: bool = False,
+) -> str:
     # Partition points.
     pts: List[Dict[str, Any]] = []
     for p in packets:
@@ -317,6 +460,37 @@ def build_html(*, packets: List[Dict[str, Any]], title: str) -> str:
                 }
             )
 
+    # Point budget per trace (0 = embed everything). LOD keeps the uncapped 2D
+    # traces in inert JSON blocks that are only parsed when a plot is zoomed.
+    fine_blocks: List[str] = []
+    capped = False
+    if int(max_points) > 0:
+        fine2d = {
+            "plot_vram_tok": traces_vram_tok,
+            "plot_heads_tok": traces_heads_tok,
+            "plot_heads_acc": traces_heads_acc,
+        }
+        capped = any(
+            len(t.get("x") or []) > int(max_points) for traces in [traces3d, *fine2d.values()] for t in traces
+        )
+        traces3d = [_cap_trace(t, int(max_points), method) for t in traces3d]
+        traces_vram_tok = [_cap_trace(t, int(max_points), method) for t in traces_vram_tok]
+        traces_heads_tok = [_cap_trace(t, int(max_points), method) for t in traces_heads_tok]
+        traces_heads_acc = [_cap_trace(t, int(max_points), method) for t in traces_heads_acc]
+        if lod and capped:
+            for plot_id, traces in fine2d.items():
+                fine_blocks.append(
+                    f'<script type="application/json" id="fine_{plot_id}">{_json_for_script(traces)}</script>'
+                )
+    lod_js = (_LOD_JS % {"budget": int(max_points)}) if fine_blocks else ""
+    fine_html = "\n    ".join(fine_blocks)
+    cap_note = (
+        f"<br /><b>Downsampled:</b> at most ~{int(max_points)} points per trace ({_html_escape(method)})"
+        + ("; zoom a 2D plot for full detail" if fine_blocks else "")
+        if capped
+        else ""
+    )
+
     data3d_json = json.dumps(traces3d, separators=(",", ":"), ensure_ascii=True)
     vram_tok_json = json.dumps(traces_vram_tok, separators=(",", ":"), ensure_ascii=True)
     heads_tok_json = json.dumps(traces_heads_tok, separators=(",", ":"), ensure_ascii=True)
@@ -455,7 +629,7 @@ def build_html(*, packets: List[Dict[str, Any]], title: str) -> str:
           <b>Tiers:</b> {tier_list}<br />
           <b>Generated UTC span:</b> <code>{_html_escape(gen_span)}</code><br />
           <b>3D axes:</b> X=vram_ratio_reserved, Y=throughput_tokens_per_s, Z=assoc_byte_disjoint_accuracy<br />
-          <b>Color:</b> desirability = log_norm(tok/s) * exp(-((vram-{target_vram_ratio:.2f})/{ratio_sigma:.2f})^2), zeroed on FAIL
+          <b>Color:</b> desirability = log_norm(tok/s) * exp(-((vram-{target_vram_ratio:.2f})/{ratio_sigma:.2f})^2), zeroed on FAIL{cap_note}
         </div>
       </div>
 
@@ -498,6 +672,7 @@ def build_html(*, packets: List[Dict[str, Any]], title: str) -> str:
       </div>
     </div>
 
+    {fine_html}
     <script>
       const data3d = {data3d_json};
       const dataVramTok = {vram_tok_json};
@@ -534,7 +709,7 @@ def build_html(*, packets: List[Dict[str, Any]], title: str) -> str:
       Plotly.newPlot("plot_vram_tok", dataVramTok, layout2d("2D: tok/s vs VRAM ratio", "vram_ratio_reserved", "throughput_tokens_per_s"), {{ responsive: true }});
       Plotly.newPlot("plot_heads_tok", dataHeadsTok, layout2d("2D: tok/s vs expert_heads", "expert_heads", "throughput_tokens_per_s"), {{ responsive: true }});
       Plotly.newPlot("plot_heads_acc", dataHeadsAcc, layout2d("2D: accuracy vs expert_heads", "expert_heads", "assoc_byte_disjoint_accuracy"), {{ responsive: true }});
-    </script>
+{lod_js}    </script>
   </body>
 </html>
 """
@@ -545,6 +720,18 @@ def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
     ap.add_argument("--packets", required=True, help="Path to ant_ratio_packets.jsonl")
     ap.add_argument("--out", required=True, help="Output HTML path")
     ap.add_argument("--title", default="VRAXION Ant Ratio Frontier v0")
+    ap.add_argument(
+        "--max-points",
+        type=int,
+        default=5000,
+        help="Max points per plotted trace (min/max-preserving decimation; 0 = embed all).",
+    )
+    ap.add_argument("--downsample", choices=METHODS, default="minmax", help="Decimation method for --max-points.")
+    ap.add_argument(
+        "--lod",
+        action="store_true",
+        help="Also embed full-resolution 2D traces, swapped in (re-decimated) when zooming.",
+    )
     return ap.parse_args(list(argv) if argv is not None else None)
 
 
@@ -557,7 +744,13 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 2
 
     packets = _load_jsonl(packets_path)
-    html = build_html(packets=packets, title=str(args.title))
+    html = build_html(
+        packets=packets,
+        title=str(args.title),
+        max_points=int(args.max_points),
+        method=str(args.downsample),
+        lod=bool(args.lod),
+    )
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(html, encoding="utf-8")
     print(f"[plot] wrote: {out_path}")
@@ -21,7 +21,17 @@ import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover
+    from .gpu_capacity_model import load_capacity_model
+    from .job_scheduler import Job, JobContext, JobResult, SlotPool, default_cpu_threads, run_jobs
+except ImportError:  # pragma: no cover
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools.gpu_capacity_model import load_capacity_model
+    from tools.job_scheduler import Job, JobContext, JobResult, SlotPool, default_cpu_threads, run_jobs
 
 
 class SweepError(RuntimeError):
@@ -132,6 +142,7 @@ def _run_probe(
     amp: int,
     force_device: str,
     timeout_s: int,
+    env_extra: Optional[Mapping[str, str]] = None,
 ) -> Tuple[Path, Dict[str, Any]]:
     tool = repo_root / "Golden Draft" / "tools" / "gpu_capacity_probe.py"
     if not tool.exists():
@@ -161,6 +172,7 @@ def _run_probe(
         str(out_dir),
     ]
     env = dict(os.environ)
+    env.update(env_extra or {})
     if force_device:
         env["VRX_FORCE_DEVICE"] = str(force_device)
 
@@ -201,6 +213,7 @@ def _run_capability_train(
     offline_only: bool,
     save_every: int,
     timeout_s: int,
+    env_extra: Optional[Mapping[str, str]] = None,
 ) -> Tuple[Path, int]:
     """Run one synth assoc_byte training job and return checkpoint path."""
 
@@ -209,6 +222,7 @@ def _run_capability_train(
     log_path = run_root / "vraxion.log"
 
     env = dict(os.environ)
+    env.update(env_extra or {})
     env.update(
         {
             "VAR_PROJECT_ROOT": str(run_root),
@@ -302,6 +316,10 @@ def _run_capability_eval(
     force_disjoint: bool,
     timeout_s: int,
     heartbeat_s: int,
+    seq_threshold: Optional[float] = None,
+    seq_margin: Optional[float] = None,
+    eval_cache_root: str = "",
+    env_extra: Optional[Mapping[str, str]] = None,
 ) -> Tuple[Path, bool]:
     tool = repo_root / "Golden Draft" / "tools" / "eval_ckpt_assoc_byte.py"
     if not tool.exists():
@@ -327,11 +345,19 @@ def _run_capability_eval(
     ]
     if force_disjoint:
         cmd.append("--force-eval-disjoint")
+    # Sequential early-stopping eval (see instnct_eval.eval_model_sequential).
+    if seq_threshold is not None:
+        cmd.extend(["--seq-threshold", str(float(seq_threshold))])
+    if seq_margin is not None:
+        cmd.extend(["--seq-margin", str(float(seq_margin))])
+    if str(eval_cache_root).strip():
+        cmd.extend(["--eval-cache-root", str(eval_cache_root)])
 
     try:
         timeout: Optional[int]
         timeout = None if int(timeout_s) <= 0 else max(1, int(timeout_s))
-        cp = subprocess.run(cmd, cwd=str(repo_root), timeout=timeout)
+        env = {**os.environ, **env_extra} if env_extra else None
+        cp = subprocess.run(cmd, cwd=str(repo_root), env=env, timeout=timeout)
         rc = int(cp.returncode)
     except subprocess.TimeoutExpired as exc:
         raise SweepError(f"capability eval timeout after {int(timeout_s)}s (run_root={run_root})") from exc
@@ -349,6 +375,43 @@ def _run_capability_eval(
     return rep, heartbeat_seen
 
 
+# Stage markers, written once a stage succeeded; --resume reuses finished stages.
+PROBE_DONE = "sweep_probe_done.json"
+TRAIN_DONE = "sweep_train_done.json"
+EVAL_DONE = "sweep_eval_done.json"
+
+
+def _read_done(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    try:
+        obj = _load_json(path)
+    except Exception:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _write_done(path: Path, obj: Dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(_stable_json(obj), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _job_mem_mb(model: Any, tier: str, batch: int) -> float:
+    """Capacity-model footprint estimate in MiB for ``tier`` at ``batch`` (0 if unknown).
+
+    Several calibrated combos can share one ant shape (different colonies);
+    the largest estimate wins.
+    """
+
+    if model is None:
+        return 0.0
+    ring_len, slot_dim = _ant_shape_for_tier(tier)
+    ests = [model.estimate_bytes_for_batch(key, int(batch)) for key in model.combo_keys_for_shape(ring_len=ring_len, slot_dim=slot_dim)]
+    ests = [int(e) for e in ests if e]
+    return max(ests) / float(1 << 20) if ests else 0.0
+
+
 def _write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     if not rows:
@@ -405,7 +468,57 @@ def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
     ap.add_argument("--cap-eval-timeout-s", type=int, default=900)
     ap.add_argument("--cap-eval-heartbeat-s", type=int, default=60)
     ap.add_argument("--cap-eval-retry-once", type=int, default=1, choices=[0, 1])
+    ap.add_argument(
+        "--cap-eval-cache-root",
+        default="",
+        help="run_db root for the persistent eval cache (resumed sweeps skip finished evals).",
+    )
+    ap.add_argument(
+        "--cap-eval-seq-threshold",
+        type=float,
+        default=None,
+        help="Stop capability eval early once the accuracy CI clears this value.",
+    )
+    ap.add_argument(
+        "--cap-eval-seq-margin",
+        type=float,
+        default=None,
+        help="Stop capability eval early once the accuracy CI half-width is <= this value.",
+    )
     ap.add_argument("--flush-every-config", type=int, default=1, choices=[0, 1])
+    # Scheduling (probe -> train -> eval per config; independent configs overlap)
+    ap.add_argument("--jobs", type=int, default=1, help="Max concurrent jobs (1 = serial).")
+    ap.add_argument("--cpu-threads", type=int, default=0, help="CPU thread pool shared by jobs (0 = all usable cores).")
+    ap.add_argument(
+        "--job-threads",
+        type=int,
+        default=0,
+        help="OMP/MKL threads per job when --jobs > 1 (0 = cpu-threads // jobs).",
+    )
+    ap.add_argument(
+        "--gpu-slots",
+        type=int,
+        default=1,
+        help="Concurrent GPU jobs (default 1 keeps probe VRAM/throughput measurements isolated; 0 = no GPU gating).",
+    )
+    ap.add_argument(
+        "--gpu-devices",
+        default="",
+        help="Comma-separated CUDA device ids, one slot each (repeat an id to share it); overrides --gpu-slots.",
+    )
+    ap.add_argument("--ram-budget-mb", type=float, default=0.0, help="Memory budget for concurrent jobs (0 = unlimited).")
+    ap.add_argument(
+        "--capacity-model",
+        default="",
+        help="capacity_model_v1.json for per-job memory estimates (default: tools/capacity_model_v1.json).",
+    )
+    ap.add_argument(
+        "--resume",
+        type=int,
+        default=0,
+        choices=[0, 1],
+        help="Reuse stages whose sweep_*_done.json marker and artifacts exist; rewrites the packets file.",
+    )
     # Fairness
     ap.add_argument("--seq-len", type=int, default=256, help="Accounting seq_len used for token budget computation.")
     ap.add_argument("--token-budget", type=int, default=1_000_000, help="Fixed token budget for capability runs.")
@@ -480,10 +593,16 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             "heartbeat_s": int(args.cap_eval_heartbeat_s),
             "eval_timeout_mode": "disabled" if int(args.cap_eval_timeout_s) <= 0 else "fixed",
             "flush_every_config": bool(int(args.flush_every_config)),
+            "cap_eval_seq_threshold": args.cap_eval_seq_threshold,
+            "cap_eval_seq_margin": args.cap_eval_seq_margin,
+            "cap_eval_cache_root": str(args.cap_eval_cache_root),
+            "jobs": int(args.jobs),
+            "resume": bool(int(args.resume)),
         }
         (out_root / "sweep_meta.json").write_text(_stable_json(meta), encoding="utf-8")
         (out_root / "sweep_failures.json").write_text(_stable_json({"failures": failures}), encoding="utf-8")
 
+    configs: List[Tuple[str, int, int, str]] = []
     for r in rows:
         if not isinstance(r, dict):
             continue
@@ -496,14 +615,42 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             continue
         if not isinstance(eh, int) or not isinstance(batch, int):
             continue
+        configs.append((tier, int(eh), int(batch), _safe_tag(f"{tier}_E{eh}_B{batch:04d}")))
+
+    resume = bool(int(args.resume))
+    if resume and packets_jsonl.exists():
+        # Packets are rebuilt from artifacts for every config below.
+        packets_jsonl.unlink()
+
+    njobs = max(1, int(args.jobs))
+    cpu_threads = int(args.cpu_threads) if int(args.cpu_threads) > 0 else default_cpu_threads()
+    job_threads = int(args.job_threads) if int(args.job_threads) > 0 else max(1, cpu_threads // njobs)
+    gpu_devices = [d.strip() for d in str(args.gpu_devices).split(",") if d.strip()]
+    if not gpu_devices:
+        gpu_devices = [""] * max(0, int(args.gpu_slots))
+    pool = SlotPool(cpu_threads=cpu_threads, gpu_devices=gpu_devices, ram_mb=float(args.ram_budget_mb))
+
+    cap_model = None
+    if float(args.ram_budget_mb) > 0:
+        model_path = Path(args.capacity_model) if str(args.capacity_model).strip() else Path(__file__).resolve().parent / "capacity_model_v1.json"
+        try:
+            cap_model = load_capacity_model(model_path)
+        except Exception as exc:
+            print(f"[vra78][warn] capacity model unavailable ({type(exc).__name__}: {exc}); memory estimates are 0")
 
-        cfg_tag = _safe_tag(f"{tier}_E{eh}_B{batch:04d}")
+    probe_gpu = str(args.probe_force_device).strip().lower() != "cpu"
+    train_gpu = str(args.cap_device) == "cuda"
+    eval_gpu = "cuda" in (cap_eval_device, cap_eval_fallback_device)
 
-        try:
+    def _probe_job(tier: str, eh: int, batch: int, cfg_tag: str) -> Any:
+        def _run(ctx: JobContext) -> Tuple[Path, Dict[str, Any]]:
             # 1) Probe run (cost metrics)
             probe_dir = out_root / "runs_probe" / cfg_tag
             probe_dir.mkdir(parents=True, exist_ok=True)
             probe_out_dir = probe_dir / "probe"
+            done_path = probe_dir / PROBE_DONE
+            if resume and _read_done(done_path) is not None and (probe_out_dir / "metrics.json").exists():
+                return probe_out_dir, _load_json(probe_out_dir / "metrics.json")
             probe_out, probe_metrics = _run_probe(
                 repo_root=repo_root,
                 out_dir=probe_out_dir,
@@ -517,12 +664,23 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 amp=int(args.probe_amp),
                 force_device=str(args.probe_force_device).strip(),
                 timeout_s=int(args.probe_timeout_s),
+                env_extra=ctx.env_overrides(),
             )
+            _write_done(done_path, {"probe_out": str(probe_out)})
+            return probe_out, probe_metrics
+
+        return _run
 
+    def _train_job(tier: str, eh: int, batch: int, cfg_tag: str) -> Any:
+        def _run(ctx: JobContext) -> Tuple[Path, int]:
             # 2) Capability run (train + postmortem eval)
             ring_len, slot_dim = _ant_shape_for_tier(tier)
             steps = tb.steps_for_batch(int(batch))
             assoc_dir = out_root / "runs_assoc" / cfg_tag / f"seed{int(args.cap_seed)}"
+            done_path = assoc_dir / TRAIN_DONE
+            done = _read_done(done_path) if resume else None
+            if done is not None and Path(str(done.get("checkpoint"))).exists():
+                return Path(str(done["checkpoint"])), int(done.get("rc", 0))
             # Capability runs in this sweep are intentionally short/bounded. The
             # wallclock trainer checks MAX_STEPS before checkpoint cadence, so a
             # larger save interval can miss all saves. Force every-step saving to
@@ -549,7 +707,21 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 offline_only=bool(args.cap_offline_only),
                 save_every=int(save_every),
                 timeout_s=int(args.cap_train_timeout_s),
+                env_extra=ctx.env_overrides(),
             )
+            _write_done(done_path, {"checkpoint": str(ckpt), "rc": int(cap_train_rc)})
+            return ckpt, cap_train_rc
+
+        return _run
+
+    def _eval_job(tier: str, eh: int, batch: int, cfg_tag: str) -> Any:
+        def _run(ctx: JobContext) -> Dict[str, Any]:
+            assoc_dir = out_root / "runs_assoc" / cfg_tag / f"seed{int(args.cap_seed)}"
+            done_path = assoc_dir / EVAL_DONE
+            done = _read_done(done_path) if resume else None
+            if done is not None and (assoc_dir / "report.json").exists():
+                return done
+            ckpt, _ = ctx.results[f"{cfg_tag}/train"]
             used_eval_device = cap_eval_device
             eval_heartbeat_seen = False
             attempt_eval_count = 0
@@ -568,6 +740,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     force_disjoint=bool(args.cap_force_disjoint),
                     timeout_s=int(args.cap_eval_timeout_s),
                     heartbeat_s=int(args.cap_eval_heartbeat_s),
+                    seq_threshold=args.cap_eval_seq_threshold,
+                    seq_margin=args.cap_eval_seq_margin,
+                    eval_cache_root=str(args.cap_eval_cache_root),
+                    env_extra=ctx.env_overrides(),
                 )
                 eval_heartbeat_seen = bool(eval_heartbeat_seen or hb_seen)
 
@@ -594,6 +770,38 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     raise eval_exc
                 raise SweepError(f"capability eval failed without exception (run_root={assoc_dir})")
 
+            out = {
+                "cap_eval_device": str(used_eval_device),
+                "eval_heartbeat_seen": bool(eval_heartbeat_seen),
+                "attempt_eval_count": int(attempt_eval_count),
+            }
+            _write_done(done_path, out)
+            return out
+
+        return _run
+
+    jobs: List[Job] = []
+    for tier, eh, batch, cfg_tag in configs:
+        mem_mb = _job_mem_mb(cap_model, tier, batch)
+        jobs.append(Job(f"{cfg_tag}/probe", _probe_job(tier, eh, batch, cfg_tag), (), job_threads, probe_gpu, mem_mb))
+        jobs.append(Job(f"{cfg_tag}/train", _train_job(tier, eh, batch, cfg_tag), (f"{cfg_tag}/probe",), job_threads, train_gpu, mem_mb))
+        jobs.append(Job(f"{cfg_tag}/eval", _eval_job(tier, eh, batch, cfg_tag), (f"{cfg_tag}/train",), job_threads, eval_gpu, mem_mb))
+
+    results: Dict[str, JobResult] = {}
+    next_cfg = 0
+
+    def _emit_config(tier: str, eh: int, batch: int, cfg_tag: str) -> None:
+        try:
+            eval_res = results[f"{cfg_tag}/eval"]
+            if not eval_res.ok:
+                raise eval_res.error if eval_res.error is not None else SweepError(f"{cfg_tag}: eval did not run")
+            probe_out, probe_metrics = results[f"{cfg_tag}/probe"].value
+            _, cap_train_rc = results[f"{cfg_tag}/train"].value
+            eval_info = eval_res.value
+            used_eval_device = str(eval_info["cap_eval_device"])
+            steps = tb.steps_for_batch(int(batch))
+            assoc_dir = out_root / "runs_assoc" / cfg_tag / f"seed{int(args.cap_seed)}"
+
             # 3) Join into packet and append.
             pkt = build_packet(
                 probe_run_root=probe_out,
@@ -637,8 +845,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     "cap_train_rc": int(cap_train_rc),
                     "cap_train_nonzero_rc": bool(int(cap_train_rc) != 0),
                     "cap_eval_device": str(used_eval_device),
-                    "eval_heartbeat_seen": bool(eval_heartbeat_seen),
-                    "attempt_eval_count": int(attempt_eval_count),
+                    "eval_heartbeat_seen": bool(eval_info["eval_heartbeat_seen"]),
+                    "attempt_eval_count": int(eval_info["attempt_eval_count"]),
                     "probe_pass": bool(_is_probe_pass(probe_metrics)),
                     "vram_ratio_reserved": vram_ratio,
                     "vram_target_abs_error": target_abs_error,
@@ -690,6 +898,21 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 except Exception as exc:
                     print(f"[vra78][warn] flush failed: {type(exc).__name__}: {exc}")
 
+    def _on_done(res: JobResult) -> None:
+        # Configs are emitted strictly in batch-targets order, so packets and
+        # CSV rows match a serial sweep regardless of completion order.
+        nonlocal next_cfg
+        results[res.name] = res
+        while next_cfg < len(configs) and f"{configs[next_cfg][3]}/eval" in results:
+            _emit_config(*configs[next_cfg])
+            next_cfg += 1
+
+    if njobs > 1:
+        print(f"[vra78] scheduler: jobs={njobs} cpu_threads={cpu_threads} threads/job={job_threads} gpu_slots={len(gpu_devices)}")
+    # Serial runs keep the ambient thread env unless --job-threads is explicit.
+    thread_env = njobs > 1 or int(args.job_threads) > 0
+    run_jobs(jobs, pool, max_workers=njobs, thread_env=thread_env, on_done=_on_done)
+
     # Final flush + friendly output pointers.
     _flush_outputs()
 
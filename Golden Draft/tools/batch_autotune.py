@@ -0,0 +1,280 @@
+"""In-process batch autotuner for the VRA-32 probe workload.
+
+``gpu_capacity_probe.py`` measures one batch per process: every call pays
+Python + torch import, an env dump, model construction and warmup. Batch
+pickers that try many candidates per config spend most of their time there.
+
+``BatchAutotuner`` builds the model once per (ant, colony, out_dim, precision,
+amp) and measures candidate batches in the same process:
+  - each trial restores the initial weights, the model's plain controller
+    attributes (ptr_update_every, ptr_inertia, EMA state, ...) and a fresh
+    optimizer, so every batch starts from the state a fresh probe run would see;
+  - CUDA cached blocks are released and peak stats reset between trials, and
+    peaks are read over the measured window only (as in the probe);
+  - OOM and other runtime errors are caught and classified, then the trial's
+    tensors are dropped so the next (smaller) batch can still run.
+
+Trials return a metrics dict in the probe's metrics.json schema (PASS/FAIL per
+the objective contract) with ``probe_mode="in_process"`` added.
+``write_artifacts`` writes env.json/metrics.json/metrics.csv/summary.md so
+downstream readers work unchanged. Short windows (a couple of warmup steps,
+~10 measured steps) are enough for the VRAM peak; re-run the chosen batch
+through the probe harness when full-length throughput numbers are needed.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+try:  # pragma: no cover
+    from . import gpu_capacity_probe as gcp
+    from .instnct_evolution import _restore_attrs, _snapshot_attrs
+except ImportError:  # pragma: no cover
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools import gpu_capacity_probe as gcp
+    from tools.instnct_evolution import _restore_attrs, _snapshot_attrs
+
+
+def metrics_pass(metrics: Mapping[str, Any]) -> bool:
+    """Contract PASS: stability_pass is true and had_oom/had_nan/had_inf are false."""
+
+    return bool(
+        metrics.get("stability_pass") is True
+        and metrics.get("had_oom") is False
+        and metrics.get("had_nan") is False
+        and metrics.get("had_inf") is False
+    )
+
+
+class BatchAutotuner:
+    """Measure many batch sizes for one probe config without leaving the process.
+
+    ``ant``/``colony`` accept the same preset|json file|inline json forms as
+    the probe CLI. ``env_obj`` may pass a precollected ``gpu_env_dump`` dict to
+    share one env dump across tuners.
+    """
+
+    def __init__(
+        self,
+        *,
+        ant: str,
+        colony: str,
+        out_dim: int,
+        precision: str,
+        amp: int,
+        env_obj: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        gcp._bootstrap_import_path()
+        gcp._validate_precision_amp(str(precision), int(amp))
+        if int(out_dim) < 1:
+            raise ValueError("out_dim must be >= 1")
+
+        from tools import gpu_env_dump, workload_id
+
+        draft_root = Path(gcp.__file__).resolve().parents[1]
+        ant_obj = gcp._extract_subspec(gcp._load_spec_obj(str(ant), draft_root=draft_root), kind="ant")
+        col_obj = gcp._extract_subspec(gcp._load_spec_obj(str(colony), draft_root=draft_root), kind="colony")
+
+        self.out_dim = int(out_dim)
+        self.precision = str(precision)
+        self.amp = int(amp)
+        self._workload_id = workload_id
+        self._spec: Dict[str, Any] = {
+            "schema_version": workload_id.SCHEMA_VERSION,
+            "ant_spec": dict(ant_obj),
+            "colony_spec": dict(col_obj),
+        }
+        self._spec["ant_spec"]["precision"] = self.precision
+        canon, _ = self._canon(1)
+
+        self.env_obj: Dict[str, Any] = dict(
+            env_obj if env_obj is not None else gpu_env_dump.collect_env(precision=self.precision, amp=self.amp)
+        )
+        total = self.env_obj.get("total_vram_bytes")
+        self.total_vram_bytes: Optional[int] = total if isinstance(total, int) else None
+
+        import torch
+
+        self._torch = torch
+        self.device = gcp._resolve_device(torch)
+        self.model = gcp._build_model(torch, canon, out_dim=self.out_dim, device=self.device)
+        self._ptr_dtype = gcp._torch_dtype_from_ptr_dtype(torch, str(canon["ant_spec"]["ptr_dtype"]))
+        self._init_state = {k: v.detach().to("cpu", copy=True) for k, v in self.model.state_dict().items()}
+        self._init_attrs = _snapshot_attrs(self.model)
+
+    def _canon(self, batch: int) -> Tuple[Dict[str, Any], str]:
+        spec = {**self._spec, "colony_spec": {**self._spec["colony_spec"], "batch_size": int(batch)}}
+        canon = self._workload_id.canonicalize_spec(spec)
+        return canon, self._workload_id.compute_workload_id(canon)
+
+    def _release(self) -> None:
+        gc.collect()
+        if self.device == "cuda":
+            self._torch.cuda.synchronize()
+            self._torch.cuda.empty_cache()
+
+    def _timed_steps(self, train_step: Callable[[], Any], nsteps: int, metrics: Dict[str, Any]) -> Tuple[List[float], bool]:
+        torch = self._torch
+        durs: List[float] = []
+        events: List[Tuple[Any, Any]] = []
+        for _ in range(int(nsteps)):
+            if self.device == "cuda":
+                st = torch.cuda.Event(enable_timing=True)
+                en = torch.cuda.Event(enable_timing=True)
+                st.record()
+                loss = train_step()
+                en.record()
+                events.append((st, en))
+            else:
+                t0 = time.perf_counter()
+                loss = train_step()
+                durs.append(time.perf_counter() - t0)
+            if gcp._note_nonfinite(torch, metrics, loss):
+                return durs, False
+        if self.device == "cuda":
+            torch.cuda.synchronize()
+            durs.extend(float(st.elapsed_time(en)) / 1000.0 for st, en in events)
+        return durs, True
+
+    def measure(self, batch: int, *, warmup_steps: int = 2, measure_steps: int = 10) -> Dict[str, Any]:
+        """Run one trial at ``batch``; return probe-schema metrics (never raises on OOM)."""
+
+        if int(batch) < 1:
+            raise ValueError("batch must be >= 1")
+        if int(warmup_steps) < 0 or int(measure_steps) < 1:
+            raise ValueError("warmup_steps must be >= 0 and measure_steps >= 1")
+
+        torch = self._torch
+        canon, wl_id = self._canon(int(batch))
+        metrics = gcp._new_metrics(
+            canon=canon,
+            wl_id=wl_id,
+            probe_id=f"{wl_id}__E{self.out_dim}__{self.precision}_amp{self.amp}",
+            out_dim=self.out_dim,
+            precision=self.precision,
+            amp=self.amp,
+            warmup_steps=int(warmup_steps),
+            measure_steps=int(measure_steps),
+        )
+        metrics["device"] = self.device
+        metrics["probe_mode"] = "in_process"
+        metrics["step_time_mode"] = "cuda_events" if self.device == "cuda" else "perf_counter"
+
+        from vraxion.instnct import absolute_hallway
+
+        # Globals are shared by every model in the process; re-assert ours.
+        absolute_hallway.EXPERT_HEADS = self.out_dim
+        absolute_hallway.PTR_DTYPE = self._ptr_dtype
+
+        self._release()
+        opt = x = y = train_step = None
+        try:
+            _restore_attrs(self.model, self._init_attrs)
+            self.model.load_state_dict(self._init_state)
+            opt = torch.optim.Adam(self.model.parameters(), lr=1e-3)
+            synth_len = int(canon["colony_spec"]["synth_len"])
+            x = torch.randn(int(batch), synth_len, 1, device=self.device, dtype=torch.float32)
+            y = torch.randint(0, 256, (int(batch),), device=self.device, dtype=torch.long)
+            train_step = gcp._make_train_step(
+                torch, self.model, opt, x, y, device=self.device, precision=self.precision, amp=self.amp
+            )
+
+            _, warm_ok = self._timed_steps(train_step, int(warmup_steps), metrics)
+            if warm_ok:
+                if self.device == "cuda":
+                    torch.cuda.reset_peak_memory_stats()
+                    torch.cuda.synchronize()
+                wall_t0 = time.perf_counter()
+                durs, measured_ok = self._timed_steps(train_step, int(measure_steps), metrics)
+                wall_s = time.perf_counter() - wall_t0
+                gcp._finalize_timing(
+                    metrics, durs, measured_ok=measured_ok, measure_steps=int(measure_steps), wall_s=wall_s
+                )
+                gcp._record_vram(
+                    torch, metrics, use_cuda=self.device == "cuda", total_vram_bytes=self.total_vram_bytes
+                )
+        except Exception as exc:
+            gcp._record_exception(metrics, exc)
+        finally:
+            # Drop grads/optimizer state/batch tensors before the next trial.
+            self.model.zero_grad(set_to_none=True)
+            del opt, x, y, train_step
+            self._release()
+        return metrics
+
+    def close(self) -> None:
+        """Free the model so the next config's tuner starts from an empty device."""
+
+        self.model = None
+        self._init_state = {}
+        self._init_attrs = {}
+        self._release()
+
+    def vram_ratio(self, metrics: Mapping[str, Any]) -> Optional[float]:
+        reserved = metrics.get("peak_vram_reserved_bytes")
+        if isinstance(reserved, int) and self.total_vram_bytes:
+            return float(reserved) / float(self.total_vram_bytes)
+        return None
+
+    def write_artifacts(self, out_dir: Path, metrics: Mapping[str, Any]) -> Path:
+        """Write probe-layout artifacts for ``metrics`` under ``out_dir``."""
+
+        out_dir = Path(out_dir)
+        gcp._atomic_write_json(out_dir / gcp.ART_ENV, self.env_obj)
+        gcp._atomic_write_json(out_dir / gcp.ART_METRICS_JSON, metrics)
+        gcp._atomic_write_csv(out_dir / gcp.ART_METRICS_CSV, metrics)
+        summ = gcp._summary_md(
+            metrics,
+            probe_id=str(metrics.get("probe_id")),
+            wl_id=str(metrics.get("workload_id")),
+            precision=self.precision,
+            amp=self.amp,
+            out_dim=self.out_dim,
+        )
+        gcp._atomic_write_text(out_dir / gcp.ART_SUMMARY, summ + "\nMode: in-process autotune trial.\n")
+        return out_dir
+
+    def search_max_batch(
+        self, *, start: int = 1, max_batch: int = 4096, max_trials: int = 16, warmup_steps: int = 2, measure_steps: int = 10
+    ) -> Tuple[Optional[int], Dict[int, Dict[str, Any]]]:
+        """Largest PASS batch in [start, max_batch]: double until FAIL, then bisect.
+
+        Returns (best batch or None, metrics by tried batch). Assumes PASS is
+        monotone in batch (true for OOM/vram_guard, the usual limiters).
+        """
+
+        tried: Dict[int, Dict[str, Any]] = {}
+
+        def _ok(b: int) -> bool:
+            if b not in tried:
+                tried[b] = self.measure(b, warmup_steps=warmup_steps, measure_steps=measure_steps)
+            return metrics_pass(tried[b])
+
+        lo, hi = None, None
+        b = max(1, int(start))
+        while len(tried) < int(max_trials) and b <= int(max_batch):
+            if not _ok(b):
+                hi = b
+                break
+            lo = b
+            if b == int(max_batch):
+                break
+            b = min(int(max_batch), b * 2)
+        if lo is None:
+            return None, tried
+        while hi is not None and hi - lo > 1 and len(tried) < int(max_trials):
+            mid = (lo + hi) // 2
+            if _ok(mid):
+                lo = mid
+            else:
+                hi = mid
+        return lo, tried
+
+
+__all__ = ["BatchAutotuner", "metrics_pass"]
@@ -15,6 +15,10 @@ Usage (example):
     --seeds 111,222 ^
     --steps 1000 ^
     --hard-eval-samples 4096
+
+``--parallel`` runs the seeds concurrently, each pinned to its own disjoint
+slice of the usable CPUs (where the OS supports affinity) with OMP/MKL thread
+counts set to the slice width. Ingest/gate still runs once after all seeds.
 """
 
 from __future__ import annotations
@@ -25,8 +29,17 @@ import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover
+    from .job_scheduler import cpu_partition, pin_process, thread_env, usable_cpus
+except ImportError:  # pragma: no cover
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools.job_scheduler import cpu_partition, pin_process, thread_env, usable_cpus
 
 
 def _repo_root() -> Path:
@@ -46,6 +59,13 @@ def _parse_seeds(s: str) -> List[int]:
     return out
 
 
+def _start(cmd: List[str], *, cwd: str, env: Optional[Mapping[str, str]], cpus: Optional[Sequence[int]], capture: bool) -> subprocess.Popen:
+    pipe = subprocess.PIPE if capture else None
+    proc = subprocess.Popen(cmd, cwd=cwd, env=None if env is None else dict(env), text=True, stdout=pipe, stderr=pipe)
+    pin_process(proc.pid, cpus, log=lambda msg: print(f"[parallel] {msg}"))
+    return proc
+
+
 def _ensure_dashboard(repo_root: Path, port: int) -> None:
     launcher = repo_root / "Golden Draft" / "tools" / "_scratch" / "launch_results_dashboard.py"
     if not launcher.exists():
@@ -87,8 +107,13 @@ def _gate_row(*, run_root: Path) -> dict:
     chance = (1.0 / float(val_range)) if val_range else float("nan")
     acc = float(ev.get("eval_acc") or 0.0)
     n = int(ev.get("eval_n") or 0)
-    ci = _ci95(acc, n)
-    lower = acc - ci
+    if isinstance(ev.get("eval_ci_low"), (int, float)):
+        # Sequential postmortem eval: use its (anytime-valid) lower bound.
+        lower = float(ev["eval_ci_low"])
+        ci = acc - lower
+    else:
+        ci = _ci95(acc, n)
+        lower = acc - ci
     pass_gate = bool(val_range) and bool(n) and (lower > chance)
 
     return {
@@ -114,8 +139,15 @@ def _postmortem_eval(
     batch_size: int,
     device: str,
     prismn_id_scale: float,
+    seq_threshold: Optional[float] = None,
+    seq_method: str = "wilson",
+    env_extra: Optional[Mapping[str, str]] = None,
+    cpus: Optional[Sequence[int]] = None,
 ) -> None:
-    """Overwrite run_root/report.json with a high-precision eval from the latest checkpoint."""
+    """Overwrite run_root/report.json with a high-precision eval from the latest checkpoint.
+
+    With ``seq_threshold`` the eval stops early once the accuracy CI clears it.
+    """
     tool = repo_root / "Golden Draft" / "tools" / "eval_ckpt_assoc_byte.py"
     if not tool.exists():
         raise SystemExit(f"missing postmortem eval tool: {tool}")
@@ -140,12 +172,13 @@ def _postmortem_eval(
         "--prismn-id-scale",
         str(float(prismn_id_scale)),
     ]
+    if seq_threshold is not None:
+        cmd.extend(["--seq-threshold", str(float(seq_threshold)), "--seq-method", str(seq_method)])
 
-    subprocess.run(
-        cmd,
-        cwd=str(repo_root / "Golden Draft"),
-        check=True,
-    )
+    env = {**os.environ, **env_extra} if env_extra else None
+    proc = _start(cmd, cwd=str(repo_root / "Golden Draft"), env=env, cpus=cpus, capture=False)
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
 
 def _find_checkpoint(run_root: Path) -> Optional[Path]:
@@ -195,6 +228,8 @@ def _run_boot(
     eval_ptr_deterministic: bool,
     abort_after: int,
     abort_acc: float,
+    env_extra: Optional[Mapping[str, str]] = None,
+    cpus: Optional[Sequence[int]] = None,
 ) -> Tuple[Path, str]:
     boot = repo_root / "Golden Draft" / "benchmarks" / "boot_synth_assoc_byte" / "run_boot_synth_assoc_byte.py"
     if not boot.exists():
@@ -263,9 +298,11 @@ def _run_boot(
 
     env = os.environ.copy()
     env["PYTHONUNBUFFERED"] = "1"
+    env.update(env_extra or {})
 
-    p = subprocess.run(cmd, cwd=str(repo_root), env=env, text=True, capture_output=True)
-    out = (p.stdout or "") + "\n" + (p.stderr or "")
+    p = _start(cmd, cwd=str(repo_root), env=env, cpus=cpus, capture=True)
+    stdout, stderr = p.communicate()
+    out = (stdout or "") + "\n" + (stderr or "")
     if p.returncode != 0:
         raise RuntimeError(f"boot runner failed rc={p.returncode}\n{out[-4000:]}")
 
@@ -310,6 +347,76 @@ def _ingest_and_gate(repo_root: Path) -> None:
     subprocess.run([sys.executable, str(gate)], cwd=str(repo_root), check=True)
 
 
+def _run_seed(
+    args: argparse.Namespace,
+    repo_root: Path,
+    seed: int,
+    *,
+    cpus: Optional[Sequence[int]] = None,
+    threads: int = 0,
+) -> Tuple[Path, dict, float]:
+    """Train + postmortem-eval one seed; returns (run_root, gate_row, wall_s)."""
+
+    t0 = time.time()
+    full_tag = f"{args.tag}_seed{int(seed)}"
+    chance = 1.0 / float(int(args.val_range))
+    abort_after = int(args.soft_cap_steps) if int(args.soft_cap_steps) > 0 else 0
+    abort_acc = float(chance) - float(args.soft_abort_margin) if abort_after > 0 else 0.0
+    run_root, _ = _run_boot(
+        repo_root=repo_root,
+        tag=full_tag,
+        seed=int(seed),
+        steps=int(args.steps),
+        seq_len=int(args.seq_len),
+        batch_size=int(args.batch_size),
+        max_samples=int(max(args.max_samples, args.eval_samples)),
+        eval_samples=int(args.eval_samples),
+        ring_len=int(args.ring_len),
+        slot_dim=int(args.slot_dim),
+        device=str(args.device),
+        lr=float(args.lr),
+        model=str(args.model),
+        prismn_n=int(args.prismn_n),
+        prismn_mode=str(args.prismn_mode),
+        prismn_shared=int(args.prismn_shared),
+        prismn_out_dim=int(args.prismn_out_dim),
+        prismn_id_scale=float(args.prismn_id_scale),
+        synth_mode=str(args.synth_mode),
+        keys=int(args.keys),
+        pairs=int(args.pairs),
+        val_range=int(args.val_range),
+        assoc_unique_keys=bool(args.assoc_unique_keys),
+        assoc_mq_dup=int(args.assoc_mq_dup),
+        assoc_mq_grouped=int(args.assoc_mq_grouped),
+        eval_disjoint=bool(args.eval_disjoint),
+        eval_ptr_deterministic=bool(args.eval_ptr_deterministic),
+        abort_after=abort_after,
+        abort_acc=abort_acc,
+        env_extra=thread_env(threads) if threads else None,
+        cpus=cpus,
+    )
+    print(f"[run] seed={seed} run_root={run_root}")
+
+    # If the run was aborted early, don't spend time on high-precision eval.
+    r = _read_report(run_root)
+    steps_done = int((r.get("train") or {}).get("steps") or 0)
+    if steps_done >= int(args.steps):
+        _postmortem_eval(
+            repo_root=repo_root,
+            run_root=run_root,
+            checkpoint=_find_checkpoint(run_root),
+            eval_samples=int(args.hard_eval_samples),
+            batch_size=int(args.batch_size),
+            device=str(args.device),
+            prismn_id_scale=float(args.prismn_id_scale),
+            seq_threshold=chance if bool(args.seq_eval) else None,
+            seq_method=str(args.seq_method),
+            env_extra=thread_env(threads) if threads else None,
+            cpus=cpus,
+        )
+    return run_root, _gate_row(run_root=run_root), time.time() - t0
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     p = argparse.ArgumentParser()
     p.add_argument("--tag", type=str, default="dev32_sd4_rl64_od1")
@@ -350,6 +457,23 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=0.01,
         help="Abort if eval_acc < (chance - margin) at soft-cap.",
     )
+    p.add_argument(
+        "--seq-eval",
+        action="store_true",
+        help="Postmortem eval stops early once the accuracy CI clears chance (PASS/FAIL gate only).",
+    )
+    p.add_argument("--seq-method", type=str, default="wilson", choices=["wilson", "bernstein"])
+    p.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the seeds concurrently, each pinned to its own slice of the CPUs.",
+    )
+    p.add_argument(
+        "--threads-per-seed",
+        type=int,
+        default=0,
+        help="OMP/MKL threads per seed with --parallel (0 = width of its CPU slice).",
+    )
     p.add_argument("--dashboard-port", type=int, default=8520)
     # Optional ETA probe; disabled by default for datapoint mining.
     p.add_argument("--microprobe-steps", type=int, default=0)
@@ -422,61 +546,28 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(f"[microprobe] run_root={probe_root} (could not estimate sec/step from log)")
 
     # Full 2-seed datapoint.
-    run_roots: List[Path] = []
-    gate_rows: List[dict] = []
-    for seed in seeds2:
-        full_tag = f"{args.tag}_seed{int(seed)}"
-        chance = 1.0 / float(int(args.val_range))
-        abort_after = int(args.soft_cap_steps) if int(args.soft_cap_steps) > 0 else 0
-        abort_acc = float(chance) - float(args.soft_abort_margin) if abort_after > 0 else 0.0
-        run_root, _ = _run_boot(
-            repo_root=repo_root,
-            tag=full_tag,
-            seed=int(seed),
-            steps=int(args.steps),
-            seq_len=int(args.seq_len),
-            batch_size=int(args.batch_size),
-            max_samples=int(max(args.max_samples, args.eval_samples)),
-            eval_samples=int(args.eval_samples),
-            ring_len=int(args.ring_len),
-            slot_dim=int(args.slot_dim),
-            device=str(args.device),
-            lr=float(args.lr),
-            model=str(args.model),
-            prismn_n=int(args.prismn_n),
-            prismn_mode=str(args.prismn_mode),
-            prismn_shared=int(args.prismn_shared),
-            prismn_out_dim=int(args.prismn_out_dim),
-            prismn_id_scale=float(args.prismn_id_scale),
-            synth_mode=str(args.synth_mode),
-            keys=int(args.keys),
-            pairs=int(args.pairs),
-            val_range=int(args.val_range),
-            assoc_unique_keys=bool(args.assoc_unique_keys),
-            assoc_mq_dup=int(args.assoc_mq_dup),
-            assoc_mq_grouped=int(args.assoc_mq_grouped),
-            eval_disjoint=bool(args.eval_disjoint),
-            eval_ptr_deterministic=bool(args.eval_ptr_deterministic),
-            abort_after=abort_after,
-            abort_acc=abort_acc,
-        )
-        print(f"[run] seed={seed} run_root={run_root}")
-        run_roots.append(run_root)
-
-        # If the run was aborted early, don't spend time on high-precision eval.
-        r = _read_report(run_root)
-        steps_done = int((r.get("train") or {}).get("steps") or 0)
-        if steps_done >= int(args.steps):
-            _postmortem_eval(
-                repo_root=repo_root,
-                run_root=run_root,
-                checkpoint=_find_checkpoint(run_root),
-                eval_samples=int(args.hard_eval_samples),
-                batch_size=int(args.batch_size),
-                device=str(args.device),
-                prismn_id_scale=float(args.prismn_id_scale),
-            )
-        gate_rows.append(_gate_row(run_root=run_root))
+    t_all = time.time()
+    if bool(args.parallel):
+        parts = cpu_partition(len(seeds2), usable_cpus())
+        threads = [int(args.threads_per_seed) or len(part) for part in parts]
+        for seed, part, nthr in zip(seeds2, parts, threads):
+            print(f"[parallel] seed={seed} cpus={part[0]}..{part[-1]} ({len(part)}) threads={nthr}")
+        with ThreadPoolExecutor(max_workers=len(seeds2)) as pool:
+            futs = [
+                pool.submit(_run_seed, args, repo_root, int(seed), cpus=part, threads=nthr)
+                for seed, part, nthr in zip(seeds2, parts, threads)
+            ]
+            results = [fut.result() for fut in futs]
+    else:
+        results = [_run_seed(args, repo_root, int(seed)) for seed in seeds2]
+    wall_all = time.time() - t_all
+
+    run_roots = [res[0] for res in results]
+    gate_rows = [res[1] for res in results]
+    for seed, res in zip(seeds2, results):
+        print(f"[time] seed={seed} wall={res[2]:.1f}s")
+    seed_sum = sum(res[2] for res in results)
+    print(f"[time] total wall={wall_all:.1f}s sum_of_seeds={seed_sum:.1f}s speedup={seed_sum / max(wall_all, 1e-9):.2f}x")
 
     _ingest_and_gate(repo_root)
     print("[done] ingested + professor-gated results.")
@@ -0,0 +1,160 @@
+"""Point-budget downsampling for plotted series.
+
+Shared by ``live_dashboard.py`` (loss/tension vs step) and
+``ant_ratio_plot_v0.py`` (frontier traces embedded into HTML). Both functions
+return sorted *indices* into the input so callers can subset every per-point
+array of a trace (x, y, hover text, marker sizes, ...) consistently.
+
+Methods:
+  - ``minmax``: bucket decimation keeping the first/last point and each
+    bucket's min and max, so spikes always survive. Vectorized with NumPy; a
+    pure-Python path keeps ``ant_ratio_plot_v0`` dependency-free.
+  - ``lttb``: Largest-Triangle-Three-Buckets (visually smoother; needs NumPy).
+
+Non-finite values (NaN/inf: divergence markers) are always kept unless
+``keep_nonfinite=False``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, List, Optional, Sequence
+
+try:  # pragma: no cover
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+METHODS = ("minmax", "lttb")
+
+
+def _minmax_py(yvals: Sequence[float], budget: int, keep_nonfinite: bool) -> List[int]:
+    nitems = len(yvals)
+    nbuck = max(1, budget // 2)
+    keep = {0, nitems - 1}
+    for bidx in range(nbuck):
+        lo = (bidx * nitems) // nbuck
+        hi = ((bidx + 1) * nitems) // nbuck
+        fin = [i for i in range(lo, hi) if math.isfinite(yvals[i])]
+        if fin:
+            keep.add(min(fin, key=lambda i: yvals[i]))
+            keep.add(max(fin, key=lambda i: yvals[i]))
+    if keep_nonfinite:
+        keep.update(i for i in range(nitems) if not math.isfinite(yvals[i]))
+    return sorted(keep)
+
+
+def minmax_indices(y: Sequence[float], budget: int, *, keep_nonfinite: bool = True) -> List[int]:
+    """Indices keeping first/last plus each bucket's min and max of ``y``.
+
+    ``y`` is bucketed in index order (sort by x first). At most ``budget`` + 2
+    points are returned, plus non-finite points when ``keep_nonfinite``.
+    """
+
+    nitems = len(y)
+    if budget <= 0 or nitems <= max(2, budget):
+        return list(range(nitems))
+
+    if np is None:
+        return _minmax_py([float(v) for v in y], int(budget), keep_nonfinite)
+
+    yarr = np.asarray(y, dtype=np.float64)
+    nbuck = max(1, int(budget) // 2)
+    edges = np.linspace(0, nitems, nbuck + 1).astype(np.int64)
+    bucket = np.repeat(np.arange(nbuck), np.diff(edges))
+
+    finite = np.isfinite(yarr)
+    ylo = np.where(finite, yarr, np.inf)
+    yhi = np.where(finite, yarr, -np.inf)
+    mins = np.minimum.reduceat(ylo, edges[:-1])
+    maxs = np.maximum.reduceat(yhi, edges[:-1])
+
+    # First index per bucket hitting the bucket min / max (buckets with no
+    # finite value contribute nothing here).
+    hitlo = np.flatnonzero((ylo == mins[bucket]) & finite)
+    hithi = np.flatnonzero((yhi == maxs[bucket]) & finite)
+    _, firstlo = np.unique(bucket[hitlo], return_index=True)
+    _, firsthi = np.unique(bucket[hithi], return_index=True)
+
+    parts = [np.array([0, nitems - 1]), hitlo[firstlo], hithi[firsthi]]
+    if keep_nonfinite:
+        parts.append(np.flatnonzero(~finite))
+    return np.unique(np.concatenate(parts)).tolist()
+
+
+def lttb_indices(
+    x: Sequence[float], y: Sequence[float], budget: int, *, keep_nonfinite: bool = True
+) -> List[int]:
+    """Largest-Triangle-Three-Buckets selection of about ``budget`` points.
+
+    Runs on the finite points; non-finite ones are added back when
+    ``keep_nonfinite``.
+    """
+
+    if np is None:
+        raise RuntimeError("numpy is required for lttb downsampling")
+
+    xarr = np.asarray(x, dtype=np.float64)
+    yarr = np.asarray(y, dtype=np.float64)
+    nitems = len(yarr)
+    if budget <= 0 or nitems <= max(3, budget):
+        return list(range(nitems))
+
+    finite = np.isfinite(xarr) & np.isfinite(yarr)
+    finidx = np.flatnonzero(finite)
+    xfin = xarr[finidx]
+    yfin = yarr[finidx]
+    nfin = len(finidx)
+
+    if nfin <= max(3, budget):
+        chosen = np.arange(nfin)
+    else:
+        nbuck = int(budget) - 2
+        edges = np.linspace(1, nfin - 1, nbuck + 1).astype(np.int64)
+        chosen = np.empty(nbuck + 2, dtype=np.int64)
+        chosen[0] = 0
+        chosen[-1] = nfin - 1
+        anchor = 0
+        for bidx in range(nbuck):
+            lo, hi = edges[bidx], edges[bidx + 1]
+            if bidx + 1 < nbuck:
+                nlo, nhi = edges[bidx + 1], edges[bidx + 2]
+                avgx = xfin[nlo:nhi].mean()
+                avgy = yfin[nlo:nhi].mean()
+            else:
+                avgx, avgy = xfin[-1], yfin[-1]
+            ax, ay = xfin[anchor], yfin[anchor]
+            area = np.abs((ax - avgx) * (yfin[lo:hi] - ay) - (ax - xfin[lo:hi]) * (avgy - ay))
+            anchor = int(lo + np.argmax(area))
+            chosen[bidx + 1] = anchor
+
+    parts = [finidx[chosen]]
+    if keep_nonfinite:
+        parts.append(np.flatnonzero(~finite))
+    return np.unique(np.concatenate(parts)).tolist()
+
+
+def downsample_indices(
+    y: Sequence[float],
+    budget: int,
+    *,
+    x: Optional[Sequence[float]] = None,
+    method: str = "minmax",
+    keep_nonfinite: bool = True,
+) -> List[int]:
+    """Dispatch to ``minmax_indices`` / ``lttb_indices`` (lttb uses ``x`` or the index)."""
+
+    if method == "minmax":
+        return minmax_indices(y, budget, keep_nonfinite=keep_nonfinite)
+    if method == "lttb":
+        xvals: Any = x if x is not None else range(len(y))
+        return lttb_indices(list(xvals), y, budget, keep_nonfinite=keep_nonfinite)
+    raise ValueError(f"unknown downsampling method: {method!r} (expected one of {METHODS})")
+
+
+__all__ = [
+    "METHODS",
+    "downsample_indices",
+    "lttb_indices",
+    "minmax_indices",
+]
@@ -0,0 +1,289 @@
+"""Persistent eval result cache (SQLite under the run_db root).
+
+Postmortem evals (``eval_ckpt_assoc_byte.py``), sweep capability evals and
+repeated ``instnct_eval.eval_model`` calls often re-evaluate the same weights
+on the same eval set (resumed sweeps, rebuilt packets). This cache stores the
+eval payload keyed by:
+  - model state hash (sha256 over sorted state_dict names/dtypes/shapes/bytes)
+  - eval dataset fingerprint (sha256 over every batch the loader yields)
+  - eval-relevant settings (device, dtype, synth mode, ...; JSON, sorted keys),
+    including ``model_settings``: the model's ``RuntimeConfig`` env snapshot and
+    the UPPERCASE globals of its defining module (``PTR_DTYPE``,
+    ``EXPERT_HEADS``, ``PTR_KERNEL_LUT``, ...), which change results without
+    changing ``state_dict``
+  - code version (sha256 of the source files that define the eval, plus every
+    ``vraxion/instnct`` module)
+
+Any change to one of these yields a new key, so entries never need
+invalidation. The database lives at ``<db_root>/eval_cache.sqlite`` next to
+``runs.sqlite``.
+
+Payloads are stored as JSON, so a hit returns the JSON round-trip of what was
+put: tuples come back as lists and non-string dict keys as strings (``{0: x}``
+-> ``{"0": x}``). Payloads that are not JSON-serializable are not cached.
+
+The data fingerprint iterates the whole eval loader once before every eval,
+hit or miss: a miss reads the eval set twice. Loaders that draw from the
+global RNG while iterating advance it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as _dt
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import torch
+
+CACHE_FILENAME = "eval_cache.sqlite"
+
+
+def _hash_tensor(hasher: Any, tenval: torch.Tensor) -> None:
+    tenval = tenval.detach().cpu().contiguous()
+    hasher.update(f"{tenval.dtype}|{tuple(tenval.shape)}|".encode("ascii"))
+    if tenval.numel():
+        hasher.update(tenval.reshape(-1).view(torch.uint8).numpy().tobytes())
+
+
+def _hash_obj(hasher: Any, obj: Any) -> None:
+    if torch.is_tensor(obj):
+        _hash_tensor(hasher, obj)
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"seq{len(obj)}|".encode("ascii"))
+        for item in obj:
+            _hash_obj(hasher, item)
+    elif isinstance(obj, Mapping):
+        hasher.update(f"map{len(obj)}|".encode("ascii"))
+        for keystr in sorted(obj, key=str):
+            hasher.update(f"{keystr}=".encode("utf-8"))
+            _hash_obj(hasher, obj[keystr])
+    else:
+        hasher.update(repr(obj).encode("utf-8"))
+
+
+def state_hash(state: Mapping[str, Any]) -> str:
+    """Content hash of a ``state_dict`` (independent of device and key order)."""
+
+    hasher = hashlib.sha256()
+    for keystr in sorted(state):
+        hasher.update(f"{keystr}:".encode("utf-8"))
+        _hash_obj(hasher, state[keystr])
+    return hasher.hexdigest()
+
+
+def loader_fingerprint(loader: Iterable[Any]) -> str:
+    """Content hash of every batch an eval loader yields (order-sensitive)."""
+
+    hasher = hashlib.sha256()
+    for batch in loader:
+        _hash_obj(hasher, batch)
+    return hasher.hexdigest()
+
+
+def code_version(paths: Sequence[str | os.PathLike[str]]) -> str:
+    """Hash of the given source files (missing files hash as their path only)."""
+
+    hasher = hashlib.sha256()
+    for pth in sorted({os.fspath(p) for p in paths}):
+        hasher.update(os.path.basename(pth).encode("utf-8"))
+        try:
+            hasher.update(Path(pth).read_bytes())
+        except OSError:
+            hasher.update(b"<missing>")
+    return hasher.hexdigest()
+
+
+def instnct_sources() -> List[str]:
+    """Every ``vraxion/instnct`` source file (empty when vraxion is not importable)."""
+
+    try:
+        from vraxion import instnct
+    except ImportError:
+        return []
+    return sorted(str(pth) for pth in Path(instnct.__file__).resolve().parent.glob("*.py"))
+
+
+def model_settings(model: Any) -> Dict[str, Any]:
+    """Eval-relevant model state that ``state_dict`` does not capture.
+
+    - ``runtime_config``: the model's ``RuntimeConfig`` snapshot (``VRX_*``
+      knobs such as think alpha or the inertia override)
+    - ``module_globals``: UPPERCASE plain globals of the model's module
+    """
+
+    out: Dict[str, Any] = {}
+    try:
+        from vraxion.instnct.runtime_config import runtime_config_for
+    except ImportError:
+        runtime_config_for = None
+    if runtime_config_for is not None:
+        out["runtime_config"] = dataclasses.asdict(runtime_config_for(model))
+    modobj = sys.modules.get(type(model).__module__)
+    out["module_globals"] = {
+        keystr: repr(valobj)
+        for keystr, valobj in sorted(vars(modobj).items() if modobj is not None else ())
+        if keystr.isupper() and (valobj is None or isinstance(valobj, (bool, int, float, str, torch.dtype)))
+    }
+    return out
+
+
+def make_key(state_digest: str, data_digest: str, settings: Mapping[str, Any], code_digest: str) -> str:
+    setjsn = json.dumps(dict(settings), sort_keys=True, default=str)
+    return hashlib.sha256("|".join([state_digest, data_digest, setjsn, code_digest]).encode("utf-8")).hexdigest()
+
+
+class EvalCache:
+    """Key -> JSON payload store at ``<db_root>/eval_cache.sqlite``."""
+
+    def __init__(self, db_root: str | os.PathLike[str]):
+        self.path = Path(db_root) / CACHE_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        con = self._connect()
+        try:
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS eval_cache (
+                  cache_key TEXT PRIMARY KEY,
+                  state_hash TEXT,
+                  data_fingerprint TEXT,
+                  settings TEXT,
+                  code_version TEXT,
+                  created_utc TEXT,
+                  payload TEXT
+                )
+                """
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS eval_cache_state ON eval_cache(state_hash)")
+            con.commit()
+        finally:
+            con.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Concurrent sweeps share the file: WAL + a generous busy timeout.
+        con = sqlite3.connect(str(self.path), timeout=30.0)
+        con.execute("PRAGMA journal_mode=WAL")
+        return con
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored payload (after the JSON round-trip) or None."""
+
+        con = self._connect()
+        try:
+            row = con.execute("SELECT payload FROM eval_cache WHERE cache_key = ?", (key,)).fetchone()
+        finally:
+            con.close()
+        return json.loads(row[0]) if row else None
+
+    def put(
+        self,
+        key: str,
+        payload: Mapping[str, Any],
+        *,
+        state_digest: str = "",
+        data_digest: str = "",
+        settings: Optional[Mapping[str, Any]] = None,
+        code_digest: str = "",
+    ) -> bool:
+        """Store ``payload``; return False (nothing stored) if it is not JSON-serializable."""
+
+        try:
+            payjsn = json.dumps(payload, sort_keys=True)
+        except (TypeError, ValueError):
+            return False
+        con = self._connect()
+        try:
+            con.execute(
+                "INSERT OR REPLACE INTO eval_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    state_digest,
+                    data_digest,
+                    json.dumps(dict(settings or {}), sort_keys=True, default=str),
+                    code_digest,
+                    _dt.datetime.now(tz=_dt.timezone.utc).isoformat(),
+                    payjsn,
+                ),
+            )
+            con.commit()
+        finally:
+            con.close()
+        return True
+
+
+def cached_eval_model(
+    model: Any,
+    loader: Iterable[Any],
+    dataset_name: str,
+    model_name: str,
+    *,
+    deps: Any,
+    cache: EvalCache,
+    eval_fn: Optional[Callable[..., Dict[str, Any]]] = None,
+    extra_settings: Optional[Mapping[str, Any]] = None,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """``instnct_eval.eval_model`` with a persistent cache in front of it.
+
+    On a hit the stored dict is returned (and ``model.last_eval_acc`` is set,
+    matching the uncached side effect) without running the model. The loader
+    is iterated once for the fingerprint before every call, hit or miss.
+    """
+
+    from . import instnct_eval
+
+    evalfn = eval_fn or instnct_eval.eval_model
+    settings: Dict[str, Any] = {
+        "device": str(deps.device),
+        "dtype": str(deps.dtype),
+        "synth_mode": str(deps.synth_mode),
+        "mi_shuffle": bool(deps.mi_shuffle),
+        "mitosis_enabled": bool(deps.mitosis_enabled),
+        "eval_fn": getattr(evalfn, "__name__", str(evalfn)),
+    }
+    settings.update(model_settings(model))
+    settings.update(dict(extra_settings or {}))
+
+    srcpth = [instnct_eval.__file__, *instnct_sources()]
+    modfil = getattr(sys.modules.get(type(model).__module__), "__file__", None)
+    if modfil:
+        srcpth.append(modfil)
+
+    sdig = state_hash(model.state_dict())
+    ddig = loader_fingerprint(loader)
+    cdig = code_version(srcpth)
+    key = make_key(sdig, ddig, settings, cdig)
+
+    hit = cache.get(key)
+    if hit is not None:
+        if log is not None:
+            log(f"[eval_cache] hit {key[:12]} ({dataset_name} | {model_name})")
+        try:
+            model.last_eval_acc = hit.get("eval_acc")
+        except Exception:
+            pass
+        return hit
+
+    out = evalfn(model, loader, dataset_name, model_name, deps=deps)
+    if not cache.put(key, out, state_digest=sdig, data_digest=ddig, settings=settings, code_digest=cdig):
+        if log is not None:
+            log(f"[eval_cache] skip {key[:12]}: result is not JSON-serializable")
+    return out
+
+
+__all__ = [
+    "CACHE_FILENAME",
+    "EvalCache",
+    "cached_eval_model",
+    "code_version",
+    "instnct_sources",
+    "loader_fingerprint",
+    "make_key",
+    "model_settings",
+    "state_hash",
+]
@@ -256,6 +256,36 @@ def _build_absolute_hallway(shape: Dict[str, Any]):
     )
 
 
+def _rng_state() -> Dict[str, Any]:
+    """Python/NumPy/torch RNG state, so a second eval can replay the first one's draws."""
+
+    import random
+
+    state: Dict[str, Any] = {"random": random.getstate(), "torch": torch.get_rng_state()}
+    try:
+        import numpy as np
+
+        state["numpy"] = np.random.get_state()
+    except Exception:
+        pass
+    if torch.cuda.is_available() and torch.cuda.is_initialized():
+        state["cuda"] = torch.cuda.get_rng_state_all()
+    return state
+
+
+def _set_rng_state(state: Dict[str, Any]) -> None:
+    import random
+
+    random.setstate(state["random"])
+    torch.set_rng_state(state["torch"])
+    if "numpy" in state:
+        import numpy as np
+
+        np.random.set_state(state["numpy"])
+    if "cuda" in state:
+        torch.cuda.set_rng_state_all(state["cuda"])
+
+
 def _start_eval_heartbeat(log_fn: Any, heartbeat_s: int) -> Tuple[threading.Event, threading.Thread]:
     interval_s = max(1, int(heartbeat_s))
     stop = threading.Event()
@@ -295,6 +325,32 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Force subset eval split (ignore any inference from vraxion.log).",
     )
+    p.add_argument(
+        "--int8",
+        action="store_true",
+        help="Also eval an int8 dynamic-quantized CPU copy and report the accuracy delta vs fp32.",
+    )
+    p.add_argument(
+        "--seq-threshold",
+        type=float,
+        default=None,
+        help="Sequential eval: stop once the accuracy CI is entirely above/below this value.",
+    )
+    p.add_argument(
+        "--seq-margin",
+        type=float,
+        default=None,
+        help="Sequential eval: stop once the accuracy CI half-width is <= this value.",
+    )
+    p.add_argument("--seq-method", type=str, default="wilson", choices=["wilson", "bernstein"])
+    p.add_argument("--seq-confidence", type=float, default=0.95)
+    p.add_argument("--seq-min-samples", type=int, default=0)
+    p.add_argument(
+        "--eval-cache-root",
+        type=str,
+        default=os.environ.get("VRX_EVAL_CACHE_ROOT", ""),
+        help="run_db root holding eval_cache.sqlite; reuse results for identical weights/data/settings/code.",
+    )
     return p.parse_args(argv)
 
 
@@ -451,14 +507,117 @@ def main(argv: Optional[list[str]] = None) -> int:
         mi_shuffle=False,
         mitosis_enabled=False,
     )
-    hb_stop, hb_thread = _start_eval_heartbeat(infra.log, int(args.heartbeat_s))
-    try:
-        eval_sum = instnct_eval.eval_model(
-            model, eval_loader, "synth_assoc_byte", str(model_kind), deps=eval_deps
+    seq_spec: Optional[Any] = None
+    if args.seq_threshold is not None or args.seq_margin is not None:
+        seq_spec = instnct_eval.SequentialEvalSpec(
+            threshold=args.seq_threshold,
+            margin=args.seq_margin,
+            confidence=float(args.seq_confidence),
+            method=str(args.seq_method),
+            min_samples=int(args.seq_min_samples),
+            seed=int(seed),
         )
-    finally:
-        hb_stop.set()
-        hb_thread.join(timeout=1.0)
+    int8_report: Optional[Dict[str, Any]] = None
+    # Eval cache (see tools/eval_cache.py): identical weights + eval data +
+    # settings + code reuse the stored result instead of re-running the eval.
+    cache: Optional[Any] = None
+    cache_key = ""
+    cache_meta: Dict[str, Any] = {}
+    cache_hit: Optional[Dict[str, Any]] = None
+    if str(args.eval_cache_root).strip():
+        from tools import eval_cache  # type: ignore
+
+        cache = eval_cache.EvalCache(str(args.eval_cache_root))
+        cache_settings = {
+            "device": str(args.device),
+            "dtype": "fp32",
+            "seed": int(seed),
+            "model": str(model_kind),
+            "synth_mode": str(synth["mode"]),
+            "int8": bool(args.int8),
+            "sequential": None if seq_spec is None else repr(seq_spec),
+            **eval_cache.model_settings(model),
+        }
+        srcpth = [
+            instnct_eval.__file__,
+            __file__,
+            getattr(sys.modules.get(type(model).__module__), "__file__", ""),
+            *eval_cache.instnct_sources(),
+        ]
+        # Fingerprinting iterates the loader; keep the eval's RNG stream as without a cache.
+        rngfp = _rng_state()
+        data_digest = eval_cache.loader_fingerprint(eval_loader)
+        _set_rng_state(rngfp)
+        cache_meta = {
+            "state_digest": eval_cache.state_hash(model.state_dict()),
+            "data_digest": data_digest,
+            "settings": cache_settings,
+            "code_digest": eval_cache.code_version([pth for pth in srcpth if pth]),
+        }
+        cache_key = eval_cache.make_key(
+            cache_meta["state_digest"], cache_meta["data_digest"], cache_settings, cache_meta["code_digest"]
+        )
+        cache_hit = cache.get(cache_key)
+
+    if cache_hit is not None:
+        infra.log(f"[eval_ckpt] eval cache hit key={cache_key[:16]} db={cache.path if cache else ''}")
+        eval_sum = cache_hit["eval"]
+        int8_report = cache_hit.get("int8")
+    else:
+        hb_stop, hb_thread = _start_eval_heartbeat(infra.log, int(args.heartbeat_s))
+        try:
+            rng0 = _rng_state()
+            t0 = time.perf_counter()
+            if seq_spec is not None:
+                eval_sum = instnct_eval.eval_model_sequential(
+                    model, eval_loader, "synth_assoc_byte", str(model_kind), deps=eval_deps, spec=seq_spec
+                )
+            else:
+                eval_sum = instnct_eval.eval_model(
+                    model, eval_loader, "synth_assoc_byte", str(model_kind), deps=eval_deps
+                )
+            eval_s = time.perf_counter() - t0
+
+            if bool(args.int8) and model_kind == "absolute_hallway":
+                from vraxion.instnct import quantize  # type: ignore
+
+                qmodel = quantize.quantize_dynamic_int8(model)
+                int8_deps = instnct_eval.EvalDeps(
+                    device="cpu",
+                    dtype=torch.float32,
+                    amp_autocast=instnct_train_wallclock.amp_autocast,
+                    log=infra.log,
+                    synth_mode=str(synth["mode"]),
+                    mi_shuffle=False,
+                    mitosis_enabled=False,
+                )
+                # Replay the fp32 eval's RNG stream so both draw the same start pointers.
+                _set_rng_state(rng0)
+                t0 = time.perf_counter()
+                eval_int8 = instnct_eval.eval_model(
+                    qmodel, eval_loader, "synth_assoc_byte", f"{model_kind}_int8", deps=int8_deps
+                )
+                eval_int8_s = time.perf_counter() - t0
+                int8_report = {
+                    "modules": quantize.int8_module_names(model),
+                    "eval": eval_int8,
+                    "delta_vs_fp32": quantize.accuracy_delta(eval_sum, eval_int8),
+                    "weight_bytes_fp32": quantize.state_bytes(model),
+                    "weight_bytes_int8": quantize.state_bytes(qmodel),
+                    "eval_s_fp32": float(eval_s),
+                    "eval_s_int8": float(eval_int8_s),
+                    "fp32_device": str(args.device),
+                }
+                infra.log(
+                    f"[eval_ckpt] int8 acc={eval_int8.get('eval_acc')} "
+                    f"delta_acc={int8_report['delta_vs_fp32'].get('eval_acc')} "
+                    f"eval_s fp32={eval_s:.2f} int8={eval_int8_s:.2f}"
+                )
+        finally:
+            hb_stop.set()
+            hb_thread.join(timeout=1.0)
+        if cache is not None and not cache.put(cache_key, {"eval": eval_sum, "int8": int8_report}, **cache_meta):
+            infra.log(f"[eval_ckpt] eval cache skip key={cache_key[:16]}: result is not JSON-serializable")
 
     losses = [float(x) for x in (ck.get("losses") or [])] if isinstance(ck.get("losses"), list) else []
     debug_last = _last_debug_from_log(log_txt)
@@ -492,6 +651,15 @@ def main(argv: Optional[list[str]] = None) -> int:
             "eval_ptr_deterministic": False,
             "abort_after": 0,
             "abort_acc": 0.0,
+            "eval_sequential": None
+            if seq_spec is None
+            else {
+                "threshold": seq_spec.threshold,
+                "margin": seq_spec.margin,
+                "confidence": float(seq_spec.confidence),
+                "method": str(seq_spec.method),
+                "min_samples": int(seq_spec.min_samples),
+            },
         },
         "model_shape": dict(shape),
         "params": params,
@@ -504,6 +672,10 @@ def main(argv: Optional[list[str]] = None) -> int:
         "eval": eval_sum,
         "notes": "postmortem eval from checkpoint (no additional training)",
     }
+    if int8_report is not None:
+        report["int8"] = int8_report
+    if cache is not None:
+        report["eval_cache"] = {"key": cache_key, "hit": cache_hit is not None}
 
     atomic_json_dump(report, str(run_root / "report.json"), indent=2)
     infra.log(f"[eval_ckpt] report saved: {run_root / 'report.json'}")
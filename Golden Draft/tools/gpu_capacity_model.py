@@ -166,6 +166,24 @@ class CapacityModelV1:
         )
         return max(1, min(int(safe_b), int(max_b)))
 
+    def estimate_bytes_for_batch(self, combo_key: str, batch: int) -> Optional[int]:
+        """Fitted footprint (overhead + base + per_batch * batch); None without a fit."""
+
+        combo = self.combos_by_key.get(combo_key)
+        if combo is None or combo.per_batch_alloc_bytes is None or combo.base_alloc_bytes is None:
+            return None
+        return int(self.overhead_bytes) + int(combo.base_alloc_bytes) + int(combo.per_batch_alloc_bytes) * int(batch)
+
+    def combo_keys_for_shape(self, *, ring_len: int, slot_dim: int) -> list[str]:
+        """Combo keys whose ant_spec matches ``ring_len`` x ``slot_dim``."""
+
+        keys: list[str] = []
+        for key, combo in self.combos_by_key.items():
+            ant_spec = combo.combo_spec_no_batch.get("ant_spec") or {}
+            if ant_spec.get("ring_len") == int(ring_len) and ant_spec.get("slot_dim") == int(slot_dim):
+                keys.append(key)
+        return keys
+
 
 def load_capacity_model(path: str | Path) -> CapacityModelV1:
     pth = Path(path)
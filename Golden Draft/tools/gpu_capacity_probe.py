@@ -25,7 +25,7 @@ import threading
 import time
 from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 
 CONTRACT_PATH_REL_GOLDEN_DRAFT = "docs/gpu/objective_contract_v1.md"
@@ -301,6 +301,233 @@ class _Heartbeat:
             self.stall_detected = True
 
 
+def _new_metrics(
+    *,
+    canon: Mapping[str, Any],
+    wl_id: str,
+    probe_id: str,
+    out_dim: int,
+    precision: str,
+    amp: int,
+    warmup_steps: int,
+    measure_steps: int,
+    debug_stall_after_step: int = -1,
+    debug_stall_s: float = 0.0,
+    debug_stall_threshold_s: float = 0.0,
+) -> dict[str, Any]:
+    """Metrics dict with every contract key present (key order = CSV column order)."""
+
+    return {
+        "batch_size": int(canon["colony_spec"]["batch_size"]),
+        "seq_len": int(canon["colony_spec"]["seq_len"]),
+        "warmup_steps": int(warmup_steps),
+        "measure_steps": int(measure_steps),
+        "measure_wall_time_s": None,
+        "median_step_time_s": None,
+        "p95_step_time_s": None,
+        "throughput_samples_per_s": None,
+        "throughput_tokens_per_s": None,
+        "peak_vram_reserved_bytes": None,
+        "peak_vram_allocated_bytes": None,
+        "had_oom": False,
+        "had_nan": False,
+        "had_inf": False,
+        "stability_pass": True,
+        "fail_reasons": [],
+        # Extras (allowed)
+        "workload_id": wl_id,
+        "probe_id": probe_id,
+        "synth_len": int(canon["colony_spec"]["synth_len"]),
+        "out_dim": int(out_dim),
+        "device": None,
+        "precision": str(precision),
+        "amp": int(amp),
+        "vram_guard_ratio": 0.92,
+        "heartbeat_stall_detected": False,
+        "heartbeat_stall_threshold_s": None,
+        "heartbeat_last_progress_age_s": None,
+        "step_time_mode": None,
+        "runtime_exception_msg": None,
+        "debug_stall_after_step": int(debug_stall_after_step),
+        "debug_stall_s": float(debug_stall_s),
+        "debug_stall_threshold_s": float(debug_stall_threshold_s),
+    }
+
+
+def _summary_md(metrics: Mapping[str, Any], *, probe_id: str, wl_id: str, precision: str, amp: int, out_dim: int) -> str:
+    status = "PASS" if bool(metrics.get("stability_pass")) else "FAIL"
+    reasons = metrics.get("fail_reasons") or []
+    reasons_str = ", ".join(str(x) for x in reasons) if reasons else "(none)"
+    return (
+        f"# GPU Capacity Probe Summary (VRA-32)\n\n"
+        f"- status: {status}\n"
+        f"- probe_id: {probe_id}\n"
+        f"- workload_id: {wl_id}\n"
+        f"- device: {metrics.get('device')}\n"
+        f"- precision/amp: {precision} / {int(amp)}\n"
+        f"- out_dim: {int(out_dim)}\n"
+        f"- batch_size: {metrics.get('batch_size')}\n"
+        f"- seq_len (accounting): {metrics.get('seq_len')}\n"
+        f"- synth_len (generated): {metrics.get('synth_len')}\n"
+        f"- throughput_samples_per_s: {metrics.get('throughput_samples_per_s')}\n"
+        f"- throughput_tokens_per_s: {metrics.get('throughput_tokens_per_s')}\n"
+        f"- median_step_time_s: {metrics.get('median_step_time_s')}\n"
+        f"- p95_step_time_s: {metrics.get('p95_step_time_s')}\n"
+        f"- peak_vram_reserved_bytes: {metrics.get('peak_vram_reserved_bytes')}\n"
+        f"- peak_vram_allocated_bytes: {metrics.get('peak_vram_allocated_bytes')}\n"
+        f"- fail_reasons: {reasons_str}\n\n"
+        f"Contract: {CONTRACT_REPO_PATH}\n"
+    )
+
+
+def _build_model(torch_mod: Any, canon: Mapping[str, Any], *, out_dim: int, device: str) -> Any:
+    """Construct the probe model on ``device`` with fp32 weights and spec hooks applied."""
+
+    from vraxion.instnct import absolute_hallway
+    from vraxion.instnct.absolute_hallway import AbsoluteHallway
+
+    ptr_dtype = _torch_dtype_from_ptr_dtype(torch_mod, str(canon["ant_spec"]["ptr_dtype"]))
+
+    # Init-time hook: must be set before model construction.
+    absolute_hallway.EXPERT_HEADS = int(out_dim)
+
+    # Make state_loop_samples a real knob: AbsoluteHallway only uses it when STATE_LOOP_METRICS is enabled.
+    # Enable it iff the workload requests it, and set globals before model construction.
+    state_loop_samples = int(canon["colony_spec"]["state_loop_samples"])
+    absolute_hallway.STATE_LOOP_METRICS = bool(state_loop_samples > 0)
+    absolute_hallway.STATE_LOOP_SAMPLES = int(max(0, state_loop_samples))
+
+    model = AbsoluteHallway(
+        input_dim=1,
+        num_classes=256,
+        ring_len=int(canon["ant_spec"]["ring_len"]),
+        slot_dim=int(canon["ant_spec"]["slot_dim"]),
+    )
+    model.train(True)
+    model.to(device=device)
+
+    # Keep weights in fp32 (stable optimizer math). If this fails, there's no meaningful probe to run.
+    model.to(dtype=torch_mod.float32)
+
+    # Forward-time hook: pointer dtype consulted in forward.
+    absolute_hallway.PTR_DTYPE = ptr_dtype
+
+    model.ptr_update_every = int(canon["colony_spec"]["ptr_update_every"])
+    model.state_loop_samples = int(max(0, state_loop_samples))
+    return model
+
+
+def _make_train_step(
+    torch_mod: Any, model: Any, opt: Any, x: Any, y: Any, *, device: str, precision: str, amp: int
+) -> Callable[[], Any]:
+    import torch.nn.functional as F
+
+    use_cuda = device == "cuda"
+
+    # "precision" is treated as compute precision (autocast dtype) for the probe run.
+    # Keep weights in fp32 to match typical training behavior (stable Adam + GradScaler on fp16).
+    autocast_ctx: Any = nullcontext()
+    if use_cuda and int(amp) == 1:
+        compute_dtype = _torch_dtype_from_precision(torch_mod, precision)
+        autocast_ctx = torch_mod.autocast(device_type="cuda", enabled=True, dtype=compute_dtype)
+
+    scaler = None
+    if use_cuda and int(amp) == 1 and precision == "fp16":
+        scaler = torch_mod.cuda.amp.GradScaler()
+
+    def train_step() -> Any:
+        opt.zero_grad(set_to_none=True)
+        with autocast_ctx:
+            out = model(x)
+            logits = out[0] if isinstance(out, (tuple, list)) else out
+            # Force fp32 loss math for stability under autocast.
+            loss = F.cross_entropy(logits.float(), y)
+        if scaler is not None:
+            scaler.scale(loss).backward()
+            scaler.step(opt)
+            scaler.update()
+        else:
+            loss.backward()
+            opt.step()
+        return loss
+
+    return train_step
+
+
+def _note_nonfinite(torch_mod: Any, metrics: dict[str, Any], loss: Any) -> bool:
+    """Record a nan/inf loss in ``metrics``; True if the loss was non-finite."""
+
+    if torch_mod.isfinite(loss):
+        return False
+    if torch_mod.isnan(loss):
+        metrics["had_nan"] = True
+    if torch_mod.isinf(loss):
+        metrics["had_inf"] = True
+    metrics["stability_pass"] = False
+    metrics["fail_reasons"].append("nan_or_inf")
+    return True
+
+
+def _finalize_timing(
+    metrics: dict[str, Any], step_durs_s: Sequence[float], *, measured_ok: bool, measure_steps: int, wall_s: float
+) -> None:
+    # Ensure timings are complete.
+    if len(step_durs_s) != int(measure_steps) or not measured_ok:
+        metrics["stability_pass"] = False
+        metrics["fail_reasons"].append("timing_missing")
+
+    # Compute timing stats.
+    if step_durs_s:
+        srt = sorted(step_durs_s)
+        med = float(srt[len(srt) // 2])
+        p95 = float(srt[int(0.95 * (len(srt) - 1))])
+        metrics["median_step_time_s"] = med
+        metrics["p95_step_time_s"] = p95
+
+        if med > 0 and p95 > 2.5 * med:
+            metrics["stability_pass"] = False
+            metrics["fail_reasons"].append("step_time_explosion")
+
+    # Walltime + throughput.
+    if measured_ok and int(measure_steps) > 0:
+        wall = float(wall_s)
+        metrics["measure_wall_time_s"] = wall
+        if wall > 0:
+            sps = (int(measure_steps) * int(metrics["batch_size"])) / wall
+            metrics["throughput_samples_per_s"] = float(sps)
+            metrics["throughput_tokens_per_s"] = float(sps) * float(metrics["seq_len"])
+
+
+def _record_vram(torch_mod: Any, metrics: dict[str, Any], *, use_cuda: bool, total_vram_bytes: Optional[int]) -> None:
+    # VRAM peaks.
+    if use_cuda:
+        try:
+            metrics["peak_vram_reserved_bytes"] = int(torch_mod.cuda.max_memory_reserved())
+            metrics["peak_vram_allocated_bytes"] = int(torch_mod.cuda.max_memory_allocated())
+        except Exception:
+            metrics["stability_pass"] = False
+            metrics["fail_reasons"].append("vram_stats_failed")
+
+    # VRAM guard.
+    if isinstance(total_vram_bytes, int) and isinstance(metrics["peak_vram_reserved_bytes"], int):
+        if metrics["peak_vram_reserved_bytes"] > int(metrics["vram_guard_ratio"] * total_vram_bytes):
+            metrics["stability_pass"] = False
+            metrics["fail_reasons"].append("vram_guard")
+
+
+def _record_exception(metrics: dict[str, Any], exc: BaseException) -> None:
+    msg = f"{type(exc).__name__}: {exc}"
+    metrics["stability_pass"] = False
+    metrics["fail_reasons"].append("runtime_exception")
+    metrics["runtime_exception_msg"] = msg
+
+    # Heuristic OOM classification.
+    low = msg.lower()
+    if "out of memory" in low or "cuda oom" in low or "cuda out of memory" in low:
+        metrics["had_oom"] = True
+        metrics["fail_reasons"].append("oom")
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     _bootstrap_import_path()
 
@@ -413,41 +640,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 2
 
     # Initialize metrics with required contract keys (must always be present).
-    metrics: dict[str, Any] = {
-        "batch_size": int(canon["colony_spec"]["batch_size"]),
-        "seq_len": int(canon["colony_spec"]["seq_len"]),
-        "warmup_steps": int(args.warmup_steps),
-        "measure_steps": int(args.measure_steps),
-        "measure_wall_time_s": None,
-        "median_step_time_s": None,
-        "p95_step_time_s": None,
-        "throughput_samples_per_s": None,
-        "throughput_tokens_per_s": None,
-        "peak_vram_reserved_bytes": None,
-        "peak_vram_allocated_bytes": None,
-        "had_oom": False,
-        "had_nan": False,
-        "had_inf": False,
-        "stability_pass": True,
-        "fail_reasons": [],
-        # Extras (allowed)
-        "workload_id": wl_id,
-        "probe_id": probe_id,
-        "synth_len": int(canon["colony_spec"]["synth_len"]),
-        "out_dim": int(args.out_dim),
-        "device": None,
-        "precision": str(args.precision),
-        "amp": int(args.amp),
-        "vram_guard_ratio": 0.92,
-        "heartbeat_stall_detected": False,
-        "heartbeat_stall_threshold_s": None,
-        "heartbeat_last_progress_age_s": None,
-        "step_time_mode": None,
-        "runtime_exception_msg": None,
-        "debug_stall_after_step": int(args.debug_stall_after_step),
-        "debug_stall_s": float(args.debug_stall_s),
-        "debug_stall_threshold_s": float(args.debug_stall_threshold_s),
-    }
+    metrics = _new_metrics(
+        canon=canon,
+        wl_id=wl_id,
+        probe_id=probe_id,
+        out_dim=int(args.out_dim),
+        precision=str(args.precision),
+        amp=int(args.amp),
+        warmup_steps=int(args.warmup_steps),
+        measure_steps=int(args.measure_steps),
+        debug_stall_after_step=int(args.debug_stall_after_step),
+        debug_stall_s=float(args.debug_stall_s),
+        debug_stall_threshold_s=float(args.debug_stall_threshold_s),
+    )
 
     write_lock = threading.Lock()
     wrote_post = False
@@ -462,28 +667,13 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             _atomic_write_json(out_dir / ART_METRICS_JSON, metrics)
             _atomic_write_csv(out_dir / ART_METRICS_CSV, metrics)
 
-            status = "PASS" if bool(metrics.get("stability_pass")) else "FAIL"
-            reasons = metrics.get("fail_reasons") or []
-            reasons_str = ", ".join(str(x) for x in reasons) if reasons else "(none)"
-            summ = (
-                f"# GPU Capacity Probe Summary (VRA-32)\n\n"
-                f"- status: {status}\n"
-                f"- probe_id: {probe_id}\n"
-                f"- workload_id: {wl_id}\n"
-                f"- device: {metrics.get('device')}\n"
-                f"- precision/amp: {args.precision} / {int(args.amp)}\n"
-                f"- out_dim: {int(args.out_dim)}\n"
-                f"- batch_size: {metrics.get('batch_size')}\n"
-                f"- seq_len (accounting): {metrics.get('seq_len')}\n"
-                f"- synth_len (generated): {metrics.get('synth_len')}\n"
-                f"- throughput_samples_per_s: {metrics.get('throughput_samples_per_s')}\n"
-                f"- throughput_tokens_per_s: {metrics.get('throughput_tokens_per_s')}\n"
-                f"- median_step_time_s: {metrics.get('median_step_time_s')}\n"
-                f"- p95_step_time_s: {metrics.get('p95_step_time_s')}\n"
-                f"- peak_vram_reserved_bytes: {metrics.get('peak_vram_reserved_bytes')}\n"
-                f"- peak_vram_allocated_bytes: {metrics.get('peak_vram_allocated_bytes')}\n"
-                f"- fail_reasons: {reasons_str}\n\n"
-                f"Contract: {CONTRACT_REPO_PATH}\n"
+            summ = _summary_md(
+                metrics,
+                probe_id=probe_id,
+                wl_id=wl_id,
+                precision=str(args.precision),
+                amp=int(args.amp),
+                out_dim=int(args.out_dim),
             )
             if debug_self_test:
                 summ += (
@@ -522,79 +712,22 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     # Main run (best-effort: always write post artifacts even on failure).
     try:
         import torch
-        import torch.nn.functional as F
-
-        from vraxion.instnct import absolute_hallway
-        from vraxion.instnct.absolute_hallway import AbsoluteHallway
 
         device = _resolve_device(torch)
         metrics["device"] = device
 
-        # "precision" is treated as compute precision (autocast dtype) for the probe run.
-        # Keep weights in fp32 to match typical training behavior (stable Adam + GradScaler on fp16).
-        compute_dtype = _torch_dtype_from_precision(torch, args.precision)
-        param_dtype = torch.float32
-        ptr_dtype = _torch_dtype_from_ptr_dtype(torch, str(canon["ant_spec"]["ptr_dtype"]))
-
-        # Init-time hook: must be set before model construction.
-        absolute_hallway.EXPERT_HEADS = int(args.out_dim)
-
-        # Make state_loop_samples a real knob: AbsoluteHallway only uses it when STATE_LOOP_METRICS is enabled.
-        # Enable it iff the workload requests it, and set globals before model construction.
-        state_loop_samples = int(canon["colony_spec"]["state_loop_samples"])
-        absolute_hallway.STATE_LOOP_METRICS = bool(state_loop_samples > 0)
-        absolute_hallway.STATE_LOOP_SAMPLES = int(max(0, state_loop_samples))
-
-        model = AbsoluteHallway(
-            input_dim=1,
-            num_classes=256,
-            ring_len=int(canon["ant_spec"]["ring_len"]),
-            slot_dim=int(canon["ant_spec"]["slot_dim"]),
-        )
-        model.train(True)
-        model.to(device=device)
-
-        # Keep weights in fp32 (stable optimizer math). If this fails, there's no meaningful probe to run.
-        model.to(dtype=param_dtype)
-
-        # Forward-time hook: pointer dtype consulted in forward.
-        absolute_hallway.PTR_DTYPE = ptr_dtype
-
-        model.ptr_update_every = int(canon["colony_spec"]["ptr_update_every"])
-        model.state_loop_samples = int(max(0, state_loop_samples))
-
+        model = _build_model(torch, canon, out_dim=int(args.out_dim), device=device)
         opt = torch.optim.Adam(model.parameters(), lr=1e-3)
 
         B = int(canon["colony_spec"]["batch_size"])
         synth_len = int(canon["colony_spec"]["synth_len"])
-        x = torch.randn(B, synth_len, 1, device=device, dtype=param_dtype)
+        x = torch.randn(B, synth_len, 1, device=device, dtype=torch.float32)
         y = torch.randint(0, 256, (B,), device=device, dtype=torch.long)
 
         use_cuda = device == "cuda"
-
-        autocast_ctx = nullcontext()
-        if use_cuda and int(args.amp) == 1:
-            autocast_ctx = torch.autocast(device_type="cuda", enabled=True, dtype=compute_dtype)
-
-        scaler = None
-        if use_cuda and int(args.amp) == 1 and args.precision == "fp16":
-            scaler = torch.cuda.amp.GradScaler()
-
-        def train_step() -> torch.Tensor:
-            opt.zero_grad(set_to_none=True)
-            with autocast_ctx:
-                out = model(x)
-                logits = out[0] if isinstance(out, (tuple, list)) else out
-                # Force fp32 loss math for stability under autocast.
-                loss = F.cross_entropy(logits.float(), y)
-            if scaler is not None:
-                scaler.scale(loss).backward()
-                scaler.step(opt)
-                scaler.update()
-            else:
-                loss.backward()
-                opt.step()
-            return loss
+        train_step = _make_train_step(
+            torch, model, opt, x, y, device=device, precision=str(args.precision), amp=int(args.amp)
+        )
 
         def step_times_s_warmup() -> list[float]:
             durs: list[float] = []
@@ -608,13 +741,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     loss = train_step()
                     en.record()
                     hb.update_progress()
-                    if not torch.isfinite(loss):
-                        if torch.isnan(loss):
-                            metrics["had_nan"] = True
-                        if torch.isinf(loss):
-                            metrics["had_inf"] = True
-                        metrics["stability_pass"] = False
-                        metrics["fail_reasons"].append("nan_or_inf")
+                    if _note_nonfinite(torch, metrics, loss):
                         break
                     ev_pairs.append((st, en))
                 torch.cuda.synchronize()
@@ -628,13 +755,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     loss = train_step()
                     t1 = time.perf_counter()
                     hb.update_progress()
-                    if not torch.isfinite(loss):
-                        if torch.isnan(loss):
-                            metrics["had_nan"] = True
-                        if torch.isinf(loss):
-                            metrics["had_inf"] = True
-                        metrics["stability_pass"] = False
-                        metrics["fail_reasons"].append("nan_or_inf")
+                    if _note_nonfinite(torch, metrics, loss):
                         break
                     durs.append(t1 - t0)
                 return durs
@@ -680,13 +801,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             if debug_self_test and i == int(args.debug_stall_after_step):
                 time.sleep(float(args.debug_stall_s))
 
-            if not torch.isfinite(loss):
-                if torch.isnan(loss):
-                    metrics["had_nan"] = True
-                if torch.isinf(loss):
-                    metrics["had_inf"] = True
-                metrics["stability_pass"] = False
-                metrics["fail_reasons"].append("nan_or_inf")
+            if _note_nonfinite(torch, metrics, loss):
                 measured_ok = False
                 break
 
@@ -708,59 +823,18 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             for st, en in ev_pairs:
                 step_durs_s.append(float(st.elapsed_time(en)) / 1000.0)
 
-        # Ensure timings are complete.
-        if len(step_durs_s) != int(args.measure_steps) or not measured_ok:
-            metrics["stability_pass"] = False
-            metrics["fail_reasons"].append("timing_missing")
-
-        # Compute timing stats.
-        if step_durs_s:
-            srt = sorted(step_durs_s)
-            med = float(srt[len(srt) // 2])
-            p95 = float(srt[int(0.95 * (len(srt) - 1))])
-            metrics["median_step_time_s"] = med
-            metrics["p95_step_time_s"] = p95
-
-            if med > 0 and p95 > 2.5 * med:
-                metrics["stability_pass"] = False
-                metrics["fail_reasons"].append("step_time_explosion")
-
-        # Walltime + throughput.
-        if measured_ok and int(args.measure_steps) > 0:
-            wall = float(wall_t1 - wall_t0)
-            metrics["measure_wall_time_s"] = wall
-            if wall > 0:
-                sps = (int(args.measure_steps) * int(metrics["batch_size"])) / wall
-                metrics["throughput_samples_per_s"] = float(sps)
-                metrics["throughput_tokens_per_s"] = float(sps) * float(metrics["seq_len"])
-
-        # VRAM peaks.
-        if use_cuda:
-            try:
-                metrics["peak_vram_reserved_bytes"] = int(torch.cuda.max_memory_reserved())
-                metrics["peak_vram_allocated_bytes"] = int(torch.cuda.max_memory_allocated())
-            except Exception:
-                metrics["stability_pass"] = False
-                metrics["fail_reasons"].append("vram_stats_failed")
-
-        # VRAM guard.
-        if isinstance(total_vram_bytes, int) and isinstance(metrics["peak_vram_reserved_bytes"], int):
-            if metrics["peak_vram_reserved_bytes"] > int(metrics["vram_guard_ratio"] * total_vram_bytes):
-                metrics["stability_pass"] = False
-                metrics["fail_reasons"].append("vram_guard")
+        _finalize_timing(
+            metrics,
+            step_durs_s,
+            measured_ok=measured_ok,
+            measure_steps=int(args.measure_steps),
+            wall_s=float(wall_t1 - wall_t0),
+        )
+        _record_vram(torch, metrics, use_cuda=use_cuda, total_vram_bytes=total_vram_bytes)
 
     except Exception as exc:
         # Catch-all: still write artifacts and exit 0.
-        msg = f"{type(exc).__name__}: {exc}"
-        metrics["stability_pass"] = False
-        metrics["fail_reasons"].append("runtime_exception")
-        metrics["runtime_exception_msg"] = msg
-
-        # Heuristic OOM classification.
-        low = msg.lower()
-        if "out of memory" in low or "cuda oom" in low or "cuda out of memory" in low:
-            metrics["had_oom"] = True
-            metrics["fail_reasons"].append("oom")
+        _record_exception(metrics, exc)
 
     # Heartbeat final snapshot.
     armed, thresh, age, stalled = hb.snapshot()
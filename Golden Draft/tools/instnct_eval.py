@@ -15,8 +15,11 @@ object or injected callables.
 
 from __future__ import annotations
 
+import inspect
 import math
+import random
 from dataclasses import dataclass
+from statistics import NormalDist
 from typing import Any, Callable, ContextManager, Dict, Iterable, Optional, Sequence, Tuple
 
 import torch
@@ -197,6 +200,16 @@ def _ensure_head_out_features(model: nn.Module) -> None:
         head.out_features = head.single.out_features
 
 
+def _accepts_inference_kw(model: nn.Module) -> bool:
+    """True when model.forward takes ``inference=`` (AbsoluteHallway fast path)."""
+
+    try:
+        params = inspect.signature(model.forward).parameters
+    except (TypeError, ValueError):
+        return False
+    return "inference" in params
+
+
 def _mi_bits_from_joint(joint: torch.Tensor) -> Optional[float]:
     """Compute mutual information in bits for a (class x bin) joint histogram."""
 
@@ -234,7 +247,10 @@ def eval_model(
     during forward passes:
     - model.last_ptr_bins (int tensor): pointer histogram bin for each sample
     - model.pointer_hist_bins (int): number of bins for last_ptr_bins
-    - model.ptr_flip_rate (float): pointer flip rate for the last step
+    - model.ptr_flip_rate (float or 0-dim tensor): pointer flip rate for the last step
+
+    Models with an ``inference=`` fast path leave these as tensors on the eval
+    device, so the per-batch accumulation below adds no host sync or H2D copy.
 
     Mitosis telemetry (when deps.mitosis_enabled):
     - model.last_ptr_int (int tensor): pointer address per sample
@@ -251,6 +267,7 @@ def eval_model(
     _ensure_head_out_features(model)
 
     criterion = nn.CrossEntropyLoss()
+    device = torch.device(deps.device)
 
     collect_mitosis = bool(deps.mitosis_enabled)
     addr_loss_sum: Optional[torch.Tensor] = None
@@ -260,24 +277,32 @@ def eval_model(
     ring_len_raw = getattr(model, "ring_range", getattr(model, "ring_len", 0))
     ring_len = int(ring_len_raw or 0)
 
-    total_loss = 0.0
-    total_correct = 0
+    # All per-batch accumulators stay on the eval device and are read back
+    # once after the loop (no per-batch .item()/.cpu() syncs). The loss sum is
+    # fp64 to match the legacy Python-float accumulation.
+    sum_dtype = torch.float32 if device.type == "mps" else torch.float64
+    loss_sum = torch.zeros((), dtype=sum_dtype, device=device)
+    # [correct, dom0_seen, dom1_seen, dom0_correct, dom1_correct]
+    counts = torch.zeros(5, dtype=torch.long, device=device)
     total_seen = 0
 
-    dom0_correct = 0
-    dom0_seen = 0
-    dom1_correct = 0
-    dom1_seen = 0
-
     mi_bins = int(getattr(model, "pointer_hist_bins", 128))
 
-    # Kept on CPU to match legacy code and reduce GPU memory.
-    joint = torch.zeros((model.head.out_features, mi_bins), dtype=torch.long)
+    joint = torch.zeros((model.head.out_features, mi_bins), dtype=torch.long, device=device)
     joint_shuffle = torch.zeros_like(joint) if deps.mi_shuffle else None
 
+    # A generator on another device (e.g. the default CPU one) keeps its legacy
+    # stream: the permutation is drawn there and moved once per batch.
+    gen = deps.mi_shuffle_generator
+    perm_device = gen.device if gen is not None else device
+
     ptr_flip_sum = 0.0
+    ptr_flip_dev: Optional[torch.Tensor] = None
     ptr_steps = 0
 
+    # Fast no-grad forward: identical logits, telemetry limited to what is read below.
+    fwd_kwargs: Dict[str, Any] = {"inference": True} if _accepts_inference_kw(model) else {}
+
     with torch.no_grad():
         for inputs, targets in loader:
             inputs = inputs.to(deps.device, non_blocking=True)
@@ -288,73 +313,93 @@ def eval_model(
             targets = targets.to(deps.device, non_blocking=True)
 
             with deps.amp_autocast():
-                outputs, _ = model(inputs)
+                outputs, _ = model(inputs, **fwd_kwargs)
                 loss = criterion(outputs, targets)
                 if collect_mitosis:
                     loss_vec = F.cross_entropy(outputs, targets, reduction="none")
 
-            total_loss += loss.item() * inputs.size(0)
+            loss_sum += loss.detach().to(sum_dtype) * inputs.size(0)
 
             preds = outputs.argmax(dim=1)
-            total_correct += (preds == targets).sum().item()
+            hits = preds == targets
+            counts[0] += hits.sum()
             total_seen += inputs.size(0)
 
             if deps.synth_mode == "assoc_mix":
                 dom0_mask = targets < 2
                 dom1_mask = ~dom0_mask
 
-                dom0_seen += dom0_mask.sum().item()
-                dom1_seen += dom1_mask.sum().item()
+                counts[1] += dom0_mask.sum()
+                counts[2] += dom1_mask.sum()
 
-                dom0_correct += ((preds == targets) & dom0_mask).sum().item()
-                dom1_correct += ((preds == targets) & dom1_mask).sum().item()
+                counts[3] += (hits & dom0_mask).sum()
+                counts[4] += (hits & dom1_mask).sum()
 
             if collect_mitosis and ring_len > 0:
                 addr = getattr(model, "last_ptr_int", None)
                 router_map = getattr(model, "router_map", None)
 
                 if addr is not None:
-                    addr_cpu = addr.to(torch.long).cpu()
-                    loss_cpu = loss_vec.detach().cpu().to(torch.float32)
+                    addr_dev = addr.to(device=device, dtype=torch.long)
+                    loss_w = loss_vec.detach().to(torch.float32)
 
                     if addr_loss_sum is None:
-                        addr_loss_sum = torch.zeros(ring_len, dtype=torch.float32)
-                        addr_count = torch.zeros(ring_len, dtype=torch.float32)
+                        addr_loss_sum = torch.zeros(ring_len, dtype=torch.float32, device=device)
+                        addr_count = torch.zeros(ring_len, dtype=torch.float32, device=device)
 
                     # Legacy aggregation: sum loss per address and count per address.
-                    addr_loss_sum += torch.bincount(addr_cpu, weights=loss_cpu, minlength=ring_len)[:ring_len]
-                    addr_count += torch.bincount(addr_cpu, minlength=ring_len)[:ring_len]
+                    assert addr_count is not None
+                    addr_loss_sum += torch.bincount(addr_dev, weights=loss_w, minlength=ring_len)[:ring_len]
+                    addr_count += torch.bincount(addr_dev, minlength=ring_len)[:ring_len]
 
                     if router_map is not None and getattr(router_map, "numel", lambda: 0)() > 0:
-                        mapped = router_map.detach().cpu()
-                        mapped_ids = mapped[addr_cpu.clamp(0, mapped.numel() - 1)]
+                        router_dev = router_map.detach().to(device)
+                        mapped_ids = router_dev[addr_dev.clamp(0, router_dev.numel() - 1)]
 
                         num_experts = int(getattr(model.head, "num_experts", 1))
                         if expert_counts is None:
-                            expert_counts = torch.zeros(num_experts, dtype=torch.float32)
+                            expert_counts = torch.zeros(num_experts, dtype=torch.float32, device=device)
                         expert_counts += torch.bincount(mapped_ids, minlength=num_experts).float()[:num_experts]
 
             if hasattr(model, "last_ptr_bins"):
-                # Keep bincount accumulation on CPU (joint is CPU).
-                bins = getattr(model, "last_ptr_bins").detach().to(device="cpu", dtype=torch.long)
-                labels = targets.detach().cpu().to(torch.long)
+                bins = getattr(model, "last_ptr_bins").detach().to(device=device, dtype=torch.long)
+                labels = targets.detach().to(torch.long)
 
                 idx = labels * mi_bins + bins
                 joint += torch.bincount(idx, minlength=joint.numel()).view_as(joint)
 
                 if deps.mi_shuffle:
-                    gen = deps.mi_shuffle_generator
-                    perm = torch.randperm(labels.numel(), generator=gen)
-                    labels_shuf = labels[perm]
+                    perm = torch.randperm(labels.numel(), generator=gen, device=perm_device)
+                    labels_shuf = labels[perm.to(device)]
 
                     idx_shuf = labels_shuf * mi_bins + bins
                     assert joint_shuffle is not None  # for type-checkers
                     joint_shuffle += torch.bincount(idx_shuf, minlength=joint.numel()).view_as(joint)
 
             if hasattr(model, "ptr_flip_rate"):
-                ptr_flip_sum += float(getattr(model, "ptr_flip_rate"))
+                flip = getattr(model, "ptr_flip_rate")
+                if torch.is_tensor(flip):
+                    flip = flip.detach().to(device=device, dtype=sum_dtype)
+                    ptr_flip_dev = flip if ptr_flip_dev is None else ptr_flip_dev + flip
+                else:
+                    ptr_flip_sum += float(flip)
                 ptr_steps += 1
 
+    # Single device -> host transfer for every accumulator.
+    total_loss = float(loss_sum.item())
+    total_correct, dom0_seen, dom1_seen, dom0_correct, dom1_correct = counts.tolist()
+    if ptr_flip_dev is not None:
+        ptr_flip_sum += float(ptr_flip_dev.item())
+    joint = joint.cpu()
+    if joint_shuffle is not None:
+        joint_shuffle = joint_shuffle.cpu()
+    if addr_loss_sum is not None:
+        addr_loss_sum = addr_loss_sum.cpu()
+    if addr_count is not None:
+        addr_count = addr_count.cpu()
+    if expert_counts is not None:
+        expert_counts = expert_counts.cpu()
+
     avg_loss = total_loss / max(total_seen, 1)
     acc = total_correct / max(total_seen, 1)
 
@@ -425,3 +470,193 @@ def eval_model(
         "mitosis_hot_addresses": mitosis_hot,
         "mitosis_expert_imbalance": mitosis_imbalance,
     }
+
+
+@dataclass(frozen=True)
+class SequentialEvalSpec:
+    """Early-stopping rule for :func:`eval_model_sequential`.
+
+    Stops as soon as the accuracy confidence interval either clears
+    ``threshold`` (entirely above or below it) or is at most ``2 * margin``
+    wide. At least one of the two must be set.
+
+    ``confidence`` is the *anytime* coverage: look ``j`` uses
+    ``alpha_j = alpha / (j * (j + 1))`` so the union over all looks holds
+    with probability >= ``confidence`` (peeking after every batch is safe).
+    """
+
+    threshold: Optional[float] = None
+    margin: Optional[float] = None
+    confidence: float = 0.95
+    method: str = "wilson"  # "wilson" | "bernstein"
+    min_samples: int = 0
+    seed: int = 0
+
+
+def wilson_interval(correct: int, n: int, alpha: float) -> Tuple[float, float]:
+    """Two-sided Wilson score interval for a binomial proportion."""
+
+    if n <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(1.0 - alpha / 2.0)
+    phat = correct / n
+    z2n = z * z / n
+    center = (phat + z2n / 2.0) / (1.0 + z2n)
+    half = z * math.sqrt(phat * (1.0 - phat) / n + z2n / (4.0 * n)) / (1.0 + z2n)
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def bernstein_interval(correct: int, n: int, alpha: float) -> Tuple[float, float]:
+    """Two-sided empirical-Bernstein interval (Maurer & Pontil) for [0, 1] samples."""
+
+    if n < 2:
+        return 0.0, 1.0
+    phat = correct / n
+    var = phat * (1.0 - phat) * n / (n - 1)  # unbiased sample variance of 0/1 hits
+    logt = math.log(4.0 / alpha)  # alpha/2 per side
+    half = math.sqrt(2.0 * var * logt / n) + 7.0 * logt / (3.0 * (n - 1))
+    return max(0.0, phat - half), min(1.0, phat + half)
+
+
+_CI_METHODS: Dict[str, Callable[[int, int, float], Tuple[float, float]]] = {
+    "wilson": wilson_interval,
+    "bernstein": bernstein_interval,
+}
+
+
+def _shuffled_batches(loader: Iterable[Any], seed: int) -> Iterable[Any]:
+    """Iterate ``loader`` in a seeded random order.
+
+    DataLoaders are rebuilt over a permuted sample order (same batch size and
+    collate); other iterables are materialized and their batch order shuffled.
+    """
+
+    if isinstance(loader, DataLoader) and loader.batch_size is not None:
+        gen = torch.Generator().manual_seed(int(seed))
+        order = torch.randperm(len(loader.dataset), generator=gen).tolist()  # type: ignore[arg-type]
+        return DataLoader(
+            loader.dataset,
+            batch_size=loader.batch_size,
+            sampler=order,
+            num_workers=loader.num_workers,
+            pin_memory=loader.pin_memory,
+            collate_fn=loader.collate_fn,
+            drop_last=loader.drop_last,
+        )
+
+    batches = list(loader)
+    random.Random(int(seed)).shuffle(batches)
+    return batches
+
+
+def eval_model_sequential(
+    model: nn.Module,
+    loader: Iterable[Tuple[torch.Tensor, torch.Tensor]],
+    dataset_name: str,
+    model_name: str,
+    *,
+    deps: EvalDeps,
+    spec: SequentialEvalSpec,
+) -> Dict[str, Any]:
+    """Early-stopping accuracy eval for gating decisions.
+
+    Batches are visited in a seeded random order; after each batch a running
+    Wilson / empirical-Bernstein interval on accuracy is checked against
+    ``spec``. Returns the ``eval_model`` keys (telemetry keys are None; eval_*
+    values cover the samples actually used) plus:
+    - eval_ci_low / eval_ci_high / eval_ci_method / eval_confidence
+    - eval_stop: "above" | "below" | "margin" | "exhausted"
+    - eval_n_total: samples available in the loader (None when unknown)
+    """
+
+    if spec.threshold is None and spec.margin is None:
+        raise ValueError("SequentialEvalSpec needs a threshold and/or a margin")
+    if spec.method not in _CI_METHODS:
+        raise ValueError(f"unknown CI method {spec.method!r} (expected one of {sorted(_CI_METHODS)})")
+    ci_fn = _CI_METHODS[spec.method]
+    alpha = 1.0 - float(spec.confidence)
+
+    model = model.to(deps.device, dtype=deps.dtype)
+    model.eval()
+
+    criterion = nn.CrossEntropyLoss()
+    fwd_kwargs: Dict[str, Any] = {"inference": True} if _accepts_inference_kw(model) else {}
+
+    n_total: Optional[int] = None
+    dataset = getattr(loader, "dataset", None)
+    if dataset is not None:
+        try:
+            n_total = len(dataset)
+        except TypeError:
+            n_total = None
+
+    total_loss = 0.0
+    total_correct = 0
+    total_seen = 0
+    looks = 0
+    ci_low, ci_high = 0.0, 1.0
+    stop = "exhausted"
+
+    with torch.no_grad():
+        for inputs, targets in _shuffled_batches(loader, spec.seed):
+            inputs = inputs.to(deps.device, non_blocking=True)
+            if inputs.dtype != deps.dtype:
+                inputs = inputs.to(deps.dtype)
+            targets = targets.to(deps.device, non_blocking=True)
+
+            with deps.amp_autocast():
+                outputs, _ = model(inputs, **fwd_kwargs)
+                loss = criterion(outputs, targets)
+
+            # One sync per batch is inherent to a sequential test.
+            total_loss += loss.item() * inputs.size(0)
+            total_correct += int((outputs.argmax(dim=1) == targets).sum().item())
+            total_seen += inputs.size(0)
+
+            looks += 1
+            ci_low, ci_high = ci_fn(total_correct, total_seen, alpha / (looks * (looks + 1)))
+            if total_seen < int(spec.min_samples):
+                continue
+            if spec.threshold is not None and ci_low > spec.threshold:
+                stop = "above"
+                break
+            if spec.threshold is not None and ci_high < spec.threshold:
+                stop = "below"
+                break
+            if spec.margin is not None and (ci_high - ci_low) / 2.0 <= spec.margin:
+                stop = "margin"
+                break
+
+    avg_loss = total_loss / max(total_seen, 1)
+    acc = total_correct / max(total_seen, 1)
+
+    try:
+        model.last_eval_acc = float(acc)
+    except Exception:
+        model.last_eval_acc = None
+
+    deps.log(
+        f"{dataset_name} | {model_name} | eval_loss {avg_loss:.4f} | eval_acc {acc:.4f} | eval_n {total_seen} | "
+        f"seq_stop {stop} | ci [{ci_low:.4f}, {ci_high:.4f}] ({spec.method}, {spec.confidence:.2f})"
+    )
+
+    return {
+        "eval_loss": avg_loss,
+        "eval_acc": acc,
+        "eval_acc_d0": None,
+        "eval_acc_d1": None,
+        "eval_n": total_seen,
+        "eval_mi_bits": None,
+        "eval_mi_bits_shuffled": None,
+        "eval_ptr_flip_rate": None,
+        "eval_tei": None,
+        "mitosis_parent_expert": None,
+        "mitosis_hot_addresses": None,
+        "mitosis_expert_imbalance": None,
+        "eval_ci_low": ci_low,
+        "eval_ci_high": ci_high,
+        "eval_ci_method": spec.method,
+        "eval_confidence": float(spec.confidence),
+        "eval_stop": stop,
+        "eval_n_total": n_total,
+    }
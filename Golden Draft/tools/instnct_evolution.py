@@ -4,27 +4,30 @@ This module is a behavior-preserving extraction of the *evolution mode* tail
 from the legacy monolithic training script.
 
 Scope is intentionally narrow:
-- ``mutate_state_dict``
+- ``mutate_state_dict`` / ``mutate_into_``
 - ``save_evo_checkpoint``
-- ``run_evolution``
+- ``run_evolution`` (serial, or a process pool when ``config.workers > 0``)
 
 Model internals and training/eval logic are treated as external dependencies
 and must be injected by the caller.
 
-The legacy behavior is intentionally kept "warts and all" (e.g. the mutation
-noise is generated on CPU and returns CPU tensors) so this module can be
-dropped into the monolith with minimal churn.
+``mutate_state_dict`` keeps the legacy behavior "warts and all" (noise is
+generated on CPU and returns CPU tensors). The generation loop itself uses
+``mutate_into_``, which reuses the discarded individuals' modules and adds
+device-side noise in place.
 """
 
 from __future__ import annotations
 
 import os
+import queue
 import random
 from dataclasses import dataclass
 from itertools import count
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
 
 import torch
+import torch.nn as nn
 
 from ._checkpoint_io import atomic_torch_save
 
@@ -46,6 +49,7 @@ def mutate_state_dict(
     pointer_only: bool = False,
     *,
     is_pointer_param: Callable[[str], bool] = _is_pointer_param,
+    generator: Optional[torch.Generator] = None,
 ) -> Dict[str, torch.Tensor]:
     """Return a mutated copy of a ``state_dict``.
 
@@ -55,6 +59,7 @@ def mutate_state_dict(
     - Noise is sampled on CPU and added to a CPU copy of the parent tensor.
 
     The returned floating tensors live on CPU (matching the legacy code).
+    ``generator`` (a CPU generator) replaces the global RNG for the noise.
     """
 
     child: Dict[str, torch.Tensor] = {}
@@ -65,11 +70,94 @@ def mutate_state_dict(
         if pointer_only and not is_pointer_param(keystr):
             child[keystr] = tenval.clone()
             continue
-        noise6 = torch.randn_like(tenval, device="cpu") * std
+        if generator is None:
+            noise6 = torch.randn_like(tenval, device="cpu") * std
+        else:
+            noise6 = torch.randn(tenval.shape, generator=generator, dtype=tenval.dtype) * std
         child[keystr] = (tenval.cpu() + noise6).to(tenval.dtype)
     return child
 
 
+def mutate_into_(
+    child: Any,
+    parent: Any,
+    std: float,
+    pointer_only: bool = False,
+    *,
+    seed: int,
+    is_pointer_param: Callable[[str], bool] = _is_pointer_param,
+) -> None:
+    """Overwrite ``child``'s weights with a mutated copy of ``parent``'s, in place.
+
+    Same tensor filter as ``mutate_state_dict``. For ``nn.Module`` pairs the
+    parent tensors are ``copy_``'d into the child's own storage and noise is
+    drawn on their device from a generator seeded with ``seed`` (no host
+    round trip). Other model types fall back to
+    ``load_state_dict(mutate_state_dict(...))`` with a seeded CPU generator.
+    """
+
+    if not (isinstance(child, nn.Module) and isinstance(parent, nn.Module)):
+        genobj = torch.Generator().manual_seed(int(seed))
+        child.load_state_dict(
+            mutate_state_dict(
+                parent.state_dict(), std, pointer_only, is_pointer_param=is_pointer_param, generator=genobj
+            )
+        )
+        return
+
+    parsta = parent.state_dict()
+    gens6: Dict[torch.device, torch.Generator] = {}
+    with torch.no_grad():
+        # state_dict() tensors are detached views of the child's own storage.
+        for keystr, dstten in child.state_dict().items():
+            dstten.copy_(parsta[keystr])
+            if not torch.is_floating_point(dstten):
+                continue
+            if pointer_only and not is_pointer_param(keystr):
+                continue
+            genobj = gens6.get(dstten.device)
+            if genobj is None:
+                genobj = torch.Generator(device=dstten.device).manual_seed(int(seed))
+                gens6[dstten.device] = genobj
+            noise6 = torch.randn(dstten.shape, generator=genobj, device=dstten.device, dtype=dstten.dtype)
+            dstten.add_(noise6, alpha=float(std))
+
+
+def _is_plain_attr(valobj: Any) -> bool:
+    return torch.is_tensor(valobj) or valobj is None or isinstance(valobj, (bool, int, float, str))
+
+
+def _snapshot_attrs(model: Any) -> Dict[str, Any]:
+    """Plain (non-module, non-parameter) attributes right after construction.
+
+    Recycled children are reset to these so controller/telemetry state left by
+    training the discarded individual does not leak into the child.
+    """
+
+    snap: Dict[str, Any] = {}
+    for keystr, valobj in vars(model).items():
+        if keystr.startswith("_") or not _is_plain_attr(valobj):
+            continue
+        snap[keystr] = valobj.detach().clone() if torch.is_tensor(valobj) else valobj
+    return snap
+
+
+def _restore_attrs(model: Any, snap: Mapping[str, Any]) -> None:
+    """Reset ``model``'s plain attributes to ``snap``.
+
+    Plain attributes created after the snapshot (lazily initialised EMAs,
+    ``last_eval_acc`` ...) are deleted so the model looks freshly built.
+    """
+
+    for keystr, valobj in list(vars(model).items()):
+        if keystr.startswith("_") or keystr in snap:
+            continue
+        if _is_plain_attr(valobj):
+            delattr(model, keystr)
+    for keystr, valobj in snap.items():
+        setattr(model, keystr, valobj.clone() if torch.is_tensor(valobj) else valobj)
+
+
 @dataclass(frozen=True)
 class EvolutionConfig:
     """Configuration bundle mirroring the legacy ``EVO_*`` globals."""
@@ -83,6 +171,11 @@ class EvolutionConfig:
     resume: bool
     checkpoint_individual: bool
     progress: bool
+    # Process-pool evaluation (0 = serial loop). seed drives the mutation
+    # noise (and the per-individual RNG streams in pool mode).
+    workers: int = 0
+    seed: Optional[int] = None
+    threads: Optional[int] = None
 
 
 def save_evo_checkpoint(
@@ -149,9 +242,17 @@ def run_evolution(
     - per generation: train+eval each individual, keep elites, refill by
       mutating random elites.
 
+    ``model_ctor`` is only called while building the initial population:
+    children recycle the discarded individuals' modules and are mutated in
+    place (``mutate_into_``, device-side noise, one seeded generator per
+    child).
+
     Returns a summary dict (matching the legacy shape).
 
     If ``config.gens <= 0`` the loop is infinite (legacy behavior).
+
+    With ``config.workers > 0`` individuals are trained/evaluated on a process
+    pool instead (see ``_run_evolution_pool``).
     """
 
     evodir = os.path.join(root, "artifacts", "evolution")
@@ -175,7 +276,27 @@ def run_evolution(
         f"pointer_only={int(config.pointer_only)} resume={int(config.resume)} start_gen={stagen} ==="
     )
 
-    # init population
+    if config.workers > 0:
+        return _run_evolution_pool(
+            dataset_name,
+            loader,
+            eval_loader,
+            dict(input_dim=input_dim, num_classes=num_classes, ring_len=ring_len, slot_dim=slot_dim),
+            ressta=ressta,
+            stagen=stagen,
+            root=root,
+            config=config,
+            model_ctor=model_ctor,
+            train_steps=train_steps,
+            eval_model=eval_model,
+            log=log,
+        )
+
+    # Per-child mutation seeds: config.seed when set, else one draw from the
+    # global torch RNG (so torch.manual_seed still makes runs reproducible).
+    evoseed = int(config.seed) if config.seed is not None else int(torch.randint(0, 2**62, ()).item())
+
+    # init population (the only model_ctor calls; children reuse these modules)
     poplst: list[Any] = []
     if ressta is not None:
         elite = model_ctor(input_dim=input_dim, num_classes=num_classes, ring_len=ring_len, slot_dim=slot_dim)
@@ -189,8 +310,12 @@ def run_evolution(
                 ring_len=ring_len,
                 slot_dim=slot_dim,
             )
-            child.load_state_dict(
-                mutate_state_dict(ressta, std=config.mut_std, pointer_only=config.pointer_only)
+            mutate_into_(
+                child,
+                elite,
+                std=config.mut_std,
+                pointer_only=config.pointer_only,
+                seed=_task_seed(evoseed, stagen - 1, len(poplst)),
             )
             poplst.append(child)
     else:
@@ -202,6 +327,7 @@ def run_evolution(
                 slot_dim=slot_dim,
             )
             poplst.append(modobj)
+    freshs = {id(modobj): _snapshot_attrs(modobj) for modobj in poplst}
 
     bestev: Optional[Tuple[float, Any, Any, Mapping[str, Any]]] = None
 
@@ -242,18 +368,20 @@ def run_evolution(
             log=log,
         )
 
-        # Refill population
+        # Refill population: discarded individuals are recycled as children
+        # (reset to construction-time attributes, weights overwritten in place).
         newpop: list[Any] = [elm[1] for elm in elites]  # keep elites
+        spares = [elm[1] for elm in fitlst[topk:]]
         while len(newpop) < config.pop:
             parobj = random.choice(elites)[1]
-            child = model_ctor(
-                input_dim=input_dim,
-                num_classes=num_classes,
-                ring_len=ring_len,
-                slot_dim=slot_dim,
-            )
-            child.load_state_dict(
-                mutate_state_dict(parobj.state_dict(), std=config.mut_std, pointer_only=config.pointer_only)
+            child = spares.pop()
+            _restore_attrs(child, freshs[id(child)])
+            mutate_into_(
+                child,
+                parobj,
+                std=config.mut_std,
+                pointer_only=config.pointer_only,
+                seed=_task_seed(evoseed, genval, len(newpop)),
             )
             newpop.append(child)
         poplst = newpop
@@ -267,3 +395,290 @@ def run_evolution(
         "best_eval": evlst,
         "best_fitness": fitval,
     }
+
+
+class _StateView:
+    """Adapter so ``save_evo_checkpoint`` can save a bare state dict."""
+
+    def __init__(self, state: Mapping[str, torch.Tensor]):
+        self._state = dict(state)
+
+    def state_dict(self) -> Dict[str, torch.Tensor]:
+        return self._state
+
+
+def _task_seed(seed: int, genval: int, idxval: int) -> int:
+    """Per-(gen, individual) RNG seed; independent of which worker runs it."""
+
+    return ((int(seed) * 1_000_003 + int(genval)) * 1_000_003 + int(idxval)) % (2**63 - 1)
+
+
+def _evo_task(
+    modobj: Any,
+    attrs: Mapping[str, Any],
+    slot: Mapping[str, torch.Tensor],
+    seedval: int,
+    tagstr: str,
+    loader: Any,
+    eval_loader: Any,
+    steps: int,
+    dataset_name: str,
+    train_steps: Callable[..., Any],
+    eval_model: Callable[..., Mapping[str, Any]],
+) -> Tuple[Any, Dict[str, Any], Dict[str, Any]]:
+    """Train+eval one individual held in the shared ``slot``; write weights back.
+
+    ``modobj`` is reset to the individual's plain attributes ``attrs`` before
+    its weights are loaded; the trained attributes are returned alongside the
+    stats. The caller's global ``random``/``torch`` RNG state is preserved.
+    """
+
+    pystate = random.getstate()
+    try:
+        with torch.random.fork_rng(devices=[]):
+            random.seed(seedval)
+            torch.manual_seed(seedval)
+            _restore_attrs(modobj, attrs)
+            modobj.load_state_dict(slot)
+            trnst = train_steps(modobj, loader, steps, dataset_name, tagstr)
+            evlst = dict(eval_model(modobj, eval_loader, dataset_name, tagstr))
+    finally:
+        random.setstate(pystate)
+    with torch.no_grad():
+        for keystr, tenval in modobj.state_dict().items():
+            slot[keystr].copy_(tenval)
+    return trnst, evlst, _snapshot_attrs(modobj)
+
+
+def _evo_worker(
+    nthreads: int,
+    slots: Sequence[Mapping[str, torch.Tensor]],
+    taskq: Any,
+    resq: Any,
+    model_ctor: Callable[..., Any],
+    ctor_kwargs: Mapping[str, Any],
+    loader: Any,
+    eval_loader: Any,
+    steps: int,
+    dataset_name: str,
+    train_steps: Callable[..., Any],
+    eval_model: Callable[..., Mapping[str, Any]],
+) -> None:
+    """Pool worker: one reusable model, tasks are ``(idx, seed, tag, attrs)``.
+
+    ``attrs=None`` means a fresh individual (construction-time attributes).
+    """
+
+    torch.set_num_threads(max(1, int(nthreads)))
+    modobj = model_ctor(**ctor_kwargs)
+    fresh = _snapshot_attrs(modobj)
+    while True:
+        task = taskq.get()
+        if task is None:
+            return
+        idxval, seedval, tagstr, attrs = task
+        try:
+            trnst, evlst, attrs = _evo_task(
+                modobj, fresh if attrs is None else attrs, slots[idxval], seedval, tagstr,
+                loader, eval_loader, steps, dataset_name, train_steps, eval_model,
+            )
+            resq.put((idxval, trnst, evlst, attrs, None))
+        except Exception as exc:
+            resq.put((idxval, None, None, None, f"{type(exc).__name__}: {exc}"))
+
+
+def _pool_result(resq: Any, procs: Sequence[Any], *, poll_s: float = 1.0) -> Any:
+    """Next result from ``resq``; raise if a worker died instead of blocking forever."""
+
+    while True:
+        try:
+            return resq.get(timeout=poll_s)
+        except queue.Empty:
+            for prcobj in procs:
+                if not prcobj.is_alive():
+                    raise RuntimeError(
+                        f"evolution worker pid={prcobj.pid} exited (exitcode={prcobj.exitcode}) mid-generation"
+                    )
+
+
+def _run_evolution_pool(
+    dataset_name: str,
+    loader: Any,
+    eval_loader: Any,
+    ctor_kwargs: Mapping[str, Any],
+    *,
+    ressta: Optional[Mapping[str, torch.Tensor]],
+    stagen: int,
+    root: str,
+    config: EvolutionConfig,
+    model_ctor: Callable[..., Any],
+    train_steps: Callable[..., Any],
+    eval_model: Callable[..., Mapping[str, Any]],
+    log: Callable[[str], None],
+) -> Dict[str, Any]:
+    """Process-pool variant of the ``run_evolution`` generation loop.
+
+    - Each individual lives in a CPU state dict of ``share_memory_()`` tensors
+      ("slot"). Workers load a slot, train+eval, and write the trained weights
+      back in place; only ``(idx, train_stats, eval_stats)`` goes over the
+      result queue.
+    - ``torch.set_num_threads`` is partitioned across workers
+      (``config.threads`` total, default ``os.cpu_count()``).
+    - Plain model attributes (controller/EMA state) travel with the slot:
+      workers reset their model to the individual's attributes before each
+      task, elites keep theirs and refilled children start from the
+      construction-time ones, as in the serial loop.
+    - Every task runs under its own ``random``/``torch`` seed from
+      ``(seed, gen, idx)`` and mutation noise comes from a parent-side
+      generator, so results depend on the seed only, not on the worker count.
+      The caller's global RNG state is left untouched. ``workers == 1`` runs
+      inline.
+
+    Without ``config.seed`` one seed is drawn from the global torch RNG (as in
+    the serial loop) and logged. Workers are forked where available unless
+    CUDA is already initialized; with spawn the callables and loaders must be
+    picklable (module-level functions or ``functools.partial`` of them). A
+    worker that dies mid-generation (OOM kill, segfault) raises RuntimeError.
+    Training must run on CPU (slots are CPU tensors).
+    """
+
+    seedval = int(config.seed) if config.seed is not None else int(torch.randint(0, 2**62, ()).item())
+    nwork = max(1, min(int(config.workers), int(config.pop)))
+    thrtot = int(config.threads) if config.threads else int(os.cpu_count() or 1)
+    nthreads = max(1, thrtot // nwork)
+
+    rngobj = random.Random(seedval)
+    genobj = torch.Generator().manual_seed(seedval)
+
+    slots: list[Dict[str, torch.Tensor]] = []
+    # Seeded initial weights without touching the caller's global torch RNG.
+    with torch.random.fork_rng(devices=[]):
+        torch.manual_seed(seedval)
+        for idxval in range(config.pop):
+            if ressta is not None:
+                state = ressta if idxval == 0 else mutate_state_dict(
+                    ressta, std=config.mut_std, pointer_only=config.pointer_only, generator=genobj
+                )
+            else:
+                state = model_ctor(**ctor_kwargs).state_dict()
+            slots.append({keystr: tenval.detach().cpu().clone().share_memory_() for keystr, tenval in state.items()})
+    # Per-slot plain attributes; None = construction-time (fresh individual).
+    attlst: list[Optional[Dict[str, Any]]] = [None] * config.pop
+
+    procs: list[Any] = []
+    taskq: Any = None
+    resq: Any = None
+    local: Any = None
+    fresh: Dict[str, Any] = {}
+    if nwork > 1:
+        import torch.multiprocessing as tmp
+
+        # A forked child cannot use CUDA once the parent has initialized it.
+        usefork = "fork" in tmp.get_all_start_methods() and not torch.cuda.is_initialized()
+        ctxobj = tmp.get_context("fork" if usefork else "spawn")
+        log(
+            f"Evolution pool: workers={nwork} threads/worker={nthreads} seed={seedval} "
+            f"start={'fork' if usefork else 'spawn'}"
+        )
+        taskq = ctxobj.Queue()
+        resq = ctxobj.Queue()
+        for _ in range(nwork):
+            prcobj = ctxobj.Process(
+                target=_evo_worker,
+                args=(nthreads, slots, taskq, resq, model_ctor, dict(ctor_kwargs), loader, eval_loader,
+                      config.steps, dataset_name, train_steps, eval_model),
+                daemon=True,
+            )
+            prcobj.start()
+            procs.append(prcobj)
+    else:
+        log(f"Evolution pool: workers={nwork} threads/worker={nthreads} seed={seedval} start=inline")
+        local = model_ctor(**ctor_kwargs)
+        fresh = _snapshot_attrs(local)
+
+    bestev: Optional[Tuple[float, Any, Any, Mapping[str, Any]]] = None
+
+    if config.gens > 0:
+        genitr: Iterable[int] = range(stagen, stagen + config.gens)
+    else:
+        genitr = count(stagen)
+
+    try:
+        for genval in genitr:
+            reslst: list[Any] = [None] * config.pop
+            if procs:
+                for idxval in range(config.pop):
+                    taskq.put((idxval, _task_seed(seedval, genval, idxval), f"evo_{genval}_{idxval}", attlst[idxval]))
+                for _ in range(config.pop):
+                    idxval, trnst, evlst, attrs, errstr = _pool_result(resq, procs)
+                    if errstr is not None:
+                        raise RuntimeError(f"evolution worker failed on individual {idxval}: {errstr}")
+                    reslst[idxval] = (trnst, evlst)
+                    attlst[idxval] = attrs
+            else:
+                for idxval in range(config.pop):
+                    attrs = attlst[idxval]
+                    trnst, evlst, attlst[idxval] = _evo_task(
+                        local, fresh if attrs is None else attrs, slots[idxval],
+                        _task_seed(seedval, genval, idxval), f"evo_{genval}_{idxval}",
+                        loader, eval_loader, config.steps, dataset_name, train_steps, eval_model,
+                    )
+                    reslst[idxval] = (trnst, evlst)
+
+            # Stable sort over slot order keeps ties deterministic.
+            fitlst = [(1.0 - float(evlst["eval_loss"]), idxval, trnst, evlst) for idxval, (trnst, evlst) in enumerate(reslst)]
+            fitlst.sort(key=lambda x: x[0], reverse=True)
+            topk = max(1, config.pop // 3)
+            elites = fitlst[:topk]
+            topidx = elites[0][1]
+
+            if bestev is None or elites[0][0] > bestev[0]:
+                bestev = elites[0]
+
+            if config.progress:
+                log(
+                    f"Gen {genval}: best_acc={elites[0][3]['eval_acc']:.4f}, "
+                    f"loss={elites[0][3]['eval_loss']:.4f}"
+                )
+
+            save_evo_checkpoint(
+                genval,
+                _StateView({keystr: tenval.clone() for keystr, tenval in slots[topidx].items()}),
+                elites[0][2],
+                elites[0][3],
+                elites[0][0],
+                root=root,
+                checkpoint_every=config.checkpoint_every,
+                log=log,
+            )
+
+            # Refill non-elite slots in place from random elites. Parent states
+            # are snapshotted first so a child never reads a half-written slot.
+            elidx = [elm[1] for elm in elites]
+            eliset = set(elidx)
+            parsta = {idxval: {k: v.clone() for k, v in slots[idxval].items()} for idxval in elidx}
+            for idxval in range(config.pop):
+                if idxval in eliset:
+                    continue
+                child = mutate_state_dict(
+                    parsta[rngobj.choice(elidx)], std=config.mut_std, pointer_only=config.pointer_only, generator=genobj
+                )
+                for keystr, tenval in child.items():
+                    slots[idxval][keystr].copy_(tenval)
+                attlst[idxval] = None
+    finally:
+        for _ in procs:
+            taskq.put(None)
+        for prcobj in procs:
+            prcobj.join(timeout=5.0)
+            if prcobj.is_alive():
+                prcobj.terminate()
+
+    assert bestev is not None
+    fitval, _bestm, trnst, evlst = bestev
+    return {
+        "mode": "evolution",
+        "best_train": trnst,
+        "best_eval": evlst,
+        "best_fitness": fitval,
+    }
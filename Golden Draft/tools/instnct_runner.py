@@ -17,6 +17,7 @@ train/eval functions.
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Mapping, Optional, Tuple
@@ -388,11 +389,10 @@ def default_context() -> InstnctRunnerContext:
         resume=bool(cfg.evo_resume),
         checkpoint_individual=bool(cfg.evo_checkpoint_individual),
         progress=bool(cfg.evo_progress),
+        workers=env_utils.env_int(os.environ, "VRX_EVO_WORKERS", 0, min_value=0)[0],
+        seed=int(cfg.seed),
     )
 
-    def _eval_model(model: Any, loader: Any, dataset_name: str, model_name: str) -> Mapping[str, Any]:
-        return instnct_eval.eval_model(model, loader, dataset_name, model_name, deps=eval_deps)
-
     def _build_eval_subset(ds: Any, *, input_collate: Any = None) -> Tuple[Any, int]:
         return instnct_eval.build_eval_loader_from_subset(ds, spec=eval_spec, input_collate=input_collate)
 
@@ -435,7 +435,8 @@ def default_context() -> InstnctRunnerContext:
         model_ctor=AbsoluteHallway,
         train_wallclock=instnct_train_wallclock.train_wallclock,
         train_steps=instnct_train_steps.train_steps,
-        eval_model=_eval_model,
+        # A partial (not a closure) so spawned evolution workers can unpickle it.
+        eval_model=functools.partial(instnct_eval.eval_model, deps=eval_deps),
     )
 
 
@@ -86,6 +86,12 @@ except Exception:  # pragma: no cover
         return None
 
 
+try:
+    from vraxion.instnct.runtime_config import runtime_config_for  # type: ignore
+except Exception:  # pragma: no cover
+    runtime_config_for = None  # type: ignore
+
+
 try:
     from vraxion.instnct.thermo import ThermostatParams, apply_thermostat  # type: ignore
 except Exception:  # pragma: no cover
@@ -565,6 +571,15 @@ def train_steps(model: torch.nn.Module, loader: Any, steps: int, dataset_name: s
     TENURE_TTL_STEPS = int(os.environ.get("VRX_TENURE_TTL_STEPS", "0"))
     TENURE_GC = os.environ.get("VRX_TENURE_GC", "0") == "1"
 
+    # Knobs consulted inside the step loop come from one frozen snapshot.
+    runtime_cfg = runtime_config_for(model) if runtime_config_for is not None else None
+    if runtime_cfg is not None:
+        INERTIA_OVERRIDE_SET = bool(runtime_cfg.ptr_inertia_override_set)
+        FORCE_CADENCE_1 = bool(runtime_cfg.force_cadence_1)
+    else:
+        INERTIA_OVERRIDE_SET = os.environ.get("VRX_PTR_INERTIA_OVERRIDE") is not None
+        FORCE_CADENCE_1 = os.environ.get("VRX_FORCE_CADENCE_1") == "1"
+
     # ---- Derived control parameter bundles ----
     THERMOSTAT_PARAMS = ThermostatParams(
         ema_beta=float(_get_setting(settings, "thermo_ema", 0.9)),
@@ -861,13 +876,13 @@ def train_steps(model: torch.nn.Module, loader: Any, steps: int, dataset_name: s
             ctrl = panic_reflex.update(float(loss))
             panic_status = ctrl["status"]
             if panic_status == "PANIC":
-                if os.environ.get("VRX_PTR_INERTIA_OVERRIDE") is None:
+                if not INERTIA_OVERRIDE_SET:
                     model.ptr_inertia = ctrl["inertia"]
                     model.ptr_walk_prob = ctrl["walk_prob"]
         ptr_velocity_raw = getattr(model, "ptr_delta_raw_mean", None)
-        if os.environ.get("VRX_PTR_INERTIA_OVERRIDE") is None:
+        if not INERTIA_OVERRIDE_SET:
             apply_inertia_auto(model, ptr_velocity_raw, INERTIA_AUTO_PARAMS, panic_active=panic_status == "PANIC")
-        if os.environ.get("VRX_FORCE_CADENCE_1") == "1":
+        if FORCE_CADENCE_1:
             model.ptr_update_every = 1
         elif cadence_gov is not None:
             flip_rate = float(model.ptr_flip_rate) if hasattr(model, "ptr_flip_rate") else 0.0
@@ -125,6 +125,12 @@ except Exception:  # pragma: no cover
     load_settings = None  # type: ignore
 
 
+try:
+    from vraxion.instnct.runtime_config import runtime_config_for  # type: ignore
+except Exception:  # pragma: no cover
+    runtime_config_for = None  # type: ignore
+
+
 try:
     from vraxion.instnct.infra import log, compute_slope, _checkpoint_paths  # type: ignore
 except Exception:  # pragma: no cover
@@ -790,9 +796,23 @@ def train_wallclock(model, loader, dataset_name, model_name, num_classes, wall_c
     model.update_scale = init_scale
     model.agc_scale_max = AGC_SCALE_MAX
     model.agc_scale_cap = AGC_SCALE_MAX
-    env_inertia = os.environ.get("VRX_PTR_INERTIA_OVERRIDE")
-    if env_inertia is not None:
-        model.ptr_inertia = float(env_inertia)
+
+    # Knobs consulted inside the step loop come from one frozen snapshot; the
+    # inertia override flag and value are both read from it so they agree.
+    runtime_cfg = runtime_config_for(model) if runtime_config_for is not None else None
+    if runtime_cfg is not None:
+        inertia_override_set = bool(runtime_cfg.ptr_inertia_override_set)
+        inertia_override = runtime_cfg.ptr_inertia_override
+        force_cadence_1 = bool(runtime_cfg.force_cadence_1)
+        ignore_max_steps = bool(runtime_cfg.ignore_max_steps)
+    else:
+        env_inertia = os.environ.get("VRX_PTR_INERTIA_OVERRIDE")
+        inertia_override_set = env_inertia is not None
+        inertia_override = float(env_inertia) if env_inertia is not None else None
+        force_cadence_1 = os.environ.get("VRX_FORCE_CADENCE_1") == "1"
+        ignore_max_steps = os.environ.get("VRX_IGNORE_MAX_STEPS") == "1"
+    if inertia_override is not None:
+        model.ptr_inertia = float(inertia_override)
         model.ptr_inertia_ema = model.ptr_inertia
 
     start = time.time()
@@ -861,9 +881,8 @@ def train_wallclock(model, loader, dataset_name, model_name, num_classes, wall_c
                 model.update_scale = float(env_scale_init)
             if env_scale_max is not None:
                 model.agc_scale_max = float(env_scale_max)
-            env_inertia = os.environ.get("VRX_PTR_INERTIA_OVERRIDE")
-            if env_inertia is not None:
-                model.ptr_inertia = float(env_inertia)
+            if inertia_override is not None:
+                model.ptr_inertia = float(inertia_override)
                 model.ptr_inertia_ema = model.ptr_inertia
             model.agc_scale_cap = model.agc_scale_max
             # Clear dynamic speed stats to avoid stale velocity.
@@ -879,7 +898,6 @@ def train_wallclock(model, loader, dataset_name, model_name, num_classes, wall_c
     while time.time() <= end_time:
         # Enforce hard step cap at the outer loop boundary too; otherwise an
         # inner-loop break can still re-enter the next epoch and overshoot.
-        ignore_max_steps = os.environ.get("VRX_IGNORE_MAX_STEPS") == "1"
         if (not ignore_max_steps) and MAX_STEPS > 0 and step >= MAX_STEPS:
             break
         for batch in loader:
@@ -1246,14 +1264,14 @@ def train_wallclock(model, loader, dataset_name, model_name, num_classes, wall_c
                 ctrl = panic_reflex.update(float(loss))
                 panic_status = ctrl["status"]
                 if panic_status == "PANIC":
-                    if os.environ.get("VRX_PTR_INERTIA_OVERRIDE") is None:
+                    if not inertia_override_set:
                         model.ptr_inertia = ctrl["inertia"]
                         model.ptr_walk_prob = ctrl["walk_prob"]
             ptr_velocity_raw = getattr(model, "ptr_delta_raw_mean", None)
             # Do not override manual inertia when VRX_PTR_INERTIA_OVERRIDE is set.
-            if os.environ.get("VRX_PTR_INERTIA_OVERRIDE") is None:
+            if not inertia_override_set:
                 apply_inertia_auto(model, ptr_velocity_raw, INERTIA_AUTO_PARAMS, panic_active=panic_status == "PANIC")
-            if os.environ.get("VRX_FORCE_CADENCE_1") == "1":
+            if force_cadence_1:
                 model.ptr_update_every = 1
             elif cadence_gov is not None:
                 flip_rate = float(model.ptr_flip_rate) if hasattr(model, "ptr_flip_rate") else 0.0
@@ -1577,7 +1595,6 @@ def train_wallclock(model, loader, dataset_name, model_name, num_classes, wall_c
                 model.ptr_walk_prob = prev_walk_prob
             step += 1
             # Respect MAX_STEPS unless explicitly disabled (used by infinite wrapper).
-            ignore_max_steps = os.environ.get("VRX_IGNORE_MAX_STEPS") == "1"
             if (not ignore_max_steps) and MAX_STEPS > 0 and step >= MAX_STEPS:
                 break
             eval_stats = None
@@ -0,0 +1,380 @@
+"""Local resource-slot job scheduler for sweep orchestrators.
+
+Sweeps (``ant_ratio_sweep_v0.py``, ...) are chains of subprocess jobs (probe ->
+train -> eval per config). This module runs independent jobs concurrently on
+one machine while keeping them inside a fixed resource pool:
+  - CPU threads: each job declares how many it uses; the scheduler exports
+    ``OMP_NUM_THREADS`` / ``MKL_NUM_THREADS`` to the job (see ``JobContext.env``)
+    so concurrent jobs partition the cores instead of oversubscribing them.
+  - GPU slots: a job needing a GPU holds one slot for its whole run. A slot may
+    be pinned to a CUDA device (``CUDA_VISIBLE_DEVICES``); listing a device
+    twice lets two jobs share it.
+  - RAM (MiB): optional budget against per-job estimates (0 = unlimited).
+
+``usable_cpus`` / ``cpu_partition`` / ``pin_process`` are the CPU-affinity
+helpers for runners that pin their subprocesses to disjoint core slices
+(``sched_setaffinity`` on Linux, ``SetProcessAffinityMask`` on Windows).
+
+Jobs may depend on other jobs by name. A job whose dependency failed is not
+run and is reported as failed with ``skipped=True``. Ready jobs start in
+declaration order, so declaring configs row by row keeps early rows ahead.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+
+class SchedulerError(RuntimeError):
+    pass
+
+
+@dataclass
+class Job:
+    name: str
+    fn: Callable[["JobContext"], Any]
+    deps: Sequence[str] = ()
+    cpu_threads: int = 1
+    gpu: bool = False
+    ram_mb: float = 0.0
+
+
+@dataclass
+class JobContext:
+    """What a running job got from the pool, plus its dependencies' results."""
+
+    name: str
+    cpu_threads: int
+    gpu_slot: Optional[int]
+    gpu_device: Optional[str]
+    results: Mapping[str, Any]
+    thread_env: bool = True
+
+    def env_overrides(self) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        if self.thread_env:
+            out.update(thread_env(self.cpu_threads))
+        if self.gpu_device is not None:
+            out["CUDA_VISIBLE_DEVICES"] = str(self.gpu_device)
+        return out
+
+    def env(self, base: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+        envmap = dict(os.environ if base is None else base)
+        envmap.update(self.env_overrides())
+        return envmap
+
+
+@dataclass
+class JobResult:
+    name: str
+    ok: bool
+    value: Any = None
+    error: Optional[BaseException] = None
+    skipped: bool = False
+    elapsed_s: float = 0.0
+
+
+@dataclass
+class _Lease:
+    cpu_threads: int
+    gpu_slot: Optional[int]
+    ram_mb: float
+
+
+@dataclass
+class SlotPool:
+    """Fixed CPU-thread / GPU-slot / RAM budget shared by running jobs.
+
+    ``gpu_devices`` entries are CUDA device ids (or "" for an unpinned slot).
+    Requests larger than the pool are clamped to it, so an oversized job still
+    runs, just alone.
+    """
+
+    cpu_threads: int
+    gpu_devices: Sequence[str] = ("",)
+    ram_mb: float = 0.0
+    _cpu_free: int = field(init=False)
+    _ram_free: float = field(init=False)
+    _gpu_free: List[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.cpu_threads = max(1, int(self.cpu_threads))
+        self.gpu_devices = [str(dev).strip() for dev in self.gpu_devices]
+        self._cpu_free = self.cpu_threads
+        self._ram_free = float(self.ram_mb)
+        self._gpu_free = list(range(len(self.gpu_devices)))
+
+    def _need(self, job: Job) -> _Lease:
+        cpu = max(1, min(int(job.cpu_threads), self.cpu_threads))
+        ram = min(max(0.0, float(job.ram_mb)), float(self.ram_mb)) if self.ram_mb > 0 else 0.0
+        gpu = 0 if (job.gpu and self.gpu_devices) else None
+        return _Lease(cpu_threads=cpu, gpu_slot=gpu, ram_mb=ram)
+
+    def try_acquire(self, job: Job) -> Optional[_Lease]:
+        need = self._need(job)
+        if need.cpu_threads > self._cpu_free:
+            return None
+        if need.ram_mb > self._ram_free:
+            return None
+        if need.gpu_slot is not None:
+            if not self._gpu_free:
+                return None
+            need.gpu_slot = self._gpu_free.pop(0)
+        self._cpu_free -= need.cpu_threads
+        self._ram_free -= need.ram_mb
+        return need
+
+    def release(self, lease: _Lease) -> None:
+        self._cpu_free += lease.cpu_threads
+        self._ram_free += lease.ram_mb
+        if lease.gpu_slot is not None:
+            self._gpu_free.append(lease.gpu_slot)
+            self._gpu_free.sort()
+
+    def device_for(self, slot: Optional[int]) -> Optional[str]:
+        if slot is None:
+            return None
+        dev = self.gpu_devices[slot]
+        return dev if dev else None
+
+
+def _check_graph(jobs: Sequence[Job]) -> None:
+    names = [job.name for job in jobs]
+    if len(set(names)) != len(names):
+        raise SchedulerError("duplicate job names")
+    known = set(names)
+    for job in jobs:
+        for dep in job.deps:
+            if dep not in known:
+                raise SchedulerError(f"job {job.name!r} depends on unknown job {dep!r}")
+
+    state: Dict[str, int] = {}
+    bydep = {job.name: list(job.deps) for job in jobs}
+
+    def _visit(name: str) -> None:
+        stack = [(name, iter(bydep[name]))]
+        state[name] = 1
+        while stack:
+            cur, deps = stack[-1]
+            nxt = next(deps, None)
+            if nxt is None:
+                state[cur] = 2
+                stack.pop()
+            elif state.get(nxt) == 1:
+                raise SchedulerError(f"dependency cycle through job {nxt!r}")
+            elif nxt not in state:
+                state[nxt] = 1
+                stack.append((nxt, iter(bydep[nxt])))
+
+    for name in names:
+        if name not in state:
+            _visit(name)
+
+
+def run_jobs(
+    jobs: Sequence[Job],
+    pool: SlotPool,
+    *,
+    max_workers: int = 1,
+    thread_env: bool = True,
+    on_done: Optional[Callable[[JobResult], None]] = None,
+) -> Dict[str, JobResult]:
+    """Run ``jobs`` respecting dependencies and ``pool``; return results by name.
+
+    ``on_done`` is called from the calling thread as each job finishes (or is
+    skipped), in completion order. With ``max_workers=1`` jobs run one at a
+    time in declaration order. Exceptions raised by a job are captured in its
+    ``JobResult``; exceptions raised by ``on_done`` propagate after running
+    jobs finish.
+    """
+
+    _check_graph(jobs)
+    pending: List[Job] = list(jobs)
+    results: Dict[str, JobResult] = {}
+    running: Dict[Future[Any], Any] = {}
+    order = {job.name: idx for idx, job in enumerate(jobs)}
+    nworkers = max(1, int(max_workers))
+
+    def _finish(res: JobResult) -> None:
+        results[res.name] = res
+        if on_done is not None:
+            on_done(res)
+
+    with ThreadPoolExecutor(max_workers=nworkers) as pool_exec:
+        try:
+            while pending or running:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for job in list(pending):
+                        failed = [dep for dep in job.deps if dep in results and not results[dep].ok]
+                        if failed:
+                            pending.remove(job)
+                            dep_res = results[failed[0]]
+                            _finish(JobResult(name=job.name, ok=False, error=dep_res.error, skipped=True))
+                            progressed = True
+                            continue
+                        if any(dep not in results for dep in job.deps):
+                            continue
+                        if len(running) >= nworkers:
+                            break
+                        lease = pool.try_acquire(job)
+                        if lease is None:
+                            continue
+                        ctx = JobContext(
+                            name=job.name,
+                            cpu_threads=lease.cpu_threads,
+                            gpu_slot=lease.gpu_slot,
+                            gpu_device=pool.device_for(lease.gpu_slot),
+                            results={dep: results[dep].value for dep in job.deps},
+                            thread_env=bool(thread_env),
+                        )
+                        pending.remove(job)
+                        fut = pool_exec.submit(job.fn, ctx)
+                        running[fut] = (job, lease, time.perf_counter())
+                        progressed = True
+
+                if not running:
+                    if pending:
+                        raise SchedulerError(f"no runnable job among {len(pending)} pending (pool too small?)")
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                # Report in declaration order when several finish together.
+                for fut in sorted(done, key=lambda f: order[running[f][0].name]):
+                    job, lease, start = running.pop(fut)
+                    pool.release(lease)
+                    elapsed = time.perf_counter() - start
+                    exc = fut.exception()
+                    if exc is not None:
+                        _finish(JobResult(name=job.name, ok=False, error=exc, elapsed_s=elapsed))
+                    else:
+                        _finish(JobResult(name=job.name, ok=True, value=fut.result(), elapsed_s=elapsed))
+        finally:
+            for fut in running:
+                fut.cancel()
+    return results
+
+
+def usable_cpus() -> List[int]:
+    """CPU ids this process may run on (affinity mask where supported)."""
+
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return sorted(os.sched_getaffinity(0))
+        except OSError:
+            pass
+    return list(range(max(1, int(os.cpu_count() or 1))))
+
+
+def default_cpu_threads() -> int:
+    return len(usable_cpus())
+
+
+def cpu_partition(nparts: int, cpus: Optional[Sequence[int]] = None) -> List[List[int]]:
+    """Split CPUs into ``nparts`` contiguous disjoint slices (shared if too few)."""
+
+    cpus = list(usable_cpus() if cpus is None else cpus)
+    nparts = max(1, int(nparts))
+    if len(cpus) < nparts:
+        return [list(cpus) for _ in range(nparts)]
+    return [cpus[(i * len(cpus)) // nparts : ((i + 1) * len(cpus)) // nparts] for i in range(nparts)]
+
+
+_PIN_NOTED: set = set()
+
+
+def _win_set_affinity(pid: int, cpus: Sequence[int]) -> Optional[str]:
+    """``SetProcessAffinityMask`` via ctypes; returns an error string or None."""
+
+    import ctypes
+    from ctypes import wintypes
+
+    nbits = 8 * ctypes.sizeof(ctypes.c_size_t)
+    if max(cpus) >= nbits:
+        return f"cpu ids >= {nbits} are outside the process's processor group"
+    mask = 0
+    for cpu in cpus:
+        mask |= 1 << int(cpu)
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.SetProcessAffinityMask.argtypes = [wintypes.HANDLE, ctypes.c_size_t]
+    kernel32.SetProcessAffinityMask.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    # PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION
+    handle = kernel32.OpenProcess(0x0200 | 0x0400, False, int(pid))
+    if not handle:
+        return f"OpenProcess failed (winerror {ctypes.get_last_error()})"
+    try:
+        if not kernel32.SetProcessAffinityMask(handle, mask):
+            return f"SetProcessAffinityMask failed (winerror {ctypes.get_last_error()})"
+    finally:
+        kernel32.CloseHandle(handle)
+    return None
+
+
+def pin_process(pid: int, cpus: Optional[Sequence[int]], *, log: Optional[Callable[[str], None]] = None) -> bool:
+    """Restrict ``pid`` to ``cpus``; False (and one log line per reason) if that fails.
+
+    Uses ``os.sched_setaffinity`` where available, else
+    ``SetProcessAffinityMask`` on Windows (first processor group only). Other
+    platforms are reported as unsupported. ``log`` defaults to stderr.
+
+    Pin right after spawn: torch/OpenMP worker threads are created later (at
+    import) and inherit the mask.
+    """
+
+    if not cpus:
+        return False
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(int(pid), set(cpus))
+            return True
+        except OSError as exc:
+            errstr = f"sched_setaffinity failed: {exc}"
+    elif sys.platform == "win32":
+        try:
+            errstr = _win_set_affinity(int(pid), list(cpus))
+        except (OSError, AttributeError) as exc:
+            errstr = f"SetProcessAffinityMask unavailable: {exc}"
+        if errstr is None:
+            return True
+    else:
+        errstr = f"CPU affinity is not supported on {sys.platform}"
+    if errstr not in _PIN_NOTED:
+        _PIN_NOTED.add(errstr)
+        msg = f"CPU pinning unavailable ({errstr}); runs share all cores"
+        if log is not None:
+            log(msg)
+        else:
+            print(f"[job_scheduler] {msg}", file=sys.stderr)
+    return False
+
+
+def thread_env(threads: int) -> Dict[str, str]:
+    return {"OMP_NUM_THREADS": str(int(threads)), "MKL_NUM_THREADS": str(int(threads))}
+
+
+__all__ = [
+    "Job",
+    "JobContext",
+    "JobResult",
+    "SchedulerError",
+    "SlotPool",
+    "cpu_partition",
+    "default_cpu_threads",
+    "pin_process",
+    "run_jobs",
+    "thread_env",
+    "usable_cpus",
+]
@@ -11,16 +11,32 @@ Design goals
 
 Parsing API
 - ``parse_log_lines(lines)`` returns stdlib-only parsed rows.
-- ``parse_log(log_path)`` returns a pandas DataFrame (requires pandas).
+- ``LogTail(log_path).poll()`` parses only bytes appended since the last poll
+  (rows kept in a columnar buffer; rotation/truncation restart the parse).
+- ``parse_log(log_path)`` returns a pandas DataFrame (requires pandas). With
+  ``tail=`` the processed frame is cached on the tail and only new rows are
+  appended to it on each refresh.
 """
 
 from __future__ import annotations
 
 import argparse
+import array
+import math
 import os
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover
+    from .downsample import METHODS, downsample_indices
+except ImportError:  # pragma: no cover
+    # ``streamlit run tools/live_dashboard.py`` puts tools/ (not the repo root) on sys.path.
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools.downsample import METHODS, downsample_indices
 
 
 RESTEP = re.compile(
@@ -42,18 +58,8 @@ def _tryflt(valstr: str) -> Optional[float]:
         return None
 
 
-def parse_log_lines(lines: Iterable[str]) -> List[Dict[str, Any]]:
-    """Parse log lines into dict rows.
-
-    Behavior contract (matches original draft script):
-    - A ``grad_norm(theta_ptr)=...`` line sets a temporary grad value.
-    - That grad value is attached to the *next* parsed step line only.
-    - Step rows contain: step, loss, raw_delta, shard_count, shard_size,
-      traction (optional), grad_norm (optional).
-    """
-
-    rows6x: List[Dict[str, Any]] = []
-    grad6x: Optional[float] = None
+def _parse_into(lines: Iterable[str], grad6x: Optional[float], addrow: Any) -> Optional[float]:
+    """Feed parsed step rows to ``addrow``; returns the pending grad carry."""
 
     for linstr in lines:
         grdmat = REGRAD.search(linstr)
@@ -69,23 +75,193 @@ def parse_log_lines(lines: Iterable[str]) -> List[Dict[str, Any]]:
         trcstr = stpmat.group("traction")
         trac6x = _tryflt(trcstr) if trcstr is not None else None
 
-        rowdat: Dict[str, Any] = {
-            "step": int(stpmat.group("step")),
-            "loss": float(stpmat.group("loss")),
-            "raw_delta": float(stpmat.group("raw_delta")),
-            "shard_count": float(stpmat.group("shard_count")),
-            "shard_size": float(stpmat.group("shard_size")),
-            "traction": trac6x,
-            "grad_norm": grad6x,
-        }
-        rows6x.append(rowdat)
+        addrow(
+            int(stpmat.group("step")),
+            float(stpmat.group("loss")),
+            float(stpmat.group("raw_delta")),
+            float(stpmat.group("shard_count")),
+            float(stpmat.group("shard_size")),
+            trac6x,
+            grad6x,
+        )
 
         # Grad applies to only the next step.
         grad6x = None
 
+    return grad6x
+
+
+def parse_log_lines(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """Parse log lines into dict rows.
+
+    Behavior contract (matches original draft script):
+    - A ``grad_norm(theta_ptr)=...`` line sets a temporary grad value.
+    - That grad value is attached to the *next* parsed step line only.
+    - Step rows contain: step, loss, raw_delta, shard_count, shard_size,
+      traction (optional), grad_norm (optional).
+    """
+
+    rows6x: List[Dict[str, Any]] = []
+
+    def _addrow(*vals: Any) -> None:
+        rows6x.append(dict(zip(COLUMNS, vals)))
+
+    _parse_into(lines, None, _addrow)
     return rows6x
 
 
+COLUMNS = ("step", "loss", "raw_delta", "shard_count", "shard_size", "traction", "grad_norm")
+_OPTCOL = ("traction", "grad_norm")
+
+
+class LogTail:
+    """Tail-following parser for one log file.
+
+    Each ``poll`` parses only the complete lines appended since the previous
+    poll; the ``grad_norm`` carry survives across polls. Rows live in growable
+    ``array`` columns (optional values stored as NaN). A new file at the same
+    path (``infra.rotate_artifacts`` moves ``current`` away) or a file shorter
+    than the consumed offset resets the buffer and reparses from byte 0.
+    """
+
+    _HEADB = 256
+
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+        self.offset = 0
+        self.resets = 0
+        self._ident: Optional[Tuple[int, int]] = None
+        self._head = b""
+        self._grad: Optional[float] = None
+        self._clear_columns()
+
+    def _clear_columns(self) -> None:
+        self.columns: Dict[str, array.array] = {
+            colnam: array.array("q" if colnam == "step" else "d") for colnam in COLUMNS
+        }
+        # Processed-frame cache for ``frame()``; ``_framed`` rows are already in it.
+        self._frame: Any = None
+        self._framed = 0
+
+    def __len__(self) -> int:
+        return len(self.columns["step"])
+
+    def reset(self) -> None:
+        self.offset = 0
+        self._ident = None
+        self._head = b""
+        self._grad = None
+        self._clear_columns()
+        self.resets += 1
+
+    def _addrow(self, *vals: Any) -> None:
+        for colnam, valobj in zip(COLUMNS, vals):
+            self.columns[colnam].append(math.nan if valobj is None else valobj)
+
+    def poll(self) -> int:
+        """Parse newly appended lines; returns the number of new rows."""
+
+        try:
+            statob = os.stat(self.log_path)
+        except OSError:
+            if self.offset or len(self):
+                self.reset()
+            return 0
+
+        ident = (int(statob.st_dev), int(statob.st_ino))
+        try:
+            with open(self.log_path, "rb") as filobj:
+                head = filobj.read(self._HEADB) if self.offset else b""
+                replaced = self._ident is not None and ident != self._ident
+                rewrote = bool(self.offset) and not head.startswith(self._head[: len(head)])
+                if replaced or rewrote or statob.st_size < self.offset:
+                    self.reset()
+                self._ident = ident
+
+                filobj.seek(self.offset)
+                newbyt = filobj.read()
+        except OSError:
+            return 0
+
+        # Only complete lines; a trailing partial line is re-read next poll.
+        endpos = newbyt.rfind(b"\n")
+        if endpos < 0:
+            return 0
+        if self.offset < self._HEADB:
+            self._head = (self._head + newbyt[: endpos + 1])[: self._HEADB]
+        self.offset += endpos + 1
+
+        nrows0 = len(self)
+        text6x = newbyt[: endpos + 1].decode("utf-8", errors="replace")
+        self._grad = _parse_into(text6x.split("\n"), self._grad, self._addrow)
+        return len(self) - nrows0
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Materialize dict rows (same shape as ``parse_log_lines``)."""
+
+        out6x: List[Dict[str, Any]] = []
+        for vals in zip(*(self.columns[colnam] for colnam in COLUMNS)):
+            rowdat = dict(zip(COLUMNS, vals))
+            for colnam in _OPTCOL:
+                if math.isnan(rowdat[colnam]):
+                    rowdat[colnam] = None
+            out6x.append(rowdat)
+        return out6x
+
+    def to_frame(self, start: int = 0):
+        """pandas DataFrame of buffered rows ``start:`` (requires pandas/numpy).
+
+        The index keeps the row positions, so a chunk lines up with a full frame.
+        """
+
+        import numpy as np  # type: ignore
+        import pandas as pd  # type: ignore
+
+        nrows6 = len(self)
+        start = min(max(0, int(start)), nrows6)
+        return pd.DataFrame(
+            {
+                colnam: np.frombuffer(
+                    self.columns[colnam],
+                    dtype=np.int64 if colnam == "step" else np.float64,
+                    count=nrows6 - start,
+                    offset=start * self.columns[colnam].itemsize,
+                ).copy()
+                for colnam in COLUMNS
+            },
+            index=pd.RangeIndex(start, nrows6),
+        )
+
+    def frame(self):
+        """Processed DataFrame, extended with the rows parsed since the last call.
+
+        Rows are deduplicated on ``step`` (first occurrence wins) and sorted by
+        step, with an unclipped ``tension`` column. Only the new rows are
+        converted and processed; a chunk that starts at or before the cached
+        last step (log restarted from a checkpoint) is merged with a re-sort.
+        """
+
+        import pandas as pd  # type: ignore
+
+        nrows6 = len(self)
+        if self._frame is not None and nrows6 == self._framed:
+            return self._frame
+
+        chunk6 = self.to_frame(self._framed)
+        self._framed = nrows6
+        chunk6["tension"] = chunk6["grad_norm"] * chunk6["raw_delta"] / 100.0
+
+        cached = self._frame
+        if cached is None or cached.empty:
+            dfobj6 = chunk6.drop_duplicates(subset=["step"]).sort_values("step")
+        elif int(chunk6["step"].min()) > int(cached["step"].iloc[-1]):
+            dfobj6 = pd.concat([cached, chunk6.drop_duplicates(subset=["step"]).sort_values("step")])
+        else:
+            dfobj6 = pd.concat([cached, chunk6]).drop_duplicates(subset=["step"]).sort_values("step")
+        self._frame = dfobj6
+        return dfobj6
+
+
 def parse_log_file(log_path: str) -> List[Dict[str, Any]]:
     """Read and parse a log file.
 
@@ -104,9 +280,11 @@ def parse_log_file(log_path: str) -> List[Dict[str, Any]]:
     return parse_log_lines(linlst)
 
 
-def parse_log(log_path: str):
+def parse_log(log_path: str, *, tail: Optional[LogTail] = None):
     """Parse a log file into a pandas DataFrame.
 
+    With ``tail`` only the bytes appended since its last poll are parsed, and
+    only those rows are appended to the frame cached on the tail.
     This function requires pandas. Importing this module does not.
     """
 
@@ -115,17 +293,24 @@ def parse_log(log_path: str):
     except Exception as exc:
         raise RuntimeError("pandas is required for parse_log()") from exc
 
-    rows6x = parse_log_file(log_path)
-    dfobj6 = pd.DataFrame(rows6x)
-
-    if dfobj6.empty:
-        return dfobj6
+    if tail is not None:
+        tail.poll()
+        dfobj6 = tail.frame()
+        if dfobj6.empty:
+            return dfobj6
+        # The cached frame keeps raw tension; clip on a shallow copy.
+        dfobj6 = dfobj6.copy(deep=False)
+    else:
+        rows6x = parse_log_file(log_path)
+        dfobj6 = pd.DataFrame(rows6x)
+        if dfobj6.empty:
+            return dfobj6
 
-    if "step" in dfobj6.columns:
-        dfobj6 = dfobj6.drop_duplicates(subset=["step"]).sort_values("step")
+        if "step" in dfobj6.columns:
+            dfobj6 = dfobj6.drop_duplicates(subset=["step"]).sort_values("step")
 
-    # Derived metric used by the dashboard.
-    dfobj6["tension"] = dfobj6["grad_norm"] * dfobj6["raw_delta"] / 100.0
+        # Derived metric used by the dashboard.
+        dfobj6["tension"] = dfobj6["grad_norm"] * dfobj6["raw_delta"] / 100.0
 
     # Clip outliers for plotting readability.
     capval = dfobj6["tension"].quantile(0.99)
@@ -134,6 +319,27 @@ def parse_log(log_path: str):
     return dfobj6
 
 
+def plot_frame(dfobj6: Any, ycol: str, max_points: int, method: str = "minmax") -> Any:
+    """Rows of ``dfobj6`` to chart for ``ycol``: about ``max_points`` (0 = all).
+
+    Spikes survive (per-bucket min/max or LTTB) and inf values are always kept.
+    NaN tension only means "no grad_norm on that step" and is dropped.
+    """
+
+    if ycol == "tension":
+        dfobj6 = dfobj6[dfobj6[ycol].notna()]
+    if int(max_points) <= 0 or len(dfobj6) <= int(max_points):
+        return dfobj6
+
+    idxlst = downsample_indices(
+        dfobj6[ycol].to_numpy(dtype="float64"),
+        int(max_points),
+        x=dfobj6["step"].to_numpy(dtype="float64"),
+        method=method,
+    )
+    return dfobj6.iloc[idxlst]
+
+
 def _req_st() -> Any:
     try:
         import streamlit as stmod6  # type: ignore
@@ -179,6 +385,13 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     parser.add_argument("--log", default=os.path.join("logs", "current", "vraxion.log"))
     parser.add_argument("--refresh", type=int, default=10, help="Auto-refresh seconds (0 disables)")
     parser.add_argument("--max-rows", type=int, default=5000, help="Display at most N rows (0 = all)")
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=4000,
+        help="Plot at most ~N points per chart (spike-preserving decimation; 0 = all)",
+    )
+    parser.add_argument("--downsample", choices=METHODS, default="minmax", help="Decimation method for charts")
 
     argobj, _unk6x = parser.parse_known_args(list(argv) if argv is not None else None)
 
@@ -204,6 +417,17 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         max_value=500000,
         value=int(argobj.max_rows),
     )
+    maxpts = stmod6.sidebar.number_input(
+        "Max plotted points",
+        min_value=0,
+        max_value=500000,
+        value=int(argobj.max_points),
+    )
+    dsmeth = stmod6.sidebar.selectbox(
+        "Downsampling",
+        options=list(METHODS),
+        index=list(METHODS).index(str(argobj.downsample)),
+    )
 
     if int(rfrsec) > 0:
         fncobj = _autorf()
@@ -214,8 +438,17 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                 "Auto-refresh helper not available; install streamlit-autorefresh for periodic refresh."
             )
 
+    # Streamlit reruns this script on every refresh; keep per-path tails in the
+    # session so each refresh only parses newly appended lines and appends
+    # them to the tail's cached frame.
+    if "vrx_log_tails" not in stmod6.session_state:
+        stmod6.session_state["vrx_log_tails"] = {}
+    tails6 = stmod6.session_state["vrx_log_tails"]
+    if logpth not in tails6:
+        tails6[logpth] = LogTail(logpth)
+
     try:
-        dfobj6 = parse_log(logpth)
+        dfobj6 = parse_log(logpth, tail=tails6[logpth])
     except Exception as exc:
         stmod6.error(f"Failed to parse log: {exc}")
         return
@@ -235,10 +468,12 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     pltx6x = _opt_mod("plotly.express")
     if pltx6x is not None:
         try:
-            figlos = pltx6x.line(dfobj6, x="step", y="loss", title="Loss")
+            figlos = pltx6x.line(plot_frame(dfobj6, "loss", int(maxpts), str(dsmeth)), x="step", y="loss", title="Loss")
             stmod6.plotly_chart(figlos, use_container_width=True)
 
-            figten = pltx6x.line(dfobj6, x="step", y="tension", title="Tension")
+            figten = pltx6x.line(
+                plot_frame(dfobj6, "tension", int(maxpts), str(dsmeth)), x="step", y="tension", title="Tension"
+            )
             stmod6.plotly_chart(figten, use_container_width=True)
         except Exception as exc:
             stmod6.warning(f"Plotly render failed, falling back to table only: {exc}")
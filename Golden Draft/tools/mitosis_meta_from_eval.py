@@ -244,7 +244,7 @@ def _collect_ptr_hist_counts(
     with torch.no_grad():
         for _ in range(total_batches):
             x = torch.randn(int(batch_size), int(seq_len), int(input_dim), dtype=torch.float32)
-            _logits, _move_penalty = model(x)
+            _logits, _move_penalty = model(x, inference=True)
             ptr = getattr(model, "last_ptr_int", None)
             if ptr is None or not hasattr(ptr, "numel"):
                 raise RuntimeError("model did not expose last_ptr_int; cannot build ptr histogram")
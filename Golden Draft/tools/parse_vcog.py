@@ -11,6 +11,7 @@ namespace (Golden Draft).
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import json
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -28,16 +29,9 @@ except ImportError:  # pragma: no cover
     from tools.vcog_parse import OnlineStats, dump_json, parse_line
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    ap = argparse.ArgumentParser(
-        description="Parse a VRAXION log file into metrics.jsonl + summary.json."
-    )
-    ap.add_argument("--log", required=True, help="Path to a log file (stdout/stderr).")
-    ap.add_argument("--out-dir", required=True, help="Output directory (will be created).")
-    args = ap.parse_args(argv)
+def parse_log_to_dir(logpth: Path, outdir: Path) -> Path:
+    """Write ``metrics.jsonl`` + ``summary.json`` for one log into ``outdir``."""
 
-    logpth = Path(args.log)
-    outdir = Path(args.out_dir)
     outdir.mkdir(parents=True, exist_ok=True)
 
     metpth = outdir / "metrics.jsonl"
@@ -65,7 +59,47 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     summary = {"loss": lossts.to_dict(), "vcog_last": lastvc or None}
     dump_json(sumpth, summary)
-    print(str(outdir))
+    return outdir
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Parse a VRAXION log file into metrics.jsonl + summary.json."
+    )
+    ap.add_argument(
+        "--log",
+        required=True,
+        action="append",
+        help="Path to a log file (stdout/stderr). Repeatable: each log then gets OUT_DIR/<log stem>/.",
+    )
+    ap.add_argument("--out-dir", required=True, help="Output directory (will be created).")
+    ap.add_argument("--workers", type=int, default=0, help="Parse several logs in a process pool (0/1 = serial).")
+    args = ap.parse_args(argv)
+
+    outdir = Path(args.out_dir)
+    logs = [Path(pth) for pth in args.log]
+    if len(logs) == 1:
+        parse_log_to_dir(logs[0], outdir)
+        print(str(outdir))
+        return 0
+
+    # Several logs: one sub-directory per log (stem, de-duplicated).
+    subdirs: list[Path] = []
+    for idx, logpth in enumerate(logs):
+        name = logpth.stem or f"log{idx}"
+        if any(sub.name == name for sub in subdirs):
+            name = f"{name}_{idx}"
+        subdirs.append(outdir / name)
+
+    if int(args.workers) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(int(args.workers), len(logs))) as poolex:
+            list(poolex.map(parse_log_to_dir, logs, subdirs))
+    else:
+        for logpth, sub in zip(logs, subdirs):
+            parse_log_to_dir(logpth, sub)
+
+    for sub in subdirs:
+        print(str(sub))
     return 0
 
 
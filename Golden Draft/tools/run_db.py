@@ -6,7 +6,9 @@ This script wraps an arbitrary command (training/eval/etc.) and records:
 - stdout/stderr append-only logs
 - parsed metrics JSONL (step/loss/V_COG)
 - meta.json + summary.json
-- a small SQLite index (runs.sqlite) for fast querying
+- a small SQLite index (runs.sqlite) for fast querying: one `runs` row per run plus
+  per-step `metrics(run_id, step, key, value)` rows (loss + numeric V_COG fields)
+- optionally (--fts) every log line in an FTS5 table for run_db_query grep
 
 Non-negotiable behavior:
 - CLI entrypoint stays:  python tools/run_db.py ... -- <cmd...>
@@ -23,6 +25,7 @@ import getpass
 import json
 import os
 import platform
+import queue
 import sqlite3
 import subprocess
 import sys
@@ -30,7 +33,7 @@ import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Sequence, TextIO, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, TextIO, Tuple
 
 # Support both:
 # - running as a script:   python tools/run_db.py
@@ -104,9 +107,17 @@ def _git_info(root: Path) -> Dict[str, Any]:
     return info
 
 
+def _connect_sqlite(db_path: Path) -> sqlite3.Connection:
+    # WAL: concurrent recorders append metrics while queries read.
+    con = sqlite3.connect(str(db_path), timeout=30.0, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    return con
+
+
 def _ensure_sqlite(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(str(db_path))
+    con = _connect_sqlite(db_path)
     try:
         con.execute(
             """
@@ -133,6 +144,19 @@ def _ensure_sqlite(db_path: Path) -> None:
             """
         )
         con.execute("CREATE INDEX IF NOT EXISTS runs_start ON runs(start_utc)")
+        con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metrics (
+              run_id TEXT NOT NULL,
+              step INTEGER,
+              key TEXT NOT NULL,
+              value REAL
+            )
+            """
+        )
+        # "one run, one key over steps" and "one key at a step across runs".
+        con.execute("CREATE INDEX IF NOT EXISTS metrics_run_key_step ON metrics(run_id, key, step)")
+        con.execute("CREATE INDEX IF NOT EXISTS metrics_key_step ON metrics(key, step)")
         con.commit()
     finally:
         con.close()
@@ -140,7 +164,7 @@ def _ensure_sqlite(db_path: Path) -> None:
 
 def _insert_sqlite(db_path: Path, row: Dict[str, Any]) -> None:
     _ensure_sqlite(db_path)
-    con = sqlite3.connect(str(db_path))
+    con = _connect_sqlite(db_path)
     try:
         cols = [
             "run_id",
@@ -173,6 +197,235 @@ def _insert_sqlite(db_path: Path, row: Dict[str, Any]) -> None:
         con.close()
 
 
+def metric_rows(ev: Dict[str, Any], vcog: Optional[Dict[str, Any]]) -> List[Tuple[str, float]]:
+    """(key, value) pairs indexed for one parsed event: ``loss`` + ``vcog.<KEY>``."""
+
+    rows: List[Tuple[str, float]] = []
+    if "loss" in ev:
+        try:
+            rows.append(("loss", float(ev["loss"])))
+        except Exception:
+            pass
+    for keystr, valraw in (vcog or {}).items():
+        if isinstance(valraw, (int, float)) and not isinstance(valraw, bool):
+            rows.append((f"vcog.{keystr}", float(valraw)))
+    return rows
+
+
+class _BatchedRows:
+    """Per-run ``executemany`` writer shared by the index tables.
+
+    Not thread-safe: during a recording only the run writer thread touches it.
+    """
+
+    _insert_sql = ""
+    _clear_sql = ""
+
+    def __init__(self, db_path: Path, run_id: str, *, batch_rows: int = 512):
+        self.run_id = run_id
+        self.batch_rows = max(1, int(batch_rows))
+        self.n_rows = 0
+        self._pending: List[Tuple[Any, ...]] = []
+        self._con: Optional[sqlite3.Connection] = _connect_sqlite(db_path)
+
+    def _push(self, row: Tuple[Any, ...]) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending or self._con is None:
+            return
+        with self._con:
+            self._con.executemany(self._insert_sql, self._pending)
+        self.n_rows += len(self._pending)
+        self._pending.clear()
+
+    def clear_run(self) -> None:
+        """Drop rows already indexed for this run (used by backfill)."""
+
+        assert self._con is not None
+        with self._con:
+            self._con.execute(self._clear_sql, (self.run_id,))
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+
+class MetricsIndex(_BatchedRows):
+    """Batched writer for the ``metrics`` table of one run.
+
+    Events without a step inherit the last step seen in the run (V_COG-only
+    lines follow the step line they describe).
+    """
+
+    _insert_sql = "INSERT INTO metrics (run_id, step, key, value) VALUES (?, ?, ?, ?)"
+    _clear_sql = "DELETE FROM metrics WHERE run_id = ?"
+
+    def __init__(self, db_path: Path, run_id: str, *, batch_rows: int = 512):
+        _ensure_sqlite(db_path)
+        super().__init__(db_path, run_id, batch_rows=batch_rows)
+        self.last_step: Optional[int] = None
+
+    def add(self, ev: Dict[str, Any], vcog: Optional[Dict[str, Any]]) -> None:
+        if "step" in ev:
+            try:
+                self.last_step = int(ev["step"])
+            except Exception:
+                pass
+        for keystr, val in metric_rows(ev, vcog):
+            self._push((self.run_id, self.last_step, keystr, val))
+
+
+def _ensure_log_fts(db_path: Path) -> None:
+    """Create the optional FTS5 log-line index (trigram: substring-capable)."""
+
+    _ensure_sqlite(db_path)
+    con = _connect_sqlite(db_path)
+    try:
+        con.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5("
+            "text, run_id UNINDEXED, stream UNINDEXED, line_no UNINDEXED, tokenize='trigram')"
+        )
+        # A run is listed here only once all of its lines are in log_fts.
+        con.execute("CREATE TABLE IF NOT EXISTS log_fts_runs (run_id TEXT PRIMARY KEY, n_lines INTEGER)")
+        con.commit()
+    finally:
+        con.close()
+
+
+class LogIndex(_BatchedRows):
+    """Batched writer for the ``log_fts`` table of one run.
+
+    ``stream`` is the run file the line lives in (stdout.log, stderr.log,
+    metrics.jsonl); ``line_no`` is 1-based within that file.
+    """
+
+    _insert_sql = "INSERT INTO log_fts (text, run_id, stream, line_no) VALUES (?, ?, ?, ?)"
+    _clear_sql = "DELETE FROM log_fts WHERE run_id = ?"
+
+    def __init__(self, db_path: Path, run_id: str, *, batch_rows: int = 512):
+        _ensure_log_fts(db_path)
+        super().__init__(db_path, run_id, batch_rows=batch_rows)
+        self._line_no: Dict[str, int] = {}
+
+    def add(self, stream: str, text: str) -> None:
+        line_no = self._line_no.get(stream, 0) + 1
+        self._line_no[stream] = line_no
+        self._push((text.rstrip("\r\n"), self.run_id, stream, line_no))
+
+    def clear_run(self) -> None:
+        super().clear_run()
+        assert self._con is not None
+        with self._con:
+            self._con.execute("DELETE FROM log_fts_runs WHERE run_id = ?", (self.run_id,))
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            if self._con is not None:
+                with self._con:
+                    self._con.execute("INSERT OR REPLACE INTO log_fts_runs VALUES (?, ?)", (self.run_id, self.n_rows))
+        finally:
+            super().close()
+
+
+LOG_FTS_FILES = ("stdout.log", "stderr.log", "metrics.jsonl")
+
+
+def _list_run_ids(runs_dir: Path) -> List[str]:
+    return sorted(p.name for p in runs_dir.iterdir() if p.is_dir()) if runs_dir.exists() else []
+
+
+def backfill_metrics(db_root: Path, run_ids: Optional[Sequence[str]] = None, *, force: bool = False) -> Dict[str, int]:
+    """Index ``runs/<run_id>/metrics.jsonl`` into the ``metrics`` table.
+
+    Runs that already have rows are skipped unless ``force`` (which re-indexes
+    them from scratch). Returns {run_id: rows_inserted} for the runs processed.
+    """
+
+    db_path = db_root / "runs.sqlite"
+    runs_dir = db_root / "runs"
+    _ensure_sqlite(db_path)
+
+    if run_ids is None:
+        run_ids = _list_run_ids(runs_dir)
+
+    con = _connect_sqlite(db_path)
+    try:
+        have = {r[0] for r in con.execute("SELECT DISTINCT run_id FROM metrics")}
+    finally:
+        con.close()
+
+    done: Dict[str, int] = {}
+    for run_id in run_ids:
+        metrics_path = runs_dir / run_id / "metrics.jsonl"
+        if not metrics_path.exists() or (run_id in have and not force):
+            continue
+        index = MetricsIndex(db_path, run_id, batch_rows=4096)
+        try:
+            index.clear_run()
+            with open(metrics_path, "r", encoding="utf-8", errors="replace") as fp:
+                for line in fp:
+                    try:
+                        ev = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(ev, dict):
+                        vcog = ev.get("vcog")
+                        index.add(ev, vcog if isinstance(vcog, dict) else None)
+        finally:
+            index.close()
+        done[run_id] = index.n_rows
+    return done
+
+
+def backfill_log_fts(db_root: Path, run_ids: Optional[Sequence[str]] = None, *, force: bool = False) -> Dict[str, int]:
+    """Index the log files of existing runs into ``log_fts``.
+
+    Runs already marked complete are skipped unless ``force``. Returns
+    {run_id: lines_indexed} for the runs processed.
+    """
+
+    db_path = db_root / "runs.sqlite"
+    runs_dir = db_root / "runs"
+    _ensure_log_fts(db_path)
+
+    if run_ids is None:
+        run_ids = _list_run_ids(runs_dir)
+
+    con = _connect_sqlite(db_path)
+    try:
+        have = {r[0] for r in con.execute("SELECT run_id FROM log_fts_runs")}
+    finally:
+        con.close()
+
+    done: Dict[str, int] = {}
+    for run_id in run_ids:
+        run_dir = runs_dir / run_id
+        if not run_dir.is_dir() or (run_id in have and not force):
+            continue
+        index = LogIndex(db_path, run_id, batch_rows=4096)
+        try:
+            index.clear_run()
+            for fn in LOG_FTS_FILES:
+                try:
+                    with open(run_dir / fn, "r", encoding="utf-8", errors="replace") as fp:
+                        for line in fp:
+                            index.add(fn, line)
+                except OSError:
+                    continue
+        finally:
+            index.close()
+        done[run_id] = index.n_rows
+    return done
+
+
 def _create_run_dir(runs_dir: Path, run_id_base: str) -> Tuple[str, Path]:
     """Create a unique run directory under runs_dir.
 
@@ -209,10 +462,19 @@ def _record_metrics_line(
     stream_name: str,
     line: str,
     metrics_fp: TextIO,
-    lock: threading.Lock,
     loss_stats: OnlineStats,
     last_vcog: MutableMapping[str, Any],
+    metrics_index: Optional[MetricsIndex] = None,
+    log_index: Optional[LogIndex] = None,
 ) -> None:
+    """Parse one log line and append its event (writer thread only; no flush)."""
+
+    if log_index is not None:
+        try:
+            log_index.add(f"{stream_name}.log", line)
+        except Exception:
+            pass
+
     ev, vcog = parse_line(line)
     if ev is None and vcog is None:
         return
@@ -222,95 +484,183 @@ def _record_metrics_line(
 
     ev["stream"] = stream_name
 
-    with lock:
-        if vcog is not None:
-            ev["vcog"] = vcog
-            last_vcog.clear()
-            last_vcog.update(vcog)
-        if "loss" in ev:
+    if vcog is not None:
+        ev["vcog"] = vcog
+        last_vcog.clear()
+        last_vcog.update(vcog)
+    if "loss" in ev:
+        try:
+            loss_stats.update(float(ev["loss"]))
+        except Exception:
+            # If loss is somehow non-numeric, skip stats update but still log event.
+            pass
+
+    evline = _safe_json_dumps(ev)
+    metrics_fp.write(evline + "\n")
+
+    if metrics_index is not None:
+        try:
+            metrics_index.add(ev, vcog)
+        except Exception:
+            # The JSONL stays authoritative; a broken index can be backfilled.
+            pass
+    if log_index is not None:
+        try:
+            log_index.add("metrics.jsonl", evline)
+        except Exception:
+            pass
+
+
+class _RunWriter:
+    """Single writer thread for a run's logs, metrics.jsonl and index tables.
+
+    Pump threads only decode pipe chunks and ``put`` them on a bounded queue, so
+    a slow disk back-pressures the pipes instead of growing memory. The writer
+    appends each chunk to its stream log in arrival order, splits lines,
+    records metrics, and flushes files + index batches once ``flush_interval_s``
+    has passed since the first unflushed write or ``flush_bytes`` are pending.
+    ``close`` drains the queue and always ends with a flush.
+    """
+
+    def __init__(
+        self,
+        *,
+        log_fps: Mapping[str, TextIO],
+        metrics_fp: TextIO,
+        loss_stats: OnlineStats,
+        last_vcog: MutableMapping[str, Any],
+        metrics_index: Optional[MetricsIndex] = None,
+        log_index: Optional[LogIndex] = None,
+        flush_interval_s: float = 0.25,
+        flush_bytes: int = 1 << 20,
+        max_chunks: int = 1024,
+    ):
+        self.log_fps = dict(log_fps)
+        self.metrics_fp = metrics_fp
+        self.loss_stats = loss_stats
+        self.last_vcog = last_vcog
+        self.metrics_index = metrics_index
+        self.log_index = log_index
+        self.flush_interval_s = float(flush_interval_s)
+        self.flush_bytes = int(flush_bytes)
+        self._queue: "queue.Queue[Optional[Tuple[str, Optional[str]]]]" = queue.Queue(maxsize=max(1, int(max_chunks)))
+        self._bufs: Dict[str, str] = {name: "" for name in self.log_fps}
+        self.n_chunks = 0
+        self._thread = threading.Thread(target=self._run, name="run_db-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, stream_name: str, text: Optional[str]) -> None:
+        """Queue decoded text; ``None`` marks EOF (a trailing partial line is recorded)."""
+
+        self._queue.put((stream_name, text))
+        self.n_chunks += 1
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _record(self, stream_name: str, line: str) -> None:
+        _record_metrics_line(
+            stream_name=stream_name,
+            line=line,
+            metrics_fp=self.metrics_fp,
+            loss_stats=self.loss_stats,
+            last_vcog=self.last_vcog,
+            metrics_index=self.metrics_index,
+            log_index=self.log_index,
+        )
+
+    def _handle(self, stream_name: str, text: Optional[str]) -> None:
+        buf = self._bufs.get(stream_name, "")
+        if text is None:
+            self._bufs[stream_name] = ""
+            if buf:
+                self._record(stream_name, buf)
+            return
+
+        # Append-only logs: write exactly what was decoded, in arrival order.
+        self.log_fps[stream_name].write(text)
+        parts = (buf + text).split("\n")
+        self._bufs[stream_name] = parts.pop()
+        for line in parts:
+            self._record(stream_name, line + "\n")
+
+    def _flush(self) -> None:
+        for fp in list(self.log_fps.values()) + [self.metrics_fp]:
             try:
-                loss_stats.update(float(ev["loss"]))
+                fp.flush()
             except Exception:
-                # If loss is somehow non-numeric, skip stats update but still log event.
                 pass
+        for index in (self.metrics_index, self.log_index):
+            if index is not None:
+                try:
+                    index.flush()
+                except Exception:
+                    pass
 
-        metrics_fp.write(_safe_json_dumps(ev) + "\n")
-        metrics_fp.flush()
+    def _run(self) -> None:
+        pending = 0
+        deadline: Optional[float] = None
+        while True:
+            try:
+                if deadline is None:
+                    item = self._queue.get()
+                else:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = ("", "")
+            if item is None:
+                break
 
+            stream_name, text = item
+            if stream_name:
+                try:
+                    self._handle(stream_name, text)
+                except Exception:
+                    # Never let a bad line stall the pumps behind a full queue.
+                    pass
+                pending += len(text or "")
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval_s
 
-def _pump_stream(
-    *,
-    stream_name: str,
-    stream,  # BinaryIO
-    log_fp: TextIO,
-    metrics_fp: TextIO,
-    lock: threading.Lock,
-    loss_stats: OnlineStats,
-    last_vcog: MutableMapping[str, Any],
-) -> None:
-    """Continuously drain a subprocess pipe.
+            if deadline is not None and (pending >= self.flush_bytes or time.monotonic() >= deadline):
+                self._flush()
+                pending = 0
+                deadline = None
+
+        self._flush()
+
+
+def _pump_stream(*, stream_name: str, stream, writer: _RunWriter) -> None:  # stream: BinaryIO
+    """Continuously drain a subprocess pipe into the run writer.
 
     Uses chunked reads (not readline) to avoid deadlocks when a process emits a long
-    line without a newline.
+    line without a newline; ``read1`` returns whatever the pipe has (up to 64 KiB)
+    instead of waiting for a full chunk.
     """
 
     decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
-    buf = ""
-
-    def _flush_lines() -> None:
-        nonlocal buf
-        while True:
-            nl = buf.find("\n")
-            if nl < 0:
-                return
-            line = buf[: nl + 1]
-            buf = buf[nl + 1 :]
-            _record_metrics_line(
-                stream_name=stream_name,
-                line=line,
-                metrics_fp=metrics_fp,
-                lock=lock,
-                loss_stats=loss_stats,
-                last_vcog=last_vcog,
-            )
+    read = getattr(stream, "read1", stream.read)
 
     try:
         while True:
-            chunk = stream.read(4096)
+            chunk = read(65536)
             if not chunk:
                 break
 
             text = decoder.decode(chunk)
-            if not text:
-                continue
-
-            # Append-only logs: write exactly what we decoded, as soon as we decoded it.
-            log_fp.write(text)
-            log_fp.flush()
-
-            buf += text
-            _flush_lines()
+            if text:
+                writer.put(stream_name, text)
 
         # Final decoder flush (rare, but can happen for partial UTF-8 sequences).
         tail = decoder.decode(b"", final=True)
         if tail:
-            log_fp.write(tail)
-            log_fp.flush()
-            buf += tail
-
-        if buf:
-            # Process a last partial line (no trailing newline).
-            _record_metrics_line(
-                stream_name=stream_name,
-                line=buf,
-                metrics_fp=metrics_fp,
-                lock=lock,
-                loss_stats=loss_stats,
-                last_vcog=last_vcog,
-            )
+            writer.put(stream_name, tail)
     except Exception:
         # Never let a reader thread crash the whole recorder.
-        return
+        pass
+    finally:
+        writer.put(stream_name, None)
 
 
 def _parse_cmd_remainder(cmd_remainder: Sequence[str]) -> List[str]:
@@ -336,6 +686,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--workdir", default="", help="Working directory for the command (default: repo root)")
     ap.add_argument("--env", action="append", default=[], help="Env override KEY=VAL (repeatable)")
     ap.add_argument("--no-sqlite", action="store_true", help="Disable sqlite indexing")
+    ap.add_argument(
+        "--fts",
+        action="store_true",
+        help="Also index every log line into the FTS5 table used by run_db_query grep",
+    )
     ap.add_argument("cmd", nargs=argparse.REMAINDER, help="Command to run. Use -- before the command.")
     args = ap.parse_args(argv)
 
@@ -387,7 +742,20 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     loss_stats = OnlineStats()
     last_vcog: Dict[str, Any] = {}
-    lock = threading.Lock()
+
+    db_path = db_root / "runs.sqlite"
+    metrics_index: Optional[MetricsIndex] = None
+    if not args.no_sqlite:
+        try:
+            metrics_index = MetricsIndex(db_path, run_id)
+        except Exception as errval:
+            print(f"[run_db] sqlite metrics index disabled: {errval!r}", file=sys.stderr)
+    log_index: Optional[LogIndex] = None
+    if args.fts and not args.no_sqlite:
+        try:
+            log_index = LogIndex(db_path, run_id)
+        except Exception as errval:
+            print(f"[run_db] sqlite log index disabled: {errval!r}", file=sys.stderr)
 
     t0 = time.monotonic()
     exit_code: int
@@ -398,77 +766,91 @@ def main(argv: Optional[List[str]] = None) -> int:
         open(stderr_path, "w", encoding="utf-8", errors="replace", newline="") as err_fp,
         open(metrics_path, "w", encoding="utf-8", newline="\n") as met_fp,
     ):
+        writer = _RunWriter(
+            log_fps={"stdout": out_fp, "stderr": err_fp},
+            metrics_fp=met_fp,
+            loss_stats=loss_stats,
+            last_vcog=last_vcog,
+            metrics_index=metrics_index,
+            log_index=log_index,
+        )
         try:
-            p = subprocess.Popen(
-                cmd,
-                cwd=str(workdir),
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=False,
-            )
-        except FileNotFoundError as e:
-            # Command couldn't be launched; record the failure and continue to summary.
-            err_fp.write(f"[run_db] failed to launch: {e}\n")
-            err_fp.flush()
-            exit_code = 127
-        else:
-            assert p.stdout is not None
-            assert p.stderr is not None
-
-            th_out = threading.Thread(
-                target=_pump_stream,
-                kwargs={
-                    "stream_name": "stdout",
-                    "stream": p.stdout,
-                    "log_fp": out_fp,
-                    "metrics_fp": met_fp,
-                    "lock": lock,
-                    "loss_stats": loss_stats,
-                    "last_vcog": last_vcog,
-                },
-                daemon=True,
-            )
-            th_err = threading.Thread(
-                target=_pump_stream,
-                kwargs={
-                    "stream_name": "stderr",
-                    "stream": p.stderr,
-                    "log_fp": err_fp,
-                    "metrics_fp": met_fp,
-                    "lock": lock,
-                    "loss_stats": loss_stats,
-                    "last_vcog": last_vcog,
-                },
-                daemon=True,
-            )
-            th_out.start()
-            th_err.start()
-
             try:
-                exit_code = p.wait()
-            except KeyboardInterrupt:
-                # Best-effort: terminate child and wait.
+                p = subprocess.Popen(
+                    cmd,
+                    cwd=str(workdir),
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=False,
+                )
+            except FileNotFoundError as e:
+                # Command couldn't be launched; record the failure and continue to summary.
+                writer.put("stderr", f"[run_db] failed to launch: {e}\n")
+                exit_code = 127
+            else:
+                assert p.stdout is not None
+                assert p.stderr is not None
+
+                th_out = threading.Thread(
+                    target=_pump_stream,
+                    kwargs={"stream_name": "stdout", "stream": p.stdout, "writer": writer},
+                    daemon=True,
+                )
+                th_err = threading.Thread(
+                    target=_pump_stream,
+                    kwargs={"stream_name": "stderr", "stream": p.stderr, "writer": writer},
+                    daemon=True,
+                )
+                th_out.start()
+                th_err.start()
+
+                try:
+                    exit_code = p.wait()
+                except KeyboardInterrupt:
+                    # Best-effort: terminate child and wait.
+                    try:
+                        p.terminate()
+                    except Exception:
+                        pass
+                    exit_code = p.wait()
+
+                # Let the pumps drain what the child already wrote; force EOF only once
+                # they stop making progress (a grandchild may hold the pipes open).
+                while th_out.is_alive() or th_err.is_alive():
+                    seen = writer.n_chunks
+                    th_out.join(timeout=0.5)
+                    th_err.join(timeout=0.5)
+                    if writer.n_chunks == seen:
+                        break
+
                 try:
-                    p.terminate()
+                    if p.stdout:
+                        p.stdout.close()
+                except Exception:
+                    pass
+                try:
+                    if p.stderr:
+                        p.stderr.close()
                 except Exception:
                     pass
-                exit_code = p.wait()
 
-            # Help threads reach EOF quickly.
-            try:
-                if p.stdout:
-                    p.stdout.close()
-            except Exception:
-                pass
-            try:
-                if p.stderr:
-                    p.stderr.close()
-            except Exception:
-                pass
+                th_out.join()
+                th_err.join()
+        finally:
+            # Guaranteed final drain + flush, whatever happened above.
+            writer.close()
 
-            th_out.join()
-            th_err.join()
+    if metrics_index is not None:
+        try:
+            metrics_index.close()
+        except Exception as errval:
+            print(f"[run_db] sqlite metrics index failed: {errval!r}", file=sys.stderr)
+    if log_index is not None:
+        try:
+            log_index.close()
+        except Exception as errval:
+            print(f"[run_db] sqlite log index failed: {errval!r}", file=sys.stderr)
 
     dur_s = time.monotonic() - t0
     end_utc = _utc_iso()
@@ -488,7 +870,6 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"[run_db] failed to write summary.json: {errval!r}", file=sys.stderr)
 
     if not args.no_sqlite:
-        db_path = db_root / "runs.sqlite"
         row = {
             "run_id": run_id,
             "start_utc": meta["start_utc"],
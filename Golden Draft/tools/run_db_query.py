@@ -5,7 +5,9 @@ from __future__ import annotations
 This intentionally stays simple and dependency-free:
 - list recent runs
 - show a run's metadata
-- grep stdout/stderr logs for a pattern
+- grep stdout/stderr logs for a pattern (via the FTS5 index where available)
+- read per-step metrics across runs from the `metrics` table
+- backfill the `metrics` table from existing runs' metrics.jsonl
 """
 
 import argparse
@@ -13,7 +15,15 @@ import re
 import sqlite3
 import sys
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:  # pragma: no cover
+    from .run_db import LOG_FTS_FILES, backfill_log_fts, backfill_metrics
+except ImportError:  # pragma: no cover
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools.run_db import LOG_FTS_FILES, backfill_log_fts, backfill_metrics
 
 
 DEFAULT_DB_ROOT = Path(r"S:\AI\Golden Draft\vault\db")
@@ -94,7 +104,68 @@ def _iter_log_lines(path: Path) -> Iterable[str]:
         return
 
 
-def cmd_grep(*, db_root: Path, pattern: str, run_id: Optional[str], ignore_case: bool) -> int:
+def _literal_fts_query(pattern: str) -> Optional[str]:
+    """FTS5 query for the literal runs every match of ``pattern`` must contain.
+
+    Only simple patterns qualify (no alternation, optional quantifiers or
+    escapes); character classes and ``.^$+()`` split the pattern into literal
+    runs, and runs of 3+ characters are ANDed as phrases. The trigram
+    tokenizer matches substrings case-insensitively, so the FTS hits are a
+    superset of the regex hits. None means the regex needs a scan.
+    """
+
+    if any(ch in "|?*{}\\" for ch in pattern):
+        return None
+    parts = re.split(r"\[[^\]]*\]|[.^$+()\[\]]", pattern)
+    phrases = ['"' + part.replace('"', '""') + '"' for part in parts if len(part) >= 3]
+    return " AND ".join(phrases) if phrases else None
+
+
+def _fts_candidates(
+    dbp: Path, query: str, run_id: Optional[str]
+) -> Optional[Tuple[Set[str], Dict[str, List[Tuple[str, str]]]]]:
+    """(fully indexed run ids, run_id -> [(file, line)] FTS matches) or None."""
+
+    if not dbp.exists():
+        return None
+    con = sqlite3.connect(str(dbp))
+    try:
+        try:
+            if run_id:
+                indexed = {r[0] for r in con.execute("SELECT run_id FROM log_fts_runs WHERE run_id = ?", [run_id])}
+            else:
+                indexed = {r[0] for r in con.execute("SELECT run_id FROM log_fts_runs")}
+            if not indexed:
+                return None
+            sql = "SELECT run_id, stream, line_no, text FROM log_fts WHERE log_fts MATCH ?"
+            params: list[object] = [query]
+            if run_id:
+                sql += " AND run_id = ?"
+                params.append(run_id)
+            rows = con.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            # No FTS table (never enabled) or a query FTS5 cannot parse.
+            return None
+    finally:
+        con.close()
+
+    order = {fn: i for i, fn in enumerate(LOG_FTS_FILES)}
+    rows.sort(key=lambda r: (r[0], order.get(r[1], len(order)), r[2]))
+    found: Dict[str, List[Tuple[str, str]]] = {}
+    for rid, fn, _line_no, text in rows:
+        found.setdefault(rid, []).append((fn, text))
+    return indexed, found
+
+
+def cmd_grep(
+    *,
+    db_root: Path,
+    pattern: str,
+    run_id: Optional[str],
+    ignore_case: bool,
+    fts_query: Optional[str] = None,
+    use_fts: bool = True,
+) -> int:
     runs_dir = db_root / "runs"
     if not runs_dir.exists():
         print(f"[run_db_query] missing runs dir: {runs_dir}", file=sys.stderr)
@@ -109,9 +180,23 @@ def cmd_grep(*, db_root: Path, pattern: str, run_id: Optional[str], ignore_case:
     else:
         targets.extend(sorted([p for p in runs_dir.iterdir() if p.is_dir()], reverse=True))
 
+    # Indexed runs: FTS picks candidate lines, the regex only post-filters them.
+    # Runs missing from the index (or non-literal patterns) fall back to a scan.
+    fts = None
+    query = fts_query or _literal_fts_query(pattern)
+    if use_fts and query:
+        fts = _fts_candidates(_db_path(db_root), query, run_id)
+
     hits = 0
     for run_dir in targets:
-        for fn in ("stdout.log", "stderr.log", "metrics.jsonl"):
+        if fts is not None and run_dir.name in fts[0]:
+            for fn, ln in fts[1].get(run_dir.name, ()):
+                if rx.search(ln):
+                    print(f"{run_dir.name}/{fn}: {ln}")
+                    hits += 1
+            continue
+
+        for fn in LOG_FTS_FILES:
             fp = run_dir / fn
             if not fp.exists():
                 continue
@@ -125,6 +210,74 @@ def cmd_grep(*, db_root: Path, pattern: str, run_id: Optional[str], ignore_case:
     return 0
 
 
+def cmd_metrics(
+    *,
+    db_root: Path,
+    key: str,
+    run_id: Optional[str],
+    step: Optional[int],
+    last_runs: int,
+    limit: int,
+) -> int:
+    dbp = _db_path(db_root)
+    if not dbp.exists():
+        print(f"[run_db_query] missing db: {dbp}", file=sys.stderr)
+        return 2
+
+    where = ["m.key = ?"]
+    params: list[object] = [key]
+    if run_id:
+        where.append("m.run_id = ?")
+        params.append(run_id)
+    elif last_runs > 0:
+        where.append("m.run_id IN (SELECT run_id FROM runs ORDER BY start_utc DESC LIMIT ?)")
+        params.append(int(last_runs))
+    if step is not None:
+        where.append("m.step = ?")
+        params.append(int(step))
+
+    sql = (
+        "SELECT m.run_id, m.step, m.value FROM metrics m "
+        f"WHERE {' AND '.join(where)} "
+        "ORDER BY m.run_id, m.step "
+        "LIMIT ?"
+    )
+    params.append(int(limit))
+
+    con = sqlite3.connect(str(dbp))
+    hits = 0
+    try:
+        try:
+            rows = list(_iter_rows(con, sql, params))
+        except sqlite3.OperationalError as errval:
+            print(f"[run_db_query] metrics table unavailable ({errval}); run `backfill` first", file=sys.stderr)
+            return 2
+        for row in rows:
+            print(f"{row['run_id']}  step={row['step']}  {key}={row['value']:.6g}")
+            hits += 1
+    finally:
+        con.close()
+    return 0 if hits else 1
+
+
+def cmd_backfill(*, db_root: Path, run_ids: Sequence[str], force: bool, logs: bool = False) -> int:
+    if not (db_root / "runs").exists():
+        print(f"[run_db_query] missing runs dir: {db_root / 'runs'}", file=sys.stderr)
+        return 2
+
+    done = backfill_metrics(db_root, list(run_ids) or None, force=force)
+    for run_id, nrows in done.items():
+        print(f"{run_id}  rows={nrows}")
+    print(f"[run_db_query] backfilled {len(done)} run(s)", file=sys.stderr)
+
+    if logs:
+        done = backfill_log_fts(db_root, list(run_ids) or None, force=force)
+        for run_id, nrows in done.items():
+            print(f"{run_id}  log_lines={nrows}")
+        print(f"[run_db_query] indexed logs of {len(done)} run(s)", file=sys.stderr)
+    return 0
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Query run_db sqlite + logs.")
     ap.add_argument("--db-root", default=str(DEFAULT_DB_ROOT), help="DB root dir (contains runs.sqlite + runs/).")
@@ -142,6 +295,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     ap_grep.add_argument("pattern")
     ap_grep.add_argument("--run-id", default=None)
     ap_grep.add_argument("-i", "--ignore-case", action="store_true")
+    ap_grep.add_argument(
+        "--fts-query",
+        default=None,
+        help="FTS5 MATCH expression selecting candidate lines (default: the pattern itself when it is a literal).",
+    )
+    ap_grep.add_argument("--no-fts", action="store_true", help="Always scan the log files.")
+
+    ap_met = sub.add_parser("metrics", help="Per-step values of one metric key (loss, vcog.ORB, ...).")
+    ap_met.add_argument("key")
+    ap_met.add_argument("--run-id", default=None)
+    ap_met.add_argument("--step", type=int, default=None)
+    ap_met.add_argument("--last-runs", type=int, default=0, help="Only the N most recent runs (0 = all).")
+    ap_met.add_argument("--limit", type=int, default=1000)
+
+    ap_back = sub.add_parser("backfill", help="Index existing runs' metrics.jsonl into the metrics table.")
+    ap_back.add_argument("run_ids", nargs="*", help="Run ids (default: every run dir).")
+    ap_back.add_argument("--force", action="store_true", help="Re-index runs that already have rows.")
+    ap_back.add_argument("--logs", action="store_true", help="Also index log lines into the FTS5 table.")
 
     args = ap.parse_args(list(argv) if argv is not None else None)
     db_root = Path(args.db_root)
@@ -156,6 +327,25 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             pattern=str(args.pattern),
             run_id=(str(args.run_id) if args.run_id else None),
             ignore_case=bool(args.ignore_case),
+            fts_query=(str(args.fts_query) if args.fts_query else None),
+            use_fts=not bool(args.no_fts),
+        )
+
+    if args.cmd == "metrics":
+        return cmd_metrics(
+            db_root=db_root,
+            key=str(args.key),
+            run_id=(str(args.run_id) if args.run_id else None),
+            step=args.step,
+            last_runs=int(args.last_runs),
+            limit=int(args.limit),
+        )
+    if args.cmd == "backfill":
+        return cmd_backfill(
+            db_root=db_root,
+            run_ids=[str(r) for r in args.run_ids],
+            force=bool(args.force),
+            logs=bool(args.logs),
         )
 
     print(f"[run_db_query] unknown command: {args.cmd}", file=sys.stderr)
@@ -4,6 +4,17 @@ This is a "result-safe" runner:
 - Runs are only considered valid if `report.json` exists under the run root.
 - All runs are pinned to CPU + eval-disjoint so comparisons are meaningful.
 
+Points within a stage are independent; ``--workers N`` runs them on a pool,
+each run pinned to its own CPU slice with matching OMP/MKL thread counts.
+Stages stay sequential (stage 2 needs stage 1's best DVLAM, ...).
+
+Next to the results jsonl:
+- ``*.manifest.json``: (config, seed) -> status/run_root, rewritten on every
+  change. ``--resume`` skips points with a result row or a run_root holding
+  report.json (a run that finished just before a crash is recovered, not rerun).
+- ``*.summary.json``: per-stage counts/best and confirm stats, rewritten as
+  each run finishes.
+
 It is intentionally placed in Golden Draft tooling.
 """
 
@@ -12,13 +23,24 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import queue
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+try:  # pragma: no cover
+    from .job_scheduler import cpu_partition, pin_process, thread_env
+except ImportError:  # pragma: no cover
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from tools.job_scheduler import cpu_partition, pin_process, thread_env
+
 
 @dataclass(frozen=True)
 class SweepPoint:
@@ -53,7 +75,14 @@ def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def _run_one(*, repo_root: Path, run_root: Path, extra_env: Dict[str, str], args: Sequence[str]) -> Path:
+def _run_one(
+    *,
+    repo_root: Path,
+    run_root: Path,
+    extra_env: Dict[str, str],
+    args: Sequence[str],
+    cpus: Optional[Sequence[int]] = None,
+) -> Path:
     _ensure_dir(run_root)
     env = dict(os.environ)
     env.update(extra_env)
@@ -66,7 +95,10 @@ def _run_one(*, repo_root: Path, run_root: Path, extra_env: Dict[str, str], args
     out_path = run_root / "stdout.log"
     err_path = run_root / "stderr.log"
     with out_path.open("wb") as out_f, err_path.open("wb") as err_f:
-        rc = subprocess.call(cmd, env=env, stdout=out_f, stderr=err_f)
+        proc = subprocess.Popen(cmd, env=env, stdout=out_f, stderr=err_f)
+        # Windows pins via SetProcessAffinityMask; unsupported platforms log once.
+        pin_process(proc.pid, cpus, log=lambda msg: print(f"[sweep] {msg}"))
+        rc = proc.wait()
     if rc != 0:
         raise RuntimeError(f"bench entrypoint exited rc={rc}")
 
@@ -211,10 +243,65 @@ def _key_for_row(r: Dict[str, object]) -> str:
     )
 
 
+class _Manifest:
+    """(config, seed) key -> run status, persisted next to the results jsonl."""
+
+    def __init__(self, path: Path, *, load: bool):
+        self.path = path
+        self.runs: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        if load and path.exists():
+            try:
+                self.runs = dict(json.loads(path.read_text(encoding="utf-8")).get("runs") or {})
+            except Exception:
+                self.runs = {}
+
+    def update(self, key: str, **fields: object) -> None:
+        with self._lock:
+            self.runs.setdefault(key, {}).update(fields)
+            _ensure_dir(self.path.parent)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({"runs": self.runs}, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+def _summarize(rows: Iterable[Dict[str, object]]) -> Dict[str, object]:
+    stages: Dict[str, Dict[str, object]] = {}
+    confirm: List[float] = []
+    for r in rows:
+        st = stages.setdefault(str(r.get("stage", "")), {"done": 0, "error": 0, "best": None})
+        if "eval_acc" not in r:
+            st["error"] = int(st["error"]) + 1  # type: ignore[call-overload]
+            continue
+        acc = float(r["eval_acc"])  # type: ignore[arg-type]
+        st["done"] = int(st["done"]) + 1  # type: ignore[call-overload]
+        best = st["best"]
+        if best is None or acc > float(best["eval_acc"]):  # type: ignore[index]
+            st["best"] = {k: r.get(k) for k in ("name", "seed", "dvlambda", "dvtau", "eval_acc", "run_root")}
+        if r.get("stage") == "confirm":
+            confirm.append(acc)
+    out: Dict[str, object] = {"updated_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "stages": stages}
+    if confirm:
+        out["confirm"] = {
+            "n": len(confirm),
+            "mean_acc": sum(confirm) / len(confirm),
+            "min_acc": min(confirm),
+            "max_acc": max(confirm),
+        }
+    return out
+
+
 def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
     p = argparse.ArgumentParser(prog="sweep_assoc_repulsion.py")
     p.add_argument("--out-jsonl", default="", help="Write/append results to this jsonl (default: timestamped under bench_vault/sweeps).")
     p.add_argument("--resume", action="store_true", help="If --out-jsonl exists, skip already-completed points.")
+    p.add_argument("--workers", type=int, default=1, help="Concurrent runs within a stage (1 = serial).")
+    p.add_argument(
+        "--threads-per-run",
+        type=int,
+        default=0,
+        help="OMP/MKL threads per run with --workers > 1 (0 = width of its CPU slice).",
+    )
     return p.parse_args(list(argv) if argv is not None else None)
 
 
@@ -245,162 +332,158 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         lr=lr,
     )
 
-    # Stage 0: baseline (diversity off).
     if str(args_cli.out_jsonl).strip():
         results_jsonl = Path(str(args_cli.out_jsonl).strip())
         if not results_jsonl.is_absolute():
             results_jsonl = repo_root / results_jsonl
     else:
         results_jsonl = out_dir / f"assoc_byte_repulsion_sweep_{_now_ts()}.jsonl"
-
-    done: set[str] = set()
-    if bool(args_cli.resume) and results_jsonl.exists():
+    summary_json = results_jsonl.with_name(results_jsonl.stem + ".summary.json")
+    resume = bool(args_cli.resume)
+    manifest = _Manifest(results_jsonl.with_name(results_jsonl.stem + ".manifest.json"), load=resume)
+
+    # Latest row per key (results + errors) for the summary; `done` holds
+    # successful rows only, so failed points are retried on resume.
+    rows_by_key: Dict[str, Dict[str, object]] = {}
+    done: Dict[str, Dict[str, object]] = {}
+    if resume:
         for r in _read_jsonl(results_jsonl):
-            done.add(_key_for_row(r))
+            rows_by_key[_key_for_row(r)] = r
+            if "eval_acc" in r:
+                done[_key_for_row(r)] = r
+        recovered: List[Dict[str, object]] = []
+        for key, ent in manifest.runs.items():
+            report = Path(str(ent.get("run_root", ""))) / "report.json"
+            if key in done or not ent.get("run_root") or not report.exists():
+                continue
+            row = dict(ent.get("row") or {})
+            acc = _read_eval_acc(report)
+            row.update({"eval_acc": acc, "eval_acc_pct": _fmt_pct(acc), "run_root": str(ent["run_root"])})
+            recovered.append(row)
+            done[key] = rows_by_key[key] = row
+            manifest.update(key, status="done", eval_acc=acc)
+        _write_jsonl(results_jsonl, recovered)
         print(f"[sweep] resume enabled: {len(done)} completed points found in {results_jsonl}")
-    rows: List[Dict[str, object]] = []
 
-    def _run_point(pt: SweepPoint) -> Tuple[float, Path]:
-        group = f"assoc_byte_v{val_range}_n{n}_mosaic"
-        tag = _safe_tag(f"{group}_{pt.name}")
-        run_root = repo_root / "bench_vault" / "benchmarks" / group / f"{_now_ts()}_{tag}"
-        _run_one(repo_root=repo_root, run_root=run_root, extra_env=pt.env, args=bench_args)
-        acc = _read_eval_acc(run_root / "report.json")
-        return acc, run_root
+    def _write_summary() -> None:
+        summary_json.write_text(json.dumps(_summarize(rows_by_key.values()), indent=2, sort_keys=True), encoding="utf-8")
 
-    print("[sweep] Stage 0: baseline (diversity OFF)")
-    base0 = dict(base)
-    base0["PRISMN_DVLAM"] = "0.0"
-    base0["PRISMN_DVTAU"] = "0.1"
-    key0 = _key_for_row(
-        {
-            "stage": "baseline",
-            "name": "baseline_div0",
-            "seed": seed0,
+    _write_summary()
+    group = f"assoc_byte_v{val_range}_n{n}_mosaic"
+    workers = max(1, int(args_cli.workers))
+    slots: "queue.Queue[Optional[List[int]]]" = queue.Queue()
+    for part in cpu_partition(workers) if workers > 1 else [None]:
+        slots.put(part)
+
+    def _point_row(stage: str, pt: SweepPoint, seed: int) -> Dict[str, object]:
+        return {
+            "stage": stage,
+            "name": pt.name,
+            "seed": seed,
             "val_range": val_range,
             "n": n,
-            "dvlambda": 0.0,
-            "dvtau": 0.1,
+            "dvlambda": float(pt.env.get("PRISMN_DVLAM", "0.0")),
+            "dvtau": float(pt.env.get("PRISMN_DVTAU", "0.1")),
         }
-    )
-    if key0 in done:
-        print("[sweep] baseline already present; loading as best_acc seed=126 from last row (best-effort)")
-        acc0 = 0.0
-        root0 = repo_root
-        for r in reversed(_read_jsonl(results_jsonl)):
-            if _key_for_row(r) == key0 and "eval_acc" in r:
-                try:
-                    acc0 = float(r.get("eval_acc", 0.0))
-                except Exception:
-                    acc0 = 0.0
-                try:
-                    root0 = Path(str(r.get("run_root", str(repo_root))))
-                except Exception:
-                    root0 = repo_root
-                break
-        print(f"[sweep] baseline disjoint eval acc (resumed): {_fmt_pct(acc0)}")
-    else:
+
+    def _run_point(key: str, row: Dict[str, object], pt: SweepPoint) -> Tuple[float, Path]:
+        cpus = slots.get()
         try:
-            acc0, root0 = _run_point(SweepPoint(name="baseline_div0", env=base0))
-            row0: Dict[str, object] = {
-                "stage": "baseline",
-                "name": "baseline_div0",
-                "seed": seed0,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": 0.0,
-                "dvtau": 0.1,
-                "eval_acc": acc0,
-                "eval_acc_pct": _fmt_pct(acc0),
-                "run_root": str(root0),
-            }
-            rows.append(row0)
-            _write_jsonl(results_jsonl, rows)
-            done.add(_key_for_row(row0))
-            rows.clear()
-            print(f"[sweep] baseline disjoint eval acc: {_fmt_pct(acc0)}")
-        except Exception as e:
-            row0 = {
-                "stage": "baseline",
-                "name": "baseline_div0",
-                "seed": seed0,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": 0.0,
-                "dvtau": 0.1,
-                "error": repr(e),
-            }
-            rows.append(row0)
-            _write_jsonl(results_jsonl, rows)
-            rows.clear()
-            raise
-
-    # Stage 1: DVLAM ladder sweep.
+            tag = _safe_tag(f"{group}_{pt.name}")
+            run_root = repo_root / "bench_vault" / "benchmarks" / group / f"{_now_ts()}_{tag}"
+            manifest.update(key, status="running", run_root=str(run_root), row=row, started_utc=time.time())
+            env = dict(pt.env)
+            if cpus is not None:
+                env.update(thread_env(int(args_cli.threads_per_run) or len(cpus)))
+            _run_one(repo_root=repo_root, run_root=run_root, extra_env=env, args=bench_args, cpus=cpus)
+            acc = _read_eval_acc(run_root / "report.json")
+            return acc, run_root
+        finally:
+            slots.put(cpus)
+
+    def _run_stage(
+        stage_points: List[Tuple[str, SweepPoint, int]], *, fail_fast: Tuple[str, ...] = ()
+    ) -> List[Dict[str, object]]:
+        """Run (stage, point, seed) items; rows come back in plan order.
+
+        A failed point whose stage is in ``fail_fast`` raises right away:
+        points not started yet are skipped (left ``pending``), running ones are
+        left to finish (the manifest lets --resume pick them up).
+        """
+
+        planned = [(stage, pt, _point_row(stage, pt, seed)) for stage, pt, seed in stage_points]
+        out: Dict[str, Dict[str, object]] = {}
+        todo = []
+        for stage, pt, row in planned:
+            key = _key_for_row(row)
+            if key in done:
+                print(f"[sweep] skip (resume): {pt.name}")
+                out[key] = done[key]
+            else:
+                manifest.update(key, status="pending", row=row)
+                todo.append((key, row, pt))
+
+        abort = threading.Event()
+
+        def _task(key: str, row: Dict[str, object], pt: SweepPoint) -> Tuple[float, Path]:
+            # Checked in the worker so a queued point never starts after a
+            # fail-fast failure, even before the main thread sees it.
+            if abort.is_set():
+                raise CancelledError()
+            try:
+                return _run_point(key, row, pt)
+            except Exception:
+                if row["stage"] in fail_fast:
+                    abort.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futs = {pool.submit(_task, key, row, pt): (key, row, pt) for key, row, pt in todo}
+            for fut in as_completed(futs):
+                key, row, pt = futs[fut]
+                row = dict(row)
+                try:
+                    acc, root = fut.result()
+                except CancelledError:
+                    continue
+                except Exception as e:
+                    row["error"] = repr(e)
+                    manifest.update(key, status="error", error=repr(e), finished_utc=time.time())
+                    print(f"[sweep] {pt.name}: ERROR {e!r}")
+                else:
+                    row.update({"eval_acc": acc, "eval_acc_pct": _fmt_pct(acc), "run_root": str(root)})
+                    done[key] = row
+                    manifest.update(key, status="done", eval_acc=acc, finished_utc=time.time())
+                    print(f"[sweep] {pt.name}: {_fmt_pct(acc)}")
+                _write_jsonl(results_jsonl, [row])
+                out[key] = rows_by_key[key] = row
+                _write_summary()
+                if "error" in row and row["stage"] in fail_fast:
+                    raise RuntimeError(f"{row['stage']} failed: {row['error']}")
+        return [out[_key_for_row(row)] for _, _, row in planned]
+
+    # Stage 0 (baseline, diversity off) and Stage 1 (DVLAM ladder) are
+    # independent, so they share one wave. The baseline is submitted first and
+    # a baseline failure cancels the ladder points that have not started.
+    print("[sweep] Stage 0: baseline (diversity OFF)")
     print("[sweep] Stage 1: DVLAM ladder (DVTAU fixed at 0.1)")
-    # Baseline (diversity off) already ran in Stage 0, so omit 0.0 here.
+    base0 = dict(base)
+    base0["PRISMN_DVLAM"] = "0.0"
+    base0["PRISMN_DVTAU"] = "0.1"
+    # Baseline (diversity off) is Stage 0, so the ladder omits 0.0.
     dvlams = [1e-4, 3e-4, 1e-3, 3e-3, 1e-2, 3e-2, 1e-1]
+    wave = [("baseline", SweepPoint(name="baseline_div0", env=base0), seed0)]
+    wave += [("dvlam", pt, seed0) for pt in _plan_dvlam_sweep(base=base, dvtaus=0.1, dvlams=dvlams)]
+    row0, *lam_rows = _run_stage(wave, fail_fast=("baseline",))
+    acc0 = float(row0["eval_acc"])  # type: ignore[arg-type]
+    print(f"[sweep] baseline disjoint eval acc: {_fmt_pct(acc0)}")
+
     best_lam = 0.0
     best_acc = acc0
-    for pt in _plan_dvlam_sweep(base=base, dvtaus=0.1, dvlams=dvlams):
-        key = _key_for_row(
-            {
-                "stage": "dvlam",
-                "name": pt.name,
-                "seed": seed0,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": float(pt.env.get("PRISMN_DVLAM", "0.0")),
-                "dvtau": float(pt.env.get("PRISMN_DVTAU", "0.1")),
-            }
-        )
-        if key in done:
-            print(f"[sweep] skip (resume): {pt.name}")
-            continue
-
-        try:
-            acc, root = _run_point(pt)
-        except Exception as e:
-            lam = float(pt.env.get("PRISMN_DVLAM", "0.0"))
-            tau = float(pt.env.get("PRISMN_DVTAU", "0.1"))
-            row = {
-                "stage": "dvlam",
-                "name": pt.name,
-                "seed": seed0,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": lam,
-                "dvtau": tau,
-                "error": repr(e),
-            }
-            rows.append(row)
-            _write_jsonl(results_jsonl, rows)
-            done.add(_key_for_row(row))
-            rows.clear()
-            print(f"[sweep] {pt.name}: ERROR {e!r}")
-            continue
-        lam = float(pt.env.get("PRISMN_DVLAM", "0.0"))
-        tau = float(pt.env.get("PRISMN_DVTAU", "0.1"))
-        row = {
-            "stage": "dvlam",
-            "name": pt.name,
-            "seed": seed0,
-            "val_range": val_range,
-            "n": n,
-            "dvlambda": lam,
-            "dvtau": tau,
-            "eval_acc": acc,
-            "eval_acc_pct": _fmt_pct(acc),
-            "run_root": str(root),
-        }
-        rows.append(row)
-        if acc > best_acc:
-            best_acc = acc
-            best_lam = lam
-        print(f"[sweep] {pt.name}: {_fmt_pct(acc)}")
-        _write_jsonl(results_jsonl, rows)
-        done.add(_key_for_row(row))
-        rows.clear()
-
+    for row in lam_rows:
+        if "eval_acc" in row and float(row["eval_acc"]) > best_acc:  # type: ignore[arg-type]
+            best_acc = float(row["eval_acc"])  # type: ignore[arg-type]
+            best_lam = float(row["dvlambda"])  # type: ignore[arg-type]
     print(f"[sweep] best DVLAM so far: {best_lam:g} -> {_fmt_pct(best_acc)}")
 
     # Stage 2: DVTAU sweep at best DVLAM (if non-zero).
@@ -408,130 +491,26 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     dvtaus = [0.0, 0.05, 0.10, 0.20, 0.30]
     best_tau = 0.1
     best_pair_acc = best_acc
-    for pt in _plan_dvtau_sweep(base=base, dvlam=best_lam, dvtaus=dvtaus):
-        key = _key_for_row(
-            {
-                "stage": "dvtau",
-                "name": pt.name,
-                "seed": seed0,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": float(pt.env.get("PRISMN_DVLAM", "0.0")),
-                "dvtau": float(pt.env.get("PRISMN_DVTAU", "0.1")),
-            }
-        )
-        if key in done:
-            print(f"[sweep] skip (resume): {pt.name}")
-            continue
-
-        try:
-            acc, root = _run_point(pt)
-        except Exception as e:
-            lam = float(pt.env.get("PRISMN_DVLAM", "0.0"))
-            tau = float(pt.env.get("PRISMN_DVTAU", "0.1"))
-            row = {
-                "stage": "dvtau",
-                "name": pt.name,
-                "seed": seed0,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": lam,
-                "dvtau": tau,
-                "error": repr(e),
-            }
-            rows.append(row)
-            _write_jsonl(results_jsonl, rows)
-            done.add(_key_for_row(row))
-            rows.clear()
-            print(f"[sweep] {pt.name}: ERROR {e!r}")
-            continue
-        lam = float(pt.env.get("PRISMN_DVLAM", "0.0"))
-        tau = float(pt.env.get("PRISMN_DVTAU", "0.1"))
-        row = {
-            "stage": "dvtau",
-            "name": pt.name,
-            "seed": seed0,
-            "val_range": val_range,
-            "n": n,
-            "dvlambda": lam,
-            "dvtau": tau,
-            "eval_acc": acc,
-            "eval_acc_pct": _fmt_pct(acc),
-            "run_root": str(root),
-        }
-        rows.append(row)
-        if acc > best_pair_acc:
-            best_pair_acc = acc
-            best_tau = tau
-        print(f"[sweep] {pt.name}: {_fmt_pct(acc)}")
-        _write_jsonl(results_jsonl, rows)
-        done.add(_key_for_row(row))
-        rows.clear()
+    for row in _run_stage([("dvtau", pt, seed0) for pt in _plan_dvtau_sweep(base=base, dvlam=best_lam, dvtaus=dvtaus)]):
+        if "eval_acc" in row and float(row["eval_acc"]) > best_pair_acc:  # type: ignore[arg-type]
+            best_pair_acc = float(row["eval_acc"])  # type: ignore[arg-type]
+            best_tau = float(row["dvtau"])  # type: ignore[arg-type]
 
     print(f"[sweep] best (DVLAM,DVTAU): ({best_lam:g},{best_tau:g}) -> {_fmt_pct(best_pair_acc)}")
 
     # Stage 3: multi-seed confirmation for the best pair.
     print("[sweep] Stage 3: confirm best pair across seeds 126/127/128")
     seeds = [126, 127, 128]
+    confirm: List[Tuple[str, SweepPoint, int]] = []
     for sd in seeds:
         env = _base_env(seed=sd, val_range=val_range, n=n)
         env["PRISMN_DVLAM"] = str(float(best_lam))
         env["PRISMN_DVTAU"] = str(float(best_tau))
-        pt = SweepPoint(name=f"confirm_seed{sd}", env=env)
-        key = _key_for_row(
-            {
-                "stage": "confirm",
-                "name": pt.name,
-                "seed": sd,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": float(best_lam),
-                "dvtau": float(best_tau),
-            }
-        )
-        if key in done:
-            print(f"[sweep] skip (resume): {pt.name}")
-            continue
-
-        try:
-            acc, root = _run_point(pt)
-        except Exception as e:
-            row = {
-                "stage": "confirm",
-                "name": pt.name,
-                "seed": sd,
-                "val_range": val_range,
-                "n": n,
-                "dvlambda": float(best_lam),
-                "dvtau": float(best_tau),
-                "error": repr(e),
-            }
-            rows.append(row)
-            _write_jsonl(results_jsonl, rows)
-            done.add(_key_for_row(row))
-            rows.clear()
-            print(f"[sweep] seed={sd} -> ERROR {e!r}")
-            continue
-
-        row = {
-            "stage": "confirm",
-            "name": pt.name,
-            "seed": sd,
-            "val_range": val_range,
-            "n": n,
-            "dvlambda": float(best_lam),
-            "dvtau": float(best_tau),
-            "eval_acc": acc,
-            "eval_acc_pct": _fmt_pct(acc),
-            "run_root": str(root),
-        }
-        rows.append(row)
-        print(f"[sweep] seed={sd} -> {_fmt_pct(acc)}")
-        _write_jsonl(results_jsonl, rows)
-        done.add(_key_for_row(row))
-        rows.clear()
+        confirm.append(("confirm", SweepPoint(name=f"confirm_seed{sd}", env=env), sd))
+    _run_stage(confirm)
 
     print(f"[sweep] results written: {results_jsonl}")
+    print(f"[sweep] summary: {summary_json}")
     return 0
 
 
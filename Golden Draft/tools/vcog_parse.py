@@ -12,16 +12,24 @@ The contract is intentionally simple and behavior-locked:
   - ``OnlineStats`` uses Welford mean/variance and reports *sample* std.
 
 These helpers are used by ``tools.parse_vcog``.
+
+Lines that cannot match (no ``V_COG[`` and not both ``step`` and ``loss``) are
+rejected with plain substring checks before any regex runs. ``parse_lines``
+returns columnar arrays for bulk parsing, and ``parse_files`` parses many
+historical logs in a process pool.
 """
 
 from __future__ import annotations
 
+import array
+import concurrent.futures
 import dataclasses
 import datetime as _dt
 import json
 import math
+import os
 import re
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 RESTEP = re.compile(r"\bstep\s+(\d+)(?:/\d+)?\b.*?\bloss\s+([0-9.+\-eE]+)")
@@ -73,14 +81,20 @@ def parse_line(linstr: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str
           - vcog_dict contains parsed V_COG fields if present
     """
 
+    # Substring prefilter: RESTEP needs "step" and "loss", REVCOG needs "V_COG[".
+    hasvcg = "V_COG[" in linstr
+    hasstp = "step" in linstr and "loss" in linstr
+    if not hasvcg and not hasstp:
+        return None, None
+
     evmapx: Dict[str, Any] = {"ts_utc": _now_utc_iso()}
 
-    stpmat = RESTEP.search(linstr)
+    stpmat = RESTEP.search(linstr) if hasstp else None
     if stpmat:
         evmapx["step"] = int(stpmat.group(1))
         evmapx["loss"] = float(stpmat.group(2))
 
-    vcgmat = REVCOG.search(linstr)
+    vcgmat = REVCOG.search(linstr) if hasvcg else None
     vcog = None
     if vcgmat:
         vcog = parse_vcog_kv(vcgmat.group(1))
@@ -90,6 +104,93 @@ def parse_line(linstr: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str
     return evmapx, vcog
 
 
+@dataclasses.dataclass
+class ParsedColumns:
+    """Columnar ``parse_line`` output: one row per line that yielded an event.
+
+    ``step`` is -1 and ``loss`` NaN when the line had no step match; ``vcog``
+    maps each V_COG key to a row-aligned list (None where the row lacks it).
+    ``ts_utc`` is not kept (it is the parse time, not the log time).
+    """
+
+    line_no: array.array = dataclasses.field(default_factory=lambda: array.array("q"))
+    step: array.array = dataclasses.field(default_factory=lambda: array.array("q"))
+    loss: array.array = dataclasses.field(default_factory=lambda: array.array("d"))
+    has_vcog: array.array = dataclasses.field(default_factory=lambda: array.array("b"))
+    vcog: Dict[str, List[Any]] = dataclasses.field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.line_no)
+
+    def events(self) -> List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """Row-wise ``(event, vcog)`` pairs, as ``parse_line`` returns them (minus ts_utc)."""
+
+        out: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]] = []
+        for rowidx in range(len(self)):
+            evmapx: Dict[str, Any] = {}
+            if self.step[rowidx] >= 0:
+                evmapx["step"] = self.step[rowidx]
+                evmapx["loss"] = self.loss[rowidx]
+            vcog = None
+            if self.has_vcog[rowidx]:
+                vcog = {k: v[rowidx] for k, v in self.vcog.items() if v[rowidx] is not None}
+            out.append((evmapx, vcog))
+        return out
+
+
+def parse_lines(lines: Iterable[str]) -> ParsedColumns:
+    """Bulk ``parse_line`` into columns (same prefilter and coercion rules)."""
+
+    cols = ParsedColumns()
+    nrows = 0
+    for linidx, linstr in enumerate(lines):
+        hasvcg = "V_COG[" in linstr
+        hasstp = "step" in linstr and "loss" in linstr
+        if not hasvcg and not hasstp:
+            continue
+
+        stpmat = RESTEP.search(linstr) if hasstp else None
+        vcgmat = REVCOG.search(linstr) if hasvcg else None
+        if stpmat is None and vcgmat is None:
+            continue
+
+        cols.line_no.append(linidx)
+        if stpmat is not None:
+            cols.step.append(int(stpmat.group(1)))
+            cols.loss.append(float(stpmat.group(2)))
+        else:
+            cols.step.append(-1)
+            cols.loss.append(math.nan)
+
+        cols.has_vcog.append(1 if vcgmat is not None else 0)
+        if vcgmat is not None:
+            for keystr, valobj in parse_vcog_kv(vcgmat.group(1)).items():
+                collst = cols.vcog.get(keystr)
+                if collst is None:
+                    collst = cols.vcog[keystr] = [None] * nrows
+                collst.append(valobj)
+        nrows += 1
+        for collst in cols.vcog.values():
+            if len(collst) < nrows:
+                collst.append(None)
+
+    return cols
+
+
+def parse_file(path: str | os.PathLike[str]) -> ParsedColumns:
+    with open(path, "r", encoding="utf-8", errors="replace") as filobj:
+        return parse_lines(filobj)
+
+
+def parse_files(paths: Sequence[str | os.PathLike[str]], *, workers: int = 0) -> List[ParsedColumns]:
+    """``parse_file`` over many logs; ``workers`` > 1 uses a process pool (input order kept)."""
+
+    if int(workers) <= 1 or len(paths) <= 1:
+        return [parse_file(pth) for pth in paths]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(int(workers), len(paths))) as poolex:
+        return list(poolex.map(parse_file, paths))
+
+
 @dataclasses.dataclass
 class OnlineStats:
     """Welford online mean/variance (sample std)."""